@@ -2,9 +2,12 @@
 Chainlit UI for Ultimate Intelligence System - Phase 6
 Beautiful, production-ready interface with real-time streaming.
 """
+import asyncio
+import importlib
 from typing import Dict, Any
 import chainlit as cl
 from datetime import datetime
+import uuid
 
 import sys
 from pathlib import Path
@@ -12,15 +15,41 @@ from pathlib import Path
 # Add ultimate-intelligence-system to path
 sys.path.insert(0, str(Path(__file__).parent / "ultimate-intelligence-system"))
 
-from src.graph.workflow import create_intelligence_graph, create_parallel_graph
 from src.models.state import IntelligenceState
+from src.utils.answer_cache import apply_cached_answer, lookup_answer, run_once, store_answer
+from src.utils.llm_governor import current_query
 from src.utils.logging_config import logger
+from src.utils.metrics import start_metrics_exporter
 from src.utils.performance import performance_monitor
+from src.utils.streaming import TOKEN_EVENT
 
 # Configuration
 ENABLE_PARALLEL = False  # Toggle parallel execution
 SHOW_DEBUG_INFO = True   # Show performance metrics
 STREAM_UPDATES = True    # Stream node updates in real-time
+BYPASS_CACHE_PREFIX = "/fresh"  # Message prefix that skips the final-answer cache
+
+# Prometheus metrics (graph nodes, LLM calls, caches) on CHAINLIT_METRICS_PORT
+start_metrics_exporter()
+
+# The graph (langgraph, LangChain models, every agent and node) is imported on
+# first use, so the UI starts without it; see warm_graph()
+GRAPH_MODULE = "src.graph.workflow"
+_graph_warmup = None
+
+
+async def _import_graph():
+    try:
+        await asyncio.to_thread(importlib.import_module, GRAPH_MODULE)
+    except Exception as e:
+        logger.warning(f"Graph warmup failed (retried on first query): {e}")
+
+
+def warm_graph():
+    """Import the graph modules in the background (once per process) while the user reads the welcome"""
+    global _graph_warmup
+    if _graph_warmup is None:
+        _graph_warmup = asyncio.create_task(_import_graph())
 
 
 @cl.on_chat_start
@@ -43,6 +72,8 @@ Ask me anything about UDC, Qatar real estate, or strategic analysis!
 - "What was UDC's revenue in FY24?"
 - "How is UDC's financial performance?"
 - "Should we invest in UDC given current market conditions?"
+
+Repeated questions are answered instantly from cache; start a message with `/fresh` to force a new analysis.
 """
     ).send()
     
@@ -50,13 +81,17 @@ Ask me anything about UDC, Qatar real estate, or strategic analysis!
     cl.user_session.set("use_parallel", ENABLE_PARALLEL)
     cl.user_session.set("show_debug", SHOW_DEBUG_INFO)
     logger.info("New chat session started")
+    warm_graph()
 
 
 @cl.on_message
 async def main(message: cl.Message):
     """Handle incoming messages"""
-    query = message.content
-    logger.info(f"Received query: {query}")
+    query = message.content.strip()
+    bypass_cache = query.lower().startswith(BYPASS_CACHE_PREFIX)
+    if bypass_cache:
+        query = query[len(BYPASS_CACHE_PREFIX):].strip()
+    logger.info(f"Received query: {query} (bypass_cache={bypass_cache})")
     
     # Start processing message
     msg = cl.Message(content="")
@@ -69,20 +104,44 @@ async def main(message: cl.Message):
     use_parallel = cl.user_session.get("use_parallel", False)
     show_debug = cl.user_session.get("show_debug", True)
     
+    # Near-duplicate of an answered question: skip the whole pipeline
+    cached = None if bypass_cache else lookup_answer(query)
+    if cached:
+        result = apply_cached_answer(initial_state, cached)
+        await stream_cache_notice(cached["answer_cache"], msg)
+        await send_final_summary(result, msg)
+        return
+    
     # Create graph
+    from src.graph.workflow import create_intelligence_graph, create_parallel_graph
     graph = create_parallel_graph() if use_parallel else create_intelligence_graph()
     
-    # Process with streaming updates
-    try:
+    # Same question already running for another user: share that run
+    joined = False
+    
+    async def join_notice():
+        nonlocal joined
+        joined = True
+        await msg.stream_token("⏳ **This question is already being analysed** - sharing that analysis...\n")
+    
+    async def run_pipeline() -> Dict[str, Any]:
+        current_query.set(uuid.uuid4().hex)  # LLM governor queues this run's calls fairly
         result = await process_with_streaming(
             graph=graph,
             state=initial_state,
             message=msg,
             show_debug=show_debug
         )
+        store_answer(query, result)
+        return result
+    
+    # Process with streaming updates
+    try:
+        result = await run_once(query, run_pipeline, variant=f"parallel={use_parallel}", on_join=join_notice)
         
-        # Send final summary
-        await send_final_summary(result, msg)
+        # Send final summary (synthesis body already streamed live if tokens arrived)
+        synthesis_streamed = result.get("synthesis_streamed", False) and not joined
+        await send_final_summary(result, msg, synthesis_streamed=synthesis_streamed)
         
     except Exception as e:
         logger.error(f"Error processing query: {e}")
@@ -91,6 +150,16 @@ async def main(message: cl.Message):
         ).send()
 
 
+async def stream_cache_notice(cache_info: Dict[str, Any], message: cl.Message):
+    """Tell the user the answer was served from the final-answer cache"""
+    age_hours = cache_info.get("age_seconds", 0) / 3600
+    await message.stream_token(
+        f"⚡ **Cached answer** (matched \"{cache_info.get('matched_question')}\", "
+        f"similarity {cache_info.get('similarity', 0):.0%}, {age_hours:.1f}h old). "
+        f"Send `{BYPASS_CACHE_PREFIX} <question>` for a fresh analysis.\n"
+    )
+
+
 async def process_with_streaming(
     graph,
     state: IntelligenceState,
@@ -99,18 +168,27 @@ async def process_with_streaming(
 ) -> Dict[str, Any]:
     """
     Process query with real-time streaming updates.
-    Shows each node as it executes.
+    Shows each node as it executes and the synthesis token by token.
     """
     performance_monitor.start_query()
     
     last_node_count = len(state.get("nodes_executed", []))
     latest_state: IntelligenceState = state
+    synthesis_streamed = False
     
     try:
-        async for event in graph.astream(state):
+        async for mode, event in graph.astream(state, stream_mode=["updates", "custom"]):
             if not event:
                 continue
             
+            if mode == "custom":
+                if isinstance(event, dict) and event.get("type") == TOKEN_EVENT:
+                    if not synthesis_streamed:
+                        await message.stream_token("\n\n## 📝 Synthesis (live)\n\n")
+                        synthesis_streamed = True
+                    await message.stream_token(event["token"])
+                continue
+            
             for node_name, node_state in event.items():
                 if not node_state or not isinstance(node_state, dict):
                     continue
@@ -145,6 +223,7 @@ async def process_with_streaming(
             latest_state["performance"] = performance_summary
         
         performance_monitor.log_summary()
+        latest_state["synthesis_streamed"] = synthesis_streamed
     
     if show_debug:
         await send_performance_metrics(latest_state)
@@ -234,7 +313,11 @@ async def stream_node_update(node_name: str, state: dict, message: cl.Message):
         await message.stream_token(f"\n\n{emoji} **{node_display}**: Completed\n")
 
 
-async def send_final_summary(state: Dict[str, Any], message: cl.Message):
+async def send_final_summary(
+    state: Dict[str, Any],
+    message: cl.Message,
+    synthesis_streamed: bool = False
+):
     """Send beautiful final summary with all results"""
     
     # Calculate execution time
@@ -271,12 +354,15 @@ async def send_final_summary(state: Dict[str, Any], message: cl.Message):
     await message.stream_token(f"**Overall Confidence:** {confidence:.0%}\n\n")
     await message.stream_token(f"**Analysis Depth:** {nodes_count} nodes, {agents_count} expert agents\n\n")
     await message.stream_token(f"**Execution Time:** {exec_time:.1f}s\n\n")
+    if state.get('answer_cache'):
+        await message.stream_token("**Source:** ⚡ Cached answer\n\n")
     
-    # Main synthesis
-    synthesis = state.get('final_synthesis') or "No synthesis available"
-    await message.stream_token("---\n\n")
-    await message.stream_token(str(synthesis))
-    await message.stream_token("\n\n")
+    # Main synthesis (skipped when it was already streamed token by token)
+    if not synthesis_streamed:
+        synthesis = state.get('final_synthesis') or "No synthesis available"
+        await message.stream_token("---\n\n")
+        await message.stream_token(str(synthesis))
+        await message.stream_token("\n\n")
     
     # Key insights
     insights = state.get('key_insights', [])
@@ -386,6 +472,11 @@ async def send_performance_metrics(state: Dict[str, Any]):
             metrics_lines.append(f"**Measured Runtime:** {total_time:.2f}s")
             metrics_lines.append("")
         
+        ttft = performance_summary.get("time_to_first_token")
+        if isinstance(ttft, (int, float)):
+            metrics_lines.append(f"**Time to First Token:** {ttft:.2f}s")
+            metrics_lines.append("")
+        
         node_times = performance_summary.get("node_times", {})
         if node_times:
             metrics_lines.append("**Node Durations (s):**")
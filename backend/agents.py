@@ -16,7 +16,7 @@ Each agent has:
 """
 
 from typing import Dict, Any, Optional
-from rag_system import retrieve_datasets, assemble_context, openai_client, openai_available
+from rag_system import retrieve_datasets, assemble_context, rag_service
 # Using enhanced adaptive prompts (Phase 2.6)
 from agent_prompts import AGENT_PROMPTS
 
@@ -199,7 +199,8 @@ Guidelines:
     def _generate_answer(self, prompt: str) -> str:
         """Generate answer using LLM (GPT-4o for expert-level analysis)"""
         
-        if not openai_available or openai_client is None:
+        openai_client = rag_service.openai_client
+        if openai_client is None:
             return "[LLM NOT AVAILABLE] OpenAI API key not configured."
         
         try:
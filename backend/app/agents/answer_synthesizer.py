@@ -24,25 +24,25 @@ class AnswerSynthesizer:
         
         if use_anthropic:
             try:
-                from anthropic import Anthropic
+                from ..services.llm_clients import llm_clients
                 api_key = os.getenv("ANTHROPIC_API_KEY")
                 if not api_key:
                     print("Warning: ANTHROPIC_API_KEY not found. Using fallback synthesis.")
                     self.client = None
                 else:
-                    self.client = Anthropic(api_key=api_key)
+                    self.client = llm_clients.anthropic(api_key=api_key)
             except ImportError:
                 print("Warning: anthropic package not installed. Using fallback synthesis.")
                 self.client = None
         else:
             try:
-                from openai import OpenAI
+                from ..services.llm_clients import llm_clients
                 api_key = os.getenv("OPENAI_API_KEY")
                 if not api_key:
                     print("Warning: OPENAI_API_KEY not found. Using fallback synthesis.")
                     self.client = None
                 else:
-                    self.client = OpenAI(api_key=api_key)
+                    self.client = llm_clients.openai(api_key=api_key)
             except ImportError:
                 print("Warning: openai package not installed. Using fallback synthesis.")
                 self.client = None
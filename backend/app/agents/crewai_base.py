@@ -5,8 +5,8 @@ Multi-agent collaborative intelligence system
 
 from crewai import Agent, Task, Crew, Process
 from crewai_tools import tool
-from anthropic import Anthropic
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, AsyncIterator, Callable, Optional
+import asyncio
 import json
 import sys
 import os
@@ -16,6 +16,18 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 
 from backend.app.core.config import settings
 from backend.app.agents.data_retrieval_layer import DataRetrievalExecutor
+from ..services.llm_clients import llm_clients
+from ..services.thread_stream import EVENT, stream_blocking_run
+
+
+# Display names for task outputs, keyed by CrewAI agent role
+AGENT_DISPLAY_NAMES = {
+    'Strategic Intelligence Orchestrator': 'Dr. Omar',
+    'Chief Financial Intelligence Officer': 'Dr. James',
+    'Market Intelligence Analyst': 'Dr. Fatima',
+    'Operations Intelligence Officer': 'Dr. Sarah',
+    'Research Intelligence Officer': 'Research Agent',
+}
 
 
 class DrOmarOrchestrator:
@@ -25,7 +37,7 @@ class DrOmarOrchestrator:
     """
     
     def __init__(self):
-        self.anthropic = Anthropic(api_key=settings.anthropic_api_key)
+        self.anthropic = llm_clients.anthropic(api_key=settings.anthropic_api_key)
         self.data_retriever = DataRetrievalExecutor()
         
         # Define Dr. Omar as CrewAI Agent
@@ -63,12 +75,77 @@ class DrOmarOrchestrator:
         Returns:
             Dict with answer, sources, agent contributions, confidence
         """
+        response: Dict[str, Any] = {}
+        async for event in self.stream_ceo_query(query):
+            if event['type'] == 'result':
+                response = event['response']
+        return response
+    
+    async def stream_ceo_query(self, query: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Process CEO query, yielding progress as the crew produces it
+        
+        The blocking crew runs in a worker thread. Each finished task is
+        yielded immediately, so the UI can show specialist insights and the
+        synthesized answer before verification completes.
+        
+        Yields:
+            {'type': 'contribution', 'agent', 'role', 'output', 'is_synthesis'} per finished task,
+            then {'type': 'result', 'response'} with the dict handle_ceo_query returns
+        """
         print(f"\n{'='*80}")
         print(f"CREWAI MULTI-AGENT SYSTEM")
         print(f"{'='*80}")
         print(f"CEO Query: {query}")
         print(f"{'='*80}\n")
         
+        try:
+            answer_text = None
+            async for kind, item in stream_blocking_run(lambda emit: self._build_crew(query, emit).kickoff()):
+                if kind == EVENT:
+                    yield item
+                    continue
+                
+                print(f"\n✓ Crew collaboration complete")
+                
+                # Extract result
+                if hasattr(item, 'output'):
+                    answer_text = item.output
+                elif isinstance(item, dict):
+                    answer_text = item.get('output', str(item))
+                else:
+                    answer_text = str(item)
+            
+            # Verify with Truthful Council
+            print(f"\nVerifying with Truthful Council...")
+            verified_result = await self._verify_with_council(answer_text, query)
+            
+            print(f"✓ Verification complete: {verified_result['verification']}")
+            
+            response = {
+                'query': query,
+                'answer': verified_result['final_answer'],
+                'confidence': verified_result['confidence'],
+                'sources': verified_result['sources_used'],
+                'agent_contributions': verified_result['agent_insights'],
+                'verification_status': verified_result['verification'],
+                'multi_agent': True,
+                'framework': 'CrewAI'
+            }
+            
+        except Exception as e:
+            print(f"\n✗ Error in crew execution: {str(e)}")
+            # Fallback to single agent
+            response = await self._fallback_single_agent(query)
+        
+        yield {'type': 'result', 'response': response}
+    
+    def _build_crew(self, query: str, emit: Callable[[Dict[str, Any]], None]) -> Crew:
+        """
+        Create the specialist agents, tasks and hierarchical crew for a query
+        
+        Each finished task is passed to ``emit`` as a contribution event.
+        """
         # Create specialist agents
         financial_agent = self._create_financial_agent()
         market_agent = self._create_market_agent()
@@ -87,59 +164,33 @@ class DrOmarOrchestrator:
         print(f"\nCreated {len(tasks)} collaborative tasks")
         print(f"Agents involved: {len([a for a in [financial_agent, market_agent, operations_agent, research_agent] if any(t.agent == a for t in tasks)])}")
         
+        finished: List[Any] = []
+        
+        def on_task_done(task_output: Any) -> None:
+            # Tasks complete in list order, so the n-th output belongs to tasks[n]
+            task = tasks[min(len(finished), len(tasks) - 1)]
+            finished.append(task_output)
+            role = getattr(task.agent, 'role', '')
+            emit({
+                'type': 'contribution',
+                'agent': AGENT_DISPLAY_NAMES.get(role, role or 'Agent'),
+                'role': role,
+                'output': getattr(task_output, 'raw', None) or getattr(task_output, 'raw_output', None) or str(task_output),
+                'is_synthesis': task.agent is self.agent
+            })
+        
+        print(f"\nStarting multi-agent collaboration...")
+        print(f"Process: Hierarchical (Dr. Omar orchestrates)")
+        
         # Create crew for collaborative work
-        crew = Crew(
-            agents=[
-                self.agent,
-                financial_agent,
-                market_agent,
-                operations_agent,
-                research_agent
-            ],
+        return Crew(
+            agents=[self.agent, financial_agent, market_agent, operations_agent, research_agent],
             tasks=tasks,
             process=Process.hierarchical,  # Dr. Omar orchestrates
             manager_llm=self._get_llm_config(),
+            task_callback=on_task_done,
             verbose=True
         )
-        
-        print(f"\nStarting multi-agent collaboration...")
-        print(f"Process: Hierarchical (Dr. Omar orchestrates)")
-        
-        # Execute multi-agent collaboration
-        try:
-            result = crew.kickoff()
-            
-            print(f"\n✓ Crew collaboration complete")
-            
-            # Extract result
-            if hasattr(result, 'output'):
-                answer_text = result.output
-            elif isinstance(result, dict):
-                answer_text = result.get('output', str(result))
-            else:
-                answer_text = str(result)
-            
-            # Verify with Truthful Council
-            print(f"\nVerifying with Truthful Council...")
-            verified_result = await self._verify_with_council(answer_text, query)
-            
-            print(f"✓ Verification complete: {verified_result['verification']}")
-            
-            return {
-                'query': query,
-                'answer': verified_result['final_answer'],
-                'confidence': verified_result['confidence'],
-                'sources': verified_result['sources_used'],
-                'agent_contributions': verified_result['agent_insights'],
-                'verification_status': verified_result['verification'],
-                'multi_agent': True,
-                'framework': 'CrewAI'
-            }
-            
-        except Exception as e:
-            print(f"\n✗ Error in crew execution: {str(e)}")
-            # Fallback to single agent
-            return await self._fallback_single_agent(query)
     
     def _create_financial_agent(self) -> Agent:
         """Dr. James - Financial Specialist"""
@@ -208,21 +259,24 @@ class DrOmarOrchestrator:
             llm=self._get_llm_config()
         )
     
+    def _search_routed(self, query: str, label: str) -> str:
+        """Route a query and return the retrieved data as JSON (shared by the data tools)"""
+        try:
+            from backend.app.ontology.intelligent_router import IntelligentQueryRouter
+            router = IntelligentQueryRouter()
+            routing = router.route_query(query)
+            
+            result = self.data_retriever.execute_retrieval(routing, query)
+            return json.dumps(result, indent=2)
+        except Exception as e:
+            return f"Error searching {label}: {str(e)}"
+    
     @tool("Search UDC Financial Data")
     def _create_financial_data_tool(self):
         """Tool for searching UDC financial data"""
         def search_financial_data(query: str) -> str:
             """Search UDC financial statements and records"""
-            try:
-                # Use data retrieval layer
-                from backend.app.ontology.intelligent_router import IntelligentQueryRouter
-                router = IntelligentQueryRouter()
-                routing = router.route_query(query)
-                
-                result = self.data_retriever.execute_retrieval(routing, query)
-                return json.dumps(result, indent=2)
-            except Exception as e:
-                return f"Error searching financial data: {str(e)}"
+            return self._search_routed(query, "financial data")
         
         return search_financial_data
     
@@ -231,15 +285,7 @@ class DrOmarOrchestrator:
         """Tool for Qatar market data"""
         def search_qatar_data(query: str) -> str:
             """Search Qatar economic and market statistics"""
-            try:
-                from backend.app.ontology.intelligent_router import IntelligentQueryRouter
-                router = IntelligentQueryRouter()
-                routing = router.route_query(query)
-                
-                result = self.data_retriever.execute_retrieval(routing, query)
-                return json.dumps(result, indent=2)
-            except Exception as e:
-                return f"Error searching Qatar data: {str(e)}"
+            return self._search_routed(query, "Qatar data")
         
         return search_qatar_data
     
@@ -248,15 +294,7 @@ class DrOmarOrchestrator:
         """Tool for property data"""
         def search_property_data(query: str) -> str:
             """Search UDC property portfolio and performance"""
-            try:
-                from backend.app.ontology.intelligent_router import IntelligentQueryRouter
-                router = IntelligentQueryRouter()
-                routing = router.route_query(query)
-                
-                result = self.data_retriever.execute_retrieval(routing, query)
-                return json.dumps(result, indent=2)
-            except Exception as e:
-                return f"Error searching property data: {str(e)}"
+            return self._search_routed(query, "property data")
         
         return search_property_data
     
@@ -372,7 +410,8 @@ class DrOmarOrchestrator:
             from backend.app.agents.truthful_council_verifier import TruthfulCouncil
             
             council = TruthfulCouncil()
-            verification = council.verify_answer(crew_result, query)
+            # Blocking Anthropic call: keep the event loop (other sessions' streams) running
+            verification = await asyncio.to_thread(council.verify_answer, crew_result, query)
             
             print(f"\n✓ Council Verification:")
             print(f"  Status: {verification.get('status', 'unknown')}")
@@ -418,7 +457,7 @@ class DrOmarOrchestrator:
         try:
             # Use Dr. Omar alone
             from backend.app.agents.dr_omar import dr_omar
-            result = dr_omar.answer_question(query)
+            result = await dr_omar.answer_question_async(query)
             
             return {
                 'query': query,
@@ -7,14 +7,14 @@ import sys
 sys.path.insert(0, 'D:/udc')
 
 import chromadb
-import json
 from typing import Dict, List, Optional, Any
-from pathlib import Path
 
 from backend.app.ontology.udc_master_ontology import DataSource
 from backend.app.agents.advanced_ranking import AdvancedRankingSystem
 from backend.app.agents.external_apis.world_bank import WorldBankAPI
 from backend.app.agents.external_apis.semantic_scholar import SemanticScholarAPI
+from ..services.udc_data_store import data_store
+from ..services.udc_data_query import StructuredDataIndex
 
 
 class DataRetrievalExecutor:
@@ -28,8 +28,10 @@ class DataRetrievalExecutor:
         # Initialize ChromaDB
         self.chroma_client = chromadb.PersistentClient(path=chroma_path)
         
-        # Load UDC JSON files
-        self.json_store = self._load_udc_json_files()
+        # UDC JSON files, parsed once by the shared data store
+        self.store = data_store()
+        self.data_index = StructuredDataIndex(self.store)
+        print(f"✓ Loaded {len(self.json_store)} JSON files")
         
         # Initialize APIs
         self.apis = {
@@ -42,30 +44,30 @@ class DataRetrievalExecutor:
         
         print("✓ Data Retrieval Executor ready")
     
+    @property
+    def json_store(self) -> Dict[str, Any]:
+        """UDC structured JSON files (re-read when a file changes on disk)"""
+        return self._load_udc_json_files()
+    
     def _load_udc_json_files(self) -> Dict[str, Any]:
         """Load all UDC structured JSON files"""
-        json_dir = Path("D:/udc/data/sample_data")
         json_store = {}
         
         json_files = [
             'financial_summary.json',
             'market_indicators.json',
             'property_portfolio.json',
-            'subsidiaries.json',
+            'subsidiaries_performance.json',
             'qatar_cool_metrics.json'
         ]
         
         for filename in json_files:
-            filepath = json_dir / filename
-            if filepath.exists():
+            if (self.store.data_dir / filename).exists():
                 try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        key = filename.replace('.json', '')
-                        json_store[key] = json.load(f)
+                    json_store[filename.replace('.json', '')] = self.store.get(filename)
                 except Exception as e:
                     print(f"Warning: Could not load {filename}: {e}")
         
-        print(f"✓ Loaded {len(json_store)} JSON files")
         return json_store
     
     def execute_retrieval(self, routing_decision: Dict, query: str) -> Dict:
@@ -93,7 +95,7 @@ class DataRetrievalExecutor:
         for source_name in primary_sources:
             try:
                 source = DataSource(source_name)
-                data = self._retrieve_from_source(source, query)
+                data = self._retrieve_from_source(source, query, results['question_type'])
                 
                 if data:
                     results['sources_queried'].append(source_name)
@@ -111,7 +113,7 @@ class DataRetrievalExecutor:
             for source_name in secondary_sources[:2]:  # Limit to 2 secondary sources
                 try:
                     source = DataSource(source_name)
-                    data = self._retrieve_from_source(source, query)
+                    data = self._retrieve_from_source(source, query, results['question_type'])
                     
                     if data:
                         results['sources_queried'].append(source_name)
@@ -125,26 +127,26 @@ class DataRetrievalExecutor:
         
         return results
     
-    def _retrieve_from_source(self, source: DataSource, query: str) -> Optional[Dict]:
+    def _retrieve_from_source(self, source: DataSource, query: str, question_type: Optional[str] = None) -> Optional[Dict]:
         """
         Actually fetch data from a specific source
         """
         
         # UDC JSON Files
         if source == DataSource.UDC_FINANCIAL_JSON:
-            return self._query_udc_financial_json(query)
+            return self._query_udc_financial_json(query, question_type)
         
         elif source == DataSource.UDC_PROPERTY_JSON:
-            return self._query_udc_property_json(query)
+            return self._query_udc_property_json(query, question_type)
         
         elif source == DataSource.UDC_SUBSIDIARIES_JSON:
-            return self._query_udc_subsidiaries_json(query)
+            return self._query_udc_subsidiaries_json(query, question_type)
         
         elif source == DataSource.UDC_QATAR_COOL_JSON:
-            return self._query_udc_qatar_cool_json(query)
+            return self._query_udc_qatar_cool_json(query, question_type)
         
         elif source == DataSource.UDC_MARKET_INDICATORS_JSON:
-            return self._query_udc_market_indicators_json(query)
+            return self._query_udc_market_indicators_json(query, question_type)
         
         # UDC PDF Documents
         elif source == DataSource.UDC_FINANCIAL_PDFS:
@@ -179,60 +181,59 @@ class DataRetrievalExecutor:
         
         return None
     
-    def _query_udc_financial_json(self, query: str) -> Dict:
-        """Query UDC financial JSON data"""
-        data = self.json_store.get('financial_summary', {})
+    def _query_udc_json(self, filename: str, label: str, query: str, question_type: Optional[str]) -> Dict:
+        """
+        Query one UDC JSON file through the structured data index
+
+        Returns only the periods and metrics the query is about, with the
+        path of every field as provenance. The whole file is returned when
+        nothing in it matches.
+        """
+        if not (self.store.data_dir / filename).exists():
+            return {
+                'type': 'structured_json',
+                'file': filename,
+                'data': {},
+                'provenance': [],
+                'projected': False,
+                'summary': f"{label} not available"
+            }
+        
+        result = self.data_index.query(query, files=[filename], question_type=question_type)
+        data = result['data'][filename]
+        if result['projected']:
+            summary = f"{label}: {result['fields']} matching fields"
+        else:
+            summary = f"{label} with {len(data)} entries"
         
         return {
             'type': 'structured_json',
-            'file': 'financial_summary.json',
+            'file': filename,
             'data': data,
-            'summary': f"Financial data with {len(data)} entries"
+            'provenance': result['provenance'],
+            'projected': result['projected'],
+            'summary': summary
         }
     
-    def _query_udc_property_json(self, query: str) -> Dict:
+    def _query_udc_financial_json(self, query: str, question_type: Optional[str] = None) -> Dict:
+        """Query UDC financial JSON data"""
+        return self._query_udc_json('financial_summary.json', "Financial data", query, question_type)
+    
+    def _query_udc_property_json(self, query: str, question_type: Optional[str] = None) -> Dict:
         """Query UDC property portfolio JSON"""
-        data = self.json_store.get('property_portfolio', {})
-        
-        return {
-            'type': 'structured_json',
-            'file': 'property_portfolio.json',
-            'data': data,
-            'summary': f"Property data with {len(data)} entries"
-        }
+        return self._query_udc_json('property_portfolio.json', "Property data", query, question_type)
     
-    def _query_udc_subsidiaries_json(self, query: str) -> Dict:
+    def _query_udc_subsidiaries_json(self, query: str, question_type: Optional[str] = None) -> Dict:
         """Query UDC subsidiaries JSON"""
-        data = self.json_store.get('subsidiaries', {})
-        
-        return {
-            'type': 'structured_json',
-            'file': 'subsidiaries.json',
-            'data': data,
-            'summary': f"Subsidiary data with {len(data)} entries"
-        }
+        return self._query_udc_json('subsidiaries_performance.json', "Subsidiary data", query, question_type)
     
-    def _query_udc_qatar_cool_json(self, query: str) -> Dict:
+    def _query_udc_qatar_cool_json(self, query: str, question_type: Optional[str] = None) -> Dict:
         """Query Qatar Cool metrics JSON"""
-        data = self.json_store.get('qatar_cool_metrics', {})
-        
-        return {
-            'type': 'structured_json',
-            'file': 'qatar_cool_metrics.json',
-            'data': data,
-            'summary': f"Qatar Cool data with {len(data)} entries"
-        }
+        return self._query_udc_json('qatar_cool_metrics.json', "Qatar Cool data", query, question_type)
     
-    def _query_udc_market_indicators_json(self, query: str) -> Dict:
+    def _query_udc_market_indicators_json(self, query: str, question_type: Optional[str] = None) -> Dict:
         """Query market indicators JSON"""
-        data = self.json_store.get('market_indicators', {})
-        
-        return {
-            'type': 'structured_json',
-            'file': 'market_indicators.json',
-            'data': data,
-            'summary': f"Market indicators with {len(data)} entries"
-        }
+        return self._query_udc_json('market_indicators.json', "Market indicators", query, question_type)
     
     def _query_chromadb(self, collection_name: str, query: str, n_results: int = 5) -> Dict:
         """Query a ChromaDB collection"""
@@ -5,12 +5,14 @@ Specializes in tourism, hospitality, hotel operations, and visitor economy
 Thinks like an operator who's opened 40+ hotels across GCC
 """
 
-from anthropic import Anthropic
 from typing import Dict, Any, Optional
 import json
 from datetime import datetime
 from pathlib import Path
 from app.agents.expert_embodiment_v2 import DR_FATIMA_EMBODIMENT
+from app.services.llm_clients import llm_clients
+from app.services.prompt_caching import cached_system_blocks, count_tokens, usage_cost_usd, usage_to_dict
+from app.services.udc_data_store import data_store
 
 
 class DrFatimaTourism:
@@ -27,7 +29,7 @@ class DrFatimaTourism:
     
     def __init__(self, anthropic_api_key: str):
         """Initialize Dr. Fatima with API key."""
-        self.client = Anthropic(api_key=anthropic_api_key)
+        self.client = llm_clients.anthropic(api_key=anthropic_api_key)
         self.name = "Dr. Fatima Al-Thani"
         self.role = "Tourism & Hospitality Expert"
         self.model = "claude-sonnet-4-20250514"  # Sonnet 4.5 for expert thinking
@@ -37,7 +39,12 @@ class DrFatimaTourism:
         
         # Load tourism/hospitality data if available
         self.data_dir = Path(__file__).resolve().parent.parent.parent.parent / "data" / "sample_data"
-        self.data = self._load_data()
+        self.store = data_store(self.data_dir)
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Current datasets, served from the shared data store."""
+        return self._load_data()
     
     def _load_data(self) -> Dict[str, Any]:
         """Load tourism and hospitality datasets."""
@@ -49,11 +56,8 @@ class DrFatimaTourism:
         
         for file in data_files:
             try:
-                filepath = self.data_dir / file
-                if filepath.exists():
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        key = file.replace('.json', '')
-                        data[key] = json.load(f)
+                if (self.data_dir / file).exists():
+                    data[file.replace('.json', '')] = self.store.get(file)
             except Exception as e:
                 print(f"Warning: Could not load {file}: {e}")
         
@@ -83,21 +87,23 @@ class DrFatimaTourism:
         if context:
             additional_context = f"\n\n=== Context from Other Experts ===\n{json.dumps(context, indent=2)}"
         
-        # Create message
-        user_message = f"""{self.expert_prompt}
-
-UDC TOURISM/HOSPITALITY CONTEXT:
+        # Embodiment and data are static per instance: cached system prefix
+        system = cached_system_blocks(
+            self.expert_prompt,
+            f"""UDC TOURISM/HOSPITALITY CONTEXT:
 - The Pearl-Qatar: Marina development with retail, dining, residential
 - Potential hotel developments at The Pearl and other locations
 - Qatar positioning as GCC tourism hub (World Cup 2022 legacy)
 - Competition from Dubai, Abu Dhabi for GCC tourists
 
 AVAILABLE DATA:
-{data_context}
-{additional_context}
-
-CEO QUESTION:
+{data_context}"""
+        )
+        
+        # Create message
+        user_message = f"""CEO QUESTION:
 {question}
+{additional_context}
 
 Think out loud. Show your process. Reference your 25 years experience opening hotels.
 Be Fatima - a veteran operator, not a consultant."""
@@ -107,20 +113,17 @@ Be Fatima - a veteran operator, not a consultant."""
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.7,  # Higher temperature for more natural veteran thinking
+                system=system,
                 messages=[{"role": "user", "content": user_message}]
             )
             
             response_text = response.content[0].text
             
-            # Calculate costs
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
+            # Calculate costs (prompt-cache writes/reads priced separately)
+            usage = usage_to_dict(response.usage)
             
             # Claude Sonnet 4.5 pricing: $3/MTok input, $15/MTok output
-            input_cost_usd = (input_tokens / 1_000_000) * 3
-            output_cost_usd = (output_tokens / 1_000_000) * 15
-            total_cost_usd = input_cost_usd + output_cost_usd
+            total_cost_usd = usage_cost_usd(usage, input_price=3, output_price=15)
             total_cost_qar = total_cost_usd * 3.64
             
             return {
@@ -130,11 +133,7 @@ Be Fatima - a veteran operator, not a consultant."""
                 "response": response_text,
                 "model": self.model,
                 "timestamp": datetime.now().isoformat(),
-                "usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens
-                },
+                "usage": {**usage, "total_tokens": count_tokens(usage)},
                 "cost": {
                     "total_cost_usd": round(total_cost_usd, 4),
                     "total_cost_qar": round(total_cost_qar, 2)
@@ -5,12 +5,15 @@ Deep financial analysis and strategic financial advisory for UDC.
 Provides comprehensive financial analysis with specific metrics, ratios, and recommendations.
 """
 
-from anthropic import Anthropic
 from typing import Dict, List, Any, Optional
 import json
 from datetime import datetime
 from pathlib import Path
 from app.agents.expert_embodiment_v2 import DR_JAMES_EMBODIMENT
+from app.services.llm_clients import llm_clients
+from app.services.prompt_caching import cached_system_blocks, count_tokens, usage_cost_usd, usage_to_dict
+from app.services.udc_data_query import StructuredDataIndex
+from app.services.udc_data_store import data_store
 
 
 class DrJamesCFO:
@@ -25,9 +28,17 @@ class DrJamesCFO:
     - Cash flow management
     """
     
+    DATA_FILES = [
+        "financial_summary.json",
+        "property_portfolio.json",
+        "qatar_cool_metrics.json",
+        "market_indicators.json",
+        "subsidiaries_performance.json"
+    ]
+    
     def __init__(self, anthropic_api_key: str):
         """Initialize Dr. James with API key and financial data."""
-        self.client = Anthropic(api_key=anthropic_api_key)
+        self.client = llm_clients.anthropic(api_key=anthropic_api_key)
         self.name = "Dr. James Williams"
         self.role = "Chief Financial Officer"
         self.model = "claude-3-haiku-20240307"  # Using Haiku for cost-effectiveness
@@ -35,49 +46,69 @@ class DrJamesCFO:
         # Expert embodiment - Think like a veteran CFO, not just an analyst
         self.personality = DR_JAMES_EMBODIMENT
         
-        # Load financial data
+        # Financial data, served from the shared data store
         self.data_dir = Path(__file__).resolve().parent.parent.parent.parent / "data" / "sample_data"
-        self.financial_data = self._load_data()
+        self.store = data_store(self.data_dir)
+        self.data_index = StructuredDataIndex(self.store)
+    
+    @property
+    def financial_data(self) -> Dict[str, Any]:
+        """Current financial datasets (re-read when a file changes on disk)."""
+        return self._load_data()
     
     def _load_data(self) -> Dict[str, Any]:
         """Load all financial datasets from JSON files."""
         data = {}
-        data_files = [
-            "financial_summary.json",
-            "property_portfolio.json", 
-            "qatar_cool_metrics.json",
-            "market_indicators.json",
-            "subsidiaries_performance.json"
-        ]
-        
-        for file in data_files:
+        for file in self.DATA_FILES:
             try:
-                filepath = self.data_dir / file
-                if filepath.exists():
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        key = file.replace('.json', '').replace('_', ' ').title()
-                        data[key] = json.load(f)
+                if (self.data_dir / file).exists():
+                    data[self._section_title(file)] = self.store.get(file)
             except Exception as e:
                 print(f"Warning: Could not load {file}: {e}")
         
         return data
     
-    def _prepare_financial_context(self) -> str:
-        """Prepare comprehensive financial context for Claude."""
-        
-        # Format all financial data into a readable context
+    @staticmethod
+    def _section_title(file: str) -> str:
+        """financial_summary.json -> Financial Summary"""
+        return file.replace('.json', '').replace('_', ' ').title()
+    
+    @staticmethod
+    def _format_sections(data: Dict[str, Any]) -> str:
+        """Format titled datasets into a readable context."""
         context_parts = []
         
-        for key, value in self.financial_data.items():
+        for key, value in data.items():
             context_parts.append(f"\n=== {key} ===")
             context_parts.append(json.dumps(value, indent=2))
         
         return "\n".join(context_parts)
     
+    def _prepare_financial_context(self) -> str:
+        """Prepare comprehensive financial context for Claude."""
+        return self._format_sections(self.financial_data)
+    
+    def _select_financial_data(self, question: str, question_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        The periods and metrics of the financial datasets a question is about.
+        
+        Returns:
+            Dict: ``sections`` (title -> projected dataset), ``projected``
+            (False when nothing matched and the sections are the complete
+            datasets) and ``provenance`` (file and path of every field).
+        """
+        selection = self.data_index.query(question, files=self.DATA_FILES, question_type=question_type)
+        return {
+            "sections": {self._section_title(file): value for file, value in selection["data"].items()},
+            "projected": selection["projected"],
+            "provenance": selection["provenance"] if selection["projected"] else []
+        }
+    
     async def analyze_financial_question(
         self, 
         question: str, 
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        question_type: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Analyze a financial question using Claude with UDC financial data.
@@ -85,31 +116,24 @@ class DrJamesCFO:
         Args:
             question: The CEO's financial question
             context: Additional context from other agents or the session
+            question_type: Routed question type ("udc_debt", ...), narrows the data sent
             
         Returns:
             Dict containing analysis, usage metrics, and costs
         """
         
-        # Prepare financial data context
-        financial_context = self._prepare_financial_context()
+        # Only the fields the question is about; every dataset if nothing matched
+        selection = self._select_financial_data(question, question_type)
+        financial_context = self._format_sections(selection["sections"])
         
         # Build additional context if provided
         additional_context = ""
         if context:
             additional_context = f"\n\n=== Additional Context ===\n{json.dumps(context, indent=2)}"
         
-        # Create comprehensive prompt
-        user_message = f"""{self.personality}
-
-The CEO has asked you the following financial question:
-
-"{question}"
-
-Available Financial Data:
-{financial_context}
-{additional_context}
-
-Provide a comprehensive financial analysis that addresses:
+        # Persona and analysis structure are static: cached system prefix. The
+        # complete datasets are too; a per-question slice goes with the question
+        system = cached_system_blocks(self.personality, """For every CEO question, provide a comprehensive financial analysis that addresses:
 
 1. DIRECT ANSWER
    - Answer the question directly with specific numbers
@@ -136,7 +160,17 @@ Provide a comprehensive financial analysis that addresses:
    - Expected financial impact
 
 Format your response professionally with clear sections. Use QAR for all currency values.
-Be direct with the CEO - he values honest, data-backed analysis."""
+Be direct with the CEO - he values honest, data-backed analysis.""", None if selection["projected"] else f"""Available Financial Data:
+{financial_context}""")
+        
+        # Create comprehensive prompt
+        data_context = ""
+        if selection["projected"]:
+            data_context = f"\n\nAvailable Financial Data (the periods and metrics relevant to this question):\n{financial_context}"
+        user_message = f"""The CEO has asked you the following financial question:
+
+"{question}"
+{additional_context}{data_context}"""
 
         try:
             # Call Claude API
@@ -144,6 +178,7 @@ Be direct with the CEO - he values honest, data-backed analysis."""
                 model=self.model,
                 max_tokens=3000,
                 temperature=0.3,  # Lower temperature for more focused financial analysis
+                system=system,
                 messages=[
                     {
                         "role": "user",
@@ -155,15 +190,13 @@ Be direct with the CEO - he values honest, data-backed analysis."""
             # Extract response text
             response_text = response.content[0].text
             
-            # Calculate costs
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
+            # Calculate costs (prompt-cache writes/reads priced separately)
+            usage = usage_to_dict(response.usage)
             
             # Claude 3 Haiku pricing: $0.25/MTok input, $1.25/MTok output
-            input_cost_usd = (input_tokens / 1_000_000) * 0.25
-            output_cost_usd = (output_tokens / 1_000_000) * 1.25
-            total_cost_usd = input_cost_usd + output_cost_usd
+            total_cost_usd = usage_cost_usd(usage, input_price=0.25, output_price=1.25)
+            output_cost_usd = (usage["output_tokens"] / 1_000_000) * 1.25
+            input_cost_usd = total_cost_usd - output_cost_usd
             total_cost_qar = total_cost_usd * 3.64  # USD to QAR conversion
             
             return {
@@ -173,18 +206,15 @@ Be direct with the CEO - he values honest, data-backed analysis."""
                 "response": response_text,
                 "model": self.model,
                 "timestamp": datetime.now().isoformat(),
-                "usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens
-                },
+                "usage": {**usage, "total_tokens": count_tokens(usage)},
                 "cost": {
                     "input_cost_usd": round(input_cost_usd, 4),
                     "output_cost_usd": round(output_cost_usd, 4),
                     "total_cost_usd": round(total_cost_usd, 4),
                     "total_cost_qar": round(total_cost_qar, 2)
                 },
-                "data_sources": list(self.financial_data.keys())
+                "data_sources": list(selection["sections"].keys()),
+                "data_provenance": selection["provenance"]
             }
             
         except Exception as e:
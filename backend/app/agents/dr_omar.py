@@ -5,13 +5,16 @@ The orchestrator agent coordinates the multi-agent debate process.
 For MVP, Dr. Omar provides intelligent responses to CEO questions using available data.
 """
 
-from typing import Any, Dict, Optional
-
-from anthropic import Anthropic
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional
 
 from app.agents.tools import udc_tools
 from app.core.config import settings
 from app.agents.expert_embodiment_v2 import DR_OMAR_EMBODIMENT
+from app.services.llm_clients import llm_clients
+from app.services.llm_governor import estimate_tokens, llm_governor
+from app.services.prompt_caching import cached_system_blocks, count_tokens, usage_cost_usd, usage_to_dict
+from app.services.single_flight import single_flight
 
 
 class DrOmar:
@@ -37,7 +40,10 @@ class DrOmar:
     
     def __init__(self):
         """Initialize Dr. Omar with Claude API access."""
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        self.client = llm_clients.anthropic(api_key=settings.anthropic_api_key)
+        # Async client for the API: requests don't block the worker's event loop.
+        # Its calls go through the LLM governor, which owns retries.
+        self.async_client = llm_clients.async_anthropic(api_key=settings.anthropic_api_key, max_retries=0)
         self.model = settings.anthropic_model_specialist  # Sonnet 4.5
         self.max_tokens = settings.max_tokens_specialist
         self.temperature = settings.llm_temperature
@@ -77,7 +83,108 @@ You have access to:
         # Step 1: Retrieve relevant data
         data_results = udc_tools.search_data(question)
         
-        # Step 2: Construct message with data context
+        # Step 2: Call Claude API
+        try:
+            response = self.client.messages.create(**self._request_params(question, data_results))
+            return self._success_response(question, response, data_results)
+            
+        except Exception as e:
+            return self._error_response(question, e)
+    
+    async def answer_question_async(
+        self,
+        question: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Answer CEO's strategic question without blocking the event loop.
+        
+        Same response as answer_question; used by the API so one worker can
+        serve many chats concurrently. Identical questions asked while one is
+        already being answered share that answer instead of calling Claude
+        again.
+        
+        Args:
+            question: CEO's question.
+            context: Optional additional context.
+            
+        Returns:
+            dict: Response with answer, data used, and token usage.
+        """
+        data_version = f"{udc_tools.data_version()}|{self.model}"
+        return await single_flight.do(
+            "dr_omar", question, data_version, lambda: self._answer_async(question)
+        )
+    
+    async def _answer_async(self, question: str) -> Dict[str, Any]:
+        data_results = await asyncio.to_thread(udc_tools.search_data, question)
+        
+        try:
+            params = self._request_params(question, data_results)
+            response = await llm_governor.call(
+                self.model,
+                lambda: self.async_client.messages.create(**params),
+                tokens=estimate_tokens(params["system"], params["messages"]),
+                agent="dr_omar"
+            )
+            return self._success_response(question, response, data_results)
+            
+        except Exception as e:
+            return self._error_response(question, e)
+    
+    async def stream_answer(
+        self,
+        question: str,
+        context: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Answer CEO's strategic question, yielding text as Claude generates it.
+        
+        Args:
+            question: CEO's question.
+            context: Optional additional context.
+            
+        Yields:
+            {"type": "token", "text": ...} for each text delta, then one
+            {"type": "done", **response} (or {"type": "error", **response})
+            with the same fields answer_question returns.
+        """
+        data_results = await asyncio.to_thread(udc_tools.search_data, question)
+        
+        try:
+            params = self._request_params(question, data_results)
+            final = []
+            async for text in llm_governor.stream(
+                self.model,
+                lambda: self._text_stream(params, final),
+                tokens=estimate_tokens(params["system"], params["messages"]),
+                agent="dr_omar"
+            ):
+                yield {"type": "token", "text": text}
+            
+            yield {"type": "done", **self._success_response(question, final[-1], data_results)}
+            
+        except Exception as e:
+            yield {"type": "error", **self._error_response(question, e)}
+    
+    async def _text_stream(self, params: Dict[str, Any], final: list) -> AsyncIterator[str]:
+        """Yield text deltas, then append the complete message to ``final``."""
+        async with self.async_client.messages.stream(**params) as stream:
+            async for text in stream.text_stream:
+                yield text
+            final.append(await stream.get_final_message())
+    
+    def _request_params(self, question: str, data_results: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Messages API request for a question and its retrieved data.
+        
+        Args:
+            question: CEO's question.
+            data_results: Data retrieved by tools.
+            
+        Returns:
+            dict: Keyword arguments for messages.create / messages.stream.
+        """
         data_context = self._format_data_for_llm(data_results)
         
         user_message = f"""CEO QUESTION: {question}
@@ -87,58 +194,68 @@ RELEVANT DATA AVAILABLE:
 
 Please provide your strategic analysis and recommendation."""
         
-        # Step 3: Call Claude API
-        try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-                system=self.system_prompt,
-                messages=[{
-                    "role": "user",
-                    "content": user_message
-                }]
-            )
-            
-            # Extract response
-            answer_text = response.content[0].text
-            
-            # Calculate tokens and cost
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
-            
-            # Estimated cost (approximate rates for Claude)
-            # Sonnet 4.5: $3/1M input, $15/1M output (USD)
-            # Convert to QAR (1 USD ≈ 3.64 QAR)
-            cost_qar = (
-                (input_tokens / 1_000_000 * 3 * 3.64) +
-                (output_tokens / 1_000_000 * 15 * 3.64)
-            )
-            
-            return {
-                "status": "success",
-                "question": question,
-                "answer": answer_text,
-                "agent": "Dr. Omar Habib",
-                "role": "Orchestrator",
-                "data_sources_used": data_results.get("results_found", 0),
-                "token_usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens,
-                    "estimated_cost_qar": round(cost_qar, 2)
-                },
-                "model": self.model
-            }
+        return {
+            "model": self.model,
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            "system": cached_system_blocks(self.system_prompt),
+            "messages": [{
+                "role": "user",
+                "content": user_message
+            }]
+        }
+    
+    def _success_response(
+        self,
+        question: str,
+        response: Any,
+        data_results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Package a Claude response with token usage and cost.
+        
+        Args:
+            question: CEO's question.
+            response: Messages API response.
+            data_results: Data retrieved by tools.
             
-        except Exception as e:
-            return {
-                "status": "error",
-                "question": question,
-                "error": str(e),
-                "agent": "Dr. Omar Habib"
-            }
+        Returns:
+            dict: Successful answer payload.
+        """
+        # Extract response
+        answer_text = response.content[0].text
+        
+        # Calculate tokens and cost (prompt-cache writes/reads priced separately)
+        usage = usage_to_dict(response.usage)
+        
+        # Estimated cost (approximate rates for Claude)
+        # Sonnet 4.5: $3/1M input, $15/1M output (USD)
+        # Convert to QAR (1 USD ≈ 3.64 QAR)
+        cost_qar = usage_cost_usd(usage, input_price=3, output_price=15) * 3.64
+        
+        return {
+            "status": "success",
+            "question": question,
+            "answer": answer_text,
+            "agent": "Dr. Omar Habib",
+            "role": "Orchestrator",
+            "data_sources_used": data_results.get("results_found", 0),
+            "token_usage": {
+                **usage,
+                "total_tokens": count_tokens(usage),
+                "estimated_cost_qar": round(cost_qar, 2)
+            },
+            "model": self.model
+        }
+    
+    def _error_response(self, question: str, error: Exception) -> Dict[str, Any]:
+        """Error payload for a failed Claude call."""
+        return {
+            "status": "error",
+            "question": question,
+            "error": str(error),
+            "agent": "Dr. Omar Habib"
+        }
     
     def _format_data_for_llm(self, data_results: Dict[str, Any]) -> str:
         """
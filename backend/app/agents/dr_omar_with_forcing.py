@@ -4,11 +4,16 @@ Shows how to use real-time forcing functions to guarantee veteran thinking
 """
 
 from typing import Any, Dict, Optional
-from anthropic import Anthropic
 from app.agents.tools import udc_tools
 from app.core.config import settings
 from app.agents.expert_embodiment_v2 import DR_OMAR_EMBODIMENT
-from app.agents.forcing_functions import force_expert_thinking, validate_expert_response
+from app.agents.forcing_functions import (
+    EXPERT_THINKING_INSTRUCTIONS,
+    expert_query_prompt,
+    validate_expert_response,
+)
+from app.services.llm_clients import llm_clients
+from app.services.prompt_caching import cached_system_blocks, count_tokens, usage_cost_usd, usage_to_dict
 
 
 class DrOmarWithForcing:
@@ -19,7 +24,7 @@ class DrOmarWithForcing:
     
     def __init__(self):
         """Initialize Dr. Omar with forcing functions enabled."""
-        self.client = Anthropic(api_key=settings.anthropic_api_key)
+        self.client = llm_clients.anthropic(api_key=settings.anthropic_api_key)
         self.model = settings.anthropic_model_specialist  # Sonnet 4.5
         self.max_tokens = settings.max_tokens_specialist
         self.temperature = 0.7  # Higher for more natural veteran thinking
@@ -49,20 +54,12 @@ class DrOmarWithForcing:
         data_context = self._format_data_for_llm(data_results)
         
         # Step 2: Apply forcing functions to prompt
-        # This wraps the base embodiment with real-time forcing instructions
-        forced_prompt = force_expert_thinking(
-            base_prompt=self.base_prompt,
-            query=question,
-            context=data_context
-        )
+        # The base embodiment and the real-time forcing instructions are
+        # static, so they are sent as a cached system prefix
+        system = cached_system_blocks(self.base_prompt, EXPERT_THINKING_INSTRUCTIONS)
         
-        # Step 3: Build user message (minimal - forcing is in system prompt)
-        user_message = f"""CEO QUESTION: {question}
-
-AVAILABLE DATA:
-{data_context}
-
-[Think out loud as instructed above]"""
+        # Step 3: Build user message (question and data only)
+        user_message = expert_query_prompt(question, data_context)
         
         # Step 4: Call Claude API with forced prompt
         try:
@@ -70,7 +67,7 @@ AVAILABLE DATA:
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=self.temperature,
-                system=forced_prompt,  # Forcing functions applied here
+                system=system,  # Forcing functions applied here
                 messages=[{
                     "role": "user",
                     "content": user_message
@@ -80,16 +77,11 @@ AVAILABLE DATA:
             # Extract response
             answer_text = response.content[0].text
             
-            # Calculate tokens and cost
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
+            # Calculate tokens and cost (prompt-cache writes/reads priced separately)
+            usage = usage_to_dict(response.usage)
             
             # Cost calculation (Sonnet 4.5: $3/1M input, $15/1M output)
-            cost_qar = (
-                (input_tokens / 1_000_000 * 3 * 3.64) +
-                (output_tokens / 1_000_000 * 15 * 3.64)
-            )
+            cost_qar = usage_cost_usd(usage, input_price=3, output_price=15) * 3.64
             
             result = {
                 "status": "success",
@@ -100,9 +92,8 @@ AVAILABLE DATA:
                 "forcing_applied": True,
                 "data_sources_used": data_results.get("results_found", 0),
                 "token_usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens,
+                    **usage,
+                    "total_tokens": count_tokens(usage),
                     "estimated_cost_qar": round(cost_qar, 2)
                 },
                 "model": self.model
@@ -5,12 +5,14 @@ Specializes in infrastructure, engineering, district cooling, smart city technol
 Thinks like an engineer who's built actual Qatar infrastructure
 """
 
-from anthropic import Anthropic
 from typing import Dict, Any, Optional
 import json
 from datetime import datetime
 from pathlib import Path
 from app.agents.expert_embodiment_v2 import DR_SARAH_EMBODIMENT
+from app.services.llm_clients import llm_clients
+from app.services.prompt_caching import cached_system_blocks, count_tokens, usage_cost_usd, usage_to_dict
+from app.services.udc_data_store import data_store
 
 
 class DrSarahInfrastructure:
@@ -27,7 +29,7 @@ class DrSarahInfrastructure:
     
     def __init__(self, anthropic_api_key: str):
         """Initialize Dr. Sarah with API key."""
-        self.client = Anthropic(api_key=anthropic_api_key)
+        self.client = llm_clients.anthropic(api_key=anthropic_api_key)
         self.name = "Dr. Sarah Al-Kuwari"
         self.role = "Infrastructure Engineer"
         self.model = "claude-sonnet-4-20250514"  # Sonnet 4.5 for expert thinking
@@ -37,7 +39,12 @@ class DrSarahInfrastructure:
         
         # Load infrastructure data if available
         self.data_dir = Path(__file__).resolve().parent.parent.parent.parent / "data" / "sample_data"
-        self.data = self._load_data()
+        self.store = data_store(self.data_dir)
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        """Current datasets, served from the shared data store."""
+        return self._load_data()
     
     def _load_data(self) -> Dict[str, Any]:
         """Load infrastructure and utilities datasets."""
@@ -49,11 +56,8 @@ class DrSarahInfrastructure:
         
         for file in data_files:
             try:
-                filepath = self.data_dir / file
-                if filepath.exists():
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        key = file.replace('.json', '')
-                        data[key] = json.load(f)
+                if (self.data_dir / file).exists():
+                    data[file.replace('.json', '')] = self.store.get(file)
             except Exception as e:
                 print(f"Warning: Could not load {file}: {e}")
         
@@ -83,10 +87,10 @@ class DrSarahInfrastructure:
         if context:
             additional_context = f"\n\n=== Context from Other Experts ===\n{json.dumps(context, indent=2)}"
         
-        # Create message
-        user_message = f"""{self.expert_prompt}
-
-UDC INFRASTRUCTURE CONTEXT:
+        # Embodiment and data are static per instance: cached system prefix
+        system = cached_system_blocks(
+            self.expert_prompt,
+            f"""UDC INFRASTRUCTURE CONTEXT:
 - Qatar Cool: District cooling utility serving The Pearl and other developments
 - The Pearl infrastructure: Fully built out, operational
 - Gewan Island: New development, infrastructure being planned/built
@@ -94,11 +98,13 @@ UDC INFRASTRUCTURE CONTEXT:
 - Constraints: Water, power, cooling demands in Qatar climate
 
 AVAILABLE DATA:
-{data_context}
-{additional_context}
-
-CEO QUESTION:
+{data_context}"""
+        )
+        
+        # Create message
+        user_message = f"""CEO QUESTION:
 {question}
+{additional_context}
 
 Think out loud. Show your engineering calculations. Reference what actually works vs PowerPoint dreams.
 Be Sarah - a veteran engineer who's built real infrastructure, not a consultant."""
@@ -108,20 +114,17 @@ Be Sarah - a veteran engineer who's built real infrastructure, not a consultant.
                 model=self.model,
                 max_tokens=4000,
                 temperature=0.7,  # Higher temperature for more natural veteran thinking
+                system=system,
                 messages=[{"role": "user", "content": user_message}]
             )
             
             response_text = response.content[0].text
             
-            # Calculate costs
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
+            # Calculate costs (prompt-cache writes/reads priced separately)
+            usage = usage_to_dict(response.usage)
             
             # Claude Sonnet 4.5 pricing: $3/MTok input, $15/MTok output
-            input_cost_usd = (input_tokens / 1_000_000) * 3
-            output_cost_usd = (output_tokens / 1_000_000) * 15
-            total_cost_usd = input_cost_usd + output_cost_usd
+            total_cost_usd = usage_cost_usd(usage, input_price=3, output_price=15)
             total_cost_qar = total_cost_usd * 3.64
             
             return {
@@ -131,11 +134,7 @@ Be Sarah - a veteran engineer who's built real infrastructure, not a consultant.
                 "response": response_text,
                 "model": self.model,
                 "timestamp": datetime.now().isoformat(),
-                "usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens
-                },
+                "usage": {**usage, "total_tokens": count_tokens(usage)},
                 "cost": {
                     "total_cost_usd": round(total_cost_usd, 4),
                     "total_cost_qar": round(total_cost_qar, 2)
@@ -14,43 +14,23 @@ These functions ensure that agent responses demonstrate:
 5. Specific recommendations (not generic)
 """
 
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import re
 
+from ..services.numeric_scanner import numeric_signals
+
 
 # ═══════════════════════════════════════════════════════════
 # PART 1: PROMPT ENHANCERS (Real-time forcing during generation)
 # ═══════════════════════════════════════════════════════════
 
-def force_expert_thinking(base_prompt: str, query: str, context: str) -> str:
-    """
-    Wrap expert prompt with forcing functions that ensure veteran thinking
-    
-    This is applied BEFORE sending to the LLM to force veteran behavior
-    during generation, not just validate after.
-    
-    Args:
-        base_prompt: The expert embodiment prompt
-        query: The CEO's question
-        context: Available data context
-        
-    Returns:
-        Enhanced prompt that forces veteran thinking patterns
-    """
-    
-    forcing_prompt = f"""
-{base_prompt}
-
+# Static forcing instructions. They never contain query-specific text, so
+# together with the embodiment prompt they form a stable, cacheable prefix.
+EXPERT_THINKING_INSTRUCTIONS = """═══════════════════════════════════════════════════════════
+CRITICAL INSTRUCTIONS FOR EVERY CEO QUESTION
 ═══════════════════════════════════════════════════════════
-CRITICAL INSTRUCTIONS FOR THIS SPECIFIC QUERY
-═══════════════════════════════════════════════════════════
-
-The CEO just asked you: "{query}"
-
-You have access to this data:
-{context[:2000]}... [more data available]
 
-NOW - THINK OUT LOUD. SHOW YOUR PROCESS.
+ALWAYS THINK OUT LOUD. SHOW YOUR PROCESS.
 
 You must:
 
@@ -120,54 +100,13 @@ leave, pricing pressure follows 6 months later.
 My call: Don't touch luxury. Go mid-market. Here's why..."
 
 ═══════════════════════════════════════════════════════════
-
-NOW: Answer the CEO's question using the CORRECT style.
-
-Think out loud. Show your process. Be the veteran you are.
-
-GO:
 """
-    
-    return forcing_prompt
-
-
-def force_orchestrator_synthesis(
-    base_prompt: str, 
-    query: str, 
-    agent_analyses: List[Dict[str, Any]]
-) -> str:
-    """
-    Force orchestrator to see cross-domain patterns specialists miss
-    
-    Applied before orchestrator synthesis to ensure cross-domain thinking.
-    
-    Args:
-        base_prompt: The master orchestrator embodiment prompt
-        query: The CEO's original question
-        agent_analyses: List of expert analyses to synthesize
-        
-    Returns:
-        Enhanced prompt that forces cross-domain synthesis
-    """
-    
-    # Format agent analyses
-    analyses_text = ""
-    for analysis in agent_analyses:
-        analyses_text += f"\n--- {analysis.get('agent', 'Expert')} ({analysis.get('role', 'Specialist')}) ---\n"
-        analyses_text += f"{analysis.get('response', analysis.get('answer', ''))[:1000]}...\n"
-    
-    forcing_prompt = f"""
-{base_prompt}
 
-═══════════════════════════════════════════════════════════
+ORCHESTRATOR_SYNTHESIS_INSTRUCTIONS = """═══════════════════════════════════════════════════════════
 CRITICAL: YOUR JOB IS TO SEE WHAT SPECIALISTS MISSED
 ═══════════════════════════════════════════════════════════
 
-CEO asked: "{query}"
-
-The domain experts gave their analyses. Here they are:
-
-{analyses_text}
+The domain experts give you their analyses with each CEO question.
 
 YOUR JOB: Find the pattern they're all missing.
 
@@ -242,14 +181,107 @@ Prove concept. Then Pearl Phase 2.
 That's the play."
 
 ═══════════════════════════════════════════════════════════
+"""
+
+
+def expert_query_prompt(query: str, context: str) -> str:
+    """
+    Query-specific part of the expert forcing prompt
+    
+    Goes in the user message, after the cached embodiment and
+    EXPERT_THINKING_INSTRUCTIONS.
+    """
+    return f"""The CEO just asked you: "{query}"
 
-NOW: Synthesize like this. Find what they missed. Show the pattern.
+You have access to this data:
+{context[:2000]}... [more data available]
+
+NOW: Answer the CEO's question using the CORRECT style.
+
+Think out loud. Show your process. Be the veteran you are.
+
+GO:
+"""
+
+
+def orchestrator_query_prompt(query: str, analyses_text: str) -> str:
+    """
+    Query-specific part of the orchestrator forcing prompt
+    
+    Goes in the user message, after the cached orchestrator embodiment and
+    ORCHESTRATOR_SYNTHESIS_INSTRUCTIONS.
+    """
+    return f"""CEO asked: "{query}"
+
+The domain experts gave their analyses. Here they are:
+
+{analyses_text}
+
+NOW: Synthesize like the example. Find what they missed. Show the pattern.
 Provide definitive strategic guidance.
 
 GO:
 """
+
+
+def force_expert_thinking(base_prompt: str, query: str, context: str) -> str:
+    """
+    Wrap expert prompt with forcing functions that ensure veteran thinking
     
-    return forcing_prompt
+    This is applied BEFORE sending to the LLM to force veteran behavior
+    during generation, not just validate after. Callers that can send a
+    separate system prompt should send base_prompt and
+    EXPERT_THINKING_INSTRUCTIONS as cached system blocks and only
+    expert_query_prompt() per request.
+    
+    Args:
+        base_prompt: The expert embodiment prompt
+        query: The CEO's question
+        context: Available data context
+        
+    Returns:
+        Enhanced prompt that forces veteran thinking patterns
+    """
+    return f"""
+{base_prompt}
+
+{EXPERT_THINKING_INSTRUCTIONS}
+{expert_query_prompt(query, context)}"""
+
+
+def format_analyses_for_orchestrator(agent_analyses: List[Dict[str, Any]]) -> str:
+    """Excerpt each expert analysis for the orchestrator prompt"""
+    analyses_text = ""
+    for analysis in agent_analyses:
+        analyses_text += f"\n--- {analysis.get('agent', 'Expert')} ({analysis.get('role', 'Specialist')}) ---\n"
+        analyses_text += f"{analysis.get('response', analysis.get('answer', ''))[:1000]}...\n"
+    return analyses_text
+
+
+def force_orchestrator_synthesis(
+    base_prompt: str, 
+    query: str, 
+    agent_analyses: List[Dict[str, Any]]
+) -> str:
+    """
+    Force orchestrator to see cross-domain patterns specialists miss
+    
+    Applied before orchestrator synthesis to ensure cross-domain thinking.
+    
+    Args:
+        base_prompt: The master orchestrator embodiment prompt
+        query: The CEO's original question
+        agent_analyses: List of expert analyses to synthesize
+        
+    Returns:
+        Enhanced prompt that forces cross-domain synthesis
+    """
+    analyses_text = format_analyses_for_orchestrator(agent_analyses)
+    return f"""
+{base_prompt}
+
+{ORCHESTRATOR_SYNTHESIS_INSTRUCTIONS}
+{orchestrator_query_prompt(query, analyses_text)}"""
 
 
 # ═══════════════════════════════════════════════════════════
@@ -265,11 +297,6 @@ class ExpertBehaviorValidator:
     
     # Patterns that indicate expert-level thinking
     EXPERT_PATTERNS = {
-        'mental_math': [
-            r'\d+\s*[×x]\s*\d+\s*=',  # Mental calculations
-            r'QAR\s+[\d,]+M?\s+[×x÷/]\s+',  # QAR calculations
-            r'\d+%\s+of\s+QAR'  # Percentage calculations
-        ],
         'pattern_recognition': [
             r'I\'?ve seen this before',
             r'reminds me of',
@@ -288,9 +315,7 @@ class ExpertBehaviorValidator:
         'self_challenge': [
             r'what if I\'?m wrong',
             r'let me challenge',
-            r'but wait',
-            r'scenario \d+:',
-            r'probability:?\s*\d+'
+            r'but wait'
         ],
         'cross_domain': [
             r'but.*says',  # Connecting different data points
@@ -299,7 +324,6 @@ class ExpertBehaviorValidator:
             r'that tells me'
         ],
         'quantified_risk': [
-            r'probability:?\s*\d+[-–]?\d*%',
             r'expected value',
             r'worst case.*\d+%',
             r'IRR.*\d+[-–]?\d*%'
@@ -314,6 +338,13 @@ class ExpertBehaviorValidator:
         ]
     }
     
+    # Numeric signals read from one scanner pass (see numeric_signals)
+    SCANNED_PATTERNS = {
+        'mental_math': ('equations', 'qar_calculations', 'shares'),  # "120 × 4 =", "QAR 50M ÷", "15% of QAR"
+        'self_challenge': ('scenario_headers', 'probabilities'),     # "Scenario 2:", "probability: 30"
+        'quantified_risk': ('risk_probabilities',)                   # "probability 30-40%"
+    }
+    
     # Anti-patterns (generic consulting speak to AVOID)
     ANTI_PATTERNS = {
         'consulting_speak': [
@@ -339,13 +370,19 @@ class ExpertBehaviorValidator:
         ]
     }
     
-    def validate_expert_thinking(self, response: str, agent_role: str) -> Dict[str, Any]:
+    def validate_expert_thinking(
+        self,
+        response: str,
+        agent_role: str,
+        signals: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, Any]:
         """
         Validate that response demonstrates expert-level thinking
         
         Args:
             response: Agent response text
             agent_role: Role of agent (e.g., "Real Estate", "CFO")
+            signals: numeric_signals(response), if already computed
             
         Returns:
             Dict with validation results and scores
@@ -359,13 +396,17 @@ class ExpertBehaviorValidator:
             'recommendations': []
         }
         
+        signals = signals if signals is not None else numeric_signals(response)
+        
         # Count expert patterns
         expert_count = 0
-        for category, patterns in self.EXPERT_PATTERNS.items():
+        for category in {**self.EXPERT_PATTERNS, **self.SCANNED_PATTERNS}:
             matches = []
-            for pattern in patterns:
+            for pattern in self.EXPERT_PATTERNS.get(category, []):
                 found = re.findall(pattern, response, re.IGNORECASE)
                 matches.extend(found)
+            for signal in self.SCANNED_PATTERNS.get(category, ()):
+                matches.extend(signals[signal])
             
             if matches:
                 expert_count += len(matches)
@@ -436,11 +477,16 @@ class ExpertBehaviorValidator:
         
         return results
     
-    def validate_thinking_process(self, response: str) -> Dict[str, bool]:
+    def validate_thinking_process(
+        self,
+        response: str,
+        signals: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, bool]:
         """
         Validate that response shows explicit thinking process
         (not just conclusions)
         """
+        signals = signals if signals is not None else numeric_signals(response)
         checks = {
             'shows_iterative_search': False,
             'shows_data_interpretation': False,
@@ -477,16 +523,24 @@ class ExpertBehaviorValidator:
             checks['shows_mental_model'] = True
         
         # Check for scenario thinking
-        if re.search(r'scenario \d+:|base case|downside|worst case', response, re.IGNORECASE):
+        if signals['scenario_headers'] or any(
+            re.match(r'base case|downside|worst case', marker, re.IGNORECASE)
+            for marker in signals['scenarios']
+        ):
             checks['shows_scenario_thinking'] = True
         
         return checks
     
-    def validate_recommendation_quality(self, response: str) -> Dict[str, Any]:
+    def validate_recommendation_quality(
+        self,
+        response: str,
+        signals: Optional[Dict[str, List[str]]] = None
+    ) -> Dict[str, Any]:
         """
         Validate that recommendations are specific and actionable
         (not generic)
         """
+        signals = signals if signals is not None else numeric_signals(response)
         quality = {
             'has_clear_recommendation': False,
             'is_quantified': False,
@@ -506,13 +560,8 @@ class ExpertBehaviorValidator:
             quality['has_clear_recommendation'] = True
             quality['score'] += 25
         
-        # Check for quantification
-        quant_patterns = [
-            r'QAR \d+[.,]?\d*[BMK]',
-            r'\d+%\s+(?:IRR|margin|return)',
-            r'\d+[-–]\d+\s+months'
-        ]
-        if any(re.search(p, response, re.IGNORECASE) for p in quant_patterns):
+        # Check for quantification ("QAR 500M", "18% IRR", "12-18 months")
+        if signals['qar_amounts'] or signals['rates'] or re.search(r'\d+[-–]\d+\s+months', response):
             quality['is_quantified'] = True
             quality['score'] += 25
         
@@ -540,10 +589,9 @@ class ExpertBehaviorValidator:
         seq_patterns = [
             r'phase \d+',
             r'first.*then.*finally',
-            r'step \d+:',
-            r'Q[1-4] \d{4}'
+            r'step \d+:'
         ]
-        if any(re.search(p, response, re.IGNORECASE) for p in seq_patterns):
+        if signals['quarters'] or any(re.search(p, response, re.IGNORECASE) for p in seq_patterns):
             quality['has_sequencing'] = True
             quality['score'] += 10
         
@@ -572,17 +620,20 @@ def validate_expert_response(
     Returns:
         Dict with comprehensive validation results
     """
+    # One scanner pass shared by all three validators
+    signals = numeric_signals(response)
+    
     results = {
         'agent_role': agent_role,
-        'expert_validation': expert_validator.validate_expert_thinking(response, agent_role),
+        'expert_validation': expert_validator.validate_expert_thinking(response, agent_role, signals),
         'overall_grade': 'PENDING'
     }
     
     if include_thinking_check:
-        results['thinking_validation'] = expert_validator.validate_thinking_process(response)
+        results['thinking_validation'] = expert_validator.validate_thinking_process(response, signals)
     
     if include_recommendation_check:
-        results['recommendation_validation'] = expert_validator.validate_recommendation_quality(response)
+        results['recommendation_validation'] = expert_validator.validate_recommendation_quality(response, signals)
     
     # Calculate overall grade
     expert_score = results['expert_validation']['score']
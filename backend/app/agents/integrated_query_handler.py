@@ -15,6 +15,7 @@ from backend.app.ontology.intelligent_router import IntelligentQueryRouter
 from backend.app.agents.data_retrieval_layer import DataRetrievalExecutor
 from backend.app.agents.answer_synthesizer import AnswerSynthesizer
 from backend.app.agents.crewai_base import DrOmarOrchestrator
+from ..services.single_flight import single_flight
 
 
 class CEOResponseSynthesizer:
@@ -492,6 +493,9 @@ class IntegratedCEOQueryHandler:
         """
         End-to-end query handling
         
+        Identical queries arriving while one is being processed await that
+        run and receive its response instead of starting their own.
+        
         Returns:
             Dict with:
                 - query: Original question
@@ -502,7 +506,17 @@ class IntegratedCEOQueryHandler:
                 - routing_decision: Question type identified
                 - data_sources_used: Sources queried
         """
-        
+        return await single_flight.do(
+            "integrated_query", query, self._pipeline_mode(), lambda: self._handle_ceo_query(query)
+        )
+    
+    def _pipeline_mode(self) -> str:
+        """Synthesis mode; responses are only shared between handlers in the same mode"""
+        if self.use_crewai:
+            return "crewai"
+        return "llm" if self.llm_synthesizer else "template"
+    
+    async def _handle_ceo_query(self, query: str) -> Dict:
         start_time = time.time()
         
         # If CrewAI enabled, use multi-agent system
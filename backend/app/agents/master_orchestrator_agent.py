@@ -4,11 +4,12 @@ Cross-domain synthesis and strategic sequencing
 Sees patterns across specialist experts that they individually miss
 """
 
-from anthropic import Anthropic
 from typing import Dict, List, Any, Optional
 import json
 from datetime import datetime
 from app.agents.expert_embodiment_v2 import MASTER_ORCHESTRATOR_EMBODIMENT
+from app.services.llm_clients import llm_clients
+from app.services.prompt_caching import cached_system_blocks, count_tokens, usage_cost_usd, usage_to_dict
 
 
 class MasterOrchestrator:
@@ -20,7 +21,7 @@ class MasterOrchestrator:
     
     def __init__(self, anthropic_api_key: str):
         """Initialize Master Orchestrator."""
-        self.client = Anthropic(api_key=anthropic_api_key)
+        self.client = llm_clients.anthropic(api_key=anthropic_api_key)
         self.name = "Master Strategist"
         self.role = "CEO Strategic Advisor"
         self.model = "claude-opus-4-20250514"  # Opus for synthesis
@@ -57,16 +58,8 @@ class MasterOrchestrator:
         if context:
             additional_context = f"\n\n=== Additional Context ===\n{json.dumps(context, indent=2)}"
         
-        # Create synthesis prompt
-        user_message = f"""{self.expert_prompt}
-
-ORIGINAL CEO QUESTION:
-{question}
-
-{expert_context}
-{additional_context}
-
-Now synthesize these expert analyses:
+        # Embodiment and synthesis steps are static: cached system prefix
+        system = cached_system_blocks(self.expert_prompt, """With each CEO question you receive the specialist expert analyses. Synthesize them:
 
 1. CONNECT THE DOTS
    What patterns emerge when you listen ACROSS the experts?
@@ -88,27 +81,33 @@ Now synthesize these expert analyses:
    Give phased plan with go/no-go gates, timing, and risk mitigation.
 
 Think like a CEO who's made $20B in decisions. See what the specialists can't see.
-"""
+""")
+        
+        # Create synthesis prompt
+        user_message = f"""ORIGINAL CEO QUESTION:
+{question}
+
+{expert_context}
+{additional_context}
+
+Now synthesize these expert analyses."""
 
         try:
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=5000,
                 temperature=0.8,  # Higher temperature for creative synthesis
+                system=system,
                 messages=[{"role": "user", "content": user_message}]
             )
             
             response_text = response.content[0].text
             
-            # Calculate costs
-            input_tokens = response.usage.input_tokens
-            output_tokens = response.usage.output_tokens
-            total_tokens = input_tokens + output_tokens
+            # Calculate costs (prompt-cache writes/reads priced separately)
+            usage = usage_to_dict(response.usage)
             
             # Claude Opus 4 pricing: $15/MTok input, $75/MTok output
-            input_cost_usd = (input_tokens / 1_000_000) * 15
-            output_cost_usd = (output_tokens / 1_000_000) * 75
-            total_cost_usd = input_cost_usd + output_cost_usd
+            total_cost_usd = usage_cost_usd(usage, input_price=15, output_price=75)
             total_cost_qar = total_cost_usd * 3.64
             
             return {
@@ -119,11 +118,7 @@ Think like a CEO who's made $20B in decisions. See what the specialists can't se
                 "model": self.model,
                 "timestamp": datetime.now().isoformat(),
                 "experts_synthesized": len(expert_responses),
-                "usage": {
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "total_tokens": total_tokens
-                },
+                "usage": {**usage, "total_tokens": count_tokens(usage)},
                 "cost": {
                     "total_cost_usd": round(total_cost_usd, 4),
                     "total_cost_qar": round(total_cost_qar, 2)
@@ -12,6 +12,8 @@ This system provides dynamic monitoring and reinforcement:
 from typing import Dict, List, Any, Optional
 import re
 
+from ..services.numeric_scanner import numeric_signals
+
 
 class ExpertBehaviorReinforcer:
     """
@@ -74,8 +76,14 @@ class ExpertBehaviorReinforcer:
         green_flags_found = [flag for flag in self.expert_green_flags 
                             if flag in response_lower]
         
+        # Numeric signals (calculations, "= QAR", rates, scenarios) from one scanner pass
+        signals = numeric_signals(response)
+        
         # Check for mental math
-        has_math = bool(re.search(r'\d+\s*[×x]\s*\d+|=\s*QAR|IRR|NPV|\d+%\s*(?:return|margin|IRR)', response))
+        has_math = bool(
+            signals['calculations'] or signals['results'] or signals['rates']
+            or re.search(r'IRR|NPV', response)
+        )
         
         # Check for historical references
         has_history = bool(re.search(r'20\d{2}|Dubai|Abu Dhabi|Saudi|Qatar|2008|crisis|boom|cycle', response, re.IGNORECASE))
@@ -85,8 +93,7 @@ class ExpertBehaviorReinforcer:
                                      response_lower))
         
         # Check for scenarios/self-challenge
-        has_scenarios = bool(re.search(r'scenario \d+|what if|probability|downside|worst case', 
-                                      response_lower))
+        has_scenarios = bool(signals['scenarios'])
         
         # Calculate score
         score = (
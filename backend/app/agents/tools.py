@@ -5,11 +5,11 @@ Tools are functions that agents can call to access UDC data, perform calculation
 or interact with external systems.
 """
 
-import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from app.core.config import settings
+from app.services.udc_data_store import data_store
 
 
 class UDCDataTools:
@@ -34,28 +34,24 @@ class UDCDataTools:
             self.data_dir = project_root / "data" / "sample_data"
         else:
             self.data_dir = Path(data_dir)
+        # Parsed files are shared with every other reader of this directory
+        self.store = data_store(self.data_dir)
     
     def _load_json_data(self, filename: str) -> Dict[str, Any]:
         """
-        Load JSON data file.
+        Load JSON data file (parsed once, re-read when the file changes).
         
         Args:
             filename: Name of JSON file to load.
             
         Returns:
-            dict: Parsed JSON data.
+            dict: Read-only view of the parsed JSON data.
             
         Raises:
             FileNotFoundError: If file doesn't exist.
             json.JSONDecodeError: If file is not valid JSON.
         """
-        filepath = self.data_dir / filename
-        
-        if not filepath.exists():
-            raise FileNotFoundError(f"Data file not found: {filepath}")
-        
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return self.store.get(filename)
     
     def get_financial_summary(self, period: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -178,6 +174,15 @@ class UDCDataTools:
         """
         return self._load_json_data("subsidiaries_performance.json")
     
+    def data_version(self) -> str:
+        """
+        Version of the UDC data files, used to key shared answers.
+        
+        Returns:
+            str: Changes whenever a JSON file is added, removed or modified.
+        """
+        return self.store.data_version()
+    
     def search_data(self, query: str) -> Dict[str, Any]:
         """
         Search across all UDC data for relevant information.
@@ -7,10 +7,11 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
-from anthropic import Anthropic
 from typing import Dict, Any
 import re
 
+from ..services.llm_clients import llm_clients
+
 try:
     from backend.app.core.config import settings
     HAS_SETTINGS = True
@@ -28,14 +29,14 @@ class TruthfulCouncil:
     def __init__(self):
         """Initialize verifier agent"""
         if HAS_SETTINGS and settings:
-            self.client = Anthropic(api_key=settings.anthropic_api_key)
+            self.client = llm_clients.anthropic(api_key=settings.anthropic_api_key)
             self.model = settings.anthropic_model_specialist
             self.max_tokens = 2000
         else:
             # Fallback to environment
             api_key = os.getenv('ANTHROPIC_API_KEY')
             if api_key:
-                self.client = Anthropic(api_key=api_key)
+                self.client = llm_clients.anthropic(api_key=api_key)
                 self.model = "claude-sonnet-4-20250514"
                 self.max_tokens = 2000
             else:
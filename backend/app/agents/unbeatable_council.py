@@ -10,25 +10,33 @@ This is the complete integration of all 4 layers:
 4. Reinforcement System (dynamic monitoring)
 """
 
-from anthropic import Anthropic
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 import asyncio
 import logging
 from datetime import datetime
 
-from backend.app.agents.expert_embodiment_v2 import (
+from .expert_embodiment_v2 import (
     DR_OMAR_EMBODIMENT,
     DR_FATIMA_EMBODIMENT,
     DR_JAMES_EMBODIMENT,
     DR_SARAH_EMBODIMENT,
     MASTER_ORCHESTRATOR_EMBODIMENT
 )
-from backend.app.agents.forcing_functions import (
-    force_expert_thinking,
-    force_orchestrator_synthesis,
+from .forcing_functions import (
+    EXPERT_THINKING_INSTRUCTIONS,
+    ORCHESTRATOR_SYNTHESIS_INSTRUCTIONS,
     validate_expert_response
 )
-from backend.app.agents.reinforcement_system import (
+from ..services.answer_cache import answer_cache, content_version
+from ..services.llm_clients import llm_clients
+from ..services.llm_governor import estimate_tokens, llm_governor
+from ..services.prompt_caching import (
+    add_usage,
+    cached_system_blocks,
+    count_tokens,
+    usage_cost_usd
+)
+from .reinforcement_system import (
     ExpertBehaviorReinforcer,
     ConversationReinforcer,
     MultiAgentCoherence
@@ -56,7 +64,9 @@ class UnbeatableStrategicCouncil:
         self,
         anthropic_api_key: str,
         enable_reinforcement: bool = True,
-        enable_validation: bool = True
+        enable_validation: bool = True,
+        enable_answer_cache: bool = True,
+        max_concurrent_experts: int = 4
     ):
         """
         Initialize the Unbeatable Strategic Council
@@ -65,16 +75,21 @@ class UnbeatableStrategicCouncil:
             anthropic_api_key: Anthropic API key
             enable_reinforcement: Enable dynamic reinforcement (recommended)
             enable_validation: Enable quality validation (recommended)
+            enable_answer_cache: Serve repeated questions from the final-answer cache
+            max_concurrent_experts: Upper bound on expert LLM calls in flight at once
         """
-        # Initialize Anthropic client
-        self.anthropic = Anthropic(
+        # Async client: expert calls overlap instead of blocking the event loop
+        self.anthropic = llm_clients.async_anthropic(
             api_key=anthropic_api_key,
-            timeout=600.0  # 10 minutes for deep thinking
+            timeout=600.0,  # 10 minutes for deep thinking
+            max_retries=0  # Retries are handled by the LLM governor
         )
         
         # Configuration
+        self.max_concurrent_experts = max(1, max_concurrent_experts)
         self.enable_reinforcement = enable_reinforcement
         self.enable_validation = enable_validation
+        self.answer_cache = answer_cache if enable_answer_cache else None
         
         # Initialize reinforcement systems
         if enable_reinforcement:
@@ -118,7 +133,9 @@ class UnbeatableStrategicCouncil:
     async def analyze_ceo_question(
         self, 
         query: str,
-        data_context: Optional[str] = None
+        data_context: Optional[str] = None,
+        use_cache: bool = True,
+        on_stage: Optional[Callable[[int, int, str], Awaitable[None]]] = None
     ) -> Dict[str, Any]:
         """
         Complete unbeatable analysis pipeline
@@ -127,6 +144,10 @@ class UnbeatableStrategicCouncil:
         Args:
             query: CEO's strategic question
             data_context: Optional data context (if you have RAG/retrieval)
+            use_cache: Return a cached decision sheet for a near-duplicate
+                question over the same data context (metadata['cached'])
+            on_stage: Optional async callback (stage, total_stages, description)
+                awaited as each pipeline stage starts
             
         Returns:
             Complete decision sheet with all analyses
@@ -142,33 +163,56 @@ class UnbeatableStrategicCouncil:
         
         # STAGE 1: Prepare data context
         logger.info("\n[1/7] Preparing data context...")
+        if on_stage:
+            await on_stage(1, 7, "Preparing data context")
         if data_context is None:
             data_context = self._generate_default_context(query)
         
+        data_version = content_version(data_context, self.agent_model, self.synthesis_model)
+        if self.answer_cache is not None and use_cache:
+            hit = self.answer_cache.get("unbeatable_council", query, data_version)
+            if hit:
+                decision_sheet = hit['payload']
+                decision_sheet['metadata'].update(hit['cache'])
+                logger.info(f"⚡ Cached decision sheet (matched: {hit['cache']['matched_question']})")
+                return decision_sheet
+        
         # STAGE 2: 4 Expert analyses with forcing functions
         logger.info("\n[2/7] Running 4 expert analyses (with forcing functions)...")
+        if on_stage:
+            await on_stage(2, 7, "Running 4 expert analyses")
         agent_analyses = await self._stage2_expert_analyses(query, data_context)
         
         # STAGE 3: Quality check and reinforcement
         logger.info("\n[3/7] Quality check and reinforcement...")
+        if on_stage:
+            await on_stage(3, 7, "Quality check and reinforcement")
         quality_report = self._stage3_quality_check(agent_analyses)
         
         # STAGE 4: Deep strategic thinking (simplified for now)
         logger.info("\n[4/7] Deep strategic reasoning...")
+        if on_stage:
+            await on_stage(4, 7, "Deep strategic reasoning")
         strategic_thinking = self._stage4_strategic_reasoning(query, agent_analyses)
         
         # STAGE 5: Identify debates
         logger.info("\n[5/7] Identifying expert debates...")
+        if on_stage:
+            await on_stage(5, 7, "Identifying expert debates")
         debates = self._stage5_debates(agent_analyses)
         
         # STAGE 6: Master orchestrator synthesis
         logger.info("\n[6/7] Master orchestrator synthesis...")
+        if on_stage:
+            await on_stage(6, 7, "Master orchestrator synthesis")
         final_synthesis = await self._stage6_orchestrator(
             query, agent_analyses, strategic_thinking, debates
         )
         
         # STAGE 7: Generate CEO decision sheet
         logger.info("\n[7/7] Generating CEO decision sheet...")
+        if on_stage:
+            await on_stage(7, 7, "Generating CEO decision sheet")
         decision_sheet = self._stage7_decision_sheet(
             query, data_context, agent_analyses, quality_report,
             strategic_thinking, debates, final_synthesis
@@ -185,6 +229,9 @@ class UnbeatableStrategicCouncil:
         logger.info(f"   Average Score: {quality_report['average_score']:.1f}/100")
         logger.info("="*80)
         
+        if self.answer_cache is not None:
+            self.answer_cache.put("unbeatable_council", query, data_version, decision_sheet)
+        
         return decision_sheet
     
     def _generate_default_context(self, query: str) -> str:
@@ -213,20 +260,21 @@ Note: Detailed data retrieval can be integrated with RAG system.
     ) -> List[Dict[str, Any]]:
         """
         Run all 4 experts with forcing functions in parallel
+        (at most max_concurrent_experts in flight)
         """
+        slots = asyncio.Semaphore(self.max_concurrent_experts)
+        
+        async def run_expert(expert_info: Dict[str, str]) -> Dict[str, Any]:
+            async with slots:
+                return await self._run_single_expert(
+                    expert_name=expert_info['name'],
+                    expert_domain=expert_info['domain'],
+                    expert_prompt=expert_info['prompt'],
+                    query=query,
+                    context=data_context
+                )
         
-        tasks = []
-        for expert_key, expert_info in self.experts.items():
-            task = self._run_single_expert(
-                expert_name=expert_info['name'],
-                expert_domain=expert_info['domain'],
-                expert_prompt=expert_info['prompt'],
-                query=query,
-                context=data_context
-            )
-            tasks.append(task)
-        
-        analyses = await asyncio.gather(*tasks)
+        analyses = await asyncio.gather(*(run_expert(info) for info in self.experts.values()))
         
         return analyses
     
@@ -242,15 +290,14 @@ Note: Detailed data retrieval can be integrated with RAG system.
         Run single expert with forcing functions and reinforcement
         """
         
-        # Apply forcing functions (Layer 2)
-        forced_prompt = force_expert_thinking(expert_prompt, query, context)
+        # Embodiment + forcing functions (Layer 2) form a static, cached prefix;
+        # only the question and data vary per call
+        system = cached_system_blocks(expert_prompt, EXPERT_THINKING_INSTRUCTIONS)
         
         # Build messages
         messages = [{
             "role": "user",
-            "content": f"""{forced_prompt}
-
-CEO QUESTION: {query}
+            "content": f"""CEO QUESTION: {query}
 
 AVAILABLE DATA:
 {context[:3000]}
@@ -260,14 +307,16 @@ AVAILABLE DATA:
         
         # Get initial response
         logger.info(f"   Consulting {expert_name}...")
-        response = self.anthropic.messages.create(
+        response = await self._create(
             model=self.agent_model,
             max_tokens=8000,
             temperature=0.7,  # Higher for more natural veteran thinking
+            system=system,
             messages=messages
         )
         
         analysis = response.content[0].text
+        usage = add_usage({}, response.usage)
         
         # Quality check and reinforcement (Layer 4)
         if self.enable_reinforcement:
@@ -282,14 +331,16 @@ AVAILABLE DATA:
                 messages.append({"role": "assistant", "content": analysis})
                 messages.append({"role": "user", "content": reinforcement_needed})
                 
-                response = self.anthropic.messages.create(
+                response = await self._create(
                     model=self.agent_model,
                     max_tokens=8000,
                     temperature=0.7,
+                    system=system,
                     messages=messages
                 )
                 
                 analysis = response.content[0].text
+                add_usage(usage, response.usage)
                 logger.info(f"      ✅ Quality improved after reinforcement")
         
         # Validation (Layer 3)
@@ -308,7 +359,8 @@ AVAILABLE DATA:
             'analysis': analysis,
             'validation': validation,
             'model': self.agent_model,
-            'tokens': response.usage.input_tokens + response.usage.output_tokens
+            'tokens': count_tokens(usage),
+            'usage': usage
         }
     
     def _stage3_quality_check(
@@ -407,18 +459,15 @@ AVAILABLE DATA:
         # Format analyses for synthesis
         analyses_text = self._format_analyses(agent_analyses)
         
-        # Apply orchestrator forcing functions
-        forced_prompt = force_orchestrator_synthesis(
+        # Orchestrator embodiment + forcing functions form the cached prefix
+        system = cached_system_blocks(
             MASTER_ORCHESTRATOR_EMBODIMENT,
-            query,
-            agent_analyses  # Pass full list for forcing function to format
+            ORCHESTRATOR_SYNTHESIS_INSTRUCTIONS
         )
         
         messages = [{
             "role": "user",
-            "content": f"""{forced_prompt}
-
-CEO QUESTION: {query}
+            "content": f"""CEO QUESTION: {query}
 
 EXPERT ANALYSES:
 {analyses_text}
@@ -433,19 +482,31 @@ EXPERT DEBATES:
         }]
         
         logger.info(f"   Synthesizing with Master Orchestrator...")
-        response = self.anthropic.messages.create(
+        response = await self._create(
             model=self.synthesis_model,
             max_tokens=16000,
             temperature=0.8,  # Higher for creative synthesis
+            system=system,
             messages=messages
         )
+        usage = add_usage({}, response.usage)
         
         return {
             'synthesis': response.content[0].text,
             'model': self.synthesis_model,
-            'tokens': response.usage.input_tokens + response.usage.output_tokens
+            'tokens': count_tokens(usage),
+            'usage': usage
         }
     
+    async def _create(self, **params):
+        """Messages API call through the process-wide LLM governor."""
+        return await llm_governor.call(
+            params["model"],
+            lambda: self.anthropic.messages.create(**params),
+            tokens=estimate_tokens(params.get("system"), params["messages"]),
+            agent="unbeatable_council"
+        )
+    
     def _stage7_decision_sheet(
         self,
         query: str,
@@ -466,6 +527,9 @@ EXPERT DEBATES:
         # Calculate total cost
         total_tokens = sum(a['tokens'] for a in agent_analyses) + final_synthesis['tokens']
         total_cost_qar = self._calculate_cost(total_tokens, agent_analyses, final_synthesis)
+        token_usage: Dict[str, int] = {}
+        for a in agent_analyses + [final_synthesis]:
+            add_usage(token_usage, a.get('usage'))
         
         return {
             'question': query,
@@ -491,6 +555,7 @@ EXPERT DEBATES:
                     'synthesis': self.synthesis_model
                 },
                 'total_tokens': total_tokens,
+                'token_usage': token_usage,
                 'estimated_cost_qar': total_cost_qar,
                 'system_version': 'unbeatable_v2.0',
                 'quality_level': 'PhD_expert_30year_veteran',
@@ -552,20 +617,22 @@ EXPERT DEBATES:
         agent_analyses: List[Dict],
         final_synthesis: Dict
     ) -> float:
-        """Calculate total cost in QAR"""
+        """Calculate total cost in QAR (cache writes/reads priced separately)"""
         
         # Sonnet 4.5: $3/MTok input, $15/MTok output
         # Opus 4: $15/MTok input, $75/MTok output
-        # Assume 50/50 input/output split
-        
-        agent_tokens = sum(a['tokens'] for a in agent_analyses)
-        synthesis_tokens = final_synthesis['tokens']
+        # Prompt cache: writes 1.25x, reads 0.1x the input price
         
         # Agent cost (Sonnet 4.5)
-        agent_cost_usd = (agent_tokens / 1_000_000) * ((3 + 15) / 2)
+        agent_cost_usd = sum(
+            usage_cost_usd(a.get('usage', {}), input_price=3, output_price=15)
+            for a in agent_analyses
+        )
         
         # Synthesis cost (Opus 4)
-        synthesis_cost_usd = (synthesis_tokens / 1_000_000) * ((15 + 75) / 2)
+        synthesis_cost_usd = usage_cost_usd(
+            final_synthesis.get('usage', {}), input_price=15, output_price=75
+        )
         
         # Total in QAR (1 USD = 3.64 QAR)
         total_cost_qar = (agent_cost_usd + synthesis_cost_usd) * 3.64
@@ -0,0 +1,113 @@
+"""
+Background council analysis endpoints.
+
+Council runs can take many minutes, so they are submitted as jobs and
+polled instead of being served within one request.
+"""
+
+from typing import Any, Dict, List, Literal, Optional
+
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field
+
+from app.services.analysis_jobs import analysis_jobs
+
+router = APIRouter()
+
+
+class AnalysisRequest(BaseModel):
+    """Request model for submitting a council analysis."""
+
+    question: str = Field(
+        ...,
+        description="CEO's strategic question",
+        min_length=10,
+        max_length=2000
+    )
+    council: Literal["unbeatable", "ultimate"] = Field(
+        default="unbeatable",
+        description="Which strategic council runs the analysis"
+    )
+    data_context: Optional[str] = Field(
+        default=None,
+        description="Optional data context (unbeatable council only; ultimate retrieves its own)"
+    )
+
+
+class AnalysisStage(BaseModel):
+    """One pipeline stage of a council run."""
+
+    number: int = Field(..., description="Stage number (1-based)")
+    total: int = Field(..., description="Total stages in the council pipeline")
+    description: str = Field(..., description="What the stage does")
+
+
+class AnalysisJob(BaseModel):
+    """Status of a background council analysis."""
+
+    id: str = Field(..., description="Analysis (session) id")
+    question: str = Field(..., description="Original question")
+    council: str = Field(..., description="Council running the analysis")
+    status: Literal["queued", "running", "completed", "failed", "cancelled"] = Field(
+        ..., description="Job status"
+    )
+    stage: Optional[AnalysisStage] = Field(default=None, description="Stage currently running")
+    progress: List[AnalysisStage] = Field(default_factory=list, description="Stages started so far")
+    error: Optional[str] = Field(default=None, description="Failure reason")
+    created_at: Optional[str] = Field(default=None, description="Submission time")
+    started_at: Optional[str] = Field(default=None, description="Time a worker picked the job up")
+    completed_at: Optional[str] = Field(default=None, description="Time the job finished")
+    result: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Final recommendation, expert responses and debate tensions (when completed)"
+    )
+
+
+@router.post("/analyses", response_model=AnalysisJob, status_code=202, tags=["Analyses"])
+async def submit_analysis(request: AnalysisRequest):
+    """
+    Queue a strategic council analysis.
+
+    Returns immediately with the job id; poll ``GET /analyses/{id}``.
+
+    Args:
+        request: Question and council selection.
+
+    Returns:
+        AnalysisJob: The queued job.
+    """
+    return await analysis_jobs.submit(
+        question=request.question,
+        council=request.council,
+        data_context=request.data_context
+    )
+
+
+@router.get("/analyses/{analysis_id}", response_model=AnalysisJob, tags=["Analyses"])
+async def get_analysis(analysis_id: str):
+    """
+    Get status, stage progress and (once completed) results of an analysis.
+
+    Raises:
+        HTTPException: 404 if the analysis does not exist.
+    """
+    job = await analysis_jobs.get(analysis_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Analysis {analysis_id} not found")
+    return job
+
+
+@router.post("/analyses/{analysis_id}/cancel", response_model=AnalysisJob, tags=["Analyses"])
+async def cancel_analysis(analysis_id: str):
+    """
+    Cancel a queued or running analysis.
+
+    Finished analyses are returned unchanged.
+
+    Raises:
+        HTTPException: 404 if the analysis does not exist.
+    """
+    job = await analysis_jobs.cancel(analysis_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Analysis {analysis_id} not found")
+    return job
@@ -4,10 +4,11 @@ Main API router combining all v1 endpoints.
 
 from fastapi import APIRouter
 
-from app.api.v1 import chat
+from app.api.v1 import analyses, chat
 
 api_router = APIRouter()
 
 # Include all endpoint routers
 api_router.include_router(chat.router, prefix="/agent", tags=["Agent"])
+api_router.include_router(analyses.router, tags=["Analyses"])
 
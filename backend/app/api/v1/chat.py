@@ -2,10 +2,12 @@
 Chat API endpoints for CEO interactions with agents.
 """
 
+import json
 from datetime import datetime
-from typing import Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.agents.dr_omar import dr_omar
@@ -66,8 +68,8 @@ async def chat_with_agent(request: ChatRequest):
         HTTPException: If question processing fails.
     """
     try:
-        # Call Dr. Omar to answer the question
-        result = dr_omar.answer_question(
+        # Call Dr. Omar to answer the question (async: the worker keeps serving other chats)
+        result = await dr_omar.answer_question_async(
             question=request.question,
             context=request.context
         )
@@ -83,6 +85,8 @@ async def chat_with_agent(request: ChatRequest):
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -90,6 +94,46 @@ async def chat_with_agent(request: ChatRequest):
         )
 
 
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _chat_events(request: ChatRequest) -> AsyncIterator[str]:
+    """Translate Dr. Omar's answer stream into SSE frames."""
+    async for chunk in dr_omar.stream_answer(
+        question=request.question,
+        context=request.context
+    ):
+        event = chunk.pop("type")
+        if event == "done":
+            chunk["timestamp"] = datetime.utcnow().isoformat()
+        yield _sse_event(event, chunk)
+
+
+@router.post("/chat/stream", tags=["Chat"])
+async def chat_with_agent_stream(request: ChatRequest):
+    """
+    Chat with Dr. Omar, streaming the answer as Server-Sent Events.
+    
+    Events:
+    - ``token``: ``{"text": ...}`` for each piece of the answer as it is generated
+    - ``done``: the full ChatResponse payload once the answer is complete
+    - ``error``: ``{"status": "error", "error": ...}`` if the LLM call fails
+    
+    Args:
+        request: Chat request with CEO question.
+        
+    Returns:
+        StreamingResponse: ``text/event-stream`` of answer events.
+    """
+    return StreamingResponse(
+        _chat_events(request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/health", tags=["Health"])
 async def agent_health():
     """
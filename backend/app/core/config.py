@@ -53,6 +53,26 @@ class Settings(BaseSettings):
         description="Celery result backend"
     )
     
+    # Background analysis jobs
+    analysis_workers: int = Field(
+        default=2,
+        description="Council analyses run concurrently per API process"
+    )
+    analysis_queue_backend: str = Field(
+        default="local",
+        description="Analysis job queue: 'local' (in-process) or 'redis' (shared via redis_url)"
+    )
+    
+    # Startup warmup
+    startup_warmup: bool = Field(
+        default=True,
+        description="Warm models, pools and caches in the background at startup (/ready goes green when done)"
+    )
+    startup_db_connections: int = Field(
+        default=5,
+        description="Database pool connections opened during warmup"
+    )
+    
     # LLM API Keys
     anthropic_api_key: str = Field(..., description="Anthropic API key")
     openai_api_key: Optional[str] = Field(default=None, description="OpenAI API key")
@@ -177,6 +197,18 @@ class Settings(BaseSettings):
         default=1000,
         description="Rate limit per hour"
     )
+    rate_limit_llm_per_minute: int = Field(
+        default=10,
+        description="Rate limit per minute for LLM-heavy endpoints (chat, analyses)"
+    )
+    rate_limit_llm_per_hour: int = Field(
+        default=100,
+        description="Rate limit per hour for LLM-heavy endpoints (chat, analyses)"
+    )
+    rate_limit_backend: str = Field(
+        default="local",
+        description="Rate limit buckets: 'local' (per process) or 'redis' (shared via redis_url)"
+    )
     
     # Development
     reload: bool = Field(default=True, description="Auto-reload on file changes")
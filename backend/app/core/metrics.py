@@ -0,0 +1,353 @@
+"""
+Prometheus metrics for UDC Polaris.
+
+A small in-process registry that renders the Prometheus text exposition
+format (0.0.4). It needs no client library, so the UIS pipeline and the
+embedding sidecar can import it without the backend settings.
+
+Two kinds of metric:
+
+- Counters, gauges and histograms are updated on the hot path: request
+  latency, LLM calls, Chroma queries, embedding batches.
+- Collectors are functions called at scrape time. They turn state that
+  already exists (``stats`` dicts, ``snapshot()``s, queue sizes) into
+  samples, so nothing is counted twice.
+
+The API exposes the default registry at ``/metrics``.
+``start_http_server`` serves it from processes without an HTTP app of
+their own (Chainlit, the embedding sidecar).
+
+The registry is per module object. In the API process everything must
+load this module as ``app.core.metrics``. A module that imports services
+as ``backend.app.*`` records into a second copy that ``/metrics`` never
+renders.
+"""
+
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; LLM calls and council stages run up to minutes
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+LabelValues = Tuple[str, ...]
+# (labels, value) pairs for one metric
+Samples = Iterable[Tuple[Dict[str, Any], float]]
+# (name, type, help, samples) families returned by a collector
+Family = Tuple[str, str, str, Samples]
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, int):
+        return str(int(value))
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, Any]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, Any]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues) -> Dict[str, str]:
+        return dict(zip(self.labelnames, key))
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonic total per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("Counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def get(self, **labels: Any) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self._labels(key))} {_format_value(value)}" for key, value in values]
+
+
+class Gauge(Counter):
+    """Value that goes up and down per label set."""
+
+    kind = "gauge"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Cumulative bucket counts, sum and count per label set."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, help, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [0.0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            else:
+                state[len(self.buckets)] += 1
+            state[-1] += value
+
+    @contextmanager
+    def time(self, **labels: Any) -> Iterator[None]:
+        """Observe the duration of the ``with`` block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: Any) -> int:
+        state = self._values.get(self._key(labels))
+        return int(sum(state[:-1])) if state else 0
+
+    def sum(self, **labels: Any) -> float:
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0.0
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = [(key, list(state)) for key, state in self._values.items()]
+        lines = []
+        for key, state in values:
+            labels = self._labels(key)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets + (math.inf,), state[:-1]):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels({**labels, 'le': _format_value(float(bound))})} {_format_value(cumulative)}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Named metrics and scrape-time collectors of one process."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._collectors: Dict[str, Callable[[], Iterable[Family]]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, help, labelnames)
+
+    def gauge(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, help, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, help, labelnames, buckets=buckets)
+
+    def register_collector(self, name: str, collect: Callable[[], Iterable[Family]]) -> None:
+        """Add (or replace) a scrape-time collector; ``name`` only identifies it."""
+        with self._lock:
+            self._collectors[name] = collect
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors.items())
+
+        lines: List[str] = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+
+        for collector_name, collect in collectors:
+            try:
+                families = list(collect())
+            except Exception as e:
+                # One broken collector must not take the whole scrape down
+                logger.warning(f"Metrics collector '{collector_name}' failed: {e}")
+                continue
+            for name, kind, help, samples in families:
+                lines.append(f"# HELP {name} {help}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in samples:
+                    if value is not None:
+                        lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get_or_create(self, cls, name: str, help: str, labelnames: Sequence[str], **kwargs) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as {metric.kind}{metric.labelnames}")
+            return metric
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware timing HTTP requests per route.
+
+    Requests are labelled with the route template (``/api/v1/analysis/{job_id}``),
+    not the raw path, so ids do not create new series. Written against raw
+    ASGI so streaming responses are timed until their last chunk.
+    """
+
+    def __init__(self, app, registry: Optional[MetricsRegistry] = None, skip_paths: Sequence[str] = ("/metrics",)):
+        self.app = app
+        registry = registry or metrics_registry
+        self.skip_paths = set(skip_paths)
+        self.latency = registry.histogram(
+            "polaris_http_request_duration_seconds",
+            "HTTP request latency by route",
+            ("method", "route", "status"),
+        )
+        self.in_progress = registry.gauge(
+            "polaris_http_requests_in_progress",
+            "HTTP requests being served",
+            ("method",),
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_progress.inc(method=method)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.in_progress.dec(method=method)
+            # The router stores the matched route in the scope
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+            self.latency.observe(time.perf_counter() - started, method=method, route=template, status=status)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    registry: "MetricsRegistry"
+
+    def do_GET(self):
+        if self.path.split("?")[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", CONTENT_TYPE)
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_servers: Dict[Tuple[str, int], ThreadingHTTPServer] = {}
+
+
+def start_http_server(port: int, addr: str = "0.0.0.0", registry: Optional["MetricsRegistry"] = None) -> ThreadingHTTPServer:
+    """
+    Serve ``/metrics`` from a daemon thread (for processes without an API).
+
+    Idempotent per address, so a re-imported module does not fail on a
+    port that is already bound.
+    """
+    server = _servers.get((addr, port))
+    if server is not None:
+        return server
+    handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry or metrics_registry})
+    server = _servers[(addr, port)] = ThreadingHTTPServer((addr, port), handler)
+    threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+    logger.info(f"Metrics exporter listening on {addr}:{server.server_port}")
+    return server
+
+
+# Global instance
+metrics_registry = MetricsRegistry()
@@ -0,0 +1,235 @@
+"""
+Rate limiting for UDC Polaris.
+
+Each client gets token buckets per endpoint tier: one refilled over a
+minute and one over an hour, sized from settings. A request must take a
+token from both. Two tiers are limited separately:
+
+- ``llm``: endpoints that start model calls (chat, chat streaming, council
+  analyses). A burst here can exhaust the Anthropic quota for every user.
+- ``default``: everything else under the API prefix (status polls, info).
+
+Rejected requests get 429 with a ``Retry-After`` header, the seconds until a
+token is available again. Buckets live in process memory by default. With
+``rate_limit_backend="redis"`` they live in Redis, so every API process
+enforces one shared limit. The Redis store fails open if Redis is
+unreachable.
+"""
+
+import json
+import logging
+import math
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+# (capacity, refill window in seconds)
+Limit = Tuple[int, float]
+
+LLM_TIER = "llm"
+DEFAULT_TIER = "default"
+
+# POST endpoints that trigger LLM calls, relative to the API prefix
+LLM_ENDPOINTS = ("/agent/chat", "/agent/chat/stream", "/analyses")
+
+REDIS_KEY_PREFIX = "polaris:ratelimit"
+
+RATE_LIMITED = metrics_registry.counter(
+    "polaris_rate_limited_total", "Requests rejected with 429 by tier", ("tier",)
+)
+
+_REDIS_TOKEN_BUCKET = """
+local now = tonumber(ARGV[1])
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i])
+    local rate = tonumber(ARGV[2 * i + 1])
+    local bucket = redis.call('HMGET', key, 'tokens', 'ts')
+    local available = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    available = math.min(capacity, available + math.max(0, now - ts) * rate)
+    tokens[i] = available
+    if available < 1 then
+        wait = math.max(wait, (1 - available) / rate)
+    end
+end
+for i, key in ipairs(KEYS) do
+    local capacity = tonumber(ARGV[2 * i])
+    local rate = tonumber(ARGV[2 * i + 1])
+    local remaining = tokens[i]
+    if wait == 0 then
+        remaining = remaining - 1
+    end
+    redis.call('HSET', key, 'tokens', remaining, 'ts', now)
+    redis.call('EXPIRE', key, math.ceil(capacity / rate) + 1)
+end
+return tostring(wait)
+"""
+
+
+class LocalRateLimitStore:
+    """
+    Token buckets in process memory.
+
+    Args:
+        clock: Monotonic time source (injectable for tests)
+        max_buckets: Full buckets are pruned once this many are tracked
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, max_buckets: int = 10000):
+        self.clock = clock
+        self.max_buckets = max_buckets
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    async def acquire(self, keys: Sequence[str], limits: Sequence[Limit]) -> float:
+        """Take one token from every bucket; returns 0 or the seconds to wait."""
+        now = self.clock()
+        available: List[float] = []
+        wait = 0.0
+        for key, (capacity, window) in zip(keys, limits):
+            rate = capacity / window
+            tokens, ts = self._buckets.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0.0, now - ts) * rate)
+            available.append(tokens)
+            if tokens < 1:
+                wait = max(wait, (1 - tokens) / rate)
+
+        for key, tokens in zip(keys, available):
+            self._buckets[key] = (tokens - 1 if wait == 0 else tokens, now)
+
+        if len(self._buckets) > self.max_buckets:
+            self._prune(now, limits)
+        return wait
+
+    def _prune(self, now: float, limits: Sequence[Limit]) -> None:
+        # A bucket untouched for the longest window is full again; forgetting it is lossless
+        longest = max(window for _, window in limits)
+        self._buckets = {key: state for key, state in self._buckets.items() if now - state[1] < longest}
+
+
+class RedisRateLimitStore:
+    """Token buckets in Redis, updated atomically by a Lua script."""
+
+    def __init__(self, url: str, password: Optional[str] = None):
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url, password=password, decode_responses=True)
+        self._script = self.client.register_script(_REDIS_TOKEN_BUCKET)
+
+    async def acquire(self, keys: Sequence[str], limits: Sequence[Limit]) -> float:
+        """Take one token from every bucket; returns 0 or the seconds to wait."""
+        args: List[float] = [time.time()]
+        for capacity, window in limits:
+            args.extend([capacity, capacity / window])
+        try:
+            return float(await self._script(keys=list(keys), args=args))
+        except Exception as e:
+            logger.warning(f"Rate limit store unavailable, allowing request: {e}")
+            return 0.0
+
+
+class RateLimiter:
+    """
+    Per-client, per-tier rate limits.
+
+    Args:
+        store: LocalRateLimitStore or RedisRateLimitStore
+        tiers: Tier name -> limits (every limit must have a token)
+        api_prefix: Only paths under this prefix are limited
+        enabled: Switch limiting off without removing the middleware
+    """
+
+    def __init__(
+        self,
+        store,
+        tiers: Dict[str, Sequence[Limit]],
+        api_prefix: str = "/api/v1",
+        enabled: bool = True
+    ):
+        self.store = store
+        self.tiers = tiers
+        self.api_prefix = api_prefix.rstrip("/")
+        self.enabled = enabled
+        self._llm_paths = {f"{self.api_prefix}{path}" for path in LLM_ENDPOINTS}
+
+    def tier_for(self, method: str, path: str) -> Optional[str]:
+        """Tier a request counts against, or None if it is not limited."""
+        if not path.startswith(f"{self.api_prefix}/"):
+            return None
+        if method == "POST" and path.rstrip("/") in self._llm_paths:
+            return LLM_TIER
+        return DEFAULT_TIER
+
+    async def check(self, client: str, tier: str) -> float:
+        """Consume a request; returns 0 if allowed, else seconds until retry."""
+        limits = self.tiers[tier]
+        keys = [f"{REDIS_KEY_PREFIX}:{tier}:{client}:{int(window)}" for _, window in limits]
+        return await self.store.acquire(keys, limits)
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware enforcing a RateLimiter.
+
+    Written against raw ASGI (not BaseHTTPMiddleware) so streaming responses
+    pass through untouched.
+    """
+
+    def __init__(self, app, limiter: RateLimiter):
+        self.app = app
+        self.limiter = limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.limiter.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        tier = self.limiter.tier_for(scope["method"], scope["path"])
+        if tier is None:
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        wait = await self.limiter.check(client[0] if client else "unknown", tier)
+        if wait <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        RATE_LIMITED.inc(tier=tier)
+        retry_after = max(1, math.ceil(wait))
+        body = json.dumps({
+            "detail": f"Rate limit exceeded for {tier} endpoints. Retry in {retry_after}s."
+        }).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(retry_after).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def _default_store():
+    if settings.rate_limit_backend == "redis":
+        return RedisRateLimitStore(settings.redis_url, password=settings.redis_password)
+    return LocalRateLimitStore()
+
+
+# Global instance
+rate_limiter = RateLimiter(
+    store=_default_store(),
+    tiers={
+        LLM_TIER: [(settings.rate_limit_llm_per_minute, 60), (settings.rate_limit_llm_per_hour, 3600)],
+        DEFAULT_TIER: [(settings.rate_limit_per_minute, 60), (settings.rate_limit_per_hour, 3600)],
+    },
+    api_prefix=settings.api_prefix,
+    enabled=settings.enable_rate_limiting,
+)
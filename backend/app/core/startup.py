@@ -0,0 +1,276 @@
+"""
+Startup warmup and readiness for UDC Polaris.
+
+Without a warmup, the first request pays for the lazy work: council module
+imports, the embedding model load, database pool connections, Chroma
+segment loading and the OpenAPI schema build. Meanwhile ``/health`` already
+reports healthy. ``Warmup`` runs that work in the background when the app
+starts:
+
+- ``database``: create missing tables, open pool connections
+- ``redis``: ping the shared rate-limit / job-queue stores (when configured)
+- ``answer_cache``: load the embedding model, open the answer cache (optional)
+- ``chroma``: open the persisted collections (optional)
+- ``udc_data``: parse the UDC data files Dr. Omar answers from
+- ``councils``: import the council pipelines (optional)
+- ``retrieval``: initialize the councils' RAG retrieval service (optional)
+- ``openapi``: build the OpenAPI schema (optional)
+
+The phases are independent, so they run concurrently. Blocking phases run
+in worker threads. ``ready`` turns true once every required phase has
+succeeded. An optional phase that fails is reported but does not block
+readiness. ``report()`` has the state, duration and detail of each phase
+for ``/ready`` and ``/health``.
+"""
+
+import asyncio
+import importlib
+import logging
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+RUNNING = "running"
+OK = "ok"
+SKIPPED = "skipped"
+FAILED = "failed"
+
+# async fn(application) -> detail text (None when there is nothing to report)
+PhaseFn = Callable[[Any], Awaitable[Optional[str]]]
+
+
+class StartupPhase:
+    """One named warmup step."""
+
+    def __init__(self, name: str, fn: PhaseFn, required: bool = True):
+        self.name = name
+        self.fn = fn
+        self.required = required
+        self.status = PENDING
+        self.seconds: Optional[float] = None
+        self.detail: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "required": self.required,
+            "seconds": round(self.seconds, 3) if self.seconds is not None else None,
+            "detail": self.detail,
+        }
+
+
+class SkipPhase(Exception):
+    """Raised by a phase that does not apply to this deployment."""
+
+
+class Warmup:
+    """
+    Run the startup phases and track readiness.
+
+    Args:
+        phases: Phases to run (all start together)
+        clock: Timer for the phase durations (injectable for tests)
+    """
+
+    def __init__(self, phases: Sequence[StartupPhase], clock: Callable[[], float] = time.perf_counter):
+        self.phases = list(phases)
+        self.clock = clock
+        self.started_at: Optional[float] = None
+        self.total_seconds: Optional[float] = None
+        self._done = asyncio.Event()
+
+    @property
+    def ready(self) -> bool:
+        """True once every required phase has succeeded."""
+        return self.finished and all(p.status in (OK, SKIPPED) for p in self.phases if p.required)
+
+    @property
+    def finished(self) -> bool:
+        return self.total_seconds is not None
+
+    @property
+    def state(self) -> str:
+        if not self.finished:
+            return "starting"
+        return "ready" if self.ready else FAILED
+
+    async def run(self, application: Any = None) -> bool:
+        """Run every phase against the FastAPI application; returns ready."""
+        self.started_at = self.clock()
+        await asyncio.gather(*(self._run_phase(phase, application) for phase in self.phases))
+        self.total_seconds = self.clock() - self.started_at
+        self._done.set()
+
+        timings = ", ".join(f"{p.name}={p.status}" + (f" {p.seconds:.2f}s" if p.seconds else "") for p in self.phases)
+        logger.info(f"Startup warmup {self.state} in {self.total_seconds:.2f}s ({timings})")
+        return self.ready
+
+    def skip(self) -> None:
+        """Mark warmup done without running it (warmup disabled)."""
+        for phase in self.phases:
+            phase.status = SKIPPED
+            phase.detail = "warmup disabled"
+        self.total_seconds = 0.0
+        self._done.set()
+
+    async def wait(self) -> bool:
+        """Wait for warmup to finish; returns ready."""
+        await self._done.wait()
+        return self.ready
+
+    def report(self) -> Dict[str, Any]:
+        """State, total time and per-phase timings."""
+        return {
+            "state": self.state,
+            "total_seconds": round(self.total_seconds, 3) if self.total_seconds is not None else None,
+            "phases": {phase.name: phase.as_dict() for phase in self.phases},
+        }
+
+    async def _run_phase(self, phase: StartupPhase, application: Any) -> None:
+        phase.status = RUNNING
+        started = self.clock()
+        try:
+            phase.detail = await phase.fn(application)
+            phase.status = OK
+        except SkipPhase as e:
+            phase.status = SKIPPED
+            phase.detail = str(e)
+        except Exception as e:
+            phase.status = FAILED
+            phase.detail = f"{type(e).__name__}: {e}"
+            log = logger.error if phase.required else logger.warning
+            log(f"Startup phase '{phase.name}' failed: {phase.detail}")
+        finally:
+            phase.seconds = self.clock() - started
+
+
+async def warm_database(application: Any) -> str:
+    """Create missing tables and fill the connection pool."""
+    from app.db.base import init_db, warm_pool
+
+    await init_db()
+    opened = await warm_pool(settings.startup_db_connections)
+    return f"{opened} pooled connections"
+
+
+async def warm_redis(application: Any) -> str:
+    """Ping the Redis clients the rate limiter and job queue already hold."""
+    from app.core.rate_limit import RedisRateLimitStore, rate_limiter
+    from app.services.analysis_jobs import RedisJobQueue, analysis_jobs
+
+    clients = []
+    if isinstance(rate_limiter.store, RedisRateLimitStore):
+        clients.append(rate_limiter.store.client)
+    if isinstance(analysis_jobs.queue, RedisJobQueue):
+        clients.append(analysis_jobs.queue.client)
+    if not clients:
+        raise SkipPhase("no Redis backend configured")
+    await asyncio.gather(*(client.ping() for client in clients))
+    return f"{len(clients)} clients"
+
+
+async def warm_answer_cache(application: Any) -> str:
+    """Load the embedding model and open the final-answer cache."""
+    from app.services.answer_cache import answer_cache
+
+    cached = await asyncio.to_thread(answer_cache.warm)
+    return f"{cached} cached answers"
+
+
+async def warm_chroma(application: Any) -> str:
+    """Open the persisted Chroma collections so their segments are loaded once."""
+    path = Path(settings.chroma_persist_directory)
+    if not path.exists():
+        raise SkipPhase(f"{path} not found")
+
+    def open_collections() -> int:
+        import chromadb
+
+        # Chroma shares one system per path, so later clients reuse this warm one
+        client = chromadb.PersistentClient(path=str(path))
+        collections = client.list_collections()
+        for collection in collections:
+            # Names in Chroma >= 0.6, Collection objects before
+            name = collection if isinstance(collection, str) else collection.name
+            client.get_collection(name).count()
+        return len(collections)
+
+    return f"{await asyncio.to_thread(open_collections)} collections"
+
+
+async def warm_udc_data(application: Any) -> str:
+    """Parse every UDC data file into the shared store (fails readiness if one is missing or corrupt)."""
+    from app.agents.tools import udc_tools
+
+    def load_all() -> int:
+        files = udc_tools.store.load_all()
+        if not files:
+            raise FileNotFoundError(f"No UDC data files in {udc_tools.data_dir}")
+        udc_tools.data_version()
+        return len(files)
+
+    return f"{await asyncio.to_thread(load_all)} data files"
+
+
+async def warm_councils(application: Any) -> None:
+    """Import the council pipelines analyses would otherwise import on first use."""
+    def import_councils() -> None:
+        for module in ("app.agents.unbeatable_council", "ultimate_council"):
+            importlib.import_module(module)
+
+    await asyncio.to_thread(import_councils)
+
+
+async def warm_retrieval(application: Any) -> str:
+    """Load the embedding model and collections behind the council retrieval."""
+    def init_retrieval() -> Dict[str, int]:
+        import rag_system
+
+        if not Path(rag_system.rag_service.chromadb_path).exists():
+            raise SkipPhase(f"{rag_system.rag_service.chromadb_path} not found")
+        return rag_system.rag_service.warmup()
+
+    counts = await asyncio.to_thread(init_retrieval)
+    return ", ".join(f"{name}: {count} documents" for name, count in counts.items())
+
+
+async def warm_openapi(application: Any) -> str:
+    """Build and cache the OpenAPI schema."""
+    if application is None:
+        raise SkipPhase("no application")
+    schema = await asyncio.to_thread(application.openapi)
+    return f"{len(schema.get('paths', {}))} paths"
+
+
+def default_phases() -> List[StartupPhase]:
+    return [
+        StartupPhase("database", warm_database),
+        StartupPhase("redis", warm_redis),
+        StartupPhase("answer_cache", warm_answer_cache, required=False),
+        StartupPhase("chroma", warm_chroma, required=False),
+        StartupPhase("udc_data", warm_udc_data),
+        # Analyses only; chat keeps serving if a council cannot be imported
+        StartupPhase("councils", warm_councils, required=False),
+        StartupPhase("retrieval", warm_retrieval, required=False),
+        StartupPhase("openapi", warm_openapi, required=False),
+    ]
+
+
+# Global instance
+warmup = Warmup(default_phases())
+
+
+def _collect_metrics():
+    yield ("polaris_ready", "gauge", "1 once the startup warmup finished and every required phase succeeded",
+           [({}, int(warmup.ready))])
+    yield ("polaris_startup_phase_duration_seconds", "gauge", "Duration of each startup warmup phase",
+           [({"phase": phase.name, "status": phase.status}, phase.seconds) for phase in warmup.phases])
+
+
+metrics_registry.register_collector("startup", _collect_metrics)
@@ -2,6 +2,8 @@
 Database base configuration and session management.
 """
 
+import asyncio
+
 from sqlalchemy import create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
@@ -70,6 +72,32 @@ async def init_db() -> None:
         await conn.run_sync(Base.metadata.create_all)
 
 
+async def warm_pool(connections: int) -> int:
+    """
+    Open pool connections ahead of the first request.
+    
+    Checks out ``connections`` connections at once (so the pool really
+    creates that many), runs a trivial query on each and returns them.
+    
+    Args:
+        connections: Connections to open (capped at the pool size).
+        
+    Returns:
+        int: Connections opened.
+    """
+    from sqlalchemy import text
+    
+    count = max(1, min(connections, settings.database_pool_size))
+    opened = await asyncio.gather(*(engine.connect() for _ in range(count)))
+    try:
+        for conn in opened:
+            await conn.execute(text("SELECT 1"))
+    finally:
+        for conn in opened:
+            await conn.close()
+    return count
+
+
 async def close_db() -> None:
     """
     Close database connections.
@@ -4,18 +4,27 @@ UDC Polaris Multi-Agent Strategic Intelligence System - Main Application.
 FastAPI application entry point.
 """
 
+import asyncio
+import sys
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from app.core.config import settings
+from app.core.metrics import CONTENT_TYPE, MetricsMiddleware, metrics_registry
+from app.core.rate_limit import RateLimitMiddleware, rate_limiter
+from app.core.startup import warmup
 
 # Import routers
 from app.api.v1.api import api_router
+from app.services.analysis_jobs import analysis_jobs
+from app.services.llm_clients import llm_clients
+from app.services.llm_governor import llm_governor
+from app.services.single_flight import single_flight
 
 
 @asynccontextmanager
@@ -36,30 +45,35 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     print(f"📍 Environment: {settings.env}")
     print(f"🔧 Debug mode: {settings.debug}")
     
-    # Initialize database connections
-    # await init_db()
+    # Warm the database pool, Redis, embedding model, Chroma, data files and
+    # council imports in the background; /ready turns green when done
+    warmup_task = None
+    if settings.startup_warmup:
+        warmup_task = asyncio.create_task(warmup.run(app), name="startup-warmup")
+    else:
+        warmup.skip()
     
-    # Initialize ChromaDB
-    # await init_chroma()
+    # Start background analysis workers
+    await analysis_jobs.start()
     
-    # Initialize Redis
-    # await init_redis()
-    
-    # Load Qatar Open Data catalog
-    # await load_qatar_data_catalog()
-    
-    print("✅ Application startup complete")
+    print("✅ Application startup complete (warmup running in background)")
     
     yield
     
     # Shutdown
     print("🛑 Shutting down application...")
     
-    # Close database connections
-    # await close_db()
+    if warmup_task is not None and not warmup_task.done():
+        warmup_task.cancel()
+        await asyncio.gather(warmup_task, return_exceptions=True)
+    
+    # Stop background analysis workers
+    await analysis_jobs.shutdown()
     
-    # Close Redis connections
-    # await close_redis()
+    # Close database connections (if anything opened the engine)
+    db_base = sys.modules.get("app.db.base")
+    if db_base is not None:
+        await db_base.close_db()
     
     print("✅ Application shutdown complete")
 
@@ -75,6 +89,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Per-client rate limits (LLM-heavy endpoints are limited separately).
+# Added before CORS so 429 responses still carry CORS headers.
+app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -87,6 +105,10 @@ app.add_middleware(
 # Add GZip compression
 app.add_middleware(GZipMiddleware, minimum_size=1000)
 
+# Per-route latency histograms (outermost, so 429s and compression are timed too)
+if settings.enable_metrics:
+    app.add_middleware(MetricsMiddleware, registry=metrics_registry)
+
 # Include API routers
 app.include_router(api_router, prefix=settings.api_prefix)
 
@@ -117,7 +139,8 @@ async def health_check():
         dict: Health status of application components.
     """
     health_status = {
-        "status": "healthy",
+        # Liveness stays 200; "starting" until the warmup finishes (see /ready)
+        "status": "healthy" if warmup.ready else warmup.state,
         "app": settings.app_name,
         "version": settings.app_version,
         "environment": settings.env,
@@ -126,12 +149,55 @@ async def health_check():
             # "database": await check_db_health(),
             # "redis": await check_redis_health(),
             # "chroma": await check_chroma_health(),
-        }
+        },
+        # Warmup state and per-phase startup timings
+        "startup": warmup.report(),
+        # Executions saved by sharing in-flight runs of identical questions
+        "request_coalescing": dict(single_flight.stats),
+        # Per-model in-flight LLM requests, queue depth and wait times
+        "llm_governor": llm_governor.snapshot(),
+        # Shared LLM connection pools: requests vs. new connections/TLS handshakes
+        "llm_clients": llm_clients.snapshot(),
     }
     
     return JSONResponse(content=health_status, status_code=200)
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness probe for load balancers.
+    
+    Returns 200 only once the startup warmup has finished and every
+    required phase succeeded; 503 while warming up or after a failure.
+    
+    Returns:
+        JSONResponse: Readiness state and per-phase startup timings.
+    """
+    report = warmup.report()
+    return JSONResponse(
+        content={"status": report["state"], "startup": report},
+        status_code=200 if warmup.ready else 503,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """
+    Prometheus scrape endpoint.
+    
+    Request latency per route, LLM tokens/cost/latency per model and agent,
+    cache hit ratios, Chroma query latency, embedding batch sizes and queue
+    depths of this worker process.
+    
+    Returns:
+        Response: Metrics in the Prometheus text format.
+    """
+    if not settings.enable_metrics:
+        return JSONResponse(content={"detail": "Metrics disabled"}, status_code=404)
+    return Response(content=metrics_registry.render(), media_type=CONTENT_TYPE)
+
+
 @app.get(f"{settings.api_prefix}/info")
 async def api_info():
     """
@@ -0,0 +1,257 @@
+"""
+Background Council Analyses
+
+Council runs make model calls that can take up to 10 minutes, which is too
+long to hold an HTTP request open. ``AnalysisJobManager`` accepts an
+analysis, persists it as queued and returns immediately. A bounded pool of
+in-process workers then runs the council and records stage progress and the
+final result through the store. ``GET /analyses/{id}`` reads the store.
+
+The queue is an in-process ``asyncio.Queue`` by default. With
+``analysis_queue_backend="redis"`` job ids go through a Redis list (any
+Redis-compatible server at ``redis_url``), so several API processes share
+one backlog. Cancellation is recorded in the store. A queued job is then
+skipped, and a running job is stopped at once if it runs in this process,
+otherwise at its next stage boundary.
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from app.core.config import settings
+from app.core.metrics import metrics_registry
+from app.services.analysis_store import FINISHED_STATUSES, SqlAnalysisStore
+from app.services.llm_governor import current_query
+
+logger = logging.getLogger(__name__)
+
+StageCallback = Callable[[int, int, str], Awaitable[None]]
+CouncilRunner = Callable[[str, Optional[str], StageCallback], Awaitable[Dict[str, Any]]]
+
+REDIS_QUEUE_KEY = "polaris:analysis_jobs"
+
+
+class JobCancelled(Exception):
+    """Raised at a stage boundary when the job was cancelled elsewhere."""
+
+
+class LocalJobQueue:
+    """In-process queue of job ids."""
+
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        # Created lazily so it binds to the running event loop
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        return self._queue
+
+    async def put(self, job_id: str) -> None:
+        await self.queue.put(job_id)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+    def depth(self) -> int:
+        """Jobs waiting for a worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+
+class RedisJobQueue:
+    """Job ids in a Redis list shared by every API process."""
+
+    def __init__(self, url: str, key: str = REDIS_QUEUE_KEY, password: Optional[str] = None):
+        import redis.asyncio as redis
+
+        self.client = redis.from_url(url, password=password, decode_responses=True)
+        self.key = key
+
+    async def put(self, job_id: str) -> None:
+        await self.client.lpush(self.key, job_id)
+
+    async def get(self) -> str:
+        while True:
+            item = await self.client.brpop(self.key, timeout=5)
+            if item is not None:
+                return item[1]
+
+
+async def run_unbeatable_council(question: str, data_context: Optional[str], on_stage: StageCallback) -> Dict[str, Any]:
+    """Run the UnbeatableStrategicCouncil pipeline."""
+    from app.agents.unbeatable_council import UnbeatableStrategicCouncil
+
+    council = UnbeatableStrategicCouncil(anthropic_api_key=settings.anthropic_api_key)
+    return await council.analyze_ceo_question(question, data_context, on_stage=on_stage)
+
+
+async def run_ultimate_council(question: str, data_context: Optional[str], on_stage: StageCallback) -> Dict[str, Any]:
+    """Run the UltimateStrategicCouncil pipeline (retrieves its own context)."""
+    from ultimate_council import UltimateStrategicCouncil
+
+    council = UltimateStrategicCouncil()
+    return await council.analyze_ceo_question(question, on_stage=on_stage)
+
+
+COUNCIL_RUNNERS: Dict[str, CouncilRunner] = {
+    "unbeatable": run_unbeatable_council,
+    "ultimate": run_ultimate_council,
+}
+
+
+class AnalysisJobManager:
+    """
+    Queue and run council analyses in the background.
+
+    Args:
+        store: Job persistence (defaults to SqlAnalysisStore on the app database)
+        runners: Council name -> async runner(question, data_context, on_stage)
+        max_workers: Analyses run concurrently by this process
+        queue: LocalJobQueue (default) or RedisJobQueue
+    """
+
+    def __init__(
+        self,
+        store=None,
+        runners: Optional[Dict[str, CouncilRunner]] = None,
+        max_workers: int = 2,
+        queue=None
+    ):
+        self.store = store or SqlAnalysisStore()
+        self.runners = runners or COUNCIL_RUNNERS
+        self.max_workers = max(1, max_workers)
+        self.queue = queue or LocalJobQueue()
+        self._workers: Set[asyncio.Task] = set()
+        self._running: Dict[str, asyncio.Task] = {}
+        self._started = 0
+        # Seconds before a worker reads the queue again after a read error
+        self.queue_retry_delay = 1.0
+
+    async def start(self) -> None:
+        """Start the worker pool, replacing workers that have stopped (idempotent)."""
+        missing = self.max_workers - len(self._workers)
+        for _ in range(missing):
+            task = asyncio.create_task(self._worker(), name=f"analysis-worker-{self._started}")
+            task.add_done_callback(self._workers.discard)
+            self._workers.add(task)
+            self._started += 1
+        if missing > 0:
+            logger.info(f"Analysis job workers started: {missing}")
+
+    async def shutdown(self) -> None:
+        """Stop the workers; running jobs are recorded as cancelled."""
+        workers = list(self._workers)
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def submit(self, question: str, council: str = "unbeatable", data_context: Optional[str] = None) -> Dict[str, Any]:
+        """Persist and enqueue a council analysis; returns the queued job view."""
+        if council not in self.runners:
+            raise ValueError(f"Unknown council '{council}'. Available: {sorted(self.runners)}")
+        await self.start()
+        job = {
+            "status": "queued",
+            "council": council,
+            "data_context": data_context,
+            "stage": None,
+            "progress": [],
+            "error": None,
+        }
+        job_id = await self.store.create(question, job)
+        await self.queue.put(job_id)
+        return await self.store.get(job_id)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Current status, stage progress and (when completed) result."""
+        return await self.store.get(job_id)
+
+    async def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Cancel a queued or running job; finished jobs are returned unchanged."""
+        job = await self.store.get(job_id)
+        if job is None or job["status"] in FINISHED_STATUSES:
+            return job
+        view = await self.store.update_job(job_id, status="cancelled")
+        task = self._running.get(job_id)
+        if task is not None:
+            task.cancel()
+        return view
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                job_id = await self.queue.get()
+            except Exception:
+                # E.g. Redis unreachable; only cancellation stops a worker
+                logger.exception("Reading the analysis job queue failed")
+                await asyncio.sleep(self.queue_retry_delay)
+                continue
+            task = asyncio.create_task(self._run(job_id))
+            self._running[job_id] = task
+            try:
+                # Unlike awaiting the task, wait() raises only when this worker
+                # is cancelled, not when cancel() stopped the job
+                await asyncio.wait({task})
+            except asyncio.CancelledError:
+                # Worker shutdown: stop the job too
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+                raise
+            finally:
+                self._running.pop(job_id, None)
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(f"Analysis job {job_id} crashed", exc_info=task.exception())
+
+    async def _run(self, job_id: str) -> None:
+        job = await self.store.get(job_id)
+        if job is None or job["status"] != "queued":
+            return  # Cancelled while queued (or already picked up)
+
+        progress = list(job.get("progress") or [])
+        current_query.set(job_id)  # LLM governor queues each analysis fairly
+
+        async def on_stage(stage: int, total: int, description: str) -> None:
+            current = await self.store.get(job_id)
+            if current is None or current["status"] == "cancelled":
+                raise JobCancelled()
+            stage_info = {"number": stage, "total": total, "description": description}
+            progress.append(stage_info)
+            await self.store.update_job(job_id, stage=stage_info, progress=list(progress))
+
+        await self.store.update_job(job_id, status="running")
+        try:
+            result = await self.runners[job["council"]](job["question"], job.get("data_context"), on_stage)
+            current = await self.store.get(job_id)
+            if current is not None and current["status"] == "cancelled":
+                return  # Cancelled after the last stage; keep the cancel
+            await self.store.complete(job_id, result)
+        except (asyncio.CancelledError, JobCancelled):
+            await self.store.update_job(job_id, status="cancelled")
+        except Exception as e:
+            logger.exception(f"Analysis job {job_id} failed")
+            await self.store.update_job(job_id, status="failed", error=str(e))
+
+
+def _default_queue():
+    if settings.analysis_queue_backend == "redis":
+        return RedisJobQueue(settings.redis_url, password=settings.redis_password)
+    return LocalJobQueue()
+
+
+# Global instance
+analysis_jobs = AnalysisJobManager(max_workers=settings.analysis_workers, queue=_default_queue())
+
+
+def _collect_metrics():
+    yield ("polaris_analysis_jobs_running", "gauge", "Council analyses running in this process",
+           [({}, len(analysis_jobs._running))])
+    # A Redis list is shared by every process; its length is not sampled per scrape
+    if isinstance(analysis_jobs.queue, LocalJobQueue):
+        yield ("polaris_analysis_queue_depth", "gauge", "Council analyses waiting for a worker",
+               [({}, analysis_jobs.queue.depth())])
+
+
+metrics_registry.register_collector("analysis_jobs", _collect_metrics)
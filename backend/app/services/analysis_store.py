@@ -0,0 +1,223 @@
+"""
+Analysis Job Persistence
+
+Stores background council analyses in the existing session tables:
+
+- ``AnalysisSession``: one row per job. Job state (queue status, council,
+  stage progress, errors) lives under ``session_metadata["job"]``. The final
+  recommendation, token count and cost are filled in on completion.
+- ``AgentResponse``: one row per expert analysis (round 1).
+- ``DebateTension``: one row per expert debate the council identified.
+
+The same row is the source of truth for ``GET /analyses/{id}``, so any API
+process can report on a job whichever worker runs it.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.prompt_caching import count_tokens
+
+# Job status (finer-grained than SessionStatus) -> AnalysisSession.session_status
+JOB_STATUSES = ("queued", "running", "completed", "failed", "cancelled")
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+
+def _session_status(job_status: str):
+    from app.db.models import SessionStatus
+
+    return {
+        "completed": SessionStatus.COMPLETED,
+        "failed": SessionStatus.FAILED,
+        "cancelled": SessionStatus.CANCELLED,
+    }.get(job_status, SessionStatus.ACTIVE)
+
+
+def expert_rows(decision_sheet: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """AgentResponse column values for each expert analysis in a decision sheet."""
+    models = decision_sheet.get("metadata", {}).get("models_used") or decision_sheet.get("models_used") or {}
+    default_model = models.get("experts") or models.get("agents") or "unknown"
+    return [
+        {
+            "agent_name": analysis.get("agent", "Unknown"),
+            "agent_role": analysis.get("domain") or analysis.get("title") or "Expert",
+            "round_number": 1,
+            "response_text": analysis.get("analysis") or analysis.get("error", ""),
+            "tokens_used": analysis.get("tokens") or count_tokens(analysis.get("usage") or {}),
+            "model_used": analysis.get("model") or default_model,
+        }
+        for analysis in decision_sheet.get("expert_analyses", [])
+    ]
+
+
+def _debate_positions(debate: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """(agent, stance) pairs from either council's debate format."""
+    if isinstance(debate.get("perspectives"), dict):  # Unbeatable: {agent: stance}
+        return list(debate["perspectives"].items())
+    return [(p.get("agent", "Unknown"), p.get("stance", "")) for p in debate.get("positions", [])]
+
+
+def tension_rows(decision_sheet: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """DebateTension column values for each expert debate in a decision sheet."""
+    rows = []
+    for debate in decision_sheet.get("expert_debates", []):
+        positions = _debate_positions(debate)
+        if not positions:
+            continue
+        first = positions[0]
+        # The opposing side is the first expert whose stance differs
+        second = next((p for p in positions[1:] if p[1] != first[1]), positions[-1])
+        rows.append({
+            "tension_title": str(debate.get("topic", "Expert disagreement"))[:200],
+            "tension_description": debate.get("note") or debate.get("type") or "Experts disagree",
+            "agent_1_name": first[0],
+            "agent_2_name": second[0],
+            "agent_1_position": first[1],
+            "agent_2_position": second[1],
+        })
+    return rows
+
+
+def recommendation_payload(decision_sheet: Dict[str, Any]) -> Dict[str, Any]:
+    """AnalysisSession.final_recommendation value for a decision sheet."""
+    recommendation = decision_sheet.get("final_recommendation")
+    if isinstance(recommendation, dict):
+        recommendation = recommendation.get("synthesis")
+    return {
+        "executive_summary": decision_sheet.get("executive_summary"),
+        "recommendation": recommendation,
+    }
+
+
+class SqlAnalysisStore:
+    """
+    Async SQLAlchemy store for analysis jobs.
+
+    Args:
+        session_factory: AsyncSession factory (defaults to app.db.base.AsyncSessionLocal)
+    """
+
+    def __init__(self, session_factory=None):
+        self._session_factory = session_factory
+
+    @property
+    def session_factory(self):
+        if self._session_factory is None:
+            from app.db.base import AsyncSessionLocal
+            self._session_factory = AsyncSessionLocal
+        return self._session_factory
+
+    async def create(self, question: str, job: Dict[str, Any]) -> str:
+        """Insert a queued job; returns its id."""
+        from app.db.models import AnalysisSession
+
+        async with self.session_factory() as db:
+            session = AnalysisSession(
+                ceo_question=question,
+                session_status=_session_status(job["status"]),
+                session_metadata={"job": job},
+            )
+            db.add(session)
+            await db.commit()
+            return session.id
+
+    async def update_job(self, job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        """Merge fields into the job state; returns the updated view."""
+        from app.db.models import AnalysisSession
+
+        async with self.session_factory() as db:
+            session = await db.get(AnalysisSession, job_id)
+            if session is None:
+                return None
+            self._apply(session, fields)
+            await db.commit()
+            return await self._view(db, session)
+
+    async def complete(self, job_id: str, decision_sheet: Dict[str, Any], **fields: Any) -> None:
+        """Persist a finished council run and its expert responses and tensions."""
+        from app.db.models import AgentResponse, AnalysisSession, DebateTension
+
+        async with self.session_factory() as db:
+            session = await db.get(AnalysisSession, job_id)
+            if session is None:
+                return
+            agents = expert_rows(decision_sheet)
+            metadata = decision_sheet.get("metadata", {})
+            session.final_recommendation = recommendation_payload(decision_sheet)
+            session.total_tokens_used = metadata.get("total_tokens") or sum(a["tokens_used"] for a in agents)
+            session.estimated_cost_qr = metadata.get("estimated_cost_qar", 0.0)
+            db.add_all(AgentResponse(session_id=job_id, **row) for row in agents)
+            db.add_all(DebateTension(session_id=job_id, **row) for row in tension_rows(decision_sheet))
+            self._apply(session, {"status": "completed", **fields})
+            await db.commit()
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Job view for the API, or None if unknown."""
+        from app.db.models import AnalysisSession
+
+        async with self.session_factory() as db:
+            session = await db.get(AnalysisSession, job_id)
+            if session is None:
+                return None
+            return await self._view(db, session)
+
+    @staticmethod
+    def _apply(session, fields: Dict[str, Any]) -> None:
+        job = dict((session.session_metadata or {}).get("job", {}))
+        job.update(fields)
+        # Reassign so SQLAlchemy notices the JSON change
+        session.session_metadata = {**(session.session_metadata or {}), "job": job}
+        status = job.get("status")
+        session.session_status = _session_status(status)
+        if status == "running" and session.started_at is None:
+            session.started_at = datetime.utcnow()
+        if status in FINISHED_STATUSES and session.completed_at is None:
+            session.completed_at = datetime.utcnow()
+
+    @staticmethod
+    async def _view(db, session) -> Dict[str, Any]:
+        from sqlalchemy import select
+
+        from app.db.models import AgentResponse, DebateTension
+
+        job = (session.session_metadata or {}).get("job", {})
+        view = {
+            "id": session.id,
+            "question": session.ceo_question,
+            **job,
+            "created_at": session.created_at.isoformat() if session.created_at else None,
+            "started_at": session.started_at.isoformat() if session.started_at else None,
+            "completed_at": session.completed_at.isoformat() if session.completed_at else None,
+        }
+        if job.get("status") == "completed":
+            responses = (await db.execute(
+                select(AgentResponse).where(AgentResponse.session_id == session.id)
+            )).scalars().all()
+            tensions = (await db.execute(
+                select(DebateTension).where(DebateTension.session_id == session.id)
+            )).scalars().all()
+            view["result"] = {
+                "final_recommendation": session.final_recommendation,
+                "total_tokens": session.total_tokens_used,
+                "estimated_cost_qr": session.estimated_cost_qr,
+                "agent_responses": [
+                    {
+                        "agent": r.agent_name,
+                        "role": r.agent_role,
+                        "response": r.response_text,
+                        "tokens": r.tokens_used,
+                        "model": r.model_used,
+                    }
+                    for r in responses
+                ],
+                "tensions": [
+                    {
+                        "title": t.tension_title,
+                        "description": t.tension_description,
+                        "agents": [t.agent_1_name, t.agent_2_name],
+                        "positions": [t.agent_1_position, t.agent_2_position],
+                    }
+                    for t in tensions
+                ],
+            }
+        return view
@@ -0,0 +1,271 @@
+"""
+Final-Answer Cache
+
+Caches the complete output of an analysis pipeline per question. A new
+question is answered from the cache when its embedding is within the
+similarity threshold of a cached question that was answered against the same
+knowledge-base data version and asks about the same specifics: the same
+years and fiscal periods (FY24 and 2024 are one period) and the same
+figures. "Revenue in 2023" and "revenue in 2024" embed almost identically
+but need different answers. On a hit the whole pipeline (extraction,
+agents, debate, synthesis) is skipped.
+
+Entries are namespaced per pipeline ("uis", "ultimate_council", ...) because
+each produces a differently shaped answer. Without an embedding model,
+lookups fall back to exact matches on the normalized question text.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.metrics import metrics_registry
+from .numeric_scanner import FIGURE_KINDS, scan
+from .udc_data_query import question_terms
+
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_ANSWER_CACHE_PATH = Path(__file__).resolve().parents[3] / "data" / "cache" / "answer_cache.sqlite3"
+DEFAULT_SIMILARITY = 0.92
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def normalize_question(question: str) -> str:
+    """Lower-case, strip punctuation and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", question.lower()).split())
+
+
+def question_specifics(question: str) -> FrozenSet[Tuple[str, Any]]:
+    """
+    Periods and figures a question asks about.
+
+    Years and fiscal periods are normalized (``FY24`` and ``2024`` both give
+    "2024"); amounts are compared in millions, so "QR 0.5bn" equals "QR 500m".
+    """
+    _, periods = question_terms(question)
+    specifics = {("period", period) for period in periods}
+    for token in scan(question):
+        if token.kind == "amount":
+            specifics.add((token.kind, round(token.millions, 6)))
+        elif token.kind in FIGURE_KINDS:
+            specifics.add((token.kind, token.value))
+    return frozenset(specifics)
+
+
+def content_version(*parts: Any) -> str:
+    """Data version for pipelines whose input context is passed in directly."""
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode("utf-8")).hexdigest()[:16]
+
+
+def sentence_embedder() -> Optional[Callable[[str], Sequence[float]]]:
+    """Same embedding model as the knowledge base (sidecar or in-process), or None if not installed."""
+    from .embedding_service import text_embedder
+
+    embed = text_embedder("all-MiniLM-L6-v2")
+    if embed is None:
+        logger.warning("sentence-transformers not installed - answer cache uses exact question matches")
+    return embed
+
+
+class AnswerCache:
+    """
+    Persistent question -> final answer cache (SQLite).
+
+    The embedding model is loaded on first lookup, and the database file is
+    created on first use, so importing this module stays cheap.
+    """
+
+    def __init__(
+        self,
+        db_path: Path = DEFAULT_ANSWER_CACHE_PATH,
+        embed_fn: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        use_embeddings: bool = True
+    ):
+        self.db_path = Path(db_path)
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self._embed_fn = embed_fn
+        self._embedder_loaded = embed_fn is not None or not use_embeddings
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        self.stats = {"hits": 0, "misses": 0, "stores": 0}
+
+    def get(
+        self,
+        namespace: str,
+        question: str,
+        data_version: Optional[str],
+        similarity_threshold: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached answer for a question, or None.
+
+        Returns:
+            Dict with 'payload' (the stored answer) and 'cache' metadata
+            (matched question, similarity, age, data version)
+        """
+        threshold = self.similarity_threshold if similarity_threshold is None else similarity_threshold
+        normalized = normalize_question(question)
+
+        with self._lock:
+            conn = self._connection()
+            rows = conn.execute(
+                "SELECT id, question, question_norm, embedding, payload, created FROM answers "
+                "WHERE namespace = ? AND data_version IS ? AND created >= ?",
+                (namespace, data_version, time.time() - self.ttl_seconds)
+            ).fetchall()
+            if not rows:
+                self.stats["misses"] += 1
+                return None
+
+            best_row, best_similarity = None, -1.0
+            for row in rows:
+                if row[2] == normalized:
+                    best_row, best_similarity = row, 1.0
+                    break
+
+            embed = self._embedder()
+            if best_row is None and embed is not None:
+                # Similar wording is not enough: the periods and figures must be the same
+                specifics = question_specifics(question)
+                candidates = [
+                    row for row in rows
+                    if row[3] is not None and question_specifics(row[1]) == specifics
+                ]
+                if candidates:
+                    query = self._embed(embed, question)
+                    matrix = np.vstack([np.frombuffer(row[3], dtype=np.float32) for row in candidates])
+                    similarities = matrix @ query
+                    index = int(np.argmax(similarities))
+                    if similarities[index] >= threshold:
+                        best_row, best_similarity = candidates[index], float(similarities[index])
+
+            if best_row is None:
+                self.stats["misses"] += 1
+                return None
+
+            with conn:
+                conn.execute("UPDATE answers SET hits = hits + 1 WHERE id = ?", (best_row[0],))
+            self.stats["hits"] += 1
+            return {
+                "payload": json.loads(best_row[4]),
+                "cache": {
+                    "cached": True,
+                    "matched_question": best_row[1],
+                    "similarity": best_similarity,
+                    "age_seconds": time.time() - best_row[5],
+                    "data_version": data_version
+                }
+            }
+
+    def put(
+        self,
+        namespace: str,
+        question: str,
+        data_version: Optional[str],
+        payload: Dict[str, Any]
+    ) -> None:
+        """Store a final answer, replacing any answer to the same question."""
+        normalized = normalize_question(question)
+        embed = self._embedder()
+        embedding = self._embed(embed, question).tobytes() if embed is not None else None
+
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "DELETE FROM answers WHERE namespace = ? AND question_norm = ?",
+                    (namespace, normalized)
+                )
+                # Answers built on older knowledge-base data can never be served again
+                conn.execute(
+                    "DELETE FROM answers WHERE namespace = ? AND data_version IS NOT ?",
+                    (namespace, data_version)
+                )
+                conn.execute(
+                    "INSERT INTO answers (namespace, data_version, question, question_norm, "
+                    "embedding, payload, created, hits) VALUES (?, ?, ?, ?, ?, ?, ?, 0)",
+                    (
+                        namespace, data_version, question, normalized, embedding,
+                        json.dumps(payload, default=str), time.time()
+                    )
+                )
+            self.stats["stores"] += 1
+
+    def warm(self) -> int:
+        """Load the embedding model and open the database now; returns cached answers."""
+        self._embedder()
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """Drop cached answers (for one namespace, or all)."""
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                if namespace is None:
+                    conn.execute("DELETE FROM answers")
+                else:
+                    conn.execute("DELETE FROM answers WHERE namespace = ?", (namespace,))
+
+    def _embedder(self) -> Optional[Callable[[str], Sequence[float]]]:
+        if not self._embedder_loaded:
+            self._embed_fn = sentence_embedder()
+            self._embedder_loaded = True
+        return self._embed_fn
+
+    @staticmethod
+    def _embed(embed: Callable[[str], Sequence[float]], text: str) -> np.ndarray:
+        vector = np.asarray(embed(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS answers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    namespace TEXT NOT NULL,
+                    data_version TEXT,
+                    question TEXT NOT NULL,
+                    question_norm TEXT NOT NULL,
+                    embedding BLOB,
+                    payload TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    hits INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE INDEX IF NOT EXISTS idx_answers_lookup ON answers (namespace, data_version);
+                """
+            )
+        return self._conn
+
+
+# Global instance shared by the UIS pipeline and the backend councils
+answer_cache = AnswerCache()
+
+
+def _collect_metrics():
+    stats = dict(answer_cache.stats)
+    lookups = stats["hits"] + stats["misses"]
+    yield ("polaris_answer_cache_lookups_total", "counter", "Final-answer cache lookups by result",
+           [({"result": "hit"}, stats["hits"]), ({"result": "miss"}, stats["misses"])])
+    yield ("polaris_answer_cache_hit_ratio", "gauge", "Final-answer cache hits per lookup since start",
+           [({}, stats["hits"] / lookups if lookups else 0.0)])
+
+
+metrics_registry.register_collector("answer_cache", _collect_metrics)
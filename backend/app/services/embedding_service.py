@@ -0,0 +1,417 @@
+"""
+Shared embedding service
+
+Each API worker, Chainlit worker and UIS process used to load its own copy
+of ``all-MiniLM-L6-v2`` (the answer cache, the LLM response cache, the
+knowledge base and rag_system each loaded one). Memory grew with the worker
+count, and every worker cold-started slowly. This module runs the model
+once per host, in an optional sidecar process that listens on a Unix
+domain socket:
+
+    python -m app.services.embedding_service --socket /tmp/polaris-embeddings.sock
+
+Workers find the sidecar through EMBEDDING_SOCKET. ``text_embedder()`` and
+the knowledge base's Chroma embedding function use it when the socket
+exists. Without it they load the model locally, once per process.
+
+The sidecar batches dynamically. Requests that arrive within
+``max_wait`` seconds of each other (a few milliseconds) are encoded in
+one ``model.encode`` call, up to ``max_batch`` texts. Requests that arrive
+while a batch is encoding form the next batch.
+
+Batch sizes, the pending queue and client latency are exported as
+Prometheus metrics. Pass ``--metrics-port`` to give the sidecar an exporter.
+
+Wire format: every frame is a 4-byte big-endian length plus a payload.
+A request is one JSON frame, ``{"texts": [...]}``. The response is a JSON
+header frame, ``{"count": n, "dim": d}`` or ``{"error": "..."}``. On
+success a second frame follows with n*d little-endian float32 values.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..core.metrics import SIZE_BUCKETS, metrics_registry, start_http_server
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "all-MiniLM-L6-v2"
+DEFAULT_SOCKET = "/tmp/polaris-embeddings.sock"
+SOCKET_ENV = "EMBEDDING_SOCKET"
+
+_HEADER = struct.Struct(">I")
+_MAX_FRAME = 64 * 1024 * 1024
+
+Encoder = Callable[[List[str]], Any]
+
+EMBEDDING_BATCH_SIZE = metrics_registry.histogram(
+    "polaris_embedding_batch_size", "Texts per model encode call", buckets=SIZE_BUCKETS
+)
+EMBEDDING_CLIENT_SECONDS = metrics_registry.histogram(
+    "polaris_embedding_client_duration_seconds", "Round trip of sidecar embedding requests"
+)
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent embedding requests into shared encode calls.
+
+    Args:
+        encode: Blocking batch encoder (list of texts -> 2-D array); runs in a worker thread
+        max_batch: Most texts per encode call
+        max_wait: Seconds the first request in a batch waits for others to join
+    """
+
+    def __init__(self, encode: Encoder, max_batch: int = 64, max_wait: float = 0.005):
+        self.encode = encode
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait
+        self._pending: List[Tuple[List[str], asyncio.Future]] = []
+        self._pending_texts = 0
+        self._arrived: Optional[asyncio.Event] = None
+        self._full: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.stats = {"requests": 0, "texts": 0, "batches": 0, "largest_batch": 0}
+
+    @property
+    def queue_depth(self) -> int:
+        """Texts waiting for the next encode call."""
+        return self._pending_texts
+
+    async def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embeddings for ``texts`` (one row per text), batched with concurrent callers."""
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        self._start()
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((texts, future))
+        self._pending_texts += len(texts)
+        self.stats["requests"] += 1
+        self._arrived.set()
+        if self._pending_texts >= self.max_batch:
+            self._full.set()
+        return await future
+
+    async def close(self) -> None:
+        """Stop the batching task (pending requests are cancelled)."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        self._pending_texts = 0
+
+    def _start(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._arrived = asyncio.Event()
+            self._full = asyncio.Event()
+            self._worker = asyncio.create_task(self._run(), name="embedding-batcher")
+
+    async def _run(self) -> None:
+        while True:
+            await self._arrived.wait()
+            if self._pending_texts < self.max_batch:
+                try:
+                    await asyncio.wait_for(self._full.wait(), self.max_wait)
+                except asyncio.TimeoutError:
+                    pass
+            batch = self._take()
+            await self._encode(batch)
+
+    def _take(self) -> List[Tuple[List[str], asyncio.Future]]:
+        """Whole requests up to max_batch texts (always at least one request)."""
+        batch, size = [], 0
+        while self._pending and (not batch or size + len(self._pending[0][0]) <= self.max_batch):
+            texts, future = self._pending.pop(0)
+            batch.append((texts, future))
+            size += len(texts)
+        self._pending_texts -= size
+        if not self._pending:
+            self._arrived.clear()
+        if self._pending_texts < self.max_batch:
+            self._full.clear()
+        return batch
+
+    async def _encode(self, batch: List[Tuple[List[str], asyncio.Future]]) -> None:
+        texts = [text for request, _ in batch for text in request]
+        self.stats["batches"] += 1
+        self.stats["texts"] += len(texts)
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(texts))
+        EMBEDDING_BATCH_SIZE.observe(len(texts))
+        try:
+            vectors = np.asarray(await asyncio.to_thread(self.encode, texts), dtype=np.float32)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        offset = 0
+        for request, future in batch:
+            if not future.done():
+                future.set_result(vectors[offset:offset + len(request)])
+            offset += len(request)
+
+
+class EmbeddingServer:
+    """
+    Serve a MicroBatcher on a Unix domain socket.
+
+    Args:
+        socket_path: Socket file to listen on (a stale file is replaced)
+        batcher: MicroBatcher wrapping the loaded model
+    """
+
+    def __init__(self, socket_path: str, batcher: MicroBatcher):
+        self.socket_path = socket_path
+        self.batcher = batcher
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    async def start(self) -> None:
+        path = Path(self.socket_path)
+        if path.exists():
+            path.unlink()
+        self._server = await asyncio.start_unix_server(self._handle, path=str(path))
+        logger.info(f"Embedding service listening on {path}")
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.close()
+        Path(self.socket_path).unlink(missing_ok=True)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    header = await reader.readexactly(_HEADER.size)
+                except asyncio.IncompleteReadError:
+                    return  # Client closed the connection
+                (length,) = _HEADER.unpack(header)
+                if length > _MAX_FRAME:
+                    return
+                request = json.loads(await reader.readexactly(length))
+                try:
+                    vectors = await self.batcher.embed(request["texts"])
+                except Exception as e:
+                    logger.error(f"Embedding request failed: {e}")
+                    _write_frame(writer, json.dumps({"error": str(e)}).encode("utf-8"))
+                else:
+                    count, dim = vectors.shape if vectors.size else (0, 0)
+                    _write_frame(writer, json.dumps({"count": count, "dim": dim}).encode("utf-8"))
+                    _write_frame(writer, vectors.astype("<f4").tobytes())
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+
+class EmbeddingClient:
+    """
+    Blocking client for the embedding sidecar.
+
+    One connection per thread, kept open between calls. Safe to share
+    across the threads of a worker. A call that fails for any reason
+    (timeout included) drops its connection, so a late reply is never read
+    as the answer to the next request.
+
+    Args:
+        socket_path: Sidecar socket
+        timeout: Seconds to wait for a response
+    """
+
+    def __init__(self, socket_path: str, timeout: float = 30.0):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def embed(self, texts: Sequence[str]) -> np.ndarray:
+        """Embeddings for ``texts``, one row per text."""
+        payload = json.dumps({"texts": list(texts)}).encode("utf-8")
+        with EMBEDDING_CLIENT_SECONDS.time():
+            try:
+                return self._request(payload)
+            except ConnectionError:
+                # The sidecar restarted; reconnect once
+                return self._request(payload)
+
+    def embed_one(self, text: str) -> np.ndarray:
+        return self.embed([text])[0]
+
+    def _request(self, payload: bytes) -> np.ndarray:
+        sock = self._socket()
+        try:
+            sock.sendall(_HEADER.pack(len(payload)) + payload)
+            header = json.loads(_recv_frame(sock))
+            if "error" in header:
+                raise RuntimeError(f"Embedding service error: {header['error']}")
+            data = _recv_frame(sock)
+        except BaseException:
+            # The connection may hold a partial or late reply
+            self._disconnect()
+            raise
+        return np.frombuffer(data, dtype="<f4").reshape(header["count"], header["dim"])
+
+    def _socket(self) -> socket.socket:
+        sock = getattr(self._local, "sock", None)
+        if sock is None:
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            sock.settimeout(self.timeout)
+            try:
+                sock.connect(self.socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._local.sock = sock
+        return sock
+
+    def _disconnect(self) -> None:
+        sock = getattr(self._local, "sock", None)
+        if sock is not None:
+            sock.close()
+            self._local.sock = None
+
+
+def _write_frame(writer: asyncio.StreamWriter, payload: bytes) -> None:
+    writer.write(_HEADER.pack(len(payload)) + payload)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    chunks, remaining = [], size
+    while remaining:
+        chunk = sock.recv(min(remaining, 1 << 20))
+        if not chunk:
+            raise ConnectionError("Embedding service closed the connection")
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv_frame(sock: socket.socket) -> bytes:
+    (length,) = _HEADER.unpack(_recv_exactly(sock, _HEADER.size))
+    return _recv_exactly(sock, length)
+
+
+_local_models: Dict[str, Any] = {}
+_local_lock = threading.Lock()
+
+
+def local_encoder(model_name: str = DEFAULT_MODEL) -> Optional[Encoder]:
+    """Batch encoder on a model loaded in this process (once), or None if not installed."""
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        return None
+    with _local_lock:
+        model = _local_models.get(model_name)
+        if model is None:
+            model = _local_models[model_name] = SentenceTransformer(model_name)
+    return lambda texts: model.encode(list(texts), convert_to_numpy=True)
+
+
+def sidecar_socket() -> Optional[str]:
+    """EMBEDDING_SOCKET, if set and the sidecar is listening there."""
+    path = os.getenv(SOCKET_ENV)
+    if not path:
+        return None
+    if not Path(path).exists():
+        logger.warning(f"{SOCKET_ENV}={path} not found; loading the embedding model in this process")
+        return None
+    # A socket file left behind by a stopped sidecar refuses connections
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    probe.settimeout(1.0)
+    try:
+        probe.connect(path)
+    except OSError as e:
+        logger.warning(f"{SOCKET_ENV}={path} is not accepting connections ({e}); "
+                       f"loading the embedding model in this process")
+        return None
+    finally:
+        probe.close()
+    return path
+
+
+_clients: Dict[str, EmbeddingClient] = {}
+
+
+def sidecar_client() -> Optional[EmbeddingClient]:
+    """Shared client for the configured sidecar, or None."""
+    path = sidecar_socket()
+    if path is None:
+        return None
+    client = _clients.get(path)
+    if client is None:
+        client = _clients[path] = EmbeddingClient(path)
+    return client
+
+
+def text_embedder(model_name: str = DEFAULT_MODEL) -> Optional[Callable[[str], np.ndarray]]:
+    """
+    Single-text embedding function for the caches.
+
+    Uses the sidecar when EMBEDDING_SOCKET is set. Otherwise uses the
+    process-wide local model. Returns None if neither is available.
+    """
+    client = sidecar_client()
+    if client is not None:
+        return client.embed_one
+    encode = local_encoder(model_name)
+    if encode is None:
+        return None
+    return lambda text: encode([text])[0]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Shared sentence-embedding sidecar")
+    parser.add_argument("--socket", default=os.getenv(SOCKET_ENV) or DEFAULT_SOCKET, help="Unix socket path")
+    parser.add_argument("--model", default=DEFAULT_MODEL, help="SentenceTransformer model name")
+    parser.add_argument("--max-batch", type=int, default=64, help="Most texts per encode call")
+    parser.add_argument("--max-wait-ms", type=float, default=5.0, help="Batching window in milliseconds")
+    parser.add_argument("--metrics-port", type=int, default=0, help="Serve Prometheus metrics on this port (0 = off)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    encode = local_encoder(args.model)
+    if encode is None:
+        raise SystemExit("sentence-transformers is not installed")
+    encode(["warmup"])
+
+    batcher = MicroBatcher(encode, max_batch=args.max_batch, max_wait=args.max_wait_ms / 1000)
+    server = EmbeddingServer(args.socket, batcher)
+    if args.metrics_port:
+        metrics_registry.register_collector("embedding_batcher", lambda: [
+            ("polaris_embedding_queue_depth", "gauge", "Texts waiting for the next encode call",
+             [({}, batcher.queue_depth)]),
+        ])
+        start_http_server(args.metrics_port)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+"""
+Ingest-Time Numeric Fact Index
+
+Runs deterministic numeric fact extraction once per knowledge-base chunk at
+ingestion and stores the normalized facts in a persistent SQLite table that
+lives next to the ChromaDB files:
+
+- metric (revenue, net_profit, operating_cash_flow)
+- value, normalized to QR millions
+- fiscal period (FY24, Q3-24, 2023, ... when stated near the figure)
+- chunk ID and page, matching the ChromaDB record
+
+Figures and periods come from the shared single-pass numeric scanner. At
+query time the extraction node joins the retrieved chunk IDs against this
+table instead of re-scanning retrieved text.
+"""
+
+import sqlite3
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.services.numeric_scanner import (
+    canonical_period,
+    labelled_amounts,
+    nearest_period,
+    normalize_period,
+    scan_tokens,
+)
+
+
+FACT_INDEX_FILENAME = "fact_index.sqlite3"  # stored inside the ChromaDB persist directory
+
+
+def extract_chunk_facts(text: str, fiscal_period: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Extract every numeric fact from one chunk of text.
+
+    Args:
+        text: Chunk text
+        fiscal_period: Period to use when none is stated near the figure
+
+    Returns:
+        List of fact dicts (metric, value, unit, fiscal_period, raw_text)
+    """
+    text = ' '.join(text.split())
+    tokens = scan_tokens(text)
+    periods = [token for token in tokens if token.kind == 'period']
+
+    return [
+        {
+            'metric': pair['metric'],
+            'value': pair['value'],
+            'unit': 'QR millions',
+            'fiscal_period': nearest_period(periods, pair['offset'], pair['end']) or fiscal_period,
+            'raw_text': pair['raw_text'],
+            'offset': pair['offset']
+        }
+        for pair in labelled_amounts(text, tokens)
+    ]
+
+
+def extract_row_facts(row: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Extract facts from one spreadsheet row.
+
+    The first text cell is treated as the row label ("Revenue"); every other
+    cell is read as "<label>: <cell>", with the column name used as the fiscal
+    period when it looks like one ("FY24", "2023").
+    """
+    label = next((value for value in row.values() if isinstance(value, str) and value.strip()), None)
+    if label is None:
+        return []
+
+    facts: List[Dict[str, Any]] = []
+    for column, cell in row.items():
+        if cell is label or cell is None or cell == '':
+            continue
+        period = next((token for token in scan_tokens(str(column), {'period'})), None)
+        facts.extend(extract_chunk_facts(
+            f"{label}: {cell}",
+            fiscal_period=normalize_period(period.text) if period else None
+        ))
+    return facts
+
+
+class FactIndex:
+    """
+    Persistent chunk-level fact table (SQLite).
+
+    Re-indexing a chunk replaces its facts, so repeated ingestion of the same
+    documents stays idempotent like the ChromaDB upserts.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS chunk_facts (
+                chunk_id TEXT NOT NULL,
+                metric TEXT NOT NULL,
+                value REAL NOT NULL,
+                unit TEXT NOT NULL,
+                fiscal_period TEXT,
+                page INTEGER,
+                source TEXT,
+                citation TEXT,
+                raw_text TEXT,
+                position INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_chunk_facts_chunk ON chunk_facts (chunk_id);
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+        self._conn.commit()
+
+    def index_chunk_facts(
+        self,
+        chunk_facts: Iterable[Tuple[str, Dict[str, Any], List[Dict[str, Any]]]]
+    ) -> int:
+        """
+        Replace the stored facts for a batch of chunks.
+
+        Args:
+            chunk_facts: (chunk_id, chunk_metadata, facts) triples
+
+        Returns:
+            Number of facts written
+        """
+        written = 0
+        with self._conn:
+            for chunk_id, metadata, facts in chunk_facts:
+                self._conn.execute("DELETE FROM chunk_facts WHERE chunk_id = ?", (chunk_id,))
+                rows = [
+                    (
+                        chunk_id,
+                        fact['metric'],
+                        fact['value'],
+                        fact['unit'],
+                        fact.get('fiscal_period'),
+                        metadata.get('page'),
+                        metadata.get('source'),
+                        metadata.get('citation'),
+                        fact.get('raw_text'),
+                        position
+                    )
+                    for position, fact in enumerate(facts)
+                ]
+                self._conn.executemany(
+                    "INSERT INTO chunk_facts VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                written += len(rows)
+            self._bump_data_version()
+        return written
+
+    def lookup(self, chunk_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Return all facts for the given chunks, ordered by the caller's chunk
+        ranking and then by position within each chunk.
+        """
+        if not chunk_ids:
+            return []
+
+        placeholders = ', '.join('?' for _ in chunk_ids)
+        cursor = self._conn.execute(
+            f"SELECT chunk_id, metric, value, unit, fiscal_period, page, source, citation, raw_text, position "
+            f"FROM chunk_facts WHERE chunk_id IN ({placeholders})",
+            chunk_ids
+        )
+        columns = [description[0] for description in cursor.description]
+        rank = {chunk_id: idx for idx, chunk_id in enumerate(chunk_ids)}
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+        rows.sort(key=lambda row: (rank[row['chunk_id']], row['position']))
+        return rows
+
+    def best_facts(self, chunk_ids: List[str], periods: Optional[Set[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        One fact per metric for the given chunks, in the extraction layer's format.
+
+        Chunks are expected in relevance order; for each metric the first
+        fact from the best-ranked chunk wins, mirroring how the query-time
+        extractor takes the first match in the concatenated results. When
+        the query names periods (in canonical_period() form), the first fact
+        of one of those periods wins over better-ranked facts of other periods.
+        """
+        facts: Dict[str, Dict[str, Any]] = {}
+        matched = set()
+        for row in self.lookup(chunk_ids):
+            in_period = bool(periods and row['fiscal_period'] and canonical_period(row['fiscal_period']) in periods)
+            if row['metric'] in matched or (row['metric'] in facts and not in_period):
+                continue
+            if in_period:
+                matched.add(row['metric'])
+            facts[row['metric']] = {
+                'value': row['value'],
+                'unit': row['unit'],
+                'source': 'fact_index',
+                'confidence': 0.95,
+                'raw_text': row['raw_text'],
+                'fiscal_period': row['fiscal_period'],
+                'chunk_id': row['chunk_id'],
+                'page': row['page'],
+                'source_citation': row['citation']
+            }
+        return facts
+
+    def count(self) -> int:
+        """Total number of indexed facts."""
+        return self._conn.execute("SELECT COUNT(*) FROM chunk_facts").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every indexed fact."""
+        with self._conn:
+            self._conn.execute("DELETE FROM chunk_facts")
+            self._bump_data_version()
+
+    def data_version(self) -> Optional[str]:
+        """Opaque stamp that changes whenever the indexed data changes."""
+        row = self._conn.execute("SELECT value FROM index_meta WHERE key = 'data_version'").fetchone()
+        return row[0] if row else None
+
+    def _bump_data_version(self) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO index_meta (key, value) VALUES ('data_version', ?)",
+            (uuid.uuid4().hex,)
+        )
+
+
+def read_data_version(db_path: Path) -> Optional[str]:
+    """
+    Read the data version of an existing fact index without creating one.
+
+    Lets other processes (e.g. response caches) detect knowledge-base changes
+    cheaply; returns None when the index or its version stamp does not exist.
+    """
+    db_path = Path(db_path)
+    if not db_path.exists():
+        return None
+    try:
+        conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        try:
+            row = conn.execute("SELECT value FROM index_meta WHERE key = 'data_version'").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error:
+        return None
+    return row[0] if row else None
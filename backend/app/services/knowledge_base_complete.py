@@ -7,18 +7,49 @@ Intelligent document storage and retrieval system with:
 - Sheet-level citations for Excel
 - Context-aware chunking
 - Relevance scoring
+- Ingest-time numeric fact index (metric/value/period per chunk)
 
 This is the brain of the UDC Polaris system - all agents query this knowledge base.
 """
 
 import chromadb
 from chromadb.utils import embedding_functions
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 import json
 from pathlib import Path
 from datetime import datetime
 import re
 
+from app.core.metrics import metrics_registry
+from app.services.embedding_service import EmbeddingClient, sidecar_client
+from app.services.fact_index import FACT_INDEX_FILENAME, FactIndex, extract_chunk_facts, extract_row_facts
+
+CHROMA_QUERY_SECONDS = metrics_registry.histogram(
+    "polaris_chroma_query_duration_seconds", "Chroma query latency (including the query embedding)", ("collection",)
+)
+
+
+class SidecarEmbeddingFunction(embedding_functions.SentenceTransformerEmbeddingFunction):
+    """SentenceTransformer embeddings from the sidecar (same name and config, so existing collections open)."""
+
+    def __init__(self, client: EmbeddingClient, model_name: str = "all-MiniLM-L6-v2"):
+        self.client = client
+        self.model_name = model_name
+        self.device = "cpu"
+        self.normalize_embeddings = False
+        self.kwargs = {}
+
+    def __call__(self, input):
+        return list(self.client.embed(list(input)))
+
+
+def knowledge_base_embedding_function(model_name: str = "all-MiniLM-L6-v2"):
+    """The sidecar's embeddings when EMBEDDING_SOCKET is set, else a model loaded in this process."""
+    client = sidecar_client()
+    if client is not None:
+        return SidecarEmbeddingFunction(client, model_name)
+    return embedding_functions.SentenceTransformerEmbeddingFunction(model_name=model_name)
+
 
 class UDCCompleteKnowledgeBase:
     """
@@ -44,8 +75,8 @@ class UDCCompleteKnowledgeBase:
         
         # Use sentence transformers for better embeddings
         print("Initializing sentence transformer model...")
-        self.embedding_function = embedding_functions.SentenceTransformerEmbeddingFunction(
-            model_name="all-MiniLM-L6-v2"  # Fast and effective
+        self.embedding_function = knowledge_base_embedding_function(
+            "all-MiniLM-L6-v2"  # Fast and effective
         )
         
         # Create persistent client
@@ -61,10 +92,14 @@ class UDCCompleteKnowledgeBase:
             metadata={"description": "UDC Complete Strategic Intelligence Database"}
         )
         
+        # Numeric facts extracted once per chunk at ingestion
+        self.fact_index = FactIndex(self.persist_directory / FACT_INDEX_FILENAME)
+        
         current_count = self.collection.count()
         print(f"[OK] Knowledge Base initialized")
         print(f"    Location: {self.persist_directory}")
         print(f"    Existing documents: {current_count}")
+        print(f"    Indexed facts: {self.fact_index.count()}")
     
     def ingest_pdf_documents(self, pdf_documents: List[Dict[str, Any]]):
         """
@@ -82,6 +117,7 @@ class UDCCompleteKnowledgeBase:
         print(f"{'='*80}\n")
         
         total_chunks = 0
+        total_facts = 0
         
         for doc_idx, doc in enumerate(pdf_documents, 1):
             source_name = doc['source']
@@ -91,6 +127,7 @@ class UDCCompleteKnowledgeBase:
             documents = []
             metadatas = []
             ids = []
+            chunk_facts = []
             doc_chunks = 0
 
             for page in doc['pages']:
@@ -104,8 +141,7 @@ class UDCCompleteKnowledgeBase:
                     # Create unique ID
                     doc_id = self._build_pdf_id(source_name, page_num, chunk_idx)
                     
-                    documents.append(chunk)
-                    metadatas.append({
+                    metadata = {
                         'source': source_name,
                         'type': 'pdf',
                         'category': category,
@@ -114,15 +150,22 @@ class UDCCompleteKnowledgeBase:
                         'total_chunks_on_page': len(chunks),
                         'word_count': len(chunk.split()),
                         'has_tables': page.get('has_tables', False)
-                    })
+                    }
+                    documents.append(chunk)
+                    metadatas.append(metadata)
                     ids.append(doc_id)
+                    chunk_facts.append((doc_id, {**metadata, 'citation': self._build_citation(metadata)},
+                                        extract_chunk_facts(chunk)))
                     doc_chunks += 1
                     total_chunks += 1
             
             self._upsert_in_batches(documents, metadatas, ids)
-            print(f"      [OK] {doc['total_pages']} pages -> {doc_chunks} chunks")
+            doc_facts = self.fact_index.index_chunk_facts(chunk_facts)
+            total_facts += doc_facts
+            print(f"      [OK] {doc['total_pages']} pages -> {doc_chunks} chunks, {doc_facts} facts")
         
         print(f"\n[SUCCESS] Ingested {total_chunks} document chunks from {len(pdf_documents)} PDFs")
+        print(f"[SUCCESS] Indexed {total_facts} numeric facts")
     
     def ingest_excel_data(self, excel_data: List[Dict[str, Any]]):
         """
@@ -139,6 +182,7 @@ class UDCCompleteKnowledgeBase:
         documents: List[str] = []
         metadatas: List[Dict[str, Any]] = []
         ids: List[str] = []
+        chunk_facts = []
         
         for file_idx, excel in enumerate(excel_data, 1):
             source_name = excel['source']
@@ -159,22 +203,29 @@ class UDCCompleteKnowledgeBase:
                     text += json.dumps(sheet_data['summary']['statistics'], indent=2)
                 
                 doc_id = self._build_excel_id(source_name, sheet_name)
-                
-                documents.append(text)
-                metadatas.append({
+                metadata = {
                     'source': source_name,
                     'type': 'excel',
                     'sheet': sheet_name,
                     'rows': sheet_data['rows'],
                     'columns': sheet_data['column_count']
-                })
+                }
+                
+                documents.append(text)
+                metadatas.append(metadata)
                 ids.append(doc_id)
                 
+                # Index facts from every row, not just the 50-row preview
+                sheet_facts = [fact for row in sheet_data['data'] for fact in extract_row_facts(row)]
+                chunk_facts.append((doc_id, {**metadata, 'citation': self._build_citation(metadata)}, sheet_facts))
+                
                 print(f"      Sheet '{sheet_name}': {sheet_data['rows']} rows")
         
         self._upsert_in_batches(documents, metadatas, ids)
+        total_facts = self.fact_index.index_chunk_facts(chunk_facts)
         
         print(f"\n[SUCCESS] Ingested {len(documents)} Excel sheets from {len(excel_data)} files")
+        print(f"[SUCCESS] Indexed {total_facts} numeric facts")
     
     def search(
         self,
@@ -204,11 +255,12 @@ class UDCCompleteKnowledgeBase:
             where_filter['category'] = filter_category
         
         # Execute search
-        results = self.collection.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where_filter if where_filter else None
-        )
+        with CHROMA_QUERY_SECONDS.time(collection=self.collection.name):
+            results = self.collection.query(
+                query_texts=[query],
+                n_results=n_results,
+                where=where_filter if where_filter else None
+            )
         
         # Format results with citations
         formatted_results = []
@@ -218,21 +270,13 @@ class UDCCompleteKnowledgeBase:
                 meta = results['metadatas'][0][i]
                 content = results['documents'][0][i]
                 distance = results['distances'][0][i]
-                
-                # Build citation
-                if meta['type'] == 'pdf':
-                    citation = f"{meta['source']}, page {meta['page']}"
-                    if meta.get('chunk', 0) > 0:
-                        citation += f" (chunk {meta['chunk']+1}/{meta['total_chunks_on_page']})"
-                elif meta['type'] == 'excel':
-                    citation = f"{meta['source']}, sheet '{meta['sheet']}'"
-                else:
-                    citation = meta['source']
+                citation = self._build_citation(meta)
                 
                 # Calculate relevance score (convert distance to similarity)
                 relevance_score = round((1 - distance) * 100, 1)
                 
                 formatted_results.append({
+                    'id': results['ids'][0][i],
                     'content': content,
                     'citation': citation,
                     'metadata': meta,
@@ -242,6 +286,32 @@ class UDCCompleteKnowledgeBase:
         
         return formatted_results
 
+    def get_chunk_facts(self, chunk_ids: List[str], periods: Optional[Set[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Join retrieved chunk IDs against the ingest-time fact index.
+        
+        Args:
+            chunk_ids: Retrieved chunk IDs, most relevant first
+            periods: Periods the query asks for (facts of these periods are preferred)
+            
+        Returns:
+            Dictionary of metric -> fact in the extraction layer's format
+            (the best-ranked chunk's fact wins for each metric)
+        """
+        return self.fact_index.best_facts(chunk_ids, periods)
+
+    @staticmethod
+    def _build_citation(meta: Dict[str, Any]) -> str:
+        """Build the human-readable citation for a stored chunk."""
+        if meta['type'] == 'pdf':
+            citation = f"{meta['source']}, page {meta['page']}"
+            if meta.get('chunk', 0) > 0:
+                citation += f" (chunk {meta['chunk']+1}/{meta['total_chunks_on_page']})"
+            return citation
+        if meta['type'] == 'excel':
+            return f"{meta['source']}, sheet '{meta['sheet']}'"
+        return meta['source']
+
     def _upsert_in_batches(
         self,
         documents: List[str],
@@ -358,9 +428,18 @@ class UDCCompleteKnowledgeBase:
             'excel_sheets': excel_count,
             'storage_path': str(self.persist_directory),
             'last_updated': datetime.now().isoformat(),
-            'collection_name': self.collection.name
+            'collection_name': self.collection.name,
+            'data_version': self.get_data_version()
         }
     
+    def get_data_version(self) -> Optional[str]:
+        """
+        Stamp that changes on every ingestion or clear.
+        
+        Response caches compare it to drop answers built on stale data.
+        """
+        return self.fact_index.data_version()
+    
     def clear_collection(self):
         """
         Clear all documents from collection (use with caution!).
@@ -372,6 +451,7 @@ class UDCCompleteKnowledgeBase:
             embedding_function=self.embedding_function,
             metadata={"description": "UDC Complete Strategic Intelligence Database"}
         )
+        self.fact_index.clear()
         print("[OK] Knowledge base cleared")
 
 
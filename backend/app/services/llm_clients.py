@@ -0,0 +1,273 @@
+"""
+Shared LLM API clients
+
+Agents, councils and verifiers used to build their own ``Anthropic`` /
+``OpenAI`` client, and each client brought its own HTTP connection pool.
+The UIS pipeline built four new agents for every query, so connections
+were never reused. Every request paid a new TCP connect and TLS handshake.
+
+``LLMClientFactory`` hands out one SDK client per configuration (provider,
+API key, base URL, retries, timeout, headers). Every client for a provider
+sends requests through one long-lived connection pool:
+
+- Keep-alive connections are tuned for bursty council traffic
+  (LLM_HTTP_MAX_CONNECTIONS, LLM_HTTP_MAX_KEEPALIVE,
+  LLM_HTTP_KEEPALIVE_EXPIRY).
+- HTTP/2 is used when the optional ``h2`` package is installed
+  (``httpx[http2]``), so parallel expert calls multiplex over one
+  connection. Set LLM_HTTP2=0 to turn it off.
+- Async pools are kept per event loop. A connection opened on one loop
+  cannot be used from another, and the Streamlit app and the tests start
+  a fresh loop per run.
+
+``snapshot()`` counts requests, new connections, TLS handshakes and the
+time until response headers arrive. Comparing connections to requests
+shows how many handshakes the shared pools save. Limits come from the
+environment because the UIS pipeline imports this module without the
+backend settings.
+"""
+
+import asyncio
+import importlib
+import logging
+import os
+import sys
+import threading
+import time
+from types import ModuleType
+from typing import Any, Dict, Optional, Tuple
+
+from ..core.metrics import metrics_registry
+
+logger = logging.getLogger(__name__)
+
+ANTHROPIC = "anthropic"
+OPENAI = "openai"
+
+
+def _http_module(sdk: ModuleType) -> ModuleType:
+    """The HTTP library an SDK is built on (``httpx``, or ``httpx2`` in newer SDKs)."""
+    base = next(cls for cls in sdk.DefaultHttpxClient.__mro__ if cls.__name__ == "Client")
+    return sys.modules[base.__module__.partition(".")[0]]
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _PoolStats:
+    """Connection and latency counters for one provider's pool."""
+
+    def __init__(self):
+        self.requests = 0
+        self.connections = 0
+        self.tls_handshakes = 0
+        self.total_latency = 0.0
+
+    def trace(self, event: str) -> None:
+        if event == "connection.connect_tcp.complete":
+            self.connections += 1
+        elif event == "connection.start_tls.complete":
+            self.tls_handshakes += 1
+
+    def record(self, started: float) -> None:
+        self.requests += 1
+        self.total_latency += time.perf_counter() - started
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "connections": self.connections,
+            "tls_handshakes": self.tls_handshakes,
+            "reused": max(0, self.requests - self.connections),
+            "mean_latency": self.total_latency / self.requests if self.requests else 0.0,
+        }
+
+
+class _MeteredTransport:
+    """One shared sync connection pool that counts connections and latency."""
+
+    def __init__(self, transport, stats: _PoolStats):
+        self._transport = transport
+        self._stats = stats
+
+    def handle_request(self, request):
+        request.extensions["trace"] = lambda event, info: self._stats.trace(event)
+        started = time.perf_counter()
+        response = self._transport.handle_request(request)
+        self._stats.record(started)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class _LoopLocalTransport:
+    """One shared async connection pool per event loop, metered like the sync one."""
+
+    def __init__(self, make_transport, stats: _PoolStats):
+        self._make_transport = make_transport
+        self._stats = stats
+        self._transports: Dict[asyncio.AbstractEventLoop, Any] = {}
+
+    async def handle_async_request(self, request):
+        async def trace(event: str, info: Dict[str, Any]) -> None:
+            self._stats.trace(event)
+
+        request.extensions["trace"] = trace
+        started = time.perf_counter()
+        response = await self._transport().handle_async_request(request)
+        self._stats.record(started)
+        return response
+
+    def _transport(self):
+        loop = asyncio.get_running_loop()
+        transport = self._transports.get(loop)
+        if transport is None:
+            # Pools of finished loops cannot be used again
+            self._transports = {known: t for known, t in self._transports.items() if not known.is_closed()}
+            transport = self._transports[loop] = self._make_transport()
+        return transport
+
+    async def aclose(self) -> None:
+        transport = self._transports.pop(asyncio.get_running_loop(), None)
+        if transport is not None:
+            await transport.aclose()
+
+
+class LLMClientFactory:
+    """
+    Shared, pooled SDK clients for the LLM providers.
+
+    Args:
+        max_connections: Open connections per provider pool
+        max_keepalive: Idle connections kept alive per provider pool
+        keepalive_expiry: Seconds an idle connection is kept
+        http2: Use HTTP/2 (defaults to on when ``h2`` is installed)
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive: int = 20,
+        keepalive_expiry: float = 120.0,
+        http2: Optional[bool] = None
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive = max_keepalive
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = _http2_available() if http2 is None else http2
+        self._stats: Dict[str, _PoolStats] = {}
+        self._http_clients: Dict[Tuple[str, bool], Any] = {}
+        self._clients: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+
+    def anthropic(self, **options) -> Any:
+        """Shared ``anthropic.Anthropic`` for these options (api_key, max_retries, ...)."""
+        import anthropic
+
+        return self._client(ANTHROPIC, False, anthropic.Anthropic, options)
+
+    def async_anthropic(self, **options) -> Any:
+        """Shared ``anthropic.AsyncAnthropic`` for these options."""
+        import anthropic
+
+        return self._client(ANTHROPIC, True, anthropic.AsyncAnthropic, options)
+
+    def openai(self, **options) -> Any:
+        """Shared ``openai.OpenAI`` for these options."""
+        import openai
+
+        return self._client(OPENAI, False, openai.OpenAI, options)
+
+    def async_openai(self, **options) -> Any:
+        """Shared ``openai.AsyncOpenAI`` for these options."""
+        import openai
+
+        return self._client(OPENAI, True, openai.AsyncOpenAI, options)
+
+    def http_client(self, provider: str, is_async: bool = False):
+        """The pooled httpx client behind every SDK client of ``provider``."""
+        key = (provider, is_async)
+        with self._lock:
+            client = self._http_clients.get(key)
+            if client is None:
+                http = _http_module(importlib.import_module(provider))
+                client = self._http_clients[key] = self._new_http_client(provider, is_async, http)
+        return client
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Per-provider requests, new connections, TLS handshakes and latency."""
+        return {
+            "http2": self.http2,
+            "clients": len(self._clients),
+            "providers": {provider: stats.as_dict() for provider, stats in self._stats.items()},
+        }
+
+    def close(self) -> None:
+        """Close the sync pools (async pools close with their event loop)."""
+        with self._lock:
+            for (_, is_async), client in list(self._http_clients.items()):
+                if not is_async:
+                    client.close()
+            self._http_clients = {key: c for key, c in self._http_clients.items() if key[1]}
+            self._clients = {key: c for key, c in self._clients.items() if key[1]}
+
+    def _client(self, provider: str, is_async: bool, cls, options: Dict[str, Any]) -> Any:
+        key = (provider, is_async, _options_key(options))
+        with self._lock:
+            client = self._clients.get(key)
+        if client is None:
+            client = cls(**options, http_client=self.http_client(provider, is_async))
+            with self._lock:
+                client = self._clients.setdefault(key, client)
+        return client
+
+    def _new_http_client(self, provider: str, is_async: bool, http: ModuleType):
+        stats = self._stats.setdefault(provider, _PoolStats())
+        limits = http.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+        if is_async:
+            transport = _LoopLocalTransport(lambda: http.AsyncHTTPTransport(limits=limits, http2=self.http2), stats)
+            return http.AsyncClient(transport=transport, follow_redirects=True)
+        transport = _MeteredTransport(http.HTTPTransport(limits=limits, http2=self.http2), stats)
+        return http.Client(transport=transport, follow_redirects=True)
+
+
+def _options_key(options: Dict[str, Any]) -> Tuple:
+    """Hashable cache key for SDK client options (headers and timeouts included)."""
+    return tuple(sorted((name, repr(value)) for name, value in options.items()))
+
+
+def _env_flag(name: str) -> Optional[bool]:
+    value = os.getenv(name)
+    return None if not value else value.lower() not in {"0", "false", "no", "off"}
+
+
+# Global instance shared by the councils, the agents and the UIS pipeline
+llm_clients = LLMClientFactory(
+    max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS") or 100),
+    max_keepalive=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE") or 20),
+    keepalive_expiry=float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY") or 120),
+    http2=_env_flag("LLM_HTTP2"),
+)
+
+
+def _collect_metrics():
+    providers = llm_clients.snapshot()["providers"]
+    for name, help, field in (
+        ("polaris_llm_http_requests_total", "Requests sent over the shared LLM connection pools", "requests"),
+        ("polaris_llm_http_connections_total", "New TCP connections opened by the shared LLM pools", "connections"),
+        ("polaris_llm_http_tls_handshakes_total", "TLS handshakes done by the shared LLM pools", "tls_handshakes"),
+    ):
+        yield (name, "counter", help, [({"provider": provider}, stats[field]) for provider, stats in providers.items()])
+
+
+metrics_registry.register_collector("llm_clients", _collect_metrics)
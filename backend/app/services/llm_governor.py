@@ -0,0 +1,456 @@
+"""
+LLM Concurrency Governor
+
+Every agent, council and verifier used to send model requests on its own.
+Under load the parallel paths (UIS ``run_agents_parallel``, the councils'
+``gather`` calls) fired many requests at once, hit the provider's rate
+limits and then all retried together. ``LLMGovernor`` is the single
+process-wide gate in front of those requests:
+
+- At most ``max_concurrency`` requests per model are in flight.
+- An optional tokens-per-minute budget per model. Prompt tokens are
+  estimated before the request is sent. Output tokens reported afterwards
+  are debited too.
+- Waiting requests are served round-robin across queries, so one query's
+  burst of parallel calls cannot starve another query.
+- A 429 or overload pauses the whole model for the ``Retry-After`` the
+  provider sent, instead of letting every caller retry on its own. Other
+  retryable errors back off exponentially. All retries are jittered.
+
+``snapshot()`` reports queue depth, in-flight requests and wait times per
+model. Every request is also recorded in the Prometheus metrics (see
+llm_usage): latency, tokens and cost per model and agent. Callers name the
+agent through ``current_agent``. Limits come from the environment (LLM_MAX_CONCURRENCY,
+LLM_TOKENS_PER_MINUTE, LLM_MAX_RETRIES), because the UIS pipeline imports
+this module without the backend settings.
+"""
+
+import asyncio
+import contextvars
+import email.utils
+import logging
+import os
+import random
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+from .llm_usage import (
+    LLM_LATENCY,
+    LLM_QUEUE_WAIT,
+    LLM_REQUESTS,
+    record_llm_usage,
+    register_governor_metrics,
+    response_usage
+)
+from .prompt_caching import USAGE_FIELDS
+
+logger = logging.getLogger(__name__)
+
+# Query the current task's LLM requests belong to (for fair queuing)
+current_query: contextvars.ContextVar[str] = contextvars.ContextVar("llm_query", default="default")
+# Agent, node or council the current task's LLM requests are made for (metrics label)
+current_agent: contextvars.ContextVar[str] = contextvars.ContextVar("llm_agent", default="unknown")
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504, 529}
+THROTTLE_STATUS = {429, 529}
+RETRYABLE_ERRORS = ("APIConnectionError", "APITimeoutError", "TimeoutError", "ConnectionError")
+
+# Awaited with (error, retry number) before the governor retries a request
+RetryHook = Callable[[BaseException, int], Awaitable[None]]
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """``Retry-After`` (or ``retry-after-ms``) from a provider error response, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value is not None:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        parsed = email.utils.parsedate_to_datetime(value)
+        return max(0.0, parsed.timestamp() - time.time()) if parsed else None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Rate limits, overloads, server errors, timeouts and dropped connections."""
+    if _status_code(exc) in RETRYABLE_STATUS:
+        return True
+    return any(cls.__name__ in RETRYABLE_ERRORS for cls in type(exc).__mro__)
+
+
+def is_throttle(exc: BaseException) -> bool:
+    """The provider asked us to slow down (429 rate limit / 529 overloaded)."""
+    return _status_code(exc) in THROTTLE_STATUS
+
+
+def backoff_delay(
+    exc: BaseException,
+    attempt: int,
+    base: float = 1.0,
+    cap: float = 30.0
+) -> float:
+    """
+    Seconds to wait before retry ``attempt`` (0-based).
+
+    Honors the provider's Retry-After when present. Otherwise uses
+    exponential backoff. Both are jittered so callers do not retry in
+    lockstep.
+    """
+    retry_after = retry_after_seconds(exc)
+    if retry_after is not None:
+        return retry_after + random.uniform(0, min(1.0, retry_after * 0.1) or 0.1)
+    delay = min(cap, base * 2 ** attempt)
+    return delay / 2 + random.uniform(0, delay / 2)
+
+
+class _ModelLane:
+    """Gate state for one model."""
+
+    def __init__(self, max_concurrency: int, tokens_per_minute: Optional[int], now: float):
+        self.max_concurrency = max(1, max_concurrency)
+        self.tokens_per_minute = tokens_per_minute or None
+        self.tokens = float(tokens_per_minute or 0)
+        self.tokens_updated = now
+        self.paused_until = 0.0
+        self.in_flight = 0
+        # query -> waiting (future, tokens) in arrival order; queries rotate round-robin
+        self.waiters: "OrderedDict[str, Deque[Tuple[asyncio.Future, int]]]" = OrderedDict()
+        self.timer: Optional[asyncio.TimerHandle] = None
+        self.stats = {"requests": 0, "queued": 0, "throttled": 0, "retries": 0, "total_wait": 0.0, "max_wait": 0.0}
+
+    @property
+    def queue_depth(self) -> int:
+        return sum(len(queue) for queue in self.waiters.values())
+
+    def refill(self, now: float) -> None:
+        if self.tokens_per_minute:
+            rate = self.tokens_per_minute / 60
+            self.tokens = min(self.tokens_per_minute, self.tokens + (now - self.tokens_updated) * rate)
+        self.tokens_updated = now
+
+    def token_wait(self, tokens: int) -> float:
+        """Seconds until ``tokens`` fit in the budget (0 if they fit now)."""
+        if not self.tokens_per_minute:
+            return 0.0
+        needed = min(tokens, self.tokens_per_minute)
+        return max(0.0, (needed - self.tokens) / (self.tokens_per_minute / 60))
+
+
+class LLMGovernor:
+    """
+    Process-wide gate for LLM requests.
+
+    Args:
+        max_concurrency: Requests in flight per model
+        tokens_per_minute: Token budget per model (None for unlimited)
+        max_retries: Retries of retryable errors in call()
+        model_limits: Per-model overrides, model -> (max_concurrency, tokens_per_minute)
+        clock: Monotonic time source
+        sleep: Async sleep (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 3,
+        model_limits: Optional[Dict[str, Tuple[int, Optional[int]]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep
+    ):
+        self.max_concurrency = max_concurrency
+        self.tokens_per_minute = tokens_per_minute
+        self.max_retries = max_retries
+        self.model_limits = model_limits or {}
+        self.clock = clock
+        self.sleep = sleep
+        self._lanes: Dict[str, _ModelLane] = {}
+
+    async def call(
+        self,
+        model: str,
+        fn: Callable[[], Awaitable[Any]],
+        tokens: int = 0,
+        query_id: Optional[str] = None,
+        agent: Optional[str] = None,
+        on_retry: Optional[RetryHook] = None
+    ) -> Any:
+        """
+        Run one LLM request under the governor, retrying retryable errors.
+
+        Args:
+            model: Model the request goes to
+            fn: Zero-argument coroutine function sending the request
+            tokens: Estimated prompt tokens (see estimate_tokens)
+            query_id: Query the request belongs to (defaults to current_query)
+            agent: Metrics label for the caller (defaults to current_agent)
+            on_retry: Awaited with (error, retry number) before each retry
+
+        Returns:
+            Whatever ``fn`` returns; output usage is debited automatically
+        """
+        attempt = 0
+        agent = agent or current_agent.get()
+        while True:
+            async with self.slot(model, tokens, query_id):
+                started = time.perf_counter()
+                try:
+                    result = await fn()
+                except Exception as exc:
+                    LLM_LATENCY.observe(time.perf_counter() - started, model=model, agent=agent)
+                    delay = self._retry_delay(model, exc, attempt)
+                    LLM_REQUESTS.inc(model=model, agent=agent, outcome="error" if delay is None else "retried")
+                    if delay is None:
+                        raise
+                    error = exc
+                else:
+                    LLM_LATENCY.observe(time.perf_counter() - started, model=model, agent=agent)
+                    LLM_REQUESTS.inc(model=model, agent=agent, outcome="ok")
+                    usage = response_usage(result)
+                    record_llm_usage(model, agent, usage)
+                    self.record_usage(model, usage["output_tokens"])
+                    return result
+            attempt += 1
+            if on_retry is not None:
+                await on_retry(error, attempt)
+            if delay:
+                await self.sleep(delay)
+
+    async def stream(
+        self,
+        model: str,
+        make_stream: Callable[[], AsyncIterator[Any]],
+        tokens: int = 0,
+        query_id: Optional[str] = None,
+        agent: Optional[str] = None,
+        on_retry: Optional[RetryHook] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Stream one LLM response under the governor.
+
+        Retryable errors are retried only before the first chunk; after
+        that the caller has already seen part of the answer. ``on_retry``
+        is awaited as in call().
+        """
+        attempt = 0
+        agent = agent or current_agent.get()
+        while True:
+            started = False
+            async with self.slot(model, tokens, query_id):
+                began = time.perf_counter()
+                usage = dict.fromkeys(USAGE_FIELDS, 0)
+                try:
+                    async for chunk in make_stream():
+                        started = True
+                        # LangChain chunks carry usage (input first, output last)
+                        for field, count in response_usage(chunk).items():
+                            usage[field] += count
+                        yield chunk
+                except Exception as exc:
+                    LLM_LATENCY.observe(time.perf_counter() - began, model=model, agent=agent)
+                    delay = None if started else self._retry_delay(model, exc, attempt)
+                    LLM_REQUESTS.inc(model=model, agent=agent, outcome="error" if delay is None else "retried")
+                    if delay is None:
+                        raise
+                    error = exc
+                else:
+                    LLM_LATENCY.observe(time.perf_counter() - began, model=model, agent=agent)
+                    LLM_REQUESTS.inc(model=model, agent=agent, outcome="ok")
+                    record_llm_usage(model, agent, usage)
+                    return
+            attempt += 1
+            if on_retry is not None:
+                await on_retry(error, attempt)
+            if delay:
+                await self.sleep(delay)
+
+    @asynccontextmanager
+    async def slot(self, model: str, tokens: int = 0, query_id: Optional[str] = None):
+        """Hold one in-flight slot for ``model`` (for streamed requests)."""
+        await self.acquire(model, tokens, query_id)
+        try:
+            yield
+        finally:
+            self.release(model)
+
+    async def acquire(self, model: str, tokens: int = 0, query_id: Optional[str] = None) -> None:
+        """Wait for a slot (and token budget) for one request to ``model``."""
+        lane = self._lane(model)
+        lane.stats["requests"] += 1
+        started = self.clock()
+        if not lane.waiters and self._try_grant(lane, tokens, started):
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        lane.waiters.setdefault(query_id or current_query.get(), deque()).append((future, tokens))
+        lane.stats["queued"] += 1
+        self._dispatch(lane)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(model)  # Granted just as the caller gave up
+            else:
+                self._forget(lane, future)
+            raise
+        waited = self.clock() - started
+        LLM_QUEUE_WAIT.observe(waited, model=model)
+        lane.stats["total_wait"] += waited
+        lane.stats["max_wait"] = max(lane.stats["max_wait"], waited)
+
+    def release(self, model: str) -> None:
+        """Return a slot taken by acquire()."""
+        lane = self._lane(model)
+        lane.in_flight -= 1
+        self._dispatch(lane)
+
+    def pause(self, model: str, seconds: float) -> None:
+        """Hold all new requests to ``model`` for ``seconds`` (provider throttling)."""
+        lane = self._lane(model)
+        lane.paused_until = max(lane.paused_until, self.clock() + seconds)
+        lane.stats["throttled"] += 1
+        logger.warning(f"LLM governor: pausing {model} for {seconds:.1f}s")
+
+    def record_usage(self, model: str, tokens: int) -> None:
+        """Debit tokens only known after the response (output) from the budget."""
+        lane = self._lane(model)
+        if lane.tokens_per_minute and tokens:
+            lane.refill(self.clock())
+            lane.tokens -= tokens
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Per-model in-flight, queue depth and wait-time metrics."""
+        result = {}
+        for model, lane in self._lanes.items():
+            stats = dict(lane.stats)
+            stats["mean_wait"] = stats["total_wait"] / stats["queued"] if stats["queued"] else 0.0
+            result[model] = {
+                "in_flight": lane.in_flight,
+                "queue_depth": lane.queue_depth,
+                "max_concurrency": lane.max_concurrency,
+                "tokens_per_minute": lane.tokens_per_minute,
+                "paused_for": max(0.0, lane.paused_until - self.clock()),
+                **stats,
+            }
+        return result
+
+    def _retry_delay(self, model: str, exc: Exception, attempt: int) -> Optional[float]:
+        """Seconds to sleep before retrying (0 when paused instead), or None to give up."""
+        if attempt >= self.max_retries or not is_retryable(exc):
+            return None
+        delay = backoff_delay(exc, attempt)
+        self._lane(model).stats["retries"] += 1
+        logger.warning(f"LLM request to {model} failed ({exc}); retry {attempt + 1}/{self.max_retries}")
+        if is_throttle(exc):
+            # Hold every request to this model, not just this one
+            self.pause(model, delay)
+            return 0.0
+        return delay
+
+    def _lane(self, model: str) -> _ModelLane:
+        lane = self._lanes.get(model)
+        if lane is None:
+            concurrency, tpm = self.model_limits.get(model, (self.max_concurrency, self.tokens_per_minute))
+            lane = self._lanes[model] = _ModelLane(concurrency, tpm, self.clock())
+        return lane
+
+    def _try_grant(self, lane: _ModelLane, tokens: int, now: float) -> bool:
+        if lane.in_flight >= lane.max_concurrency or now < lane.paused_until:
+            return False
+        lane.refill(now)
+        if lane.token_wait(tokens) > 0:
+            return False
+        lane.in_flight += 1
+        if lane.tokens_per_minute:
+            lane.tokens -= min(tokens, lane.tokens_per_minute)
+        return True
+
+    def _dispatch(self, lane: _ModelLane) -> None:
+        """Grant waiting requests round-robin across queries while capacity lasts."""
+        while lane.waiters and lane.in_flight < lane.max_concurrency:
+            query, queue = next(iter(lane.waiters.items()))
+            future, tokens = queue[0]
+            if future.done():
+                queue.popleft()
+                self._rotate(lane, query, queue)
+                continue
+
+            now = self.clock()
+            wait = lane.paused_until - now
+            if wait <= 0:
+                lane.refill(now)
+                wait = lane.token_wait(tokens)
+            if wait > 0:
+                self._wake_later(lane, wait, future)
+                return
+
+            queue.popleft()
+            self._rotate(lane, query, queue)
+            self._try_grant(lane, tokens, now)
+            future.set_result(None)
+
+    @staticmethod
+    def _rotate(lane: _ModelLane, query: str, queue: Deque) -> None:
+        if queue:
+            lane.waiters.move_to_end(query)
+        else:
+            del lane.waiters[query]
+
+    def _wake_later(self, lane: _ModelLane, delay: float, future: asyncio.Future) -> None:
+        if lane.timer is not None:
+            lane.timer.cancel()
+
+        def wake():
+            lane.timer = None
+            self._dispatch(lane)
+
+        lane.timer = future.get_loop().call_later(delay, wake)
+
+    def _forget(self, lane: _ModelLane, future: asyncio.Future) -> None:
+        for query, queue in list(lane.waiters.items()):
+            for entry in queue:
+                if entry[0] is future:
+                    queue.remove(entry)
+                    if not queue:
+                        del lane.waiters[query]
+                    self._dispatch(lane)
+                    return
+
+
+def estimate_tokens(*texts: Any) -> int:
+    """Rough prompt size (~4 characters per token) for the token budget."""
+    return sum(len(str(text)) for text in texts if text) // 4
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+# Global instance shared by the councils, Dr. Omar and the UIS agents
+llm_governor = LLMGovernor(
+    max_concurrency=_env_int("LLM_MAX_CONCURRENCY", 4),
+    tokens_per_minute=_env_int("LLM_TOKENS_PER_MINUTE", None),
+    max_retries=_env_int("LLM_MAX_RETRIES", 3),
+)
+
+
+register_governor_metrics(llm_governor)
@@ -0,0 +1,106 @@
+"""
+LLM Usage Metrics
+
+Token usage of model responses and the Prometheus metrics the LLMGovernor
+records for every request: attempts by outcome, latency, queue wait,
+tokens by kind and estimated cost, per model and agent.
+
+``response_usage`` reads Anthropic, OpenAI and LangChain responses (and
+stream chunks) into the Messages API usage fields, so the governor can
+debit output tokens and price a response whichever client made it.
+"""
+
+from typing import Any, Dict
+
+from ..core.metrics import metrics_registry
+from .prompt_caching import model_prices, usage_cost_usd, usage_to_dict
+
+
+LLM_REQUESTS = metrics_registry.counter(
+    "polaris_llm_requests_total", "LLM request attempts by outcome (ok, retried, error)", ("model", "agent", "outcome")
+)
+LLM_LATENCY = metrics_registry.histogram(
+    "polaris_llm_request_duration_seconds", "LLM request latency per attempt, excluding queueing", ("model", "agent")
+)
+LLM_QUEUE_WAIT = metrics_registry.histogram(
+    "polaris_llm_queue_wait_seconds", "Time LLM requests waited for a governor slot", ("model",)
+)
+LLM_TOKENS = metrics_registry.counter(
+    "polaris_llm_tokens_total", "LLM tokens by kind (input, output, cache_read, cache_write)", ("model", "agent", "kind")
+)
+LLM_COST = metrics_registry.counter(
+    "polaris_llm_cost_usd_total", "Estimated LLM spend in USD (list prices)", ("model", "agent")
+)
+_TOKEN_KINDS = {
+    "input_tokens": "input",
+    "output_tokens": "output",
+    "cache_read_input_tokens": "cache_read",
+    "cache_creation_input_tokens": "cache_write",
+}
+
+
+def output_tokens(response: Any) -> int:
+    """Output tokens reported by an Anthropic, OpenAI or LangChain response."""
+    return response_usage(response)["output_tokens"]
+
+
+def response_usage(response: Any) -> Dict[str, int]:
+    """
+    Token usage of an Anthropic, OpenAI or LangChain response (or stream chunk).
+
+    Returned in the Messages API fields (see prompt_caching.USAGE_FIELDS):
+    ``input_tokens`` is the uncached part of the prompt. Fields that are
+    missing are 0.
+    """
+    usage = getattr(response, "usage", None)
+    if usage is not None:
+        if getattr(usage, "output_tokens", None) is None and hasattr(usage, "completion_tokens"):
+            # OpenAI chat completions
+            return usage_to_dict({
+                "input_tokens": getattr(usage, "prompt_tokens", 0),
+                "output_tokens": usage.completion_tokens,
+            })
+        return usage_to_dict(usage)
+    message = getattr(response, "message", None)  # LangChain generation chunk
+    metadata = getattr(message if message is not None else response, "usage_metadata", None)
+    if isinstance(metadata, dict):
+        details = metadata.get("input_token_details") or {}
+        read = details.get("cache_read") or 0
+        write = details.get("cache_creation") or 0
+        return usage_to_dict({
+            "input_tokens": max(0, (metadata.get("input_tokens") or 0) - read - write),
+            "output_tokens": metadata.get("output_tokens"),
+            "cache_read_input_tokens": read,
+            "cache_creation_input_tokens": write,
+        })
+    usage = (getattr(response, "llm_output", None) or {}).get("usage")  # LangChain ChatResult
+    if isinstance(usage, dict):
+        return usage_to_dict(usage)
+    return usage_to_dict(None)
+
+
+def record_llm_usage(model: str, agent: str, usage: Dict[str, int]) -> None:
+    """Add one response's tokens and estimated cost to the LLM metrics."""
+    for field, kind in _TOKEN_KINDS.items():
+        if usage.get(field):
+            LLM_TOKENS.inc(usage[field], model=model, agent=agent, kind=kind)
+    prices = model_prices(model)
+    if prices is not None:
+        cost = usage_cost_usd(usage, input_price=prices[0], output_price=prices[1])
+        if cost:
+            LLM_COST.inc(cost, model=model, agent=agent)
+
+
+def register_governor_metrics(governor: Any, name: str = "llm_governor") -> None:
+    """Report a governor's in-flight requests, queue depth and throttles per model."""
+
+    def collect():
+        lanes = governor.snapshot()
+        yield ("polaris_llm_in_flight", "gauge", "LLM requests holding a governor slot",
+               [({"model": model}, lane["in_flight"]) for model, lane in lanes.items()])
+        yield ("polaris_llm_queue_depth", "gauge", "LLM requests waiting for a governor slot",
+               [({"model": model}, lane["queue_depth"]) for model, lane in lanes.items()])
+        yield ("polaris_llm_throttled_total", "counter", "Provider throttles (429/529) that paused a model",
+               [({"model": model}, lane["throttled"]) for model, lane in lanes.items()])
+
+    metrics_registry.register_collector(name, collect)
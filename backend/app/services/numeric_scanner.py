@@ -0,0 +1,308 @@
+"""
+Single-Pass Numeric Scanner
+
+One precompiled alternation regex tokenizes a text in a single left-to-right
+pass into typed tokens:
+
+- label     financial metric labels (revenue, net profit, operating cash flow)
+- scenario  scenario / probability / downside markers
+- operator  arithmetic operators between figures (×, x, ÷, /, *, =)
+- period    fiscal periods (FY24, Q3-24, H1 2023) and bare years
+- amount    currency amounts with sign, currency and unit (-QR 460.5m, $2.5B)
+- percent   percentages (15%, 8.5 %)
+- number    any other bare number
+
+Extraction, verification, the fact index and the expert-behaviour validators
+all consume the same token stream instead of each re-running its own regex
+battery over the same text.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+
+METRIC_LABELS: Dict[str, str] = {
+    'revenue': r"total\s+revenues?|revenues?",
+    'net_profit': r"net\s+profit|profit",
+    'operating_cash_flow': r"operating\s+cash\s+flow|cash\s+flow\s+from\s+operations|OCF",
+}
+
+_NUMBER = r"\d+(?:,\d{3})*(?:\.\d+)?"
+_UNIT = r"million|billion|thousand|mn|bn|m|b|k"
+
+# Each alternative is gated on the characters it can start with, so the engine
+# rejects most positions with one character-class test instead of trying
+# every branch.
+SCANNER_PATTERN = re.compile(
+    r"""
+    (?=[tronpc])(?P<label>\b(?:""" + '|'.join(f"(?P<{metric}>{label})" for metric, label in METRIC_LABELS.items()) + r""")\b)
+  | (?=[spbwd])(?P<scenario>\bscenario\s+\d+:?|\bprobability:?\s*\d+(?:\s*[-–]\s*\d+)?\s*%?|\bprobability\b
+        |\bbase\s+case\b|\bworst\s+case\b|\bdownside\b|\bwhat\s+if\b)
+  | (?P<operator>[×÷=]|\s[x*/](?=\s*\d)|(?<=\d)[x*](?=\d))
+  | (?=[fqh1-4])(?P<period>\b(?:FY\s?\d{2,4}|[1-4]Q\s?\d{2,4}|Q[1-4][\s\-]?\d{2,4}|H[12][\s\-]?\d{2,4})\b)
+  | (?=[-+−$\dqu])(?P<amount>
+        (?:(?<![\w.\d])(?P<sign1>[-+−])\s*)?
+        (?:(?P<currency_prefix>\b(?:QAR|QR|USD)(?![A-Za-z])|\$)\s*(?P<sign2>[-+−])?\s*|(?<![a-wyzA-WYZ_\d.,]))
+        (?P<number>""" + _NUMBER + r""")
+        (?:\s*(?P<unit>(?:""" + _UNIT + r""")\b))?
+        (?:\s*(?P<currency_suffix>\b(?:QAR|QR|USD)\b))?
+        (?P<percent>\s*%)?
+    )
+    """,
+    re.IGNORECASE | re.VERBOSE
+)
+
+YEAR_PATTERN = re.compile(r"(?:19|20)\d{2}")
+
+UNIT_SCALE = {
+    'thousand': 0.001, 'k': 0.001,
+    'million': 1.0, 'mn': 1.0, 'm': 1.0,
+    'billion': 1000.0, 'bn': 1000.0, 'b': 1000.0,
+}
+
+
+class NumericToken(NamedTuple):
+    """One token produced by scan()."""
+    kind: str
+    text: str
+    start: int
+    end: int
+    value: Optional[float] = None  # Signed figure as written (before unit scaling)
+    unit: Optional[str] = None
+    currency: Optional[str] = None
+    metric: Optional[str] = None   # Set for label tokens
+
+    @property
+    def millions(self) -> Optional[float]:
+        """Amount normalized to millions (unitless figures are taken as millions)."""
+        if self.value is None:
+            return None
+        return self.value * UNIT_SCALE.get((self.unit or 'million').lower(), 1.0)
+
+
+def _parse_number(number: str) -> Optional[float]:
+    try:
+        return float(number.replace(',', ''))
+    except ValueError:
+        return None
+
+
+def scan(text: str) -> Iterator[NumericToken]:
+    """
+    Tokenize text in a single pass.
+
+    Args:
+        text: Any text (report page, chunk, agent response)
+
+    Yields:
+        NumericToken in document order
+    """
+    for match in SCANNER_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'label':
+            metric = next(name for name in METRIC_LABELS if match.group(name))
+            yield NumericToken('label', match.group(0), match.start(), match.end(), metric=metric)
+            continue
+        if kind != 'amount':
+            yield NumericToken(kind, match.group(0), match.start(), match.end())
+            continue
+
+        number = match.group('number')
+        value = _parse_number(number)
+        if value is None:
+            continue
+        sign = (match.group('sign1') or '') + (match.group('sign2') or '')
+        if '-' in sign or '−' in sign:
+            value = -value
+        currency = match.group('currency_prefix') or match.group('currency_suffix')
+        unit = match.group('unit')
+
+        if match.group('percent'):
+            token_kind = 'percent'
+        elif currency or unit:
+            token_kind = 'amount'
+        elif YEAR_PATTERN.fullmatch(number):
+            token_kind = 'period'
+        else:
+            token_kind = 'number'
+
+        yield NumericToken(
+            token_kind,
+            match.group(0).strip(),
+            match.start(),
+            match.end(),
+            value=value,
+            unit=unit.lower() if unit else None,
+            currency=currency.upper() if currency else None
+        )
+
+
+def scan_tokens(text: str, kinds: Optional[set] = None) -> List[NumericToken]:
+    """Return scan() results as a list, optionally restricted to some kinds."""
+    return [token for token in scan(text) if kinds is None or token.kind in kinds]
+
+
+# Text allowed between a metric label and its figure ("Revenue: ", "profit of ")
+_LABEL_GAP = re.compile(r"[\s:\-–]*(?:(?:of|was|is|at|totall?ed|reached|stood\s+at)\s+)?", re.IGNORECASE)
+
+
+def labelled_amounts(text: str, tokens: Optional[List[NumericToken]] = None) -> List[Dict[str, Any]]:
+    """
+    Pair each metric label with the figure immediately following it.
+
+    Args:
+        text: Text that was scanned
+        tokens: Tokens from a previous scan of text (scanned here if omitted)
+
+    Returns:
+        List of dicts (metric, value in millions, raw_text, offset, end) in document order
+    """
+    tokens = tokens if tokens is not None else scan_tokens(text)
+    pairs = []
+    for label, figure in zip(tokens, tokens[1:]):
+        if label.kind != 'label' or figure.kind not in ('amount', 'number'):
+            continue
+        if not _LABEL_GAP.fullmatch(text, label.end, figure.start):
+            continue
+        pairs.append({
+            'metric': label.metric,
+            'value': figure.millions,
+            'raw_text': text[label.start:figure.end],
+            'offset': label.start,
+            'end': figure.end
+        })
+    return pairs
+
+
+def normalize_period(token_text: str) -> str:
+    """Canonical form of a period token ("fy 24" -> "FY24")."""
+    return re.sub(r'\s', '', token_text).upper()
+
+
+def canonical_period(period: str) -> str:
+    """
+    Comparable form of a fiscal period: "FY24", "FY2024" and "2024" give
+    "2024"; "Q3-24", "3Q24" and "Q3 2024" give "Q3 2024".
+    """
+    text = normalize_period(period)
+    part = re.search(r"[QH][1-4]|[1-4]Q", text)
+    if part:
+        text = text[:part.start()] + text[part.end():]
+    digits = re.findall(r"\d{2,4}", text)
+    year = digits[-1] if digits else ""
+    if len(year) == 2:
+        year = "20" + year
+    if not part:
+        return year
+    label = part.group(0)
+    if label[0].isdigit():
+        label = "Q" + label[0]
+    return f"{label} {year}".strip()
+
+
+PERIOD_WINDOW = 80  # characters searched either side of a figure for its period
+
+
+def nearest_period(periods: List[NumericToken], start: int, end: int) -> Optional[str]:
+    """Find the fiscal period stated closest to a figure (within PERIOD_WINDOW), if any."""
+    best: Optional[Tuple[int, str]] = None
+    for period in periods:
+        if period.start < start - PERIOD_WINDOW or period.start > end + PERIOD_WINDOW:
+            continue
+        distance = min(abs(period.start - start), abs(period.start - end))
+        if best is None or distance < best[0]:
+            best = (distance, normalize_period(period.text))
+    return best[1] if best else None
+
+
+FIGURE_KINDS = ('amount', 'number', 'percent')
+ARITHMETIC_OPERATORS = ('×', 'x', '÷', '/', '*')
+
+_GAP = re.compile(r"\s*")
+_SHARE_OF_GAP = re.compile(r"\s+of\s+", re.IGNORECASE)
+_RATE_SUFFIX = re.compile(r"\s+(?:IRR|margin|return)\b", re.IGNORECASE)
+
+
+def numeric_signals(text: str, tokens: Optional[List[NumericToken]] = None) -> Dict[str, List[str]]:
+    """
+    Classify the numeric reasoning in a response from one token stream.
+
+    Returns:
+        Dict of snippet lists:
+        - calculations: "a × b" expressions (with "= c" when stated)
+        - equations: calculations that state a result ("120 × 4 = 480")
+        - qar_calculations: calculations starting from a QAR amount
+        - shares: "15% of QAR 2B"
+        - results: "= QAR 480M"
+        - rates: "18% IRR", "12% margin"
+        - qar_amounts: QAR amounts with a unit ("QAR 500M")
+        - scenarios: scenario / downside / probability markers
+        - scenario_headers: "Scenario 2:"
+        - probabilities: "probability 30", "probability: 30-40%"
+        - risk_probabilities: probabilities stated as a percentage
+        - quarters: "Q3 2024"
+    """
+    tokens = tokens if tokens is not None else scan_tokens(text)
+    signals: Dict[str, List[str]] = {
+        key: [] for key in (
+            'calculations', 'equations', 'qar_calculations', 'shares', 'results',
+            'rates', 'qar_amounts', 'scenarios', 'scenario_headers', 'probabilities',
+            'risk_probabilities', 'quarters'
+        )
+    }
+
+    def adjacent(left: NumericToken, right: NumericToken, gap=_GAP) -> bool:
+        return bool(gap.fullmatch(text, left.end, right.start))
+
+    for i, token in enumerate(tokens):
+        following = tokens[i + 1] if i + 1 < len(tokens) else None
+
+        if token.kind == 'scenario':
+            signals['scenarios'].append(token.text)
+            marker = token.text.lower()
+            if marker.startswith('scenario') and marker.endswith(':'):
+                signals['scenario_headers'].append(token.text)
+            elif marker.startswith('probability') and any(ch.isdigit() for ch in marker):
+                signals['probabilities'].append(token.text)
+                if marker.endswith('%'):
+                    signals['risk_probabilities'].append(token.text)
+        elif token.kind == 'period' and token.text[:1].upper() == 'Q':
+            signals['quarters'].append(token.text)
+        elif token.kind == 'amount' and token.currency == 'QAR' and token.unit:
+            signals['qar_amounts'].append(token.text)
+        elif token.kind == 'operator' and token.text == '=' and following is not None \
+                and following.kind == 'amount' and following.currency == 'QAR' and adjacent(token, following):
+            signals['results'].append(text[token.start:following.end])
+
+        if token.kind == 'percent' and following is not None:
+            if following.kind == 'amount' and following.currency == 'QAR' \
+                    and adjacent(token, following, _SHARE_OF_GAP):
+                signals['shares'].append(text[token.start:following.end])
+        if token.kind == 'percent' and _RATE_SUFFIX.match(text, token.end):
+            signals['rates'].append(text[token.start:_RATE_SUFFIX.match(text, token.end).end()])
+
+        # figure, operator, figure [, "=", figure]
+        if token.kind not in FIGURE_KINDS or i + 2 >= len(tokens):
+            continue
+        operator, right = tokens[i + 1], tokens[i + 2]
+        if operator.kind != 'operator' or operator.text.strip().lower() not in ARITHMETIC_OPERATORS \
+                or right.kind not in FIGURE_KINDS:
+            continue
+        if not (adjacent(token, operator) and adjacent(operator, right)):
+            continue
+        end = right.end
+        stated = False
+        equals = tokens[i + 3] if i + 3 < len(tokens) else None
+        if equals is not None and equals.kind == 'operator' and equals.text == '=' and adjacent(right, equals):
+            end, stated = equals.end, True
+            result = tokens[i + 4] if i + 4 < len(tokens) else None
+            if result is not None and result.kind in FIGURE_KINDS and adjacent(equals, result):
+                end = result.end
+        expression = text[token.start:end]
+        signals['calculations'].append(expression)
+        if stated:
+            signals['equations'].append(expression)
+        if token.kind == 'amount' and token.currency == 'QAR':
+            signals['qar_calculations'].append(expression)
+
+    return signals
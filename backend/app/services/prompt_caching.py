@@ -0,0 +1,102 @@
+"""
+Anthropic Prompt Caching
+
+The expert personas and forcing instructions are several kilobytes of static
+text sent on every call. Sending them as system blocks marked with
+``cache_control`` lets Anthropic reuse the processed prefix: later calls read
+it at a fraction of the input price instead of paying for it again. Anything
+that varies per request (question, data, facts) must come after the
+breakpoints, in the user message.
+
+Cost accounting follows the Messages API usage fields. ``input_tokens``
+counts only the uncached part of the prompt. Cache writes are billed at
+1.25x and cache reads at 0.1x the base input price.
+"""
+
+from typing import Any, Dict, List, Optional
+
+CACHE_CONTROL = {"type": "ephemeral"}
+MAX_CACHE_BREAKPOINTS = 4  # API limit per request
+
+CACHE_WRITE_PRICE_MULTIPLIER = 1.25
+CACHE_READ_PRICE_MULTIPLIER = 0.10
+
+USAGE_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+)
+
+
+def cached_system_blocks(*parts: Optional[str]) -> List[Dict[str, Any]]:
+    """
+    Build a ``system=`` value with a cache breakpoint after each static part.
+
+    Pass the parts from most to least widely shared (persona first, then
+    instructions), so callers that share only the persona still share its
+    cached prefix.
+    """
+    blocks: List[Dict[str, Any]] = [{"type": "text", "text": part} for part in parts if part]
+    for block in blocks[-MAX_CACHE_BREAKPOINTS:]:
+        block["cache_control"] = dict(CACHE_CONTROL)
+    return blocks
+
+
+def usage_to_dict(usage: Any) -> Dict[str, int]:
+    """Token counts from an Anthropic ``usage`` object (or dict), missing fields as 0."""
+    if usage is None:
+        return {field: 0 for field in USAGE_FIELDS}
+    if isinstance(usage, dict):
+        return {field: int(usage.get(field) or 0) for field in USAGE_FIELDS}
+    return {field: int(getattr(usage, field, 0) or 0) for field in USAGE_FIELDS}
+
+
+def add_usage(total: Dict[str, int], usage: Any) -> Dict[str, int]:
+    """Accumulate one response's usage into ``total`` (returned for chaining)."""
+    for field, count in usage_to_dict(usage).items():
+        total[field] = total.get(field, 0) + count
+    return total
+
+
+def count_tokens(usage: Dict[str, int]) -> int:
+    """All prompt and completion tokens, cached or not."""
+    return sum(usage.get(field, 0) for field in USAGE_FIELDS)
+
+
+def usage_cost_usd(usage: Dict[str, int], input_price: float, output_price: float) -> float:
+    """
+    Cost of a usage record in USD.
+
+    Args:
+        usage: Dict with the USAGE_FIELDS counts
+        input_price: Base input price, USD per million tokens
+        output_price: Output price, USD per million tokens
+    """
+    input_cost = (
+        usage.get("input_tokens", 0)
+        + usage.get("cache_creation_input_tokens", 0) * CACHE_WRITE_PRICE_MULTIPLIER
+        + usage.get("cache_read_input_tokens", 0) * CACHE_READ_PRICE_MULTIPLIER
+    ) * input_price
+    output_cost = usage.get("output_tokens", 0) * output_price
+    return (input_cost + output_cost) / 1_000_000
+
+
+# USD per million (input, output) tokens by model family, most specific first
+MODEL_PRICES = (
+    ("opus", (15.0, 75.0)),
+    ("sonnet", (3.0, 15.0)),
+    ("haiku", (0.8, 4.0)),
+    ("gpt-5", (1.25, 10.0)),
+    ("gpt-4o", (2.5, 10.0)),
+    ("gpt-3.5", (0.5, 1.5)),
+)
+
+
+def model_prices(model: str) -> Optional[tuple]:
+    """(input, output) USD per million tokens for ``model``, or None if unknown."""
+    name = (model or "").lower()
+    for family, prices in MODEL_PRICES:
+        if family in name:
+            return prices
+    return None
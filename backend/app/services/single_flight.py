@@ -0,0 +1,125 @@
+"""
+In-Flight Request Coalescing
+
+During a board meeting several executives often ask the same question within
+seconds. The answer cache only helps once the first run has finished. Until
+then every copy of the question would start its own multi-agent run.
+``SingleFlight`` lets the first caller run the pipeline and makes identical
+concurrent callers await that same run.
+
+Requests are identical when they share a namespace (the pipeline), the
+normalized question text (same normalization as the answer cache) and the
+data version. A leader that is cancelled (client disconnect) does not
+cancel the shared run while other callers still wait on it. Once the last
+waiting caller is cancelled, the run is cancelled too, so abandoned
+questions stop spending model calls. Errors reach every waiting caller.
+
+Coalescing is per event loop and process. The answer cache covers repeats
+across processes and over time.
+"""
+
+import asyncio
+import copy
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..core.metrics import metrics_registry
+from .answer_cache import normalize_question
+
+logger = logging.getLogger(__name__)
+
+FlightKey = Tuple[str, str, Optional[str]]
+
+
+class SingleFlight:
+    """
+    Share one execution between concurrent identical requests.
+
+    ``stats`` counts executions (runs actually started), coalesced (callers
+    served by another caller's run, i.e. executions saved) and in_flight
+    (runs currently executing).
+    """
+
+    def __init__(self):
+        self._flights: Dict[FlightKey, asyncio.Future] = {}
+        # Run -> callers currently awaiting it
+        self._waiters: Dict[asyncio.Future, int] = {}
+        self.stats = {"executions": 0, "coalesced": 0, "in_flight": 0}
+
+    async def do(
+        self,
+        namespace: str,
+        question: str,
+        data_version: Optional[str],
+        fn: Callable[[], Awaitable[Any]],
+        on_join: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Any:
+        """
+        Run ``fn`` once for all concurrent identical requests.
+
+        Args:
+            namespace: Pipeline name; answers are only shared within one
+            question: Question as asked (normalized for the key)
+            data_version: Version of the data the answer is built on
+            fn: Zero-argument coroutine function producing the answer
+            on_join: Awaited when this caller joins a run already in flight
+
+        Returns:
+            The answer. Joining callers receive a deep copy so they cannot
+            mutate each other's result.
+        """
+        key = (namespace, normalize_question(question), data_version)
+        flight = self._flights.get(key)
+        if flight is not None:
+            self.stats["coalesced"] += 1
+            logger.info(f"Coalesced identical in-flight request ({namespace}): {question[:80]}")
+            return copy.deepcopy(await self._wait(flight, on_join))
+
+        flight = asyncio.ensure_future(fn())
+        self._flights[key] = flight
+        self.stats["executions"] += 1
+        self.stats["in_flight"] += 1
+        flight.add_done_callback(lambda _: self._finish(key, flight))
+        return await self._wait(flight)
+
+    def in_flight(self, namespace: str, question: str, data_version: Optional[str]) -> bool:
+        """Whether an identical request is currently executing."""
+        return (namespace, normalize_question(question), data_version) in self._flights
+
+    async def _wait(self, flight: asyncio.Future, on_join: Optional[Callable[[], Awaitable[None]]] = None) -> Any:
+        """Await a run as one of its callers; the last caller to leave early cancels it."""
+        self._waiters[flight] = self._waiters.get(flight, 0) + 1
+        try:
+            if on_join is not None:
+                await on_join()
+            return await asyncio.shield(flight)
+        finally:
+            self._waiters[flight] -= 1
+            if not self._waiters[flight]:
+                del self._waiters[flight]
+                if not flight.done():
+                    # Every caller went away (disconnected or cancelled)
+                    flight.cancel()
+
+    def _finish(self, key: FlightKey, flight: asyncio.Future) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        self.stats["in_flight"] -= 1
+        if not flight.cancelled():
+            # Mark the exception as retrieved when every caller went away
+            flight.exception()
+
+
+# Global instance shared by the query handlers and the UIS pipeline
+single_flight = SingleFlight()
+
+
+def _collect_metrics():
+    stats = dict(single_flight.stats)
+    yield ("polaris_single_flight_calls_total", "counter", "Pipeline calls that started a run or joined one in flight",
+           [({"result": "executed"}, stats["executions"]), ({"result": "coalesced"}, stats["coalesced"])])
+    yield ("polaris_single_flight_in_flight", "gauge", "Pipeline runs in flight",
+           [({}, stats["in_flight"])])
+
+
+metrics_registry.register_collector("single_flight", _collect_metrics)
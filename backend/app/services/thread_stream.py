@@ -0,0 +1,48 @@
+"""
+Blocking-Run Event Streaming
+
+Frameworks such as CrewAI expose progress only through synchronous callbacks
+fired from inside a blocking ``kickoff()``. ``stream_blocking_run`` runs such
+a call in a worker thread, keeping the event loop free, and turns every
+callback into an item of an async iterator as soon as it fires. Callers can
+show partial results (finished agent tasks) while the run continues.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable, Tuple
+
+EVENT = "event"
+RESULT = "result"
+
+_DONE = object()
+
+
+async def stream_blocking_run(
+    run: Callable[[Callable[[Any], None]], Any]
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    Run ``run(emit)`` in a thread and yield its progress.
+
+    Yields ``("event", item)`` for each ``emit(item)`` in the order emitted,
+    then a single ``("result", value)`` with the return value. An exception
+    raised by ``run`` is re-raised after the events emitted before it.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def emit(item: Any) -> None:
+        loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    def worker() -> Any:
+        try:
+            return run(emit)
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, _DONE)
+
+    future = loop.run_in_executor(None, worker)
+    while True:
+        item = await queue.get()
+        if item is _DONE:
+            break
+        yield EVENT, item
+    yield RESULT, await future
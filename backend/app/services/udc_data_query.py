@@ -0,0 +1,314 @@
+"""
+Structured UDC Data Queries
+
+Projects the UDC data files down to the fields a question is about. The
+data retrieval layer used to return whole files as ``data``. Dr. James put
+all five files (about 9k tokens) into every prompt. Most questions need a
+handful of periods and metrics.
+
+Each file gets a path index. Every leaf field (``annual_summary[1].revenue``)
+is indexed under:
+
+- the words of the file name and of the keys on its path: metric, section
+  and asset names (``financial``, ``revenue``, ``annual``, ``pearl``);
+- the identity values of the list items it belongs to, such as a year, a
+  period, a precinct or a project name;
+- the periods in those keys and values (``2024``, ``q3``).
+
+For each term of a question, the fields indexed under it that match the
+most question terms are selected: "Pearl occupancy" gives the Pearl's
+occupancy fields, "the Pearl" every Pearl field. The question's periods
+filter out fields of other periods. The result is the matching fields in
+their original nesting, plus each list item's identity fields and the
+file's metadata (units, currency, source), with the file, path and period
+of every field as provenance. If nothing matches, the complete files are
+returned, as before. Indexes are rebuilt when the data store re-reads a
+file.
+"""
+
+import re
+import threading
+from typing import Any, Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple, Union
+
+from .udc_data_store import UDCDataStore, udc_data_store
+
+
+DEFAULT_MAX_FIELDS = 100
+
+# Values that name a list item ({"year": 2024, ...}, {"name": "Porto Arabia", ...})
+IDENTITY_KEYS = ("year", "period", "name", "project", "initiative", "asset")
+ALWAYS_INCLUDED = ("metadata",)
+
+STOPWORDS = frozenset("""
+    a about after all also an and any are as at be been before by can could did do does for from had has
+    have how i in is it its me more most much of on or our over should show tell than that the their
+    them there these this to udc under us was we were what when where which who why will with would
+    you your give current latest recent trend performance doing key main business company data
+    information summary
+""".split())
+
+# Question words -> words used in the data keys
+SYNONYMS: Dict[str, Tuple[str, ...]] = {
+    "leverage": ("debt", "equity"),
+    "borrowing": ("debt", "credit"),
+    "loan": ("debt", "credit", "facility"),
+    "sale": ("revenue", "sale"),
+    "income": ("revenue", "profit", "income"),
+    "earning": ("profit", "eps"),
+    "profitability": ("profit", "margin", "return"),
+    "roe": ("return", "equity", "roe"),
+    "liquidity": ("cash", "current", "quick"),
+    "cooling": ("cool", "cooling"),
+    "hotel": ("hotel", "hospitality"),
+    "occupied": ("occupancy",),
+    "vacancy": ("occupancy",),
+    "capex": ("capital", "commitment", "investment"),
+    "valuation": ("price", "target", "value"),
+    "risk": ("risk", "concern"),
+    "worry": ("risk", "concern"),
+}
+
+# Routed question types (udc_master_ontology.CEOQuestionType values) -> implied terms
+QUESTION_TYPE_TERMS: Dict[str, Tuple[str, ...]] = {
+    "udc_revenue": ("revenue",),
+    "udc_profitability": ("profit", "margin", "return"),
+    "udc_segment_performance": ("revenue", "breakdown"),
+    "udc_property_performance": ("occupancy", "price", "rental", "yield"),
+    "udc_subsidiary_performance": ("revenue", "profit", "occupancy"),
+    "udc_cashflow": ("cash", "flow"),
+    "udc_debt": ("debt", "equity", "interest", "credit"),
+    "udc_occupancy_rates": ("occupancy",),
+    "udc_average_daily_rate": ("adr", "rate", "hotel"),
+}
+
+Path = Tuple[Union[str, int], ...]
+
+_SPLIT = re.compile(r"[^a-z0-9]+")
+_YEAR = re.compile(r"^(?:19|20)\d{2}$")
+_PERIOD = re.compile(r"^(?:q[1-4]|h[12]|9m|6m)$")
+
+
+def _stem(word: str) -> str:
+    if len(word) > 4 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def _tokens(text: Any) -> List[str]:
+    # "UDC's" -> "udc", not "udc" and "s"
+    text = re.sub(r"['\u2019]s\b", "", str(text).lower())
+    return [_stem(token) for token in _SPLIT.split(text) if len(token) > 1]
+
+
+def _split_periods(tokens: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+    """(terms, periods) of a token list, without stopwords."""
+    terms: Set[str] = set()
+    periods: Set[str] = set()
+    for token in tokens:
+        if _YEAR.match(token) or _PERIOD.match(token):
+            periods.add(token)
+        elif token not in STOPWORDS and not token.isdigit():
+            terms.add(token)
+    return terms, periods
+
+
+def question_terms(question: str, question_type: Optional[str] = None) -> Tuple[Set[str], Set[str]]:
+    """
+    Search terms and periods of a question.
+
+    ``FY24`` and ``2024`` both give the period "2024"; ``Q3 2024`` gives
+    "q3" and "2024".
+    """
+    text = question.lower()
+    text = re.sub(r"\bfy\s?'?(\d{2})\b", r"20\1", text)
+    text = re.sub(r"\b([1-4])q\b", r"q\1", text)
+    text = re.sub(r"\bnine months\b", "9m", text)
+    terms, periods = _split_periods(_tokens(text))
+    for term in list(terms):
+        terms.update(SYNONYMS.get(term, ()))
+    terms.update(QUESTION_TYPE_TERMS.get(question_type or "", ()))
+    return terms, periods
+
+
+def format_path(path: Path) -> str:
+    """``("annual_summary", 1, "revenue")`` -> ``annual_summary[1].revenue``"""
+    text = ""
+    for part in path:
+        text += f"[{part}]" if isinstance(part, int) else (f".{part}" if text else part)
+    return text
+
+
+class IndexedField(NamedTuple):
+    position: int
+    path: Path
+    terms: FrozenSet[str]
+    periods: FrozenSet[str]
+
+
+class FileIndex:
+    """Path index over the leaf fields of one data file."""
+
+    def __init__(self, filename: str, data: Dict[str, Any]):
+        self.filename = filename
+        self.data = data
+        self.fields: List[IndexedField] = []
+        # term -> ids of the fields indexed under it
+        self.postings: Dict[str, List[int]] = {}
+        # list item path -> paths of its identity fields
+        self.identity: Dict[Path, List[Path]] = {}
+        file_terms, _ = _split_periods(_tokens(filename.rsplit(".", 1)[0]))
+        for key, value in data.items():
+            if key not in ALWAYS_INCLUDED:
+                self._walk(value, (key,), file_terms, set())
+
+    def _walk(self, value: Any, path: Path, terms: Set[str], periods: Set[str]) -> None:
+        key_terms, key_periods = _split_periods(_tokens(path[-1])) if isinstance(path[-1], str) else (set(), set())
+        terms, periods = terms | key_terms, periods | key_periods
+
+        if isinstance(value, dict):
+            identity = [key for key in IDENTITY_KEYS if key in value and not isinstance(value[key], (dict, list))]
+            if identity and isinstance(path[-1], int):
+                self.identity[path] = [path + (key,) for key in identity]
+                for key in identity:
+                    id_terms, id_periods = _split_periods(_tokens(value[key]))
+                    terms, periods = terms | id_terms, periods | id_periods
+            for key, child in value.items():
+                self._walk(child, path + (key,), terms, periods)
+        elif isinstance(value, list) and any(isinstance(item, (dict, list)) for item in value):
+            for i, item in enumerate(value):
+                self._walk(item, path + (i,), terms, periods)
+        else:
+            # Scalars and lists of scalars ("key_concerns": [...]) are one field
+            field_id = len(self.fields)
+            self.fields.append(IndexedField(field_id, path, frozenset(terms), frozenset(periods)))
+            for term in terms:
+                self.postings.setdefault(term, []).append(field_id)
+
+    def match(self, terms: Set[str], periods: Set[str]) -> List[IndexedField]:
+        """Every field sharing a term with the question, except fields of other periods."""
+        field_ids = {field_id for term in terms for field_id in self.postings.get(term, ())}
+
+        years = {period for period in periods if _YEAR.match(period)}
+        parts = periods - years
+        matches = []
+        for field_id in sorted(field_ids):
+            field = self.fields[field_id]
+            field_years = {period for period in field.periods if _YEAR.match(period)}
+            if years and field_years and not years & field_years:
+                continue
+            field_parts = field.periods - field_years
+            if parts and field_parts and not parts & field_parts:
+                continue
+            matches.append(field)
+        return matches
+
+    def project(self, paths: Sequence[Path]) -> Dict[str, Any]:
+        """The selected fields in their original nesting, with identity fields and metadata."""
+        keep: Set[Path] = set(paths)
+        for path in paths:
+            for i in range(1, len(path)):
+                keep.update(self.identity.get(path[:i], ()))
+        prefixes = {path[:i] for path in keep for i in range(1, len(path))}
+
+        def build(value: Any, path: Path) -> Any:
+            if path in keep:
+                return value
+            if isinstance(value, dict):
+                return {key: build(child, path + (key,)) for key, child in value.items()
+                        if path + (key,) in keep or path + (key,) in prefixes}
+            return [build(child, path + (i,)) for i, child in enumerate(value)
+                    if path + (i,) in keep or path + (i,) in prefixes]
+
+        projected = build(self.data, ())
+        for key in ALWAYS_INCLUDED:
+            if key in self.data:
+                projected = {key: self.data[key], **projected}
+        return projected
+
+
+class StructuredDataIndex:
+    """
+    Field-level queries over the files of a UDCDataStore.
+    """
+
+    def __init__(self, store: Optional[UDCDataStore] = None):
+        self.store = store or udc_data_store
+        # filename -> index of the data object the store returned
+        self._indexes: Dict[str, FileIndex] = {}
+        self._lock = threading.Lock()
+
+    def file_index(self, filename: str) -> FileIndex:
+        """Index of a file, rebuilt when the store has re-read it."""
+        data = self.store.get(filename)
+        index = self._indexes.get(filename)
+        if index is None or index.data is not data:
+            with self._lock:
+                index = self._indexes.get(filename)
+                if index is None or index.data is not data:
+                    index = self._indexes[filename] = FileIndex(filename, data)
+        return index
+
+    def query(
+        self,
+        question: str,
+        files: Optional[Sequence[str]] = None,
+        question_type: Optional[str] = None,
+        max_fields: int = DEFAULT_MAX_FIELDS
+    ) -> Dict[str, Any]:
+        """
+        Fields of the data files relevant to a question.
+
+        Args:
+            question: The user's question.
+            files: Data files to search (all files in the store if None).
+            question_type: Routed question type ("udc_debt", ...), adds its implied terms.
+            max_fields: Most fields returned across all files.
+
+        Returns:
+            dict: ``data`` (file -> projected JSON), ``provenance`` (file,
+            path and period of every field returned), ``projected`` (False
+            when nothing matched and ``data`` holds the complete files),
+            ``fields`` (count returned), ``terms`` and ``periods``.
+        """
+        terms, periods = question_terms(question, question_type)
+        indexes = [self.file_index(filename) for filename in (files if files is not None else self.store.filenames())
+                   if (self.store.data_dir / filename).exists()]
+
+        # (question terms matched, file, field)
+        candidates = [(len(terms & field.terms), index, field)
+                      for index in indexes for field in index.match(terms, periods)]
+        best: Dict[str, int] = {}
+        for coverage, _, field in candidates:
+            for term in terms & field.terms:
+                best[term] = max(best.get(term, 0), coverage)
+        matches = [(coverage, index, field) for coverage, index, field in candidates
+                   if any(best[term] == coverage for term in terms & field.terms)]
+        matches.sort(key=lambda match: -match[0])
+        matches = matches[:max_fields]
+
+        result: Dict[str, Any] = {"terms": sorted(terms), "periods": sorted(periods)}
+        if not matches:
+            return {**result, "projected": False, "fields": sum(len(index.fields) for index in indexes),
+                    "data": {index.filename: index.data for index in indexes},
+                    "provenance": [{"file": index.filename, "path": "", "period": None} for index in indexes]}
+
+        selected: Dict[str, List[IndexedField]] = {}
+        for _, index, field in matches:
+            selected.setdefault(index.filename, []).append(field)
+        data = {}
+        provenance = []
+        for index in indexes:
+            fields = sorted(selected.get(index.filename, []), key=lambda field: field.position)
+            if not fields:
+                continue
+            data[index.filename] = index.project([field.path for field in fields])
+            provenance.extend(
+                {"file": index.filename, "path": format_path(field.path),
+                 "period": " ".join(sorted(field.periods)) or None}
+                for field in fields
+            )
+        return {**result, "projected": True, "fields": len(matches), "data": data, "provenance": provenance}
+
+
+# Global instance over data/sample_data
+udc_data_index = StructuredDataIndex()
@@ -0,0 +1,171 @@
+"""
+UDC Structured Data Store
+
+One in-memory copy of the UDC data files (``data/sample_data/*.json``) per
+process. UDCDataTools, Dr. James and the data retrieval layer used to read
+and parse the files themselves: ``search_data`` alone parsed up to five
+files per question, and each agent kept a private copy that never saw
+later edits.
+
+Each file is parsed once. Every access stats the file, and a file whose
+mtime or size changed is parsed again, so edited data is served on the
+next call without a restart. Callers get read-only views (``FrozenDict``
+/ ``FrozenList``) of the shared copy. They serialize like plain dicts and
+lists, and ``copy.deepcopy`` turns one into a mutable copy.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..core.metrics import metrics_registry
+
+
+DEFAULT_DATA_DIR = Path(__file__).resolve().parents[3] / "data" / "sample_data"
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("UDC data views are read-only; copy.deepcopy() one to modify it")
+
+
+class FrozenDict(dict):
+    """Read-only dict shared by every caller of the data store."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return {key: copy.deepcopy(value, memo) for key, value in self.items()}
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(list):
+    """Read-only list shared by every caller of the data store."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return [copy.deepcopy(value, memo) for value in self]
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Read-only copy of parsed JSON (dicts and lists at every level)."""
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+class UDCDataStore:
+    """
+    Parsed UDC data files of one directory, revalidated by mtime and size.
+    """
+
+    def __init__(self, data_dir: Optional[Path] = None):
+        self.data_dir = Path(data_dir) if data_dir is not None else DEFAULT_DATA_DIR
+        # filename -> ((mtime_ns, size), parsed data)
+        self._entries: Dict[str, Tuple[Tuple[int, int], FrozenDict]] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "loads": 0}
+
+    def get(self, filename: str) -> FrozenDict:
+        """
+        Parsed contents of one data file.
+
+        Args:
+            filename: File name inside the data directory, e.g. "financial_summary.json".
+
+        Returns:
+            FrozenDict: Read-only view of the file (shared, do not copy per call).
+
+        Raises:
+            FileNotFoundError: If the file doesn't exist.
+            json.JSONDecodeError: If the file is not valid JSON.
+        """
+        path = self.data_dir / filename
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._entries.pop(filename, None)
+            raise FileNotFoundError(f"Data file not found: {path}")
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(filename)
+        if entry is not None and entry[0] == signature:
+            self.stats["hits"] += 1
+            return entry[1]
+
+        with self._lock:
+            # Another thread may have parsed the new version meanwhile
+            entry = self._entries.get(filename)
+            if entry is not None and entry[0] == signature:
+                self.stats["hits"] += 1
+                return entry[1]
+            with open(path, "r", encoding="utf-8") as f:
+                data = freeze(json.load(f))
+            self._entries[filename] = (signature, data)
+            self.stats["loads"] += 1
+            return data
+
+    def filenames(self) -> List[str]:
+        """Data files currently in the directory, sorted by name."""
+        return sorted(path.name for path in self.data_dir.glob("*.json"))
+
+    def load_all(self) -> Dict[str, FrozenDict]:
+        """Every data file, keyed by file name (parses only new or changed files)."""
+        return {filename: self.get(filename) for filename in self.filenames()}
+
+    def data_version(self) -> str:
+        """
+        Version of the data files, used to key shared answers.
+
+        Returns:
+            str: Changes whenever a JSON file is added, removed or modified.
+        """
+        stats = sorted(
+            (path.name, path.stat().st_mtime_ns, path.stat().st_size)
+            for path in self.data_dir.glob("*.json")
+        )
+        return hashlib.sha256(repr(stats).encode("utf-8")).hexdigest()[:16]
+
+
+_stores: Dict[Path, UDCDataStore] = {}
+_stores_lock = threading.Lock()
+
+
+def data_store(data_dir: Optional[Path] = None) -> UDCDataStore:
+    """The process-wide store of a data directory (the default sample data if None)."""
+    key = Path(data_dir).resolve() if data_dir is not None else DEFAULT_DATA_DIR
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = _stores[key] = UDCDataStore(key)
+        return store
+
+
+# Global instance for data/sample_data
+udc_data_store = data_store()
+
+
+def _collect_metrics():
+    stores = list(_stores.values())
+    yield ("polaris_udc_data_reads_total", "counter", "UDC data file reads served from memory or parsed from disk",
+           [({"result": "hit"}, sum(store.stats["hits"] for store in stores)),
+            ({"result": "load"}, sum(store.stats["loads"] for store in stores))])
+
+
+metrics_registry.register_collector("udc_data_store", _collect_metrics)
@@ -12,18 +12,22 @@ Components:
 4. LLM integration (GPT-3.5-turbo)
 5. End-to-end RAG pipeline
 6. Testing with sample queries
+
+The components live in ``rag_service`` and are loaded on first use (or by
+the API's startup warmup), not when this module is imported.
 """
 
+import hashlib
 import os
+import threading
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import chromadb
-from chromadb.config import Settings
-from sentence_transformers import SentenceTransformer
-from openai import OpenAI
+from typing import List, Dict, Any, Optional, Tuple
 import json
 from dotenv import load_dotenv
 
+from app.core.metrics import metrics_registry
+from app.services.embedding_service import text_embedder
+
 # Load environment variables from .env file
 project_root = Path(__file__).parent.parent
 env_file = project_root / '.env'
@@ -35,40 +39,165 @@ EMBEDDING_MODEL_NAME = 'all-MiniLM-L6-v2'
 LLM_MODEL = 'gpt-3.5-turbo'  # Balance of quality and cost
 DEFAULT_TOP_K = 5
 
-# Initialize components
-print("Initializing RAG System...")
-print("-" * 80)
-
-# ChromaDB client
-chroma_client = chromadb.PersistentClient(
-    path=CHROMADB_PATH,
-    settings=Settings(anonymized_telemetry=False)
+CHROMA_QUERY_SECONDS = metrics_registry.histogram(
+    "polaris_chroma_query_duration_seconds", "Chroma query latency (including the query embedding)", ("collection",)
 )
 
-# Collections
-qatar_collection = chroma_client.get_collection("qatar_open_data")
-corporate_collection = chroma_client.get_collection("corporate_intelligence")
 
-# Embedding model
-embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+# ============================================================================
+# 0. Retrieval Service
+# ============================================================================
+
+class RetrievalService:
+    """
+    Embedding model, ChromaDB collections and OpenAI client of the RAG pipeline
+    
+    Nothing is loaded when the module is imported: agents, councils, scripts
+    and tests that only import this module no longer pay for the model load
+    and the Chroma connection. ``init()`` connects on first use (idempotent
+    and thread-safe); ``warmup()`` also runs one embedding and loads the
+    collection segments, so the first real query is fast.
+    """
+    
+    def __init__(self, chromadb_path: str = CHROMADB_PATH, embedding_model: str = EMBEDDING_MODEL_NAME):
+        self.chromadb_path = chromadb_path
+        self.embedding_model = embedding_model
+        self.embed_text = None
+        self.chroma_client = None
+        self.qatar_collection = None
+        self.corporate_collection = None
+        self._openai_client = None
+        self._openai_checked = False
+        self._initialized = False
+        self._data_version: Optional[Tuple[Any, str]] = None
+        self._lock = threading.RLock()
+    
+    @property
+    def initialized(self) -> bool:
+        return self._initialized
+    
+    @property
+    def openai_client(self):
+        """OpenAI client, created on first access (None without OPENAI_API_KEY)"""
+        if not self._openai_checked:
+            with self._lock:
+                if not self._openai_checked:
+                    openai_api_key = os.getenv('OPENAI_API_KEY')
+                    if openai_api_key:
+                        from openai import OpenAI
+                        self._openai_client = OpenAI(api_key=openai_api_key)
+                    self._openai_checked = True
+        return self._openai_client
+    
+    @property
+    def openai_available(self) -> bool:
+        return self.openai_client is not None
+    
+    def init(self) -> "RetrievalService":
+        """
+        Load the embedding model and open the collections (once)
+        
+        Returns:
+            The service itself, so callers can write ``rag_service.init().qatar_collection``
+            
+        Raises:
+            ImportError: No embedding model or sidecar is available
+        """
+        if self._initialized:
+            return self
+        
+        with self._lock:
+            if self._initialized:
+                return self
+            
+            print("Initializing RAG System...")
+            print("-" * 80)
+            
+            # Embedding model (served by the shared sidecar when EMBEDDING_SOCKET is set)
+            embed_text = text_embedder(self.embedding_model)
+            if embed_text is None:
+                raise ImportError("sentence-transformers is not installed and no embedding sidecar is configured")
+            
+            import chromadb
+            from chromadb.config import Settings
+            
+            chroma_client = chromadb.PersistentClient(
+                path=self.chromadb_path,
+                settings=Settings(anonymized_telemetry=False)
+            )
+            self.qatar_collection = chroma_client.get_collection("qatar_open_data")
+            self.corporate_collection = chroma_client.get_collection("corporate_intelligence")
+            self.chroma_client = chroma_client
+            self.embed_text = embed_text
+            self._initialized = True
+            
+            print("✓ ChromaDB client connected")
+            print("✓ Collections loaded (qatar_open_data, corporate_intelligence)")
+            print(f"✓ Embedding model loaded ({self.embedding_model})")
+            if self.openai_available:
+                print("✓ OpenAI client initialized (GPT-3.5-turbo)")
+            else:
+                print("⚠️  OpenAI API key not found (retrieval-only mode)")
+            print()
+        
+        return self
+    
+    def warmup(self) -> Dict[str, int]:
+        """
+        Initialize and exercise every component once
+        
+        Returns:
+            Document count per collection
+        """
+        self.init()
+        self.embed_text("warmup")
+        return {
+            'qatar_open_data': self.qatar_collection.count(),
+            'corporate_intelligence': self.corporate_collection.count()
+        }
+    
+    def data_version(self) -> str:
+        """
+        Fingerprint of the indexed documents, used to key cached answers
+        
+        Hashes the ids, documents and metadata of both collections, so it
+        changes when documents are added, removed or re-ingested with new
+        content. The hash is only recomputed after Chroma's database files
+        change on disk.
+        """
+        self.init()
+        signature = self._store_signature()
+        with self._lock:
+            if signature is None or self._data_version is None or self._data_version[0] != signature:
+                digest = hashlib.sha256()
+                for collection in (self.qatar_collection, self.corporate_collection):
+                    records = collection.get(include=['documents', 'metadatas'])
+                    rows = sorted(zip(records['ids'], records['documents'], records['metadatas']),
+                                  key=lambda row: row[0])
+                    digest.update(json.dumps([collection.name, rows], sort_keys=True, default=str).encode('utf-8'))
+                self._data_version = (signature, digest.hexdigest()[:16])
+            return self._data_version[1]
+    
+    def _store_signature(self) -> Optional[Tuple[Tuple[str, int, int], ...]]:
+        """Modification time and size of Chroma's SQLite files (None if there are none)"""
+        files = sorted(Path(self.chromadb_path).glob('chroma.sqlite3*'))
+        if not files:
+            return None
+        return tuple((path.name, path.stat().st_mtime_ns, path.stat().st_size) for path in files)
+
+
+# Global instance
+rag_service = RetrievalService()
 
-# OpenAI client (conditional)
-openai_api_key = os.getenv('OPENAI_API_KEY')
-if openai_api_key:
-    openai_client = OpenAI(api_key=openai_api_key)
-    openai_available = True
-else:
-    openai_client = None
-    openai_available = False
 
-print("✓ ChromaDB client connected")
-print("✓ Collections loaded (qatar_open_data, corporate_intelligence)")
-print("✓ Embedding model loaded (all-MiniLM-L6-v2)")
-if openai_available:
-    print("✓ OpenAI client initialized (GPT-3.5-turbo)")
-else:
-    print("⚠️  OpenAI API key not found (retrieval-only mode)")
-print()
+def __getattr__(name: str) -> Any:
+    # Module-level names from before the service existed
+    # (``from rag_system import openai_client, qatar_collection``)
+    if name in ('openai_client', 'openai_available'):
+        return getattr(rag_service, name)
+    if name in ('embed_text', 'chroma_client', 'qatar_collection', 'corporate_collection'):
+        return getattr(rag_service.init(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
@@ -85,10 +214,21 @@ def embed_query(query: str) -> List[float]:
     Returns:
         384-dimensional embedding vector
     """
-    embedding = embedding_model.encode(query)
+    embedding = rag_service.init().embed_text(query)
     return embedding.tolist()
 
 
+def data_version() -> str:
+    """
+    Version of the indexed collections, used to key cached answers
+    
+    Returns:
+        String that changes whenever documents are added to, removed from
+        or updated in either collection
+    """
+    return rag_service.data_version()
+
+
 # ============================================================================
 # 2. ChromaDB Retrieval Function
 # ============================================================================
@@ -111,6 +251,8 @@ def retrieve_datasets(
     Returns:
         Dictionary with retrieved datasets and metadata
     """
+    service = rag_service.init()
+    
     # Generate query embedding
     query_embedding = embed_query(query)
     
@@ -122,20 +264,21 @@ def retrieve_datasets(
     # Determine which collection(s) to search
     collections = []
     if source_type == 'qatar_open_data' or source_type is None:
-        collections.append(('qatar', qatar_collection))
+        collections.append(('qatar', service.qatar_collection))
     if source_type == 'corporate_intelligence' or source_type is None:
-        collections.append(('corporate', corporate_collection))
+        collections.append(('corporate', service.corporate_collection))
     
     all_results = []
     
     # Search each collection
     for coll_name, collection in collections:
         try:
-            results = collection.query(
-                query_embeddings=[query_embedding],
-                n_results=top_k,
-                where=where_filter if where_filter else None
-            )
+            with CHROMA_QUERY_SECONDS.time(collection=collection.name):
+                results = collection.query(
+                    query_embeddings=[query_embedding],
+                    n_results=top_k,
+                    where=where_filter if where_filter else None
+                )
             
             # Parse results
             for i in range(len(results['ids'][0])):
@@ -268,7 +411,8 @@ def generate_answer(
         LLM-generated answer with citations
     """
     # Check if OpenAI is available
-    if not openai_available or openai_client is None:
+    openai_client = rag_service.openai_client
+    if openai_client is None:
         return "[LLM NOT AVAILABLE]\n\nOpenAI API key not configured. Set OPENAI_API_KEY environment variable to enable answer generation.\n\nRetrieved context:\n" + context
     
     try:
@@ -442,6 +586,7 @@ def test_rag_system():
 # ============================================================================
 
 if __name__ == "__main__":
+    rag_service.init()
     print("\n" + "="*100)
     print("RAG SYSTEM INITIALIZED")
     print("="*100)
@@ -10,11 +10,13 @@ Uses Latest Models (Nov 2025):
 
 import os
 import asyncio
-from typing import Dict, List, Any, Optional
+from typing import Awaitable, Callable, Dict, List, Any, Optional
 from pathlib import Path
 from dotenv import load_dotenv
-import anthropic
-import openai
+
+from app.services.llm_clients import llm_clients
+from app.services.llm_governor import estimate_tokens, llm_governor
+from app.services.prompt_caching import cached_system_blocks, usage_to_dict
 
 # Load environment variables from .env file
 project_root = Path(__file__).parent.parent
@@ -27,7 +29,8 @@ ULTIMATE_MODEL_CONFIG = {
     'agents': {
         'model': 'claude-opus-4-1',  # Correct format: dashes not dots
         'temperature': 0.3,
-        'max_tokens': 8000
+        'max_tokens': 8000,
+        'max_concurrent': int(os.getenv('COUNCIL_MAX_CONCURRENT_EXPERTS', '4'))
     },
     
     # Deep Thinking - Extended reasoning
@@ -79,9 +82,11 @@ class UltimateStrategicCouncil:
         anthropic_key = os.getenv('ANTHROPIC_API_KEY')
         if anthropic_key:
             # Extended timeout for Sonnet 4.5 Thinking (deep reasoning can take 5-10 min)
-            self.anthropic = anthropic.Anthropic(
+            # Async client so the 4 expert calls genuinely overlap
+            self.anthropic = llm_clients.async_anthropic(
                 api_key=anthropic_key,
-                timeout=600.0  # 10 minutes
+                timeout=600.0,  # 10 minutes
+                max_retries=0  # Retries are handled by the LLM governor
             )
             self.anthropic_available = True
         else:
@@ -92,7 +97,7 @@ class UltimateStrategicCouncil:
         # OpenAI client for GPT-5
         openai_key = os.getenv('OPENAI_API_KEY')
         if openai_key:
-            self.openai_client = openai.OpenAI(api_key=openai_key)
+            self.openai_client = llm_clients.async_openai(api_key=openai_key, max_retries=0)
             self.openai_available = True
         else:
             self.openai_client = None
@@ -104,7 +109,7 @@ class UltimateStrategicCouncil:
             from agents import dr_omar, dr_fatima, dr_james, dr_sarah
             # Using enhanced adaptive prompts (Phase 2.6)
             from agent_prompts import AGENT_PROMPTS, ORCHESTRATOR_PROMPT
-            from rag_system import retrieve_datasets
+            from rag_system import retrieve_datasets, data_version
             
             self.agents = {
                 'dr_omar': dr_omar,
@@ -115,16 +120,36 @@ class UltimateStrategicCouncil:
             self.agent_prompts = AGENT_PROMPTS
             self.orchestrator_prompt = ORCHESTRATOR_PROMPT
             self.retrieve_datasets = retrieve_datasets
+            self.data_version = data_version
             
         except ImportError as e:
             print(f"⚠️  Error importing dependencies: {e}")
             self.agents = {}
             self.retrieve_datasets = None
+            self.data_version = None
+        
+        # Final-answer cache for repeated CEO questions
+        try:
+            from app.services.answer_cache import answer_cache
+            self.answer_cache = answer_cache
+        except ImportError:
+            self.answer_cache = None
     
-    async def analyze_ceo_question(self, query: str) -> Dict[str, Any]:
+    async def analyze_ceo_question(
+        self,
+        query: str,
+        use_cache: bool = True,
+        on_stage: Optional[Callable[[int, int, str], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
         """
         Complete analysis pipeline for CEO question
         
+        A near-duplicate of a question already answered against the same
+        ChromaDB contents returns the cached Decision Sheet instead
+        (metadata['cached'] is True). Pass use_cache=False to force a
+        fresh analysis. on_stage, if given, is awaited with
+        (stage, total_stages, description) as each stage starts.
+        
         6-Stage Process:
         1. Retrieve comprehensive context (30+ datasets)
         2. Run 4 expert analyses (Opus 4.1) in parallel
@@ -139,18 +164,35 @@ class UltimateStrategicCouncil:
         print("="*100)
         print(f"\nCEO Question: {query}\n")
         
+        version = None
+        if self.answer_cache is not None and self.data_version is not None:
+            version = self.data_version()
+            if use_cache:
+                hit = self.answer_cache.get("ultimate_council", query, version)
+                if hit:
+                    decision_sheet = hit['payload']
+                    decision_sheet.setdefault('metadata', {}).update(hit['cache'])
+                    print(f"⚡ Cached Decision Sheet (matched: {hit['cache']['matched_question']})")
+                    return decision_sheet
+        
         # STAGE 1: Retrieve comprehensive data
         print("[1/6] Retrieving comprehensive context from ChromaDB...")
+        if on_stage:
+            await on_stage(1, 6, "Retrieving comprehensive context")
         context = self._retrieve_comprehensive_context(query, n_results=30)
         print(f"      ✓ Retrieved {len(context)} relevant datasets")
         
         # STAGE 2: Run 4 expert agents in parallel (Opus 4.1)
         print("\n[2/6] Running 4 expert analyses (Claude Opus 4.1)...")
+        if on_stage:
+            await on_stage(2, 6, "Running 4 expert analyses")
         agent_analyses = await self._run_expert_agents(query, context)
         print(f"      ✓ {len(agent_analyses)} expert analyses complete")
         
         # STAGE 3: Deep strategic reasoning (Sonnet 4.5 Thinking)
         print("\n[3/6] Deep strategic reasoning (Sonnet 4.5 Thinking)...")
+        if on_stage:
+            await on_stage(3, 6, "Deep strategic reasoning")
         strategic_thinking = await self._deep_strategic_analysis(
             query, agent_analyses, context
         )
@@ -158,11 +200,15 @@ class UltimateStrategicCouncil:
         
         # STAGE 4: Identify expert debates
         print("\n[4/6] Identifying expert disagreements...")
+        if on_stage:
+            await on_stage(4, 6, "Identifying expert disagreements")
         debates = self._identify_debates(agent_analyses)
         print(f"      ✓ Found {len(debates)} areas of expert debate")
         
         # STAGE 5: Final synthesis (GPT-5)
         print("\n[5/6] Final synthesis (GPT-5)...")
+        if on_stage:
+            await on_stage(5, 6, "Final synthesis")
         final_recommendation = await self._synthesize_with_gpt5(
             query, agent_analyses, strategic_thinking, debates
         )
@@ -170,6 +216,8 @@ class UltimateStrategicCouncil:
         
         # STAGE 6: Generate CEO Decision Sheet
         print("\n[6/6] Generating CEO Decision Sheet...")
+        if on_stage:
+            await on_stage(6, 6, "Generating CEO Decision Sheet")
         decision_sheet = self._generate_decision_sheet(
             query, agent_analyses, strategic_thinking,
             debates, final_recommendation, context
@@ -180,6 +228,9 @@ class UltimateStrategicCouncil:
         print("✅ ANALYSIS COMPLETE - CEO DECISION SHEET READY")
         print("="*100)
         
+        if version is not None:
+            self.answer_cache.put("ultimate_council", query, version, decision_sheet)
+        
         return decision_sheet
     
     def _retrieve_comprehensive_context(self, query: str, n_results: int = 30) -> List[Dict]:
@@ -195,22 +246,23 @@ class UltimateStrategicCouncil:
         return retrieval_result.get('results', [])
     
     async def _run_expert_agents(self, query: str, context: List[Dict]) -> List[Dict]:
-        """Run all 4 expert agents in parallel with Claude Opus 4.1"""
+        """Run all 4 expert agents in parallel with Claude Opus 4.1 (bounded by max_concurrent)"""
         
         if not self.anthropic_available:
             # Fallback to existing agent system
             print("      ⚠️  Anthropic unavailable, using fallback agents")
             return self._run_fallback_agents(query, context)
         
+        slots = asyncio.Semaphore(max(1, ULTIMATE_MODEL_CONFIG['agents']['max_concurrent']))
+        
+        async def run_agent(agent_key: str) -> Dict:
+            async with slots:
+                return await self._run_single_agent(agent_key, query, context)
+        
         # Run all 4 agents in parallel
-        tasks = [
-            self._run_single_agent("dr_omar", query, context),
-            self._run_single_agent("dr_fatima", query, context),
-            self._run_single_agent("dr_james", query, context),
-            self._run_single_agent("dr_sarah", query, context)
-        ]
-        
-        return await asyncio.gather(*tasks)
+        return await asyncio.gather(*(
+            run_agent(agent_key) for agent_key in ("dr_omar", "dr_fatima", "dr_james", "dr_sarah")
+        ))
     
     async def _run_single_agent(self, agent_key: str, query: str, 
                                 context: List[Dict]) -> Dict:
@@ -226,19 +278,19 @@ class UltimateStrategicCouncil:
         # Format context
         context_str = self._format_context(context)
         
-        # Build full prompt
-        full_prompt = f"""{prompt}
-
-═══════════════════════════════════════════════════════════
+        # Expert prompt and UDC context are static: cached system prefix.
+        # Retrieved data and the question vary per call, so they go last.
+        system = cached_system_blocks(prompt, """═══════════════════════════════════════════════════════════
 UDC CONTEXT
 ═══════════════════════════════════════════════════════════
 United Development Company (UDC) is Qatar's master developer, operating:
 - The Pearl-Qatar: Luxury waterfront development
 - Lusail: Smart city development
 - UDC Tower: Premium commercial real estate
-- Various hospitality and retail assets
-
-═══════════════════════════════════════════════════════════
+- Various hospitality and retail assets""")
+        
+        # Build full prompt
+        full_prompt = f"""═══════════════════════════════════════════════════════════
 AVAILABLE DATA SOURCES
 ═══════════════════════════════════════════════════════════
 {context_str}
@@ -255,10 +307,11 @@ YOUR EXPERT ANALYSIS (Use the 5-section structure)
         
         # Call Claude Opus 4.1
         try:
-            message = self.anthropic.messages.create(
+            message = await self._anthropic_create(
                 model=ULTIMATE_MODEL_CONFIG['agents']['model'],
                 max_tokens=ULTIMATE_MODEL_CONFIG['agents']['max_tokens'],
                 temperature=ULTIMATE_MODEL_CONFIG['agents']['temperature'],
+                system=system,
                 messages=[{
                     "role": "user",
                     "content": full_prompt
@@ -270,7 +323,8 @@ YOUR EXPERT ANALYSIS (Use the 5-section structure)
                 "title": agent.title,
                 "domain": agent.category,
                 "analysis": message.content[0].text,
-                "model": ULTIMATE_MODEL_CONFIG['agents']['model']
+                "model": ULTIMATE_MODEL_CONFIG['agents']['model'],
+                "usage": usage_to_dict(message.usage)
             }
             
         except Exception as e:
@@ -354,7 +408,7 @@ Take as much space as needed to reason thoroughly."""
 
         try:
             # Deep thinking with extended timeout (Sonnet 4.5 can take 5-10 minutes)
-            message = self.anthropic.messages.create(
+            message = await self._anthropic_create(
                 model=ULTIMATE_MODEL_CONFIG['strategic_thinking']['model'],
                 max_tokens=ULTIMATE_MODEL_CONFIG['strategic_thinking']['max_tokens'],
                 temperature=ULTIMATE_MODEL_CONFIG['strategic_thinking']['temperature'],
@@ -376,6 +430,15 @@ Take as much space as needed to reason thoroughly."""
                 "model": "error"
             }
     
+    async def _anthropic_create(self, **params):
+        """Messages API call through the process-wide LLM governor"""
+        return await llm_governor.call(
+            params["model"],
+            lambda: self.anthropic.messages.create(**params),
+            tokens=estimate_tokens(params.get("system"), params["messages"]),
+            agent="ultimate_council"
+        )
+    
     def _identify_debates(self, agent_analyses: List[Dict]) -> List[Dict]:
         """Identify areas where experts disagree"""
         
@@ -491,14 +554,20 @@ Be specific. Quantify. This CEO makes $100M+ decisions."""
 
         try:
             # GPT-5 uses max_completion_tokens and doesn't support custom temperature
-            response = self.openai_client.chat.completions.create(
-                model=ULTIMATE_MODEL_CONFIG['synthesis']['model'],
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                max_completion_tokens=ULTIMATE_MODEL_CONFIG['synthesis']['max_tokens']
-                # Note: GPT-5 only supports temperature=1 (default)
+            synthesis_messages = [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ]
+            response = await llm_governor.call(
+                ULTIMATE_MODEL_CONFIG['synthesis']['model'],
+                lambda: self.openai_client.chat.completions.create(
+                    model=ULTIMATE_MODEL_CONFIG['synthesis']['model'],
+                    messages=synthesis_messages,
+                    max_completion_tokens=ULTIMATE_MODEL_CONFIG['synthesis']['max_tokens']
+                    # Note: GPT-5 only supports temperature=1 (default)
+                ),
+                tokens=estimate_tokens(system_prompt, user_prompt),
+                agent="ultimate_council"
             )
             
             return {
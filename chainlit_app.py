@@ -7,10 +7,15 @@ import chainlit as cl
 import os
 from dotenv import load_dotenv
 from backend.app.agents.unbeatable_council import UnbeatableStrategicCouncil
+from backend.app.core.metrics import start_http_server
 
 # Load environment variables
 load_dotenv()
 
+# Prometheus metrics (LLM calls, governor queue) on CHAINLIT_METRICS_PORT
+if os.getenv("CHAINLIT_METRICS_PORT"):
+    start_http_server(int(os.getenv("CHAINLIT_METRICS_PORT")))
+
 
 @cl.on_chat_start
 async def start():
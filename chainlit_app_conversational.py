@@ -8,15 +8,17 @@ sys.path.insert(0, 'D:/udc')
 
 import chainlit as cl
 from typing import Dict, List, Optional
+import logging
 import time
 from datetime import datetime
 import json
 from pathlib import Path
-import asyncio
 
 # Import CrewAI orchestrator
 from backend.app.agents.crewai_base import DrOmarOrchestrator
 
+logger = logging.getLogger(__name__)
+
 # Initialize CrewAI orchestrator
 dr_omar = DrOmarOrchestrator()
 
@@ -102,11 +104,7 @@ When you ask a question, we collaborate to dig deep and provide you with multi-p
 
 What would you like to know?"""
     
-    # Stream the welcome message
-    for word in welcome.split():
-        await msg.stream_token(word + " ")
-        await asyncio.sleep(0.02)
-    
+    await msg.stream_token(welcome)
     await msg.update()
     
     # Initialize session
@@ -138,7 +136,6 @@ async def main(message: cl.Message):
     try:
         # Route and analyze query
         await response_msg.stream_token("*Analyzing your question...*\n\n")
-        await asyncio.sleep(0.3)
         
         # Check if we have the data
         data_check = await check_data_availability(query)
@@ -210,12 +207,7 @@ async def handle_missing_data(msg: cl.Message, query: str, data_check: Dict):
         conversational_responses['no_data_source']
     )
     
-    # Stream the response
-    for part in response_parts:
-        for word in part.split():
-            await msg.stream_token(word + " ")
-            await asyncio.sleep(0.02)
-    
+    await msg.stream_token("".join(response_parts))
     await msg.update()
     
     # Mark that we're waiting for CEO input
@@ -240,22 +232,14 @@ async def handle_ceo_answer(answer: str, context: Dict):
     msg = cl.Message(content="")
     await msg.send()
     
-    acknowledgment = "Got it! I've saved this information. "
-    
-    # Stream acknowledgment
-    for word in acknowledgment.split():
-        await msg.stream_token(word + " ")
-        await asyncio.sleep(0.02)
+    await msg.stream_token("Got it! I've saved this information. ")
     
     # Now provide follow-up
     await msg.stream_token("\n\nBased on what you just told me")
     
     # Generate follow-up
     follow_up = await generate_follow_up_with_context(original_query, answer, memory)
-    
-    for word in follow_up.split():
-        await msg.stream_token(" " + word)
-        await asyncio.sleep(0.02)
+    await msg.stream_token(follow_up)
     
     await msg.update()
 
@@ -267,66 +251,45 @@ async def stream_answer_with_data(
 ):
     """
     Stream a conversational answer using CrewAI multi-agent system
+    
+    Specialist insights and the synthesized answer are shown as each crew
+    task finishes; verification details follow once the council is done.
     """
+    started = time.perf_counter()
+    first_output_at = None
+    
     # Clear analyzing message
     msg.content = ""
+    await msg.stream_token("👥 Consulting specialist agents...\n\n")
     
-    # Show collaboration happening
-    await msg.stream_token("🤔 Analyzing your question...\n\n")
-    await asyncio.sleep(0.5)
-    
-    await msg.stream_token("👥 Consulting specialist agents...\n")
-    await asyncio.sleep(0.5)
-    
-    await msg.stream_token("💬 Agents are collaborating...\n\n")
-    await asyncio.sleep(0.5)
-    
-    # Execute multi-agent system
-    response = await dr_omar.handle_ceo_query(query)
-    
-    # Show which agents contributed
-    if response.get('agent_contributions'):
-        await msg.stream_token("**🎯 Agent Insights:**\n")
-        for agent_type, agent_name in response['agent_contributions'].items():
-            await msg.stream_token(f"• {agent_name}\n")
-        await msg.stream_token("\n---\n\n")
-        await asyncio.sleep(0.5)
+    response: Dict = {}
+    answer = None
+    async for event in dr_omar.stream_ceo_query(query):
+        if first_output_at is None:
+            first_output_at = time.perf_counter() - started
+        
+        if event['type'] == 'result':
+            response = event['response']
+        elif event['is_synthesis']:
+            # Dr. Omar's synthesis is the answer
+            answer = make_conversational(event['output'])
+            await msg.stream_token("\n---\n\n" + answer)
+        else:
+            await msg.stream_token(f"• **{event['agent']}** shared insights\n")
+            await cl.Text(
+                name=f"{event['agent']} - {event['role']}",
+                content=event['output'],
+                display="side"
+            ).send()
+    
+    # Fallback path (no crew tasks finished): answer only arrives with the result
+    if answer is None:
+        answer = make_conversational(response.get('answer', ''))
+        await msg.stream_token("\n---\n\n" + answer)
     
     # Check confidence
     confidence = response.get('confidence', 0)
     
-    # Conversational opening based on confidence  
-    if confidence >= 80:
-        opening = "Based on our multi-agent analysis, "
-    elif confidence >= 60:
-        opening = "From what our team found, "
-    else:
-        opening = "Our agents found some information, though we're not entirely certain: "
-    
-    # Stream opening
-    for word in opening.split():
-        await msg.stream_token(word + " ")
-        await asyncio.sleep(0.02)
-    
-    # Stream main answer
-    answer = response['answer']
-    
-    # Make it more conversational
-    answer = make_conversational(answer)
-    
-    # Stream word by word for natural feel
-    words = answer.split()
-    for i, word in enumerate(words):
-        await msg.stream_token(word + " ")
-        
-        # Natural pauses at punctuation
-        if word.endswith(('.', '!', '?')):
-            await asyncio.sleep(0.15)
-        elif word.endswith(','):
-            await asyncio.sleep(0.08)
-        else:
-            await asyncio.sleep(0.02)
-    
     # Add context from memory if relevant
     ceo_context = memory.get_ceo_info(query)
     if ceo_context:
@@ -363,6 +326,11 @@ async def stream_answer_with_data(
     
     await msg.update()
     
+    logger.info(
+        f"Answer streamed: first output after {first_output_at or 0:.2f}s, "
+        f"complete after {time.perf_counter() - started:.2f}s"
+    )
+    
     # Save to conversation history
     memory.add_to_history(query, answer)
 
@@ -0,0 +1,126 @@
+"""Benchmark: paced word-by-word rendering vs. streaming crew progress.
+
+Replays a crew run with fixed per-task LLM latencies and measures what the CEO
+sees in the conversational Chainlit app. The previous path waited for the
+whole crew and then replayed the answer with asyncio.sleep pacing. The
+streaming path shows each finished task as it arrives, with no pacing.
+
+Example:
+    python scripts/benchmark_conversational_streaming.py --task-seconds 0.5 --answer-words 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BACKEND_PATH = PROJECT_ROOT / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.thread_stream import EVENT, stream_blocking_run  # noqa: E402
+
+SPECIALISTS = ["Dr. James", "Dr. Fatima", "Dr. Sarah"]
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark conversational answer delivery.")
+    parser.add_argument("--task-seconds", type=float, default=0.5, help="LLM time per crew task")
+    parser.add_argument("--answer-words", type=int, default=300, help="Words in the synthesized answer")
+    return parser.parse_args(argv)
+
+
+def build_answer(n_words: int) -> str:
+    """Answer text with a sentence end every 20 words and a comma every 12."""
+    words = []
+    for i in range(1, n_words + 1):
+        word = f"word{i}"
+        if i % 20 == 0:
+            word += "."
+        elif i % 12 == 0:
+            word += ","
+        words.append(word)
+    return " ".join(words)
+
+
+def make_crew(task_seconds: float, answer: str) -> Callable[[Callable[[Dict], None]], str]:
+    """Blocking crew stand-in: each specialist task, then the synthesis, emits when done."""
+    def kickoff(emit: Callable[[Dict], None]) -> str:
+        for agent in SPECIALISTS:
+            time.sleep(task_seconds)
+            emit({"agent": agent, "output": f"{agent} insight", "is_synthesis": False})
+        time.sleep(task_seconds)
+        emit({"agent": "Dr. Omar", "output": answer, "is_synthesis": True})
+        return answer
+    return kickoff
+
+
+class RecordingMessage:
+    """Records when each token would reach the UI."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.token_times: List[float] = []
+
+    async def stream_token(self, token: str) -> None:
+        self.token_times.append(time.perf_counter() - self.started)
+
+
+async def paced(task_seconds: float, answer: str) -> RecordingMessage:
+    """Previous stream_answer_with_data: wait for everything, then replay slowly."""
+    msg = RecordingMessage()
+    for status in ("Analyzing...", "Consulting...", "Collaborating..."):
+        await msg.stream_token(status)
+        await asyncio.sleep(0.5)
+    make_crew(task_seconds, answer)(lambda event: None)  # kickoff() blocked the loop
+    for agent in SPECIALISTS:
+        await msg.stream_token(agent)
+    await asyncio.sleep(0.5)
+    for word in "Based on our multi-agent analysis,".split():
+        await msg.stream_token(word + " ")
+        await asyncio.sleep(0.02)
+    for word in answer.split():
+        await msg.stream_token(word + " ")
+        if word.endswith((".", "!", "?")):
+            await asyncio.sleep(0.15)
+        elif word.endswith(","):
+            await asyncio.sleep(0.08)
+        else:
+            await asyncio.sleep(0.02)
+    return msg
+
+
+async def streaming(task_seconds: float, answer: str) -> RecordingMessage:
+    """Current stream_answer_with_data: forward crew events as they fire."""
+    msg = RecordingMessage()
+    await msg.stream_token("Consulting...")
+    async for kind, event in stream_blocking_run(make_crew(task_seconds, answer)):
+        if kind == EVENT:
+            await msg.stream_token(event["output"])
+    return msg
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    answer = build_answer(args.answer_words)
+    crew_seconds = args.task_seconds * (len(SPECIALISTS) + 1)
+
+    print(f"Crew LLM time: {crew_seconds:.2f}s, answer: {args.answer_words} words")
+    print(f"{'path':<12}{'first insight':>16}{'end-to-end':>14}{'added latency':>16}")
+    for name, render in (("paced", paced), ("streaming", streaming)):
+        msg = asyncio.run(render(args.task_seconds, answer))
+        # token_times[0] is the status line; the next token is the first agent output
+        first_insight = msg.token_times[1] if name == "streaming" else msg.token_times[3]
+        total = msg.token_times[-1]
+        print(f"{name:<12}{first_insight:>15.2f}s{total:>13.2f}s{total - crew_seconds:>15.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
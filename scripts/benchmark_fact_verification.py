@@ -0,0 +1,97 @@
+"""Benchmark: indexed fact matching in FactVerifier vs. the linear per-claim scan.
+
+Builds a synthetic fact set (as produced by map-reduce extraction) and a batch
+of claims, then times the previous approach (re-scan every fact and re-parse
+string values for every claim) against the sorted-array binary-search pass.
+
+Example:
+    python scripts/benchmark_fact_verification.py --facts 1000 --claims 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+UIS_PATH = PROJECT_ROOT / "ultimate-intelligence-system"
+if str(UIS_PATH) not in sys.path:
+    sys.path.insert(0, str(UIS_PATH))
+
+from src.nodes.verify import FactVerifier  # noqa: E402
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark FactVerifier fact matching.")
+    parser.add_argument("--facts", type=int, default=1000, help="Number of extracted facts")
+    parser.add_argument("--claims", type=int, default=500, help="Number of numeric claims")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions")
+    return parser.parse_args(argv)
+
+
+def build_inputs(n_facts: int, n_claims: int) -> tuple[Dict[str, Any], List[float]]:
+    """Facts mix float and comma-formatted string values, like real extraction output."""
+    rng = random.Random(42)
+    facts: Dict[str, Any] = {}
+    for i in range(n_facts):
+        value = round(rng.uniform(-5000, 50000), 1)
+        facts[f"metric_{i}"] = {"value": f"{value:,}" if i % 3 == 0 else value, "unit": "QR millions"}
+    values = [float(str(data["value"]).replace(",", "")) for data in facts.values()]
+    # Half the claims restate a fact (with rounding), half are unsupported
+    claims = [
+        rng.choice(values) * rng.uniform(0.998, 1.002) if i % 2 else rng.uniform(-6000, 60000)
+        for i in range(n_claims)
+    ]
+    return facts, claims
+
+
+def linear_scan(facts: Dict[str, Any], claims: List[float]) -> int:
+    """Previous _verify_number behaviour: scan and re-parse every fact per claim."""
+    verified = 0
+    for number in claims:
+        for data in facts.values():
+            fact_value = data["value"]
+            if isinstance(fact_value, str):
+                fact_value = float(fact_value.replace(",", ""))
+            if abs(fact_value - number) / max(abs(fact_value), abs(number), 1.0) < 0.01:
+                verified += 1
+                break
+    return verified
+
+
+def indexed(verifier: FactVerifier, facts: Dict[str, Any], claims: List[float]) -> int:
+    """Normalize facts once, then one vectorized binary-search pass."""
+    fact_values, _ = verifier._index_facts(facts)
+    return int((verifier._match_claims(np.array(claims), fact_values) >= 0).sum())
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    facts, claims = build_inputs(args.facts, args.claims)
+    verifier = FactVerifier()
+
+    linear_verified = linear_scan(facts, claims)
+    indexed_verified = indexed(verifier, facts, claims)
+    if linear_verified != indexed_verified:
+        print(f"Mismatch: linear={linear_verified} indexed={indexed_verified}")
+        return 1
+
+    linear_seconds = timeit.timeit(lambda: linear_scan(facts, claims), number=args.repeat) / args.repeat
+    indexed_seconds = timeit.timeit(lambda: indexed(verifier, facts, claims), number=args.repeat) / args.repeat
+
+    print(f"Facts: {args.facts}  Claims: {args.claims}  Verified: {indexed_verified}")
+    print(f"Linear scan:   {linear_seconds * 1000:9.2f} ms")
+    print(f"Indexed pass:  {indexed_seconds * 1000:9.2f} ms")
+    print(f"Speedup:       {linear_seconds / indexed_seconds:9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
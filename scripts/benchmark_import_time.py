@@ -0,0 +1,98 @@
+"""Startup benchmark: cold import time of the UI, CLI, graph and node modules.
+
+Each module is imported in a fresh interpreter (``python -X importtime -c
+"import <module>"``), so nothing is shared between runs but the OS file
+cache. The report has the median cumulative import time per module and
+flags the heavy libraries (langgraph, langchain_anthropic, chromadb, ...)
+the import pulled in. The graph, the LangChain models and the RAG
+components should only load when they are first used.
+
+The thresholds CI enforces live in
+ultimate-intelligence-system/tests/test_import_time.py.
+
+Example:
+    python scripts/benchmark_import_time.py --repeat 5
+    python scripts/benchmark_import_time.py src.nodes.verify src.graph.workflow
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+UIS_PATH = PROJECT_ROOT / "ultimate-intelligence-system"
+BACKEND_PATH = PROJECT_ROOT / "backend"
+
+# (module, directory it is imported from)
+DEFAULT_MODULES: List[Tuple[str, Path]] = [
+    ("src.nodes.classify", UIS_PATH),
+    ("src.nodes.verify", UIS_PATH),
+    ("src.nodes.extract", UIS_PATH),
+    ("src.nodes.synthesis", UIS_PATH),
+    ("src.agents.financial_agent", UIS_PATH),
+    ("src.utils.llm_governor", UIS_PATH),
+    ("src.utils.chat_models", UIS_PATH),
+    ("main", UIS_PATH),
+    ("app", PROJECT_ROOT),
+    ("src.graph.workflow", UIS_PATH),
+    ("rag_system", BACKEND_PATH),
+    ("agents", BACKEND_PATH),
+]
+
+HEAVY_MODULES = ("langgraph", "langchain_anthropic", "anthropic", "chromadb", "openai", "sentence_transformers", "torch")
+
+
+def import_times(module: str, cwd: Path) -> Dict[str, float]:
+    """Cumulative import time in seconds of every module one cold ``import <module>`` loads."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(cwd), str(BACKEND_PATH)])}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=cwd, env=env, capture_output=True, text=True, timeout=300,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "import failed")
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def benchmark(modules: Sequence[Tuple[str, Path]], repeat: int) -> None:
+    print(f"{'module':<30} {'median':>9} {'min':>9}  heavy imports")
+    print("-" * 90)
+    for module, cwd in modules:
+        runs = []
+        try:
+            for _ in range(repeat):
+                runs.append(import_times(module, cwd))
+        except RuntimeError as e:
+            print(f"{module:<30} {'-':>9} {'-':>9}  not importable here: {e}")
+            continue
+        seconds = [run[module] for run in runs]
+        heavy = [name for name in HEAVY_MODULES if name in runs[-1]]
+        print(f"{module:<30} {statistics.median(seconds) * 1000:>7.0f}ms {min(seconds) * 1000:>7.0f}ms  "
+              f"{', '.join(heavy) or '-'}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("modules", nargs="*", help="Modules to time (imported from ultimate-intelligence-system)")
+    parser.add_argument("--repeat", type=int, default=3, help="Cold imports per module")
+    args = parser.parse_args()
+
+    modules = [(module, UIS_PATH) for module in args.modules] or DEFAULT_MODULES
+    benchmark(modules, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""Microbenchmark: single-pass numeric scanner vs. the per-consumer regex batteries.
+
+The legacy batteries below are the patterns extraction, verification, the fact
+index and the expert validators each ran over the same text before they
+shared the scanner. Pages are representative annual-report text built from the
+figures in data/sample_data/financial_summary.json; pass --pages-dir to time
+real extracted page text (one .txt file per page) instead.
+
+Example:
+    python scripts/benchmark_numeric_scanner.py --repeat 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import timeit
+from pathlib import Path
+from typing import List, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BACKEND_PATH = PROJECT_ROOT / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.numeric_scanner import labelled_amounts, numeric_signals, scan_tokens  # noqa: E402
+
+
+REPORT_PAGE = """
+UNITED DEVELOPMENT COMPANY Q.P.S.C. - ANNUAL REPORT {year}
+Chairman's Message
+In FY{yy} the Group delivered total revenue of QR 1,045.0 million, compared with
+QR 1,032.1 million in {prev}. Net profit of QR 450.0 million was recorded, while
+Operating Cash Flow: -QR 460.5 million reflected continued investment at Gewan Island.
+Rental income reached QR 330 million (31.6% of revenue); hospitality contributed
+QR 95.2 million. Total assets stood at QR 11.5 billion and total debt at QR 3.4 bn,
+a debt-to-equity ratio of 0.45x. Return on equity was 5.9% and interest coverage 2.52x.
+Quarterly results: Q1 {year} revenue QR 250 million, Q2 {year} QR 265 million,
+Q3 {year} QR 265 million with a fair value loss of QR 33 million.
+Quick math: 2,000 units × QAR 1.5M = QAR 3,000M. 15% of QAR 2B is QAR 300M.
+Scenario 1: probability 60% base case. Scenario 2: probability: 25-30% downside.
+Worst case 18% IRR on Phase 2; cash flow from operations QR -120.4 million in H1 {year}.
+"""
+
+LEGACY_BATTERIES: List[str] = [
+    # extraction layer
+    r"revenues?\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
+    r"total\s+revenues?\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
+    r"revenue[:\s]+(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?",
+    r"net\s+profit\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
+    r"profit\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
+    r"operating cash flow[:\s]+(-)?(?:QR|QAR|$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?",
+    r"cash flow from operations[:\s]+(-)?(?:QR|QAR|$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?",
+    r"OCF[:\s]+(-)?(?:QR|QAR|$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?",
+    # fiscal periods (fact index)
+    r"\b(FY\s?\d{2,4}|[1-4]Q\s?\d{2,4}|Q[1-4][\s\-]?\d{2,4}|H[12][\s\-]?\d{2,4}|20\d{2})\b",
+    # verification
+    r"(?P<full>(?:(?P<sign1>[-+])\s*)?(?:(?P<currency_prefix>QR|USD|\$)\s*)?(?:(?P<sign2>[-+])\s*)?"
+    r"(?P<number>[\d][\d,]*\.?\d*)(?:\s*(?P<unit>million|billion|m|bn|B|M))(?:\s*(?P<currency_suffix>QR|USD|\$))?)",
+    # expert validators
+    r"\d+\s*[×x]\s*\d+\s*=",
+    r"QAR\s+[\d,]+M?\s+[×x÷/]\s+",
+    r"\d+%\s+of\s+QAR",
+    r"scenario \d+:",
+    r"probability:?\s*\d+",
+    r"probability:?\s*\d+[-–]?\d*%",
+    r"scenario \d+:|base case|downside|worst case",
+    r"QAR \d+[.,]?\d*[BMK]",
+    r"\d+%\s+(?:IRR|margin|return)",
+    r"Q[1-4] \d{4}",
+    r"\d+\s*[×x]\s*\d+|=\s*QAR|IRR|NPV|\d+%\s*(?:return|margin|IRR)",
+    r"scenario \d+|what if|probability|downside|worst case",
+]
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark the single-pass numeric scanner.")
+    parser.add_argument("--repeat", type=int, default=100, help="Passes over the page set per timing")
+    parser.add_argument("--pages-dir", type=Path, help="Directory of extracted page .txt files")
+    return parser.parse_args(argv)
+
+
+def load_pages(pages_dir: Path | None) -> List[str]:
+    """Real page text when available, otherwise representative report pages."""
+    if pages_dir:
+        return [path.read_text(encoding="utf-8") for path in sorted(pages_dir.glob("*.txt"))]
+    return [
+        REPORT_PAGE.format(year=year, yy=str(year)[2:], prev=year - 1)
+        for year in (2021, 2022, 2023, 2024)
+    ] * 5
+
+
+def legacy(pages: List[str]) -> None:
+    """Every consumer re-scans each page with its own patterns."""
+    for page in pages:
+        text = " ".join(page.split())
+        for pattern in LEGACY_BATTERIES:
+            for _ in re.finditer(pattern, text, re.IGNORECASE):
+                pass
+
+
+def single_pass(pages: List[str]) -> None:
+    """One scan per page; every consumer reads the same token list."""
+    for page in pages:
+        text = " ".join(page.split())
+        tokens = scan_tokens(text)
+        labelled_amounts(text, tokens)
+        numeric_signals(text, tokens)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = parse_args(argv)
+    pages = load_pages(args.pages_dir)
+    if not pages:
+        print("No pages to benchmark.")
+        return 1
+
+    legacy_seconds = timeit.timeit(lambda: legacy(pages), number=args.repeat)
+    scanner_seconds = timeit.timeit(lambda: single_pass(pages), number=args.repeat)
+    per_page = 1_000_000 / (len(pages) * args.repeat)
+
+    print(f"Pages: {len(pages)}  Repeats: {args.repeat}")
+    print(f"Legacy regex batteries: {legacy_seconds * per_page:8.1f} µs/page")
+    print(f"Single-pass scanner:    {scanner_seconds * per_page:8.1f} µs/page")
+    print(f"Speedup:                {legacy_seconds / scanner_seconds:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,167 @@
+"""Load test: concurrent /api/v1/agent/chat throughput on a single worker.
+
+Serves the FastAPI app from one uvicorn server (one event loop, as in a single
+worker) in a background thread, with a stub LLM of fixed latency, so no API
+key or network is needed. "blocking" reproduces the previous handler, whose
+synchronous Anthropic call held the event loop for the whole LLM latency;
+"async" is the current AsyncAnthropic path. The /chat/stream variant also
+reports time to first token.
+
+Example:
+    python scripts/load_test_chat.py --requests 20 --latency 0.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Sequence
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+BACKEND_PATH = PROJECT_ROOT / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+# Settings only need to validate; the stub replaces the Anthropic client
+os.environ.setdefault("SECRET_KEY", "load-test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ANTHROPIC_API_KEY", "load-test")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+from app.agents.dr_omar import dr_omar  # noqa: E402
+from app.main import app  # noqa: E402
+
+QUESTION = "What is our current debt-to-equity ratio and should I be concerned?"
+ANSWER_TOKENS = ["Debt-to-equity ", "is 0.48, ", "approaching ", "our 0.5 ", "covenant."]
+
+
+def _message() -> SimpleNamespace:
+    usage = SimpleNamespace(input_tokens=1200, output_tokens=300)
+    return SimpleNamespace(content=[SimpleNamespace(text="".join(ANSWER_TOKENS))], usage=usage)
+
+
+class _Stream:
+    """Async context manager mimicking ``AsyncAnthropic().messages.stream``."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+
+    async def __aenter__(self) -> "_Stream":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    @property
+    async def text_stream(self):
+        for token in ANSWER_TOKENS:
+            await asyncio.sleep(self.latency / len(ANSWER_TOKENS))
+            yield token
+
+    async def get_final_message(self) -> SimpleNamespace:
+        return _message()
+
+
+class StubAsyncAnthropic:
+    """Non-blocking LLM: awaits its latency."""
+
+    def __init__(self, latency: float) -> None:
+        self.latency = latency
+        self.messages = SimpleNamespace(create=self._create, stream=lambda **kwargs: _Stream(latency))
+
+    async def _create(self, **kwargs: Any) -> SimpleNamespace:
+        await asyncio.sleep(self.latency)
+        return _message()
+
+
+class StubBlockingAnthropic(StubAsyncAnthropic):
+    """Previous behaviour: a synchronous client call inside the async handler."""
+
+    async def _create(self, **kwargs: Any) -> SimpleNamespace:
+        time.sleep(self.latency)
+        return _message()
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Load test the chat API with a stub LLM.")
+    parser.add_argument("--requests", type=int, default=20, help="Concurrent requests")
+    parser.add_argument("--latency", type=float, default=0.5, help="Stub LLM latency in seconds")
+    return parser.parse_args(argv)
+
+
+async def run_chat(client: httpx.AsyncClient, n_requests: int) -> float:
+    """Fire n concurrent /chat requests; return wall time."""
+    started = time.perf_counter()
+    responses = await asyncio.gather(*(
+        client.post("/api/v1/agent/chat", json={"question": QUESTION}) for _ in range(n_requests)
+    ))
+    assert all(response.status_code == 200 for response in responses), responses[0].text
+    return time.perf_counter() - started
+
+
+async def run_stream(client: httpx.AsyncClient, n_requests: int) -> tuple[float, List[float]]:
+    """Fire n concurrent /chat/stream requests; return wall time and per-request TTFT."""
+    started = time.perf_counter()
+
+    async def one() -> float:
+        request_start = time.perf_counter()
+        ttft = None
+        async with client.stream("POST", "/api/v1/agent/chat/stream", json={"question": QUESTION}) as response:
+            async for line in response.aiter_lines():
+                if ttft is None and line == "event: token":
+                    ttft = time.perf_counter() - request_start
+        return ttft or 0.0
+
+    ttfts = await asyncio.gather(*(one() for _ in range(n_requests)))
+    return time.perf_counter() - started, list(ttfts)
+
+
+def start_worker() -> tuple[uvicorn.Server, str]:
+    """Run the app on a free local port in a background thread."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, f"http://127.0.0.1:{port}"
+
+
+async def main_async(args: argparse.Namespace, base_url: str) -> None:
+    limits = httpx.Limits(max_connections=args.requests)
+    async with httpx.AsyncClient(base_url=base_url, timeout=None, limits=limits) as client:
+        print(f"{args.requests} concurrent requests, stub LLM latency {args.latency:.2f}s, 1 worker")
+        print(f"{'endpoint':<22}{'wall time':>12}{'throughput':>16}{'median TTFT':>14}")
+        for name, stub in (("chat (blocking)", StubBlockingAnthropic), ("chat (async)", StubAsyncAnthropic)):
+            dr_omar.async_client = stub(args.latency)
+            wall = await run_chat(client, args.requests)
+            print(f"{name:<22}{wall:>11.2f}s{args.requests / wall:>12.1f} r/s{'-':>14}")
+
+        dr_omar.async_client = StubAsyncAnthropic(args.latency)
+        wall, ttfts = await run_stream(client, args.requests)
+        median_ttft = sorted(ttfts)[len(ttfts) // 2]
+        print(f"{'chat/stream (async)':<22}{wall:>11.2f}s{args.requests / wall:>12.1f} r/s{median_ttft:>13.2f}s")
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    server, base_url = start_worker()
+    try:
+        asyncio.run(main_async(parse_args(argv), base_url))
+    finally:
+        server.should_exit = True
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
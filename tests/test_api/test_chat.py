@@ -0,0 +1,172 @@
+"""Tests for the async chat endpoint and its SSE streaming variant."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List
+
+import httpx
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+# Settings only need to validate; tests replace the Anthropic client
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+from app.agents.dr_omar import dr_omar  # noqa: E402
+from app.core.rate_limit import rate_limiter  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.llm_governor import LLMGovernor  # noqa: E402
+from app.services.single_flight import single_flight  # noqa: E402
+
+QUESTION = "What is our current debt-to-equity ratio?"
+LLM_SECONDS = 0.2
+TOKENS = ["Debt-to-equity ", "is 0.48."]
+
+
+def _message() -> SimpleNamespace:
+    usage = SimpleNamespace(input_tokens=100, output_tokens=20)
+    return SimpleNamespace(content=[SimpleNamespace(text="".join(TOKENS))], usage=usage)
+
+
+class _Stream:
+    async def __aenter__(self) -> "_Stream":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    @property
+    async def text_stream(self):
+        for token in TOKENS:
+            yield token
+
+    async def get_final_message(self) -> SimpleNamespace:
+        return _message()
+
+
+class StubAsyncAnthropic:
+    """Stands in for ``anthropic.AsyncAnthropic`` with a fixed latency."""
+
+    def __init__(self) -> None:
+        self.messages = SimpleNamespace(create=self._create, stream=lambda **kwargs: _Stream())
+        self.calls = 0
+
+    async def _create(self, **kwargs: Any) -> SimpleNamespace:
+        self.calls += 1
+        await asyncio.sleep(LLM_SECONDS)
+        return _message()
+
+
+@pytest.fixture(autouse=True)
+def _no_rate_limit(monkeypatch):
+    """These tests send more chats than the per-client LLM limit allows."""
+    monkeypatch.setattr(rate_limiter, "enabled", False)
+
+
+def _client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+def test_concurrent_chats_share_one_worker(monkeypatch):
+    """Ten different chats finish in about one LLM latency, not ten."""
+    stub = StubAsyncAnthropic()
+    monkeypatch.setattr(dr_omar, "async_client", stub)
+    # Measure the worker alone, not the per-model LLM concurrency cap
+    monkeypatch.setattr("app.agents.dr_omar.llm_governor", LLMGovernor(max_concurrency=10))
+
+    async def run() -> List[httpx.Response]:
+        async with _client() as client:
+            return await asyncio.gather(*(
+                client.post("/api/v1/agent/chat", json={"question": f"{QUESTION} (board pack {n})"})
+                for n in range(10)
+            ))
+
+    started = time.perf_counter()
+    responses = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+
+    assert [response.status_code for response in responses] == [200] * 10
+    assert responses[0].json()["answer"] == "Debt-to-equity is 0.48."
+    assert stub.calls == 10
+    assert elapsed < 3 * LLM_SECONDS
+
+
+def test_llm_governor_caps_chats_in_flight(monkeypatch):
+    """Beyond the per-model cap, chats queue for a slot instead of hitting Claude at once."""
+    stub = StubAsyncAnthropic()
+    governor = LLMGovernor(max_concurrency=2)
+    monkeypatch.setattr(dr_omar, "async_client", stub)
+    monkeypatch.setattr("app.agents.dr_omar.llm_governor", governor)
+
+    async def run() -> List[httpx.Response]:
+        async with _client() as client:
+            return await asyncio.gather(*(
+                client.post("/api/v1/agent/chat", json={"question": f"{QUESTION} (memo {n})"})
+                for n in range(4)
+            ))
+
+    started = time.perf_counter()
+    responses = asyncio.run(run())
+    elapsed = time.perf_counter() - started
+
+    assert [response.status_code for response in responses] == [200] * 4
+    assert elapsed >= 2 * LLM_SECONDS
+    stats = governor.snapshot()[dr_omar.model]
+    assert stats["requests"] == 4
+    assert stats["queued"] == 2
+    assert stats["in_flight"] == 0
+
+
+def test_identical_concurrent_chats_share_one_answer(monkeypatch):
+    """The same question asked five times at once calls Claude once."""
+    stub = StubAsyncAnthropic()
+    monkeypatch.setattr(dr_omar, "async_client", stub)
+    before = dict(single_flight.stats)
+
+    async def run() -> List[httpx.Response]:
+        async with _client() as client:
+            questions = [QUESTION, QUESTION.upper(), f"  {QUESTION}  ", QUESTION, QUESTION.rstrip("?")]
+            return await asyncio.gather(*(
+                client.post("/api/v1/agent/chat", json={"question": question}) for question in questions
+            ))
+
+    responses = asyncio.run(run())
+
+    assert [response.status_code for response in responses] == [200] * 5
+    assert {response.json()["answer"] for response in responses} == {"Debt-to-equity is 0.48."}
+    assert stub.calls == 1
+    assert single_flight.stats["coalesced"] - before["coalesced"] == 4
+
+
+def test_chat_stream_emits_tokens_then_done(monkeypatch):
+    """The SSE endpoint sends each token, then the full response payload."""
+    monkeypatch.setattr(dr_omar, "async_client", StubAsyncAnthropic())
+
+    async def run() -> httpx.Response:
+        async with _client() as client:
+            return await client.post("/api/v1/agent/chat/stream", json={"question": QUESTION})
+
+    response = asyncio.run(run())
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = [
+        (frame.split("\n")[0].removeprefix("event: "), json.loads(frame.split("\n")[1].removeprefix("data: ")))
+        for frame in response.text.strip().split("\n\n")
+    ]
+    assert events[:2] == [("token", {"text": TOKENS[0]}), ("token", {"text": TOKENS[1]})]
+    kind, done = events[-1]
+    assert kind == "done"
+    assert done["answer"] == "Debt-to-equity is 0.48."
+    assert done["token_usage"]["total_tokens"] == 120
+    assert "timestamp" in done
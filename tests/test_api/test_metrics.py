@@ -0,0 +1,146 @@
+"""Tests for the Prometheus metrics registry, exporter and /metrics endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import urllib.request
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+from app.core.metrics import MetricsRegistry, start_http_server  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.llm_governor import LLMGovernor, current_agent  # noqa: E402
+from app.services.llm_usage import LLM_COST, LLM_LATENCY, LLM_REQUESTS, LLM_TOKENS  # noqa: E402
+
+
+def _get(*paths: str) -> list:
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.get(path) for path in paths]
+
+    return asyncio.run(run())
+
+
+def test_registry_renders_the_text_format():
+    registry = MetricsRegistry()
+    requests = registry.counter("demo_requests_total", "Requests", ("route",))
+    depth = registry.gauge("demo_queue_depth", "Queued")
+    latency = registry.histogram("demo_seconds", "Latency", buckets=(0.1, 1.0))
+
+    requests.inc(route='/a"b')
+    requests.inc(2, route='/a"b')
+    depth.set(3)
+    depth.dec()
+    for value in (0.05, 0.5, 5):
+        latency.observe(value)
+    registry.register_collector("broken", lambda: 1 / 0)
+    registry.register_collector("pool", lambda: [("demo_pool_size", "gauge", "Pool", [({"pool": "db"}, 5)])])
+
+    text = registry.render()
+
+    assert '# TYPE demo_requests_total counter\ndemo_requests_total{route="/a\\"b"} 3\n' in text
+    assert "demo_queue_depth 2\n" in text
+    assert 'demo_seconds_bucket{le="0.1"} 1\n' in text
+    assert 'demo_seconds_bucket{le="1"} 2\n' in text
+    assert 'demo_seconds_bucket{le="+Inf"} 3\n' in text
+    assert "demo_seconds_sum 5.55\ndemo_seconds_count 3\n" in text
+    assert 'demo_pool_size{pool="db"} 5\n' in text
+    # Re-registering returns the same metric (modules can be imported twice)
+    assert registry.counter("demo_requests_total", "Requests", ("route",)) is requests
+
+
+def test_governed_calls_record_latency_tokens_and_cost_per_agent():
+    governor = LLMGovernor(max_concurrency=2)
+    usage = SimpleNamespace(input_tokens=1000, output_tokens=200, cache_read_input_tokens=0, cache_creation_input_tokens=0)
+
+    async def create():
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(usage=usage)
+
+    async def chunks():
+        # LangChain stream chunks: input usage on the first, output on the last
+        yield SimpleNamespace(message=SimpleNamespace(usage_metadata={"input_tokens": 50, "output_tokens": 0}))
+        yield SimpleNamespace(message=SimpleNamespace(usage_metadata={"input_tokens": 0, "output_tokens": 7}))
+
+    async def run():
+        await governor.call("claude-sonnet-metrics", create, agent="dr_omar")
+        current_agent.set("synthesis")
+        async for _ in governor.stream("claude-sonnet-metrics", chunks):
+            pass
+
+    asyncio.run(run())
+
+    model = "claude-sonnet-metrics"
+    assert LLM_REQUESTS.get(model=model, agent="dr_omar", outcome="ok") == 1
+    assert LLM_LATENCY.count(model=model, agent="dr_omar") == 1
+    assert LLM_LATENCY.sum(model=model, agent="dr_omar") >= 0.01
+    assert LLM_TOKENS.get(model=model, agent="dr_omar", kind="input") == 1000
+    assert LLM_TOKENS.get(model=model, agent="dr_omar", kind="output") == 200
+    # Sonnet list prices: $3 / $15 per million tokens
+    assert abs(LLM_COST.get(model=model, agent="dr_omar") - 0.006) < 1e-9
+    assert LLM_TOKENS.get(model=model, agent="synthesis", kind="input") == 50
+    assert LLM_TOKENS.get(model=model, agent="synthesis", kind="output") == 7
+
+
+def test_metrics_endpoint_reports_route_latency_and_component_state():
+    health, info, missing, metrics = _get("/health", "/api/v1/info", "/api/v1/no-such-route", "/metrics")
+
+    assert health.status_code == info.status_code == 200
+    assert missing.status_code == 404
+    assert metrics.status_code == 200
+    assert metrics.headers["content-type"].startswith("text/plain; version=0.0.4")
+    text = metrics.text
+    assert 'polaris_http_request_duration_seconds_count{method="GET",route="/health",status="200"}' in text
+    assert 'polaris_http_request_duration_seconds_count{method="GET",route="/api/v1/info",status="200"}' in text
+    # Unknown paths share one series instead of one per URL
+    assert 'route="unmatched",status="404"' in text
+    assert "/api/v1/no-such-route" not in text
+    assert 'route="/metrics"' not in text
+    for family in ("polaris_ready", "polaris_single_flight_calls_total", "polaris_answer_cache_hit_ratio",
+                   "polaris_analysis_jobs_running", "polaris_http_requests_in_progress"):
+        assert f"# TYPE {family} " in text
+
+
+def test_council_llm_calls_appear_in_the_metrics_endpoint():
+    """The jobs API's council records into the registry /metrics renders."""
+    from app.agents.unbeatable_council import UnbeatableStrategicCouncil
+
+    async def create(**params):
+        usage = SimpleNamespace(input_tokens=300, output_tokens=40)
+        return SimpleNamespace(content=[SimpleNamespace(text="analysis")], usage=usage)
+
+    council = UnbeatableStrategicCouncil(
+        anthropic_api_key="test-key", enable_reinforcement=False, enable_validation=False, enable_answer_cache=False
+    )
+    council.anthropic = SimpleNamespace(messages=SimpleNamespace(create=create))
+    asyncio.run(council._create(model="claude-council-metrics", max_tokens=10, messages=[{"role": "user", "content": "hi"}]))
+
+    text = _get("/metrics")[0].text
+    assert 'polaris_llm_requests_total{model="claude-council-metrics",agent="unbeatable_council",outcome="ok"} 1' in text
+    assert 'polaris_llm_tokens_total{model="claude-council-metrics",agent="unbeatable_council",kind="input"} 300' in text
+
+
+def test_exporter_serves_the_registry_for_processes_without_an_api():
+    registry = MetricsRegistry()
+    registry.gauge("chainlit_demo", "Demo").set(1)
+    server = start_http_server(0, addr="127.0.0.1", registry=registry)
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics", timeout=5) as response:
+            body = response.read().decode("utf-8")
+        assert "chainlit_demo 1\n" in body
+    finally:
+        server.shutdown()
+        server.server_close()
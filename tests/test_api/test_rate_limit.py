@@ -0,0 +1,113 @@
+"""Tests for the token-bucket rate limiting middleware."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+import httpx
+from fastapi import FastAPI
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+from app.core.rate_limit import (  # noqa: E402
+    DEFAULT_TIER,
+    LLM_TIER,
+    LocalRateLimitStore,
+    RateLimiter,
+    RateLimitMiddleware,
+    rate_limiter,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _app(llm_limits, default_limits, clock: FakeClock) -> FastAPI:
+    app = FastAPI()
+
+    @app.post("/api/v1/agent/chat")
+    async def chat():
+        return {"answer": "ok"}
+
+    @app.get("/api/v1/analyses/{analysis_id}")
+    async def status(analysis_id: str):
+        return {"id": analysis_id, "status": "running"}
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    limiter = RateLimiter(
+        store=LocalRateLimitStore(clock=clock),
+        tiers={LLM_TIER: llm_limits, DEFAULT_TIER: default_limits},
+    )
+    app.add_middleware(RateLimitMiddleware, limiter=limiter)
+    return app
+
+
+def _send(app: FastAPI, requests: List[Tuple[str, str]], client_ip: str = "10.0.0.1") -> List[httpx.Response]:
+    async def run():
+        transport = httpx.ASGITransport(app=app, client=(client_ip, 5000))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return [await client.request(method, path) for method, path in requests]
+
+    return asyncio.run(run())
+
+
+def test_llm_endpoints_are_limited_separately_with_retry_after():
+    clock = FakeClock()
+    app = _app(llm_limits=[(2, 60), (100, 3600)], default_limits=[(5, 60), (100, 3600)], clock=clock)
+
+    responses = _send(app, [("POST", "/api/v1/agent/chat")] * 3 + [("GET", "/api/v1/analyses/a1")] * 3)
+
+    assert [r.status_code for r in responses] == [200, 200, 429, 200, 200, 200]
+    # Two tokens per minute refill one every 30 seconds
+    assert responses[2].headers["retry-after"] == "30"
+    assert "llm" in responses[2].json()["detail"]
+
+    clock.now += 30
+    assert _send(app, [("POST", "/api/v1/agent/chat")])[0].status_code == 200
+
+
+def test_hourly_bucket_and_clients_are_independent():
+    clock = FakeClock()
+    app = _app(llm_limits=[(100, 60), (3, 3600)], default_limits=[(100, 60), (100, 3600)], clock=clock)
+
+    responses = _send(app, [("POST", "/api/v1/agent/chat")] * 4)
+    assert [r.status_code for r in responses] == [200, 200, 200, 429]
+    assert responses[3].headers["retry-after"] == "1200"
+
+    assert _send(app, [("POST", "/api/v1/agent/chat")], client_ip="10.0.0.2")[0].status_code == 200
+
+
+def test_paths_outside_the_api_are_never_limited():
+    clock = FakeClock()
+    app = _app(llm_limits=[(1, 60)], default_limits=[(1, 60)], clock=clock)
+
+    responses = _send(app, [("GET", "/health")] * 5)
+
+    assert [r.status_code for r in responses] == [200] * 5
+
+
+def test_application_limiter_classifies_council_endpoints():
+    assert rate_limiter.tier_for("POST", "/api/v1/agent/chat") == LLM_TIER
+    assert rate_limiter.tier_for("POST", "/api/v1/agent/chat/stream") == LLM_TIER
+    assert rate_limiter.tier_for("POST", "/api/v1/analyses") == LLM_TIER
+    assert rate_limiter.tier_for("GET", "/api/v1/analyses/abc") == DEFAULT_TIER
+    assert rate_limiter.tier_for("POST", "/api/v1/analyses/abc/cancel") == DEFAULT_TIER
+    assert rate_limiter.tier_for("GET", "/health") is None
@@ -0,0 +1,111 @@
+"""Tests for the startup warmup and the /ready probe."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+from app.core.startup import (  # noqa: E402
+    SkipPhase,
+    StartupPhase,
+    Warmup,
+    warm_openapi,
+    warm_udc_data,
+)
+from app.main import app  # noqa: E402
+
+
+def _sleeper(seconds: float, detail: str = None, error: Exception = None):
+    async def phase(application):
+        await asyncio.sleep(seconds)
+        if error is not None:
+            raise error
+        return detail
+
+    return phase
+
+
+def _get(path: str) -> httpx.Response:
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path)
+
+    return asyncio.run(run())
+
+
+def test_phases_run_concurrently_and_report_timings():
+    warmup = Warmup([
+        StartupPhase("database", _sleeper(0.1, "5 pooled connections")),
+        StartupPhase("councils", _sleeper(0.1)),
+        StartupPhase("redis", _sleeper(0, error=SkipPhase("no Redis backend configured"))),
+    ])
+    assert warmup.state == "starting"
+
+    started = time.perf_counter()
+    assert asyncio.run(warmup.run())
+    elapsed = time.perf_counter() - started
+
+    assert elapsed < 0.18
+    report = warmup.report()
+    assert report["state"] == "ready"
+    assert report["phases"]["database"]["status"] == "ok"
+    assert report["phases"]["database"]["detail"] == "5 pooled connections"
+    assert report["phases"]["database"]["seconds"] >= 0.1
+    assert report["phases"]["redis"]["status"] == "skipped"
+    assert report["total_seconds"] >= 0.1
+
+
+def test_optional_failures_are_reported_but_required_ones_block_readiness():
+    optional = Warmup([
+        StartupPhase("udc_data", _sleeper(0)),
+        StartupPhase("chroma", _sleeper(0, error=RuntimeError("segment missing")), required=False),
+    ])
+    assert asyncio.run(optional.run())
+    assert optional.report()["phases"]["chroma"]["detail"] == "RuntimeError: segment missing"
+
+    required = Warmup([StartupPhase("database", _sleeper(0, error=ConnectionError("refused")))])
+    assert not asyncio.run(required.run())
+    assert required.state == "failed"
+
+
+def test_ready_endpoint_follows_warmup(monkeypatch):
+    warmup = Warmup([StartupPhase("udc_data", _sleeper(0, "5 data files"))])
+    monkeypatch.setattr("app.main.warmup", warmup)
+
+    starting = _get("/ready")
+    assert starting.status_code == 503
+    assert starting.json()["status"] == "starting"
+    assert _get("/health").json()["status"] == "starting"
+
+    asyncio.run(warmup.run())
+
+    ready = _get("/ready")
+    assert ready.status_code == 200
+    assert ready.json()["startup"]["phases"]["udc_data"]["detail"] == "5 data files"
+    health = _get("/health").json()
+    assert health["status"] == "healthy"
+    assert health["startup"]["state"] == "ready"
+
+
+def test_udc_data_and_openapi_phases_warm_the_real_app():
+    detail = asyncio.run(warm_udc_data(app))
+    assert detail.endswith("data files")
+    assert int(detail.split()[0]) >= 1
+
+    app.openapi_schema = None
+    assert asyncio.run(warm_openapi(app)).endswith("paths")
+    assert app.openapi_schema is not None
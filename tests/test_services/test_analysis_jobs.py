@@ -0,0 +1,276 @@
+"""Tests for background council analysis jobs."""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+# Settings only need to validate; no database or Anthropic call is made
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("ANTHROPIC_API_KEY", "test-key")
+
+from app.services.analysis_jobs import AnalysisJobManager, LocalJobQueue  # noqa: E402
+from app.services.analysis_store import (  # noqa: E402
+    expert_rows,
+    recommendation_payload,
+    tension_rows,
+)
+
+UNBEATABLE_SHEET = {
+    "question": "Should we accelerate Gewan Phase 2?",
+    "executive_summary": "Proceed in two tranches.",
+    "expert_analyses": [
+        {"agent": "Dr. James Mitchell", "domain": "Finance & Economics", "analysis": "Recommend GO.", "tokens": 900},
+        {"agent": "Dr. Sarah Al-Kuwari", "domain": "Infrastructure", "analysis": "Avoid for now.", "tokens": 700},
+    ],
+    "expert_debates": [{
+        "topic": "Strategic direction",
+        "perspectives": {"Dr. James Mitchell": "positive", "Dr. Sarah Al-Kuwari": "negative"},
+        "note": "Experts have differing recommendations",
+    }],
+    "final_recommendation": "CONDITIONAL GO",
+    "metadata": {"total_tokens": 2400, "estimated_cost_qar": 1.5, "models_used": {"experts": "sonnet"}},
+}
+
+
+class InMemoryAnalysisStore:
+    """Same interface as SqlAnalysisStore, kept in a dict."""
+
+    def __init__(self) -> None:
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    async def create(self, question: str, job: Dict[str, Any]) -> str:
+        job_id = f"job-{len(self.jobs) + 1}"
+        self.jobs[job_id] = {"id": job_id, "question": question, **job}
+        return job_id
+
+    async def update_job(self, job_id: str, **fields: Any) -> Optional[Dict[str, Any]]:
+        self.jobs[job_id].update(fields)
+        return await self.get(job_id)
+
+    async def complete(self, job_id: str, decision_sheet: Dict[str, Any], **fields: Any) -> None:
+        self.results[job_id] = decision_sheet
+        self.jobs[job_id].update(status="completed", **fields)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.jobs.get(job_id)
+        return copy.deepcopy(job) if job is not None else None
+
+
+def test_jobs_run_on_a_bounded_pool_with_stage_progress():
+    """Three jobs on two workers: never more than two councils at once, all complete."""
+    store = InMemoryAnalysisStore()
+    active, peak = 0, 0
+
+    async def council(question, data_context, on_stage):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        for stage in (1, 2):
+            await on_stage(stage, 2, f"stage {stage}")
+            await asyncio.sleep(0.05)
+        active -= 1
+        return {**UNBEATABLE_SHEET, "question": question}
+
+    async def run():
+        manager = AnalysisJobManager(store=store, runners={"unbeatable": council}, max_workers=2)
+        jobs = [await manager.submit(f"Question number {i} for the council") for i in range(3)]
+        assert all(job["status"] == "queued" for job in jobs)
+        while any(job["status"] != "completed" for job in store.jobs.values()):
+            await asyncio.sleep(0.01)
+        await manager.shutdown()
+        return jobs
+
+    jobs = asyncio.run(run())
+
+    assert peak == 2
+    finished = store.jobs[jobs[0]["id"]]
+    assert [stage["number"] for stage in finished["progress"]] == [1, 2]
+    assert finished["stage"] == {"number": 2, "total": 2, "description": "stage 2"}
+    assert store.results[jobs[2]["id"]]["question"] == "Question number 2 for the council"
+
+
+def test_cancel_stops_running_and_skips_queued_jobs():
+    """A running council is cancelled mid-stage; a queued one never starts."""
+    store = InMemoryAnalysisStore()
+    started = []
+
+    async def council(question, data_context, on_stage):
+        started.append(question)
+        await on_stage(1, 7, "Running 4 expert analyses")
+        await asyncio.sleep(10)
+        return UNBEATABLE_SHEET
+
+    async def run():
+        manager = AnalysisJobManager(store=store, runners={"unbeatable": council}, max_workers=1)
+        running = await manager.submit("First long-running question")
+        queued = await manager.submit("Second question waiting in line")
+        while store.jobs[running["id"]].get("stage") is None:
+            await asyncio.sleep(0.01)
+
+        await manager.cancel(queued["id"])
+        await manager.cancel(running["id"])
+        await asyncio.sleep(0.05)
+        await manager.shutdown()
+        return running["id"], queued["id"]
+
+    running_id, queued_id = asyncio.run(run())
+
+    assert store.jobs[running_id]["status"] == "cancelled"
+    assert store.jobs[queued_id]["status"] == "cancelled"
+    assert started == ["First long-running question"]
+
+
+def test_failures_are_recorded_and_unknown_councils_rejected():
+    """Runner errors mark the job failed; unknown councils are refused up front."""
+    store = InMemoryAnalysisStore()
+
+    async def council(question, data_context, on_stage):
+        raise RuntimeError("Anthropic overloaded")
+
+    async def run():
+        manager = AnalysisJobManager(store=store, runners={"unbeatable": council}, max_workers=1)
+        with pytest.raises(ValueError):
+            await manager.submit("Question for a council that does not exist", council="imaginary")
+        job = await manager.submit("Question that will fail in the council")
+        while store.jobs[job["id"]]["status"] in ("queued", "running"):
+            await asyncio.sleep(0.01)
+        await manager.shutdown()
+        return job["id"]
+
+    job_id = asyncio.run(run())
+
+    assert store.jobs[job_id]["status"] == "failed"
+    assert store.jobs[job_id]["error"] == "Anthropic overloaded"
+
+
+class FlakyQueue(LocalJobQueue):
+    """Local queue whose first reads fail, like a Redis connection error."""
+
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+
+    async def get(self) -> str:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("Redis unreachable")
+        return await super().get()
+
+
+def test_workers_survive_queue_errors_and_jobs_cancelled_before_they_start():
+    """Neither a failed queue read nor an early cancel shrinks the pool."""
+    store = InMemoryAnalysisStore()
+
+    async def council(question, data_context, on_stage):
+        await on_stage(1, 1, "stage 1")
+        return {**UNBEATABLE_SHEET, "question": question}
+
+    async def run():
+        manager = AnalysisJobManager(store=store, runners={"unbeatable": council}, max_workers=1,
+                                     queue=FlakyQueue(failures=2))
+        manager.queue_retry_delay = 0.01
+        first = await manager.submit("Question whose job is cancelled before it runs")
+
+        # Cancel the job task after the worker picks it up but before it first runs
+        worker_get = manager.queue.get
+        cancelled = asyncio.Event()
+
+        def cancel_job(job_id):
+            manager._running[job_id].cancel()
+            cancelled.set()
+
+        async def get_and_cancel():
+            job_id = await worker_get()
+            manager.queue.get = worker_get
+            asyncio.get_running_loop().call_soon(cancel_job, job_id)
+            return job_id
+
+        manager.queue.get = get_and_cancel
+        await asyncio.wait_for(cancelled.wait(), 5)
+
+        second = await manager.submit("Question for the same, still running worker")
+        for _ in range(500):
+            if store.jobs[second["id"]]["status"] == "completed":
+                break
+            await asyncio.sleep(0.01)
+        workers = len(manager._workers)
+        await manager.shutdown()
+        return first["id"], workers
+
+    first_id, workers = asyncio.run(run())
+
+    assert store.jobs[first_id]["status"] == "queued"
+    assert first_id not in store.results
+    assert workers == 1
+
+
+def test_a_cancel_is_not_overwritten_by_a_late_result():
+    """A council that finishes despite the cancel does not mark the job completed."""
+    store = InMemoryAnalysisStore()
+
+    async def council(question, data_context, on_stage):
+        await on_stage(1, 1, "stage 1")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            pass  # Some council code swallows cancellation and returns anyway
+        return UNBEATABLE_SHEET
+
+    async def run():
+        manager = AnalysisJobManager(store=store, runners={"unbeatable": council}, max_workers=1)
+        job = await manager.submit("Question cancelled in its last stage")
+        while store.jobs[job["id"]].get("stage") is None:
+            await asyncio.sleep(0.01)
+        await manager.cancel(job["id"])
+        await asyncio.sleep(0.05)
+        await manager.shutdown()
+        return job["id"]
+
+    job_id = asyncio.run(run())
+
+    assert store.jobs[job_id]["status"] == "cancelled"
+    assert job_id not in store.results
+
+
+def test_decision_sheets_map_to_session_tables():
+    """Both councils' sheet formats map onto AgentResponse and DebateTension rows."""
+    agents = expert_rows(UNBEATABLE_SHEET)
+    assert agents[0] == {
+        "agent_name": "Dr. James Mitchell",
+        "agent_role": "Finance & Economics",
+        "round_number": 1,
+        "response_text": "Recommend GO.",
+        "tokens_used": 900,
+        "model_used": "sonnet",
+    }
+    assert tension_rows(UNBEATABLE_SHEET)[0]["agent_2_position"] == "negative"
+    assert recommendation_payload(UNBEATABLE_SHEET)["recommendation"] == "CONDITIONAL GO"
+
+    ultimate_sheet = {
+        "expert_analyses": [{
+            "agent": "Dr. Omar", "title": "Orchestrator", "analysis": "...", "model": "claude-opus-4-1",
+            "usage": {"input_tokens": 100, "output_tokens": 50},
+        }],
+        "expert_debates": [{
+            "topic": "Strategic Recommendation",
+            "positions": [{"agent": "Dr. Omar", "stance": "positive"}, {"agent": "Dr. Fatima", "stance": "neutral"}],
+            "type": "recommendation_divergence",
+        }],
+        "final_recommendation": {"synthesis": "GO", "model": "gpt-5"},
+    }
+    assert expert_rows(ultimate_sheet)[0]["tokens_used"] == 150
+    assert tension_rows(ultimate_sheet)[0]["agent_2_name"] == "Dr. Fatima"
+    assert recommendation_payload(ultimate_sheet)["recommendation"] == "GO"
@@ -0,0 +1,64 @@
+"""Tests for the final-answer cache."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.answer_cache import AnswerCache  # noqa: E402
+
+
+def _embed(text: str) -> list[float]:
+    text = text.lower()
+    return [text.count("revenue"), text.count("udc"), text.count("risk"), text.count("2024")]
+
+
+def test_similar_question_at_same_version_is_served(tmp_path):
+    """Near-duplicate questions hit; unrelated questions and other versions miss."""
+    cache = AnswerCache(db_path=tmp_path / "answers.sqlite3", embed_fn=_embed, similarity_threshold=0.95)
+    cache.put("uis", "What was UDC revenue in 2024?", "v1", {"final_synthesis": "QR 1,032M"})
+
+    hit = cache.get("uis", "UDC's 2024 revenue?", "v1")
+    assert hit["payload"] == {"final_synthesis": "QR 1,032M"}
+    assert hit["cache"]["cached"] is True
+    assert hit["cache"]["matched_question"] == "What was UDC revenue in 2024?"
+
+    assert cache.get("uis", "What are UDC's key risks?", "v1") is None
+    assert cache.get("uis", "UDC's 2024 revenue?", "v2") is None
+    assert cache.get("ultimate_council", "UDC's 2024 revenue?", "v1") is None
+    assert cache.stats == {"hits": 1, "misses": 3, "stores": 1}
+
+
+def test_semantic_hits_need_the_same_periods_and_figures(tmp_path):
+    """Questions that differ only in a year, period or figure are not served each other's answers."""
+    def embed_words(text: str) -> list[float]:
+        # Blind to numbers, so every variant below is a perfect semantic match
+        text = text.lower()
+        return [text.count("revenue"), text.count("udc"), text.count("project")]
+
+    cache = AnswerCache(db_path=tmp_path / "answers.sqlite3", embed_fn=embed_words, similarity_threshold=0.95)
+    cache.put("uis", "What was UDC revenue in 2024?", "v1", {"final_synthesis": "QR 1,045M"})
+    cache.put("uis", "Should UDC fund a QR 500m project?", "v1", {"final_synthesis": "Yes"})
+
+    assert cache.get("uis", "What was UDC revenue in 2023?", "v1") is None
+    assert cache.get("uis", "What was UDC revenue in Q3 2024?", "v1") is None
+    assert cache.get("uis", "Should UDC fund a QR 600m project?", "v1") is None
+    assert cache.get("uis", "UDC FY24 revenue", "v1")["payload"] == {"final_synthesis": "QR 1,045M"}
+    assert cache.get("uis", "Should UDC fund a QR 0.5bn project?", "v1")["payload"] == {"final_synthesis": "Yes"}
+
+
+def test_new_data_version_drops_stale_answers_and_ttl_expires(tmp_path):
+    """Storing at a new version purges older answers; old entries age out."""
+    cache = AnswerCache(db_path=tmp_path / "answers.sqlite3", use_embeddings=False)
+    cache.put("uis", "What are UDC's key risks?", "v1", {"final_synthesis": "old"})
+    cache.put("uis", "What was UDC revenue?", "v2", {"final_synthesis": "new"})
+
+    assert cache.get("uis", "what are udc s key risks", "v1") is None
+    assert cache.get("uis", "What was UDC revenue", "v2")["payload"]["final_synthesis"] == "new"
+
+    cache.ttl_seconds = -1
+    assert cache.get("uis", "What was UDC revenue?", "v2") is None
@@ -0,0 +1,96 @@
+"""Tests that the councils' expert calls run concurrently, up to their cap."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Tuple
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+import ultimate_council  # noqa: E402
+from backend.app.agents.unbeatable_council import UnbeatableStrategicCouncil  # noqa: E402
+
+LLM_SECONDS = 0.2
+
+
+class SlowAsyncAnthropicStub:
+    """Stands in for ``anthropic.AsyncAnthropic``; every call takes LLM_SECONDS."""
+
+    def __init__(self) -> None:
+        self.intervals: List[Tuple[float, float]] = []
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs: Any) -> SimpleNamespace:
+        started = time.perf_counter()
+        await asyncio.sleep(LLM_SECONDS)
+        self.intervals.append((started, time.perf_counter()))
+        usage = SimpleNamespace(input_tokens=10, output_tokens=10)
+        return SimpleNamespace(content=[SimpleNamespace(text="analysis")], usage=usage)
+
+    def max_in_flight(self) -> int:
+        return max(
+            sum(1 for start, end in self.intervals if start <= moment < end)
+            for moment, _ in self.intervals
+        )
+
+
+def _unbeatable(max_concurrent_experts: int) -> Tuple[UnbeatableStrategicCouncil, SlowAsyncAnthropicStub]:
+    council = UnbeatableStrategicCouncil(
+        anthropic_api_key="test-key",
+        enable_reinforcement=False,
+        enable_validation=False,
+        enable_answer_cache=False,
+        max_concurrent_experts=max_concurrent_experts,
+    )
+    council.anthropic = stub = SlowAsyncAnthropicStub()
+    return council, stub
+
+
+def test_unbeatable_experts_overlap_in_time():
+    """All four expert calls are in flight together; wall time is about one call."""
+    council, stub = _unbeatable(max_concurrent_experts=4)
+
+    started = time.perf_counter()
+    analyses = asyncio.run(council._stage2_expert_analyses("Should we buy plot ZX-17?", "data"))
+    elapsed = time.perf_counter() - started
+
+    assert len(analyses) == 4
+    assert stub.max_in_flight() == 4
+    assert elapsed < 2 * LLM_SECONDS
+
+
+def test_unbeatable_concurrency_cap_is_respected():
+    """With a cap of 2, at most two expert calls run at once."""
+    council, stub = _unbeatable(max_concurrent_experts=2)
+
+    asyncio.run(council._stage2_expert_analyses("Should we buy plot ZX-17?", "data"))
+
+    assert len(stub.intervals) == 4
+    assert stub.max_in_flight() == 2
+
+
+def test_ultimate_experts_overlap_in_time(monkeypatch):
+    """UltimateStrategicCouncil runs its four Opus agents concurrently too."""
+    monkeypatch.setitem(ultimate_council.ULTIMATE_MODEL_CONFIG["agents"], "max_concurrent", 4)
+    council = ultimate_council.UltimateStrategicCouncil()
+    council.anthropic = stub = SlowAsyncAnthropicStub()
+    council.anthropic_available = True
+    council.agents = {
+        key: SimpleNamespace(name=key, title="Expert", category="domain")
+        for key in ("dr_omar", "dr_fatima", "dr_james", "dr_sarah")
+    }
+    council.agent_prompts = {key: "persona" for key in council.agents}
+
+    started = time.perf_counter()
+    analyses = asyncio.run(council._run_expert_agents("Is tower QW-42 on schedule?", []))
+    elapsed = time.perf_counter() - started
+
+    assert [analysis["analysis"] for analysis in analyses] == ["analysis"] * 4
+    assert stub.max_in_flight() == 4
+    assert elapsed < 2 * LLM_SECONDS
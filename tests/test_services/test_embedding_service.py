@@ -0,0 +1,174 @@
+"""Tests for the shared embedding sidecar and its micro-batching."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services import embedding_service  # noqa: E402
+from app.services.embedding_service import (  # noqa: E402
+    EmbeddingClient,
+    EmbeddingServer,
+    MicroBatcher,
+    text_embedder,
+)
+
+
+class FakeModel:
+    """Deterministic 3-d 'embeddings' that record each encode call."""
+
+    def __init__(self):
+        self.batches = []
+
+    def encode(self, texts):
+        self.batches.append(list(texts))
+        return np.array([[len(text), text.count("a"), 1.0] for text in texts], dtype=np.float32)
+
+
+@pytest.fixture
+def sidecar(tmp_path):
+    """An EmbeddingServer on a temporary socket, served from a background loop."""
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch=64, max_wait=0.02)
+    server = EmbeddingServer(str(tmp_path / "embeddings.sock"), batcher)
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    asyncio.run_coroutine_threadsafe(server.start(), loop).result(5)
+    yield server, model
+    asyncio.run_coroutine_threadsafe(server.close(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def test_concurrent_requests_share_one_encode_call():
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch=64, max_wait=0.02)
+
+    async def run():
+        results = await asyncio.gather(*(batcher.embed([f"rent {'a' * i}", "pearl"]) for i in range(8)))
+        await batcher.close()
+        return results
+
+    results = asyncio.run(run())
+
+    assert len(model.batches) == 1
+    assert len(model.batches[0]) == 16
+    for i, vectors in enumerate(results):
+        assert vectors.shape == (2, 3)
+        assert vectors[0][1] == i
+        assert list(vectors[1]) == [5.0, 1.0, 1.0]
+    assert batcher.stats == {"requests": 8, "texts": 16, "batches": 1, "largest_batch": 16}
+
+
+def test_full_batches_flush_without_waiting_and_errors_reach_every_caller():
+    model = FakeModel()
+    batcher = MicroBatcher(model.encode, max_batch=4, max_wait=5.0)
+
+    async def run():
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.embed(["x", "y"]) for _ in range(4))), 1.0)
+        await batcher.close()
+        return results
+
+    assert len(asyncio.run(run())) == 4
+    assert [len(batch) for batch in model.batches] == [4, 4]
+
+    def broken(texts):
+        raise RuntimeError("model not loaded")
+
+    failing = MicroBatcher(broken, max_wait=0.01)
+
+    async def fail():
+        results = await asyncio.gather(failing.embed(["a"]), failing.embed(["b"]), return_exceptions=True)
+        await failing.close()
+        return results
+
+    assert [str(result) for result in asyncio.run(fail())] == ["model not loaded"] * 2
+
+
+def test_workers_embed_through_the_sidecar_in_shared_batches(sidecar):
+    server, model = sidecar
+    client = EmbeddingClient(server.socket_path)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        vectors = list(pool.map(client.embed_one, [f"q{'a' * i}" for i in range(16)]))
+
+    assert [v[1] for v in vectors] == list(range(16))
+    assert sum(len(batch) for batch in model.batches) == 16
+    assert len(model.batches) < 16
+    assert client.embed(["one", "two"]).shape == (2, 3)
+
+
+def test_a_timed_out_request_does_not_leak_its_reply_into_the_next(sidecar):
+    server, model = sidecar
+    encode = model.encode
+
+    def slow_encode(texts):
+        if "slow" in texts:
+            time.sleep(0.5)
+        return encode(texts)
+
+    server.batcher.encode = slow_encode
+    client = EmbeddingClient(server.socket_path, timeout=0.1)
+
+    with pytest.raises(socket.timeout):
+        client.embed(["slow"])
+    client.timeout = 5.0
+
+    assert [list(v) for v in client.embed(["bcdefghi"])] == [[8.0, 0.0, 1.0]]
+    assert [list(v) for v in client.embed(["aa"])] == [[2.0, 2.0, 1.0]]
+    # Let the abandoned request finish before the sidecar shuts down
+    while ["slow"] not in model.batches:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+
+def test_embedders_use_the_sidecar_when_configured(sidecar, monkeypatch):
+    server, model = sidecar
+    monkeypatch.setenv("EMBEDDING_SOCKET", server.socket_path)
+    monkeypatch.setattr(embedding_service, "_clients", {})
+    monkeypatch.setattr(embedding_service, "local_encoder", lambda name: pytest.fail("model loaded locally"))
+
+    embed = text_embedder()
+    assert list(embed("banana")) == [6.0, 3.0, 1.0]
+
+    from app.services.knowledge_base_complete import SidecarEmbeddingFunction, knowledge_base_embedding_function
+
+    function = knowledge_base_embedding_function()
+    assert isinstance(function, SidecarEmbeddingFunction)
+    # Same identity as the local function, so persisted collections still validate
+    assert function.name() == "sentence_transformer"
+    assert function.get_config()["model_name"] == "all-MiniLM-L6-v2"
+    assert [list(v) for v in function(["aa", "b"])] == [[2.0, 2.0, 1.0], [1.0, 0.0, 1.0]]
+
+
+def test_missing_socket_falls_back_to_the_local_model(tmp_path, monkeypatch):
+    monkeypatch.setenv("EMBEDDING_SOCKET", str(tmp_path / "missing.sock"))
+    monkeypatch.setattr(embedding_service, "local_encoder", lambda name: FakeModel().encode)
+
+    assert list(text_embedder()("ab")) == [2.0, 1.0, 1.0]
+
+
+def test_stale_socket_file_falls_back_to_the_local_model(tmp_path, monkeypatch):
+    # Bound but never listening, like the file a killed sidecar leaves behind
+    path = tmp_path / "stale.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(path))
+    stale.close()
+    monkeypatch.setenv("EMBEDDING_SOCKET", str(path))
+    monkeypatch.setattr(embedding_service, "_clients", {})
+    monkeypatch.setattr(embedding_service, "local_encoder", lambda name: FakeModel().encode)
+
+    assert path.exists()
+    assert embedding_service.sidecar_client() is None
+    assert list(text_embedder()("ab")) == [2.0, 1.0, 1.0]
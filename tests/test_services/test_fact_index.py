@@ -0,0 +1,82 @@
+"""Tests for ingest-time numeric fact extraction."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.fact_index import (  # noqa: E402
+    FactIndex,
+    extract_chunk_facts,
+    extract_row_facts,
+    read_data_version,
+)
+
+
+def test_extract_chunk_facts_normalizes_units_and_periods():
+    """Billions, negatives and nearby fiscal periods are normalized."""
+    facts = extract_chunk_facts(
+        "In FY24 revenue of QR 1.2 bn was recorded.\nOperating Cash Flow: -QR 460.5 million"
+    )
+    by_metric = {fact["metric"]: fact for fact in facts}
+
+    assert by_metric["revenue"]["value"] == 1200.0
+    assert by_metric["revenue"]["fiscal_period"] == "FY24"
+    assert by_metric["operating_cash_flow"]["value"] == -460.5
+    assert len(facts) == 2
+
+
+def test_extract_row_facts_uses_period_columns():
+    """Spreadsheet rows yield one fact per period column."""
+    facts = extract_row_facts({"Metric": "Revenue", "FY23": 950, "FY24": "QAR 1,032.1m"})
+
+    assert [(fact["fiscal_period"], fact["value"]) for fact in facts] == [
+        ("FY23", 950.0),
+        ("FY24", 1032.1),
+    ]
+
+
+def test_fact_index_lookup_preserves_chunk_rank(tmp_path):
+    """Lookups return facts in the caller's chunk order."""
+    index = FactIndex(tmp_path / "facts.sqlite3")
+    index.index_chunk_facts([
+        ("a", {"page": 1}, extract_chunk_facts("Revenue: QR 100 million")),
+        ("b", {"page": 2}, extract_chunk_facts("Revenue: QR 200 million")),
+    ])
+
+    rows = index.lookup(["b", "a"])
+
+    assert [row["value"] for row in rows] == [200.0, 100.0]
+    assert rows[0]["page"] == 2
+
+
+def test_best_facts_prefer_the_requested_period(tmp_path):
+    """A lower-ranked fact of the query's period wins over a better-ranked fact of another period."""
+    index = FactIndex(tmp_path / "facts.sqlite3")
+    index.index_chunk_facts([
+        ("fy23", {"page": 1}, extract_chunk_facts("FY23 revenue: QR 950 million")),
+        ("fy24", {"page": 2}, extract_chunk_facts("FY2024 revenue: QR 1,032.1 million")),
+    ])
+
+    assert index.best_facts(["fy23", "fy24"])["revenue"]["value"] == 950.0
+    assert index.best_facts(["fy23", "fy24"], {"2024"})["revenue"]["value"] == 1032.1
+    # No fact of the requested period: the best-ranked fact is kept
+    assert index.best_facts(["fy23", "fy24"], {"2022"})["revenue"]["fiscal_period"] == "FY23"
+
+
+def test_data_version_changes_on_ingest_and_clear(tmp_path):
+    """Every write bumps the version other processes read for cache invalidation."""
+    db_path = tmp_path / "facts.sqlite3"
+    assert read_data_version(db_path) is None
+
+    index = FactIndex(db_path)
+    index.index_chunk_facts([("a", {}, extract_chunk_facts("Revenue: QR 100 million"))])
+    first = read_data_version(db_path)
+    index.clear()
+
+    assert first is not None
+    assert read_data_version(db_path) == index.data_version() != first
@@ -123,3 +123,28 @@ def test_smart_chunk_respects_word_limit(knowledge_base):
     assert len(chunks) >= 2
     assert all(len(chunk.split()) <= 12 for chunk in chunks)
 
+
+
+def test_ingestion_indexes_numeric_facts(knowledge_base):
+    """Numeric facts are extracted once at ingestion and joined by chunk ID."""
+    documents = _sample_pdf_documents()
+    documents[0]["pages"][0]["text"] += " FY24 revenue of QR 1,032.1 million was reported."
+    knowledge_base.ingest_pdf_documents(documents)
+    knowledge_base.ingest_excel_data(_sample_excel_documents())
+
+    results = knowledge_base.search("revenue", n_results=2, filter_type="pdf")
+    facts = knowledge_base.get_chunk_facts([result["id"] for result in results])
+
+    assert facts["revenue"]["value"] == 1032.1
+    assert facts["revenue"]["fiscal_period"] == "FY24"
+    assert facts["revenue"]["page"] == 1
+    assert facts["revenue"]["source_citation"] == "Annual Report 2024.pdf, page 1"
+
+    excel_id = knowledge_base._build_excel_id("financials.xlsx", "Summary")
+    excel_facts = knowledge_base.get_chunk_facts([excel_id])
+    assert excel_facts["revenue"]["value"] == 500.0
+
+    # Re-ingestion replaces rather than duplicates a chunk's facts
+    fact_count = knowledge_base.fact_index.count()
+    knowledge_base.ingest_pdf_documents(documents)
+    assert knowledge_base.fact_index.count() == fact_count
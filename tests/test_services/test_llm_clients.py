@@ -0,0 +1,141 @@
+"""Tests for the shared, pooled LLM client factory."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import anthropic
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.llm_clients import LLMClientFactory  # noqa: E402
+
+MESSAGE = {
+    "id": "msg_1",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-test-model",
+    "content": [{"type": "text", "text": "Occupancy is 91%."}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 12, "output_tokens": 5},
+}
+
+
+class _MessagesHandler(BaseHTTPRequestHandler):
+    """Minimal keep-alive Messages API endpoint."""
+
+    protocol_version = "HTTP/1.1"
+    connections = set()
+
+    def do_POST(self):
+        self.connections.add(self.client_address)
+        self.rfile.read(int(self.headers.get("content-length", 0)))
+        body = json.dumps(MESSAGE).encode("utf-8")
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_url():
+    _MessagesHandler.connections = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _MessagesHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _ask(client):
+    return client.messages.create(
+        model="claude-test-model",
+        max_tokens=16,
+        messages=[{"role": "user", "content": "Pearl occupancy?"}],
+    )
+
+
+def test_agents_share_one_client_and_one_connection(api_url):
+    """Five agents built one after another reuse a single keep-alive connection."""
+    factory = LLMClientFactory(http2=False)
+
+    clients = [factory.anthropic(api_key="test-key", base_url=api_url, max_retries=0) for _ in range(5)]
+    answers = [_ask(client).content[0].text for client in clients]
+
+    assert answers == ["Occupancy is 91%."] * 5
+    assert all(client is clients[0] for client in clients)
+    stats = factory.snapshot()["providers"]["anthropic"]
+    assert stats["requests"] == 5
+    assert stats["connections"] == 1
+    assert stats["reused"] == 4
+    assert stats["mean_latency"] > 0
+
+
+def test_pooling_saves_the_per_agent_connections(api_url):
+    """Per-agent SDK clients open a connection each; pooled ones share one, whatever their options."""
+    per_agent = [anthropic.Anthropic(api_key="test-key", base_url=api_url, max_retries=0) for _ in range(3)]
+    for client in per_agent:
+        _ask(client)
+    assert len(_MessagesHandler.connections) == 3
+
+    _MessagesHandler.connections = set()
+    factory = LLMClientFactory(http2=False)
+    pooled = [
+        factory.anthropic(api_key="test-key", base_url=api_url, max_retries=0, timeout=timeout)
+        for timeout in (30.0, 60.0, 600.0)
+    ]
+    for client in pooled:
+        _ask(client)
+
+    assert len({id(client) for client in pooled}) == 3
+    assert len(_MessagesHandler.connections) == 1
+    assert factory.snapshot()["providers"]["anthropic"]["connections"] == 1
+    for client in per_agent:
+        client.close()
+
+
+def test_async_clients_pool_per_event_loop(api_url):
+    """Concurrent calls open parallel connections once; later calls and loops reuse the pool."""
+    factory = LLMClientFactory(http2=False)
+
+    async def burst():
+        clients = [factory.async_anthropic(api_key="test-key", base_url=api_url, max_retries=0) for _ in range(3)]
+        await asyncio.gather(*(_ask(client) for client in clients))
+        await _ask(clients[0])
+
+    asyncio.run(burst())
+    first = dict(factory.snapshot()["providers"]["anthropic"])
+    asyncio.run(burst())
+    second = factory.snapshot()["providers"]["anthropic"]
+
+    assert first["requests"] == 4
+    assert first["connections"] <= 3
+    # A new loop cannot reuse the old loop's sockets, so it opens its own
+    assert second["requests"] == 8
+    assert second["connections"] - first["connections"] <= 3
+    assert factory.snapshot()["clients"] == 1
+
+
+def test_clients_are_keyed_by_configuration():
+    factory = LLMClientFactory(http2=False)
+
+    default = factory.anthropic(api_key="key-a")
+    assert factory.anthropic(api_key="key-a") is default
+    assert factory.anthropic(api_key="key-b") is not default
+    assert factory.anthropic(api_key="key-a", max_retries=0) is not default
+    assert factory.async_anthropic(api_key="key-a") is not default
+    assert factory.openai(api_key="key-a")._client is factory.http_client("openai")
+    assert factory.snapshot()["clients"] == 5
@@ -0,0 +1,215 @@
+"""Tests for the process-wide LLM concurrency governor."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.llm_governor import LLMGovernor, backoff_delay  # noqa: E402
+from app.services.llm_usage import output_tokens  # noqa: E402
+
+
+class ProviderError(Exception):
+    """Shaped like anthropic.APIStatusError: status_code plus an httpx-like response."""
+
+    def __init__(self, status_code: int, headers=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.response = SimpleNamespace(status_code=status_code, headers=headers or {})
+
+
+def test_concurrency_is_capped_per_model():
+    governor = LLMGovernor(max_concurrency=2)
+    active = {"opus": 0, "sonnet": 0}
+    peak = {"opus": 0, "sonnet": 0}
+
+    async def request(model):
+        active[model] += 1
+        peak[model] = max(peak[model], active[model])
+        await asyncio.sleep(0.02)
+        active[model] -= 1
+        return model
+
+    async def run():
+        calls = [governor.call(model, lambda m=model: request(m)) for model in ["opus", "sonnet"] * 5]
+        return await asyncio.gather(*calls)
+
+    results = asyncio.run(run())
+
+    assert results == ["opus", "sonnet"] * 5
+    assert peak == {"opus": 2, "sonnet": 2}
+    snapshot = governor.snapshot()
+    assert snapshot["opus"]["requests"] == 5
+    assert snapshot["opus"]["queued"] == 3
+    assert snapshot["opus"]["in_flight"] == 0
+    assert snapshot["opus"]["queue_depth"] == 0
+    assert snapshot["opus"]["mean_wait"] > 0
+
+
+def test_waiting_queries_are_served_round_robin():
+    """A query's burst of parallel calls does not starve a later query."""
+    governor = LLMGovernor(max_concurrency=1)
+    order = []
+
+    async def request(label):
+        order.append(label)
+        await asyncio.sleep(0.01)
+
+    async def run():
+        calls = [governor.call("opus", lambda i=i: request(f"a{i}"), query_id="a") for i in range(4)]
+        calls += [governor.call("opus", lambda i=i: request(f"b{i}"), query_id="b") for i in range(2)]
+        await asyncio.gather(*calls)
+
+    asyncio.run(run())
+
+    assert order == ["a0", "a1", "b0", "a2", "b1", "a3"]
+
+
+def test_rate_limit_pauses_the_model_for_retry_after():
+    governor = LLMGovernor(max_concurrency=4, max_retries=2)
+    attempts = []
+
+    async def request():
+        attempts.append(asyncio.get_running_loop().time())
+        if len(attempts) == 1:
+            raise ProviderError(429, {"retry-after": "0.05"})
+        return "ok"
+
+    retried = []
+
+    async def on_retry(exc, attempt):
+        retried.append((exc.status_code, attempt))
+
+    async def run():
+        assert await governor.call("opus", request, on_retry=on_retry) == "ok"
+
+    asyncio.run(run())
+
+    assert attempts[1] - attempts[0] >= 0.05
+    assert retried == [(429, 1)]
+    stats = governor.snapshot()["opus"]
+    assert stats["throttled"] == 1
+    assert stats["retries"] == 1
+
+
+def test_non_retryable_errors_and_exhausted_retries_are_raised():
+    governor = LLMGovernor(max_retries=1)
+    attempts = []
+
+    async def bad_request():
+        attempts.append("400")
+        raise ProviderError(400)
+
+    async def overloaded():
+        attempts.append("500")
+        raise ProviderError(500)
+
+    async def run():
+        with pytest.raises(ProviderError):
+            await governor.call("opus", bad_request)
+        with pytest.raises(ProviderError):
+            await governor.call("opus", overloaded)
+
+    slept = []
+
+    async def no_sleep(seconds):
+        slept.append(seconds)
+
+    governor.sleep = no_sleep
+    asyncio.run(run())
+
+    assert attempts == ["400", "500", "500"]
+    assert len(slept) == 1
+    assert governor.snapshot()["opus"]["in_flight"] == 0
+
+
+def test_token_budget_delays_requests_that_do_not_fit():
+    # 6000 tokens per minute refill 100 per second
+    governor = LLMGovernor(max_concurrency=4, tokens_per_minute=6000)
+    started = []
+
+    async def request():
+        started.append(asyncio.get_running_loop().time())
+        return SimpleNamespace(usage=SimpleNamespace(output_tokens=0))
+
+    async def run():
+        await governor.call("opus", request, tokens=5990)
+        await governor.call("opus", request, tokens=15)
+
+    asyncio.run(run())
+
+    # The second request needs ~5 more tokens, i.e. ~0.05s of refill
+    assert started[1] - started[0] >= 0.04
+    assert governor.snapshot()["opus"]["queued"] == 1
+
+
+def test_stream_retries_only_before_the_first_chunk():
+    governor = LLMGovernor(max_retries=3)
+    attempts = []
+
+    async def flaky_then_ok():
+        attempts.append("connect")
+        if len(attempts) == 1:
+            raise ProviderError(529)
+        for chunk in ["Net ", "profit ", "rose."]:
+            yield chunk
+
+    async def breaks_midway():
+        attempts.append("midway")
+        yield "Partial "
+        raise ProviderError(503)
+
+    async def run():
+        chunks = [chunk async for chunk in governor.stream("opus", flaky_then_ok)]
+        assert chunks == ["Net ", "profit ", "rose."]
+        received = []
+        with pytest.raises(ProviderError):
+            async for chunk in governor.stream("opus", breaks_midway):
+                received.append(chunk)
+        assert received == ["Partial "]
+
+    governor.pause = lambda model, seconds: None
+    asyncio.run(run())
+
+    assert attempts == ["connect", "connect", "midway"]
+    assert governor.snapshot()["opus"]["in_flight"] == 0
+
+
+def test_backoff_honors_retry_after_and_reads_usage():
+    assert 10 <= backoff_delay(ProviderError(429, {"retry-after": "10"}), attempt=0) <= 11
+    assert 0.2 <= backoff_delay(ProviderError(429, {"retry-after-ms": "200"}), attempt=5) <= 0.3
+    assert 2 <= backoff_delay(ProviderError(503), attempt=2) <= 4
+
+    assert output_tokens(SimpleNamespace(usage=SimpleNamespace(output_tokens=42))) == 42
+    assert output_tokens(SimpleNamespace(usage=SimpleNamespace(output_tokens=None, completion_tokens=7))) == 7
+    assert output_tokens(SimpleNamespace(usage_metadata={"output_tokens": 3})) == 3
+    assert output_tokens("plain text") == 0
+
+
+def test_api_process_shares_one_governor_with_the_council():
+    """The jobs API's council calls go through the same governor and query context as every other caller."""
+    code = (
+        "import sys, app.main\n"
+        "from app.services import analysis_jobs, llm_governor\n"
+        "from app.agents import unbeatable_council\n"
+        "assert unbeatable_council.llm_governor is llm_governor.llm_governor\n"
+        "assert analysis_jobs.current_query is llm_governor.current_query\n"
+        "print(sorted(name for name in sys.modules if name.startswith('backend')))\n"
+    )
+    # The repository root on the path too, so a stray ``backend.app`` import would load a second copy
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_PATH.parent), "SECRET_KEY": "test", "DATABASE_URL": "sqlite://"}
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_PATH, env=env,
+                            capture_output=True, text=True, timeout=120)
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip().splitlines()[-1] == "[]"
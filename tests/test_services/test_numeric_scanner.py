@@ -0,0 +1,60 @@
+"""Tests for the shared single-pass numeric scanner."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.numeric_scanner import labelled_amounts, numeric_signals, scan_tokens  # noqa: E402
+
+
+def test_scan_types_amounts_percents_and_periods():
+    """Signs, currencies and units are read wherever they are written."""
+    tokens = scan_tokens("In FY24 -QR 460.5m, QR -12 bn, $2.5B, 3.4bn USD, 15% and 2023-2024; A380")
+
+    assert [(token.kind, token.value, token.unit) for token in tokens] == [
+        ("period", None, None),
+        ("amount", -460.5, "m"),
+        ("amount", -12.0, "bn"),
+        ("amount", 2.5, "b"),
+        ("amount", 3.4, "bn"),
+        ("percent", 15.0, None),
+        ("period", 2023.0, None),
+        ("period", 2024.0, None),
+    ]
+    assert tokens[2].millions == -12000.0
+
+
+def test_labelled_amounts_pair_labels_with_following_figure():
+    """Each metric label takes the figure right after it, normalized to millions."""
+    pairs = labelled_amounts(
+        "Revenue: QR 1,032.1 million. Net Profit: -QR 50 million. "
+        "Operating Cash Flow: QR 1.2 billion. Profit margin improved in 2024."
+    )
+
+    assert [(pair["metric"], pair["value"]) for pair in pairs] == [
+        ("revenue", 1032.1),
+        ("net_profit", -50.0),
+        ("operating_cash_flow", 1200.0),
+    ]
+
+
+def test_numeric_signals_classify_reasoning_markers():
+    """Calculations, rates and scenario markers come from the same token stream."""
+    signals = numeric_signals(
+        "Quick math: 120 × 4 = 480, QAR 500M ÷ 2 = QAR 250M and 15% of QAR 2B. "
+        "Scenario 1: probability 30-40%, 18% IRR, launch Q3 2025."
+    )
+
+    assert signals["equations"] == ["120 × 4 = 480", "QAR 500M ÷ 2 = QAR 250M"]
+    assert signals["qar_calculations"] == ["QAR 500M ÷ 2 = QAR 250M"]
+    assert signals["shares"] == ["15% of QAR 2B"]
+    assert signals["results"] == ["= QAR 250M"]
+    assert signals["rates"] == ["18% IRR"]
+    assert signals["scenario_headers"] == ["Scenario 1:"]
+    assert signals["risk_probabilities"] == ["probability 30-40%"]
+    assert signals["quarters"] == ["Q3 2025"]
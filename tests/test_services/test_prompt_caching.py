@@ -0,0 +1,82 @@
+"""Tests for Anthropic prompt caching of the static persona prompts."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.prompt_caching import cached_system_blocks, usage_cost_usd  # noqa: E402
+from backend.app.agents.unbeatable_council import UnbeatableStrategicCouncil  # noqa: E402
+
+
+class RecordingAnthropicStub:
+    """Stands in for ``anthropic.AsyncAnthropic``; records every request payload."""
+
+    def __init__(self) -> None:
+        self.requests: List[Dict[str, Any]] = []
+        self.messages = SimpleNamespace(create=self._create)
+
+    async def _create(self, **kwargs: Any) -> SimpleNamespace:
+        self.requests.append(kwargs)
+        first_call = len(self.requests) == 1
+        usage = SimpleNamespace(
+            input_tokens=40,
+            output_tokens=200,
+            cache_creation_input_tokens=3000 if first_call else 0,
+            cache_read_input_tokens=0 if first_call else 3000,
+        )
+        return SimpleNamespace(content=[SimpleNamespace(text="My call: go mid-market.")], usage=usage)
+
+
+def test_cached_system_blocks_put_breakpoints_on_static_parts():
+    """Every static part is a text block ending in a cache breakpoint."""
+    blocks = cached_system_blocks("persona", None, "instructions")
+
+    assert [block["text"] for block in blocks] == ["persona", "instructions"]
+    assert all(block["cache_control"] == {"type": "ephemeral"} for block in blocks)
+
+
+def test_expert_calls_share_a_stable_cached_prefix():
+    """Only the user message changes between questions; cache reads are billed at 0.1x."""
+    council = UnbeatableStrategicCouncil(
+        anthropic_api_key="test-key",
+        enable_reinforcement=False,
+        enable_validation=False,
+        enable_answer_cache=False,
+    )
+    stub = RecordingAnthropicStub()
+    council.anthropic = stub
+    expert = council.experts["dr_omar"]
+
+    results = [
+        asyncio.run(council._run_single_expert(
+            expert_name=expert["name"],
+            expert_domain=expert["domain"],
+            expert_prompt=expert["prompt"],
+            query=question,
+            context="Pearl occupancy 92%",
+        ))
+        for question in ("Should we buy plot ZX-17?", "Is tower QW-42 on schedule?")
+    ]
+
+    first, second = stub.requests
+    assert first["system"] == second["system"]
+    assert first["system"][0]["text"] == expert["prompt"]
+    assert first["system"][-1]["cache_control"] == {"type": "ephemeral"}
+    assert "ZX-17" not in str(first["system"])
+    assert "ZX-17" in first["messages"][0]["content"]
+
+    write_usage, read_usage = (result["usage"] for result in results)
+    assert read_usage["cache_read_input_tokens"] == 3000
+    assert results[1]["tokens"] == 3240
+    assert usage_cost_usd(read_usage, 3, 15) < usage_cost_usd(write_usage, 3, 15)
+    assert council._calculate_cost(0, results, {"usage": {}}) == round(
+        (usage_cost_usd(write_usage, 3, 15) + usage_cost_usd(read_usage, 3, 15)) * 3.64, 2
+    )
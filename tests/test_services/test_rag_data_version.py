@@ -0,0 +1,47 @@
+"""Tests for the RAG system's data version, which keys cached answers."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+chromadb = pytest.importorskip("chromadb")
+
+from rag_system import RetrievalService  # noqa: E402
+
+
+@pytest.fixture
+def service(tmp_path):
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(path=str(tmp_path), settings=Settings(anonymized_telemetry=False))
+    service = RetrievalService(chromadb_path=str(tmp_path))
+    # Collections only: the embedding model is not needed to version the data
+    service.qatar_collection = client.create_collection("qatar_open_data")
+    service.corporate_collection = client.create_collection("corporate_intelligence")
+    service.chroma_client = client
+    service._initialized = True
+    service.qatar_collection.add(ids=["q1"], documents=["Hotel occupancy 2024"],
+                                 metadatas=[{"category": "Tourism"}], embeddings=[[1.0, 0.0]])
+    return service
+
+
+def test_data_version_changes_when_content_changes_at_the_same_count(service):
+    version = service.data_version()
+    assert service.data_version() == version
+
+    # Re-ingesting a document with new content keeps every collection count the same
+    service.qatar_collection.upsert(ids=["q1"], documents=["Hotel occupancy 2025"],
+                                    metadatas=[{"category": "Tourism"}], embeddings=[[1.0, 0.0]])
+    updated = service.data_version()
+    assert updated != version
+
+    service.corporate_collection.add(ids=["c1"], documents=["UDC annual report"],
+                                     metadatas=[{"source": "pdf"}], embeddings=[[0.0, 1.0]])
+    assert service.data_version() not in (version, updated)
@@ -0,0 +1,48 @@
+"""Import-time budget for the RAG system: importing it must not load its components."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+
+# Generous for slow CI machines; loading Chroma alone takes over a second
+IMPORT_BUDGET_SECONDS = 1.0
+HEAVY_MODULES = ("chromadb", "openai", "sentence_transformers", "torch")
+
+
+def _import_times(module: str) -> dict:
+    """Cumulative import time in seconds per module, from ``python -X importtime``."""
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_PATH)}
+    env.pop("OPENAI_API_KEY", None)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_PATH, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+def test_importing_rag_system_stays_within_budget():
+    times = _import_times("rag_system")
+
+    loaded = [name for name in HEAVY_MODULES if name in times]
+    assert loaded == [], f"rag_system imports {loaded} at import time"
+    assert times["rag_system"] < IMPORT_BUDGET_SECONDS
+
+
+def test_agents_import_without_loading_retrieval_components():
+    times = _import_times("agents")
+
+    assert "agents" in times
+    assert not [name for name in HEAVY_MODULES if name in times]
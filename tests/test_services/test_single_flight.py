@@ -0,0 +1,157 @@
+"""Tests for in-flight request coalescing."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.single_flight import SingleFlight  # noqa: E402
+
+
+def _counting_pipeline(delay: float = 0.05):
+    calls = []
+
+    async def pipeline():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return {"answer": "Net profit rose 12%.", "sources": ["financial_summary.json"]}
+
+    return pipeline, calls
+
+
+def test_identical_concurrent_requests_share_one_execution():
+    """Near-identical wording coalesces; each caller gets its own copy."""
+    flights = SingleFlight()
+    pipeline, calls = _counting_pipeline()
+    questions = ["What was net profit in 2024?", "what was NET profit in 2024", "What was net profit in 2024?"]
+
+    async def run():
+        return await asyncio.gather(*(flights.do("uis", q, "v1", pipeline) for q in questions))
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert all(result == results[0] for result in results)
+    results[1]["sources"].append("mutated")
+    assert results[2]["sources"] == ["financial_summary.json"]
+    assert flights.stats == {"executions": 1, "coalesced": 2, "in_flight": 0}
+
+
+def test_data_version_namespace_and_timing_separate_flights():
+    """Different data, a different pipeline or a later request all execute again."""
+    flights = SingleFlight()
+    pipeline, calls = _counting_pipeline()
+    question = "How is Gewan Phase 2 progressing?"
+
+    async def run():
+        await asyncio.gather(
+            flights.do("uis", question, "v1", pipeline),
+            flights.do("uis", question, "v2", pipeline),
+            flights.do("dr_omar", question, "v1", pipeline),
+        )
+        assert not flights.in_flight("uis", question, "v1")
+        await flights.do("uis", question, "v1", pipeline)
+
+    asyncio.run(run())
+
+    assert len(calls) == 4
+    assert flights.stats["coalesced"] == 0
+
+
+def test_errors_reach_every_caller_and_are_not_shared_later():
+    flights = SingleFlight()
+    attempts = []
+
+    async def failing():
+        attempts.append(1)
+        await asyncio.sleep(0.02)
+        raise RuntimeError("Anthropic overloaded")
+
+    async def run():
+        results = await asyncio.gather(
+            flights.do("uis", "Pearl occupancy?", None, failing),
+            flights.do("uis", "Pearl occupancy?", None, failing),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        with pytest.raises(RuntimeError):
+            await flights.do("uis", "Pearl occupancy?", None, failing)
+
+    asyncio.run(run())
+    assert len(attempts) == 2
+
+
+def test_cancelled_leader_does_not_cancel_joined_callers():
+    """A disconnecting first caller leaves the shared run going for the others."""
+    flights = SingleFlight()
+    pipeline, calls = _counting_pipeline(delay=0.1)
+    joined = []
+
+    async def on_join():
+        joined.append(1)
+
+    async def run():
+        leader = asyncio.create_task(flights.do("uis", "Qatar Cool capacity?", "v1", pipeline))
+        await asyncio.sleep(0.01)
+        follower = asyncio.create_task(flights.do("uis", "Qatar Cool capacity?", "v1", pipeline, on_join=on_join))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        return await follower, leader
+
+    result, leader = asyncio.run(run())
+
+    assert leader.cancelled()
+    assert result["answer"] == "Net profit rose 12%."
+    assert joined == [1]
+    assert len(calls) == 1
+
+
+def test_run_is_cancelled_when_every_caller_has_gone():
+    """An abandoned question stops its pipeline instead of finishing unobserved."""
+    flights = SingleFlight()
+    steps = []
+
+    async def pipeline():
+        for step in range(10):
+            steps.append(step)
+            await asyncio.sleep(0.02)
+        return {"answer": "done"}
+
+    async def run():
+        callers = [asyncio.create_task(flights.do("uis", "Gewan sales pace?", "v1", pipeline)) for _ in range(2)]
+        await asyncio.sleep(0.03)
+        callers[0].cancel()
+        await asyncio.sleep(0.03)
+        assert flights.in_flight("uis", "Gewan sales pace?", "v1")
+        callers[1].cancel()
+        await asyncio.sleep(0.05)
+        return len(steps)
+
+    steps_run = asyncio.run(run())
+
+    assert steps_run < 6
+    assert flights.stats == {"executions": 1, "coalesced": 1, "in_flight": 0}
+
+
+def test_chainlit_entry_points_import_the_handler_from_the_repository_root():
+    """Loaded as ``backend.app``, nothing may import ``app.*``: at the root that is the Chainlit app.py."""
+    modules = ["backend.app.services.single_flight"]
+    if importlib.util.find_spec("crewai") is not None:
+        modules.append("backend.app.agents.integrated_query_handler")
+    code = "import sys\n" + "".join(f"import {module}\n" for module in modules) + "print('app' in sys.modules)\n"
+    env = {**os.environ, "PYTHONPATH": str(BACKEND_PATH.parent)}
+    result = subprocess.run([sys.executable, "-c", code], cwd=BACKEND_PATH.parent, env=env,
+                            capture_output=True, text=True, timeout=120)
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip().splitlines()[-1] == "False"
@@ -0,0 +1,72 @@
+"""Tests for streaming progress out of blocking runs."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+from app.services.thread_stream import EVENT, RESULT, stream_blocking_run  # noqa: E402
+
+
+def test_events_arrive_while_the_run_is_still_working():
+    """Each emit reaches the consumer before the blocking run finishes."""
+    release = threading.Event()
+
+    def crew(emit):
+        emit("financial")
+        release.wait(timeout=5)  # Blocks until the consumer has seen the first event
+        emit("synthesis")
+        return "final answer"
+
+    async def consume():
+        seen = []
+        async for kind, item in stream_blocking_run(crew):
+            seen.append((kind, item))
+            if item == "financial":
+                release.set()
+        return seen
+
+    assert asyncio.run(consume()) == [
+        (EVENT, "financial"),
+        (EVENT, "synthesis"),
+        (RESULT, "final answer"),
+    ]
+
+
+def test_event_loop_stays_free_and_errors_propagate():
+    """Other coroutines run during the blocking call; its exception is re-raised last."""
+    def failing_crew(emit):
+        emit("financial")
+        time.sleep(0.2)
+        raise RuntimeError("crew failed")
+
+    async def consume():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tick_task = asyncio.create_task(ticker())
+        seen = []
+        try:
+            async for kind, item in stream_blocking_run(failing_crew):
+                seen.append(item)
+        finally:
+            tick_task.cancel()
+            assert seen == ["financial"]
+            assert ticks >= 5
+
+    with pytest.raises(RuntimeError, match="crew failed"):
+        asyncio.run(consume())
@@ -0,0 +1,121 @@
+"""Tests for the indexed structured-data query layer over the UDC data files."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.services.udc_data_query import StructuredDataIndex, question_terms, udc_data_index  # noqa: E402
+from app.services.udc_data_store import UDCDataStore  # noqa: E402
+
+FINANCIAL = {
+    "metadata": {"currency": "QAR", "units": "millions"},
+    "annual_summary": [
+        {"year": 2023, "revenue": 1032.1, "net_profit": 236.4, "debt_to_equity": 0.45},
+        {"year": 2024, "revenue": 1045.0, "net_profit": 240.1, "debt_to_equity": 0.48},
+    ],
+    "quarterly_performance": [
+        {"period": "Q2 2024", "revenue": 250, "net_profit": 55},
+        {"period": "Q3 2024", "revenue": 265, "net_profit": 61},
+    ],
+    "credit_facilities": {"total_available": 4000, "utilized": 3500},
+}
+PROPERTY = {
+    "metadata": {"as_of": "2024-09-30"},
+    "the_pearl_qatar": {
+        "precincts": [
+            {"name": "Porto Arabia", "occupancy_percent": 91, "units": 2500},
+            {"name": "Qanat Quartier", "occupancy_percent": 84, "units": 600},
+        ],
+    },
+    "gewan_island": {"occupancy_percent": 40, "units": 400},
+}
+
+
+def _write(path: Path, data, mtime_ns: int) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def index(tmp_path):
+    _write(tmp_path / "financial_summary.json", FINANCIAL, 1_000_000_000)
+    _write(tmp_path / "property_portfolio.json", PROPERTY, 1_000_000_000)
+    return StructuredDataIndex(UDCDataStore(tmp_path))
+
+
+def test_question_terms_normalize_periods_and_drop_filler():
+    terms, periods = question_terms("How did UDC's FY24 and 3Q revenue compare?")
+    assert periods == {"2024", "q3"}
+    assert terms == {"compare", "revenue"}
+
+    terms, _ = question_terms("Should we worry?", "udc_debt")
+    assert {"debt", "equity", "credit", "concern"} <= terms
+
+
+def test_query_returns_matching_periods_and_metrics_with_provenance(index):
+    result = index.query("What was FY24 revenue?")
+
+    assert result["projected"] is True
+    # Identity fields and metadata travel with the matching metrics; other years and files do not
+    assert result["data"] == {"financial_summary.json": {
+        "metadata": FINANCIAL["metadata"],
+        "annual_summary": [{"year": 2024, "revenue": 1045.0}],
+        "quarterly_performance": [{"period": "Q2 2024", "revenue": 250}, {"period": "Q3 2024", "revenue": 265}],
+    }}
+    assert {"file": "financial_summary.json", "path": "annual_summary[1].revenue", "period": "2024"} \
+        in result["provenance"]
+
+    q3 = index.query("Q3 2024 net profit")["data"]["financial_summary.json"]
+    assert q3["quarterly_performance"] == [{"period": "Q3 2024", "net_profit": 61}]
+
+
+def test_query_prefers_fields_matching_more_terms(index):
+    pearl = index.query("How is the Pearl doing?")["data"]["property_portfolio.json"]
+    assert pearl["the_pearl_qatar"] == PROPERTY["the_pearl_qatar"]
+    assert "gewan_island" not in pearl
+
+    porto = index.query("Porto Arabia occupancy")["data"]["property_portfolio.json"]
+    assert porto["the_pearl_qatar"]["precincts"] == [{"name": "Porto Arabia", "occupancy_percent": 91}]
+
+    debt = index.query("Should we worry?", files=["financial_summary.json"], question_type="udc_debt")
+    assert [p["path"] for p in debt["provenance"]] == [
+        "annual_summary[0].debt_to_equity", "annual_summary[1].debt_to_equity",
+        "credit_facilities.total_available", "credit_facilities.utilized",
+    ]
+
+
+def test_unmatched_questions_get_the_complete_files(index):
+    result = index.query("Tell me a joke")
+
+    assert result["projected"] is False
+    assert result["data"] == {"financial_summary.json": FINANCIAL, "property_portfolio.json": PROPERTY}
+
+
+def test_index_follows_file_changes(index, tmp_path):
+    assert index.query("Gewan occupancy")["data"]["property_portfolio.json"]["gewan_island"] == {"occupancy_percent": 40}
+
+    _write(tmp_path / "property_portfolio.json",
+           {**PROPERTY, "gewan_island": {"occupancy_percent": 55}}, 2_000_000_000)
+
+    assert index.query("Gewan occupancy")["data"]["property_portfolio.json"]["gewan_island"] == {"occupancy_percent": 55}
+
+
+def test_sample_data_questions_send_a_fraction_of_the_data():
+    full = len(json.dumps(udc_data_index.store.load_all()))
+
+    for question in ("What was FY24 revenue?", "What's our debt-to-equity ratio?", "Qatar Cool capacity"):
+        result = udc_data_index.query(question)
+        assert result["projected"] is True
+        assert len(json.dumps(result["data"])) < full / 10
@@ -0,0 +1,100 @@
+"""Tests for the shared, mtime-revalidated UDC data store."""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_PATH = Path(__file__).resolve().parents[2] / "backend"
+if str(BACKEND_PATH) not in sys.path:
+    sys.path.insert(0, str(BACKEND_PATH))
+
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+
+from app.agents.tools import UDCDataTools  # noqa: E402
+from app.services.udc_data_store import FrozenDict, UDCDataStore, data_store, udc_data_store  # noqa: E402
+
+FINANCIAL = {
+    "annual_summary": [
+        {"year": 2023, "revenue": 1032.1, "total_debt": 3400, "total_equity": 7500,
+         "debt_to_equity": 0.45, "cash_and_equivalents": 900},
+        {"year": 2024, "revenue": 1045.0, "total_debt": 3500, "total_equity": 7300,
+         "debt_to_equity": 0.48, "cash_and_equivalents": 850},
+    ],
+    "quarterly_performance": [{"period": "Q3 2024", "revenue": 265}],
+    "key_metrics_thresholds": {"debt_to_equity": 0.5},
+    "metadata": {"source": "annual report"},
+}
+
+
+def _write(path: Path, data, mtime_ns: int) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    _write(tmp_path / "financial_summary.json", FINANCIAL, 1_000_000_000)
+    _write(tmp_path / "qatar_cool_metrics.json", {"capacity_tr": 271000}, 1_000_000_000)
+    return tmp_path
+
+
+def test_files_are_parsed_once_and_reparsed_when_they_change(data_dir):
+    store = UDCDataStore(data_dir)
+
+    first = store.get("financial_summary.json")
+    assert store.get("financial_summary.json") is first
+    assert store.stats == {"hits": 1, "loads": 1}
+    version = store.data_version()
+
+    _write(data_dir / "financial_summary.json", {**FINANCIAL, "metadata": {"source": "restated"}}, 2_000_000_000)
+
+    assert store.get("financial_summary.json")["metadata"]["source"] == "restated"
+    assert store.stats["loads"] == 2
+    assert store.data_version() != version
+    assert sorted(store.load_all()) == ["financial_summary.json", "qatar_cool_metrics.json"]
+    assert store.stats["loads"] == 3
+
+    with pytest.raises(FileNotFoundError):
+        store.get("subsidiaries_performance.json")
+
+
+def test_views_are_read_only_but_serialize_and_copy_like_plain_json(data_dir):
+    data = UDCDataStore(data_dir).get("financial_summary.json")
+
+    with pytest.raises(TypeError):
+        data["metadata"] = {}
+    with pytest.raises(TypeError):
+        data["annual_summary"].append({})
+    with pytest.raises(TypeError):
+        data["annual_summary"][0].update(revenue=0)
+
+    assert json.loads(json.dumps(data, indent=2)) == FINANCIAL
+    mutable = copy.deepcopy(data)
+    mutable["annual_summary"][0]["revenue"] = 0
+    assert type(mutable) is dict and type(mutable["annual_summary"]) is list
+    assert data["annual_summary"][0]["revenue"] == 1032.1
+    restored = pickle.loads(pickle.dumps(data))
+    assert isinstance(restored, FrozenDict) and restored == data
+
+
+def test_tools_share_one_store_per_directory(data_dir):
+    tools, other = UDCDataTools(str(data_dir)), UDCDataTools(str(data_dir))
+    assert tools.store is other.store is data_store(data_dir)
+    assert UDCDataTools().store is udc_data_store
+
+    for _ in range(3):
+        results = tools.search_data("debt and district cooling revenue")["results"]
+        assert [result["category"] for result in results] == ["debt", "qatar_cool"]
+    other.get_financial_summary("2024")
+
+    # Two files, parsed once each across every call and both instances
+    assert tools.store.stats["loads"] == 2
+    assert results[0]["data"]["status"] == "YELLOW FLAG"
@@ -1,9 +1,12 @@
 import asyncio
+import uuid
 from datetime import datetime
 from typing import Optional
 
-from src.graph.workflow import create_intelligence_graph, create_parallel_graph
 from src.models.state import IntelligenceState
+from src.utils.answer_cache import apply_cached_answer, lookup_answer, run_once, store_answer
+from src.utils.llm_cache import kb_data_version
+from src.utils.llm_governor import current_query
 from src.utils.logging_config import logger
 from src.utils.performance import performance_monitor
 
@@ -11,7 +14,8 @@ from src.utils.performance import performance_monitor
 async def process_query(
     query: str, 
     use_parallel: bool = False, 
-    use_routing: bool = True
+    use_routing: bool = True,
+    bypass_cache: bool = False
 ) -> dict:
     """
     Process a query through the intelligence system.
@@ -20,15 +24,13 @@ async def process_query(
         query: User query
         use_parallel: Use parallel agent execution (faster)
         use_routing: Use conditional routing based on complexity (optimized)
+        bypass_cache: Always run the full pipeline, ignoring cached answers
     """
     logger.info("=" * 80)
     logger.info(f"NEW QUERY: {query}")
     logger.info(f"Options: parallel={use_parallel}, routing={use_routing}")
     logger.info("=" * 80)
     
-    # Start performance monitoring
-    performance_monitor.start_query()
-    
     # Initialize state
     initial_state: IntelligenceState = {
         "query": query,
@@ -80,7 +82,41 @@ async def process_query(
         "retry_count": 0
     }
     
-    # Create appropriate graph
+    # Serve near-duplicate questions from the final-answer cache
+    data_version = kb_data_version()
+    cached = None if bypass_cache else lookup_answer(query, data_version=data_version)
+    if cached:
+        result = apply_cached_answer(initial_state, cached)
+        result["total_time_seconds"] = (
+            result["execution_end"] - result["execution_start"]
+        ).total_seconds()
+        logger.info(f"QUERY ANSWERED FROM CACHE in {result['total_time_seconds']:.3f}s")
+        return result
+    
+    # Identical queries already running share that run instead of starting their own
+    return await run_once(
+        query,
+        lambda: _run_pipeline(initial_state, use_parallel, use_routing, data_version),
+        variant=f"parallel={use_parallel},routing={use_routing}",
+        data_version=data_version
+    )
+
+
+async def _run_pipeline(
+    initial_state: IntelligenceState,
+    use_parallel: bool,
+    use_routing: bool,
+    data_version: Optional[str]
+) -> dict:
+    """Run the graph, record performance and cache the answer."""
+    query = initial_state["query"]
+    current_query.set(uuid.uuid4().hex)  # LLM governor queues this run's calls fairly
+    
+    # Start performance monitoring (only the run that callers share, not each caller)
+    performance_monitor.start_query()
+    
+    # Create appropriate graph (imported here: langgraph and the models are slow to import)
+    from src.graph.workflow import create_intelligence_graph, create_parallel_graph
     if use_parallel:
         graph = create_parallel_graph()
     else:
@@ -105,6 +141,8 @@ async def process_query(
     # Log performance
     performance_monitor.log_summary()
     
+    store_answer(query, result, data_version=data_version)
+    
     logger.info("=" * 80)
     logger.info("QUERY COMPLETE")
     logger.info(f"Time: {result['total_time_seconds']:.2f}s")
@@ -1,20 +1,30 @@
 """
 Phase 3 - Specialist Agent Layer
 Four PhD-level agents providing expert analysis with forced citation.
+
+The agent modules are imported on first attribute access, so importing one
+agent (``src.agents.financial_agent``) does not import the other three.
 """
 
-from .financial_agent import FinancialEconomist, financial_agent_node
-from .market_agent import MarketEconomist, market_agent_node
-from .operations_agent import OperationsExpert, operations_agent_node
-from .research_agent import ResearchScientist, research_agent_node
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    'FinancialEconomist': 'financial_agent',
+    'financial_agent_node': 'financial_agent',
+    'MarketEconomist': 'market_agent',
+    'market_agent_node': 'market_agent',
+    'OperationsExpert': 'operations_agent',
+    'operations_agent_node': 'operations_agent',
+    'ResearchScientist': 'research_agent',
+    'research_agent_node': 'research_agent',
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    'FinancialEconomist',
-    'financial_agent_node',
-    'MarketEconomist',
-    'market_agent_node',
-    'OperationsExpert',
-    'operations_agent_node',
-    'ResearchScientist',
-    'research_agent_node',
-]
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f"{__name__}.{module}"), name)
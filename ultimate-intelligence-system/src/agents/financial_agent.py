@@ -4,10 +4,11 @@ PhD-level financial analysis with forced data citation.
 """
 from typing import Any, Dict, List
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from src.models.state import IntelligenceState
 from src.config.settings import settings
+from src.utils.chat_models import chat_model
+from src.utils.prompt_caching import cached_system_message
 from src.utils.logging_config import logger
 
 
@@ -20,11 +21,7 @@ class FinancialEconomist:
     """
     
     def __init__(self):
-        self.llm = ChatAnthropic(
-            model=settings.ANALYSIS_MODEL,
-            temperature=settings.ANALYSIS_TEMP,
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+        self.llm = chat_model(settings.ANALYSIS_MODEL, settings.ANALYSIS_TEMP)
         
         # Deep expertise backstory (builds analytical framework)
         self.persona = """You are Dr. Fatima Al-Mansouri, a distinguished financial economist
@@ -224,7 +221,7 @@ Remember: You are analyzing for a CEO who needs actionable intelligence."""
 
         try:
             messages = [
-                SystemMessage(content=system_prompt),
+                cached_system_message(system_prompt),
                 HumanMessage(content=user_prompt)
             ]
             
@@ -4,10 +4,11 @@ GCC market intelligence with competitive analysis.
 """
 from typing import Any, Dict, List, Optional
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from src.models.state import IntelligenceState
 from src.config.settings import settings
+from src.utils.chat_models import chat_model
+from src.utils.prompt_caching import cached_system_message
 from src.utils.logging_config import logger
 
 
@@ -20,11 +21,7 @@ class MarketEconomist:
     """
     
     def __init__(self):
-        self.llm = ChatAnthropic(
-            model=settings.ANALYSIS_MODEL,
-            temperature=settings.ANALYSIS_TEMP,
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+        self.llm = chat_model(settings.ANALYSIS_MODEL, settings.ANALYSIS_TEMP)
         
         self.persona = """You are Dr. Khalid bin Ahmed, Qatar's foremost market economist
 and competitive intelligence strategist. Over two decades you have mapped every major
@@ -214,7 +211,7 @@ Focus on market position, competitive dynamics, and strategic implications."""
 
         try:
             messages = [
-                SystemMessage(content=system_prompt),
+                cached_system_message(system_prompt),
                 HumanMessage(content=user_prompt)
             ]
             
@@ -4,10 +4,11 @@ Execution reality checks and operational feasibility.
 """
 from typing import Any, Dict, List, Optional
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from src.models.state import IntelligenceState
 from src.config.settings import settings
+from src.utils.chat_models import chat_model
+from src.utils.prompt_caching import cached_system_message
 from src.utils.logging_config import logger
 
 
@@ -20,11 +21,7 @@ class OperationsExpert:
     """
     
     def __init__(self):
-        self.llm = ChatAnthropic(
-            model=settings.ANALYSIS_MODEL,
-            temperature=settings.ANALYSIS_TEMP,
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+        self.llm = chat_model(settings.ANALYSIS_MODEL, settings.ANALYSIS_TEMP)
         
         self.persona = """You are Sarah Mitchell, a veteran operations executive with 26 years
 of experience converting ambitious boardroom strategy into executed reality across North
@@ -194,7 +191,7 @@ Focus on: Can we do this? What resources? What risks? How long?"""
 
         try:
             messages = [
-                SystemMessage(content=system_prompt),
+                cached_system_message(system_prompt),
                 HumanMessage(content=user_prompt)
             ]
             
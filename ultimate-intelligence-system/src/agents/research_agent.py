@@ -4,10 +4,11 @@ Academic grounding and evidence-based analysis.
 """
 from typing import Any, Dict, List, Optional
 
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from src.models.state import IntelligenceState
 from src.config.settings import settings
+from src.utils.chat_models import chat_model
+from src.utils.prompt_caching import cached_system_message
 from src.utils.logging_config import logger
 
 
@@ -20,11 +21,7 @@ class ResearchScientist:
     """
     
     def __init__(self):
-        self.llm = ChatAnthropic(
-            model=settings.ANALYSIS_MODEL,
-            temperature=settings.ANALYSIS_TEMP,
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+        self.llm = chat_model(settings.ANALYSIS_MODEL, settings.ANALYSIS_TEMP)
         
         self.persona = """You are Dr. James Chen, an evidence-obsessed research scientist who
 translates academic rigor into practical intelligence for executives. You split your time
@@ -197,7 +194,7 @@ Be the intellectual skeptic who ensures rigor."""
 
         try:
             messages = [
-                SystemMessage(content=system_prompt),
+                cached_system_message(system_prompt),
                 HumanMessage(content=user_prompt)
             ]
             
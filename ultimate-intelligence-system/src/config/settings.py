@@ -18,6 +18,33 @@ class Settings:
     ANALYSIS_TEMP = 0.7      # Creative for analysis
     SYNTHESIS_TEMP = 0.5     # Balanced for synthesis
     
+    # Extraction Configuration
+    EXTRACTION_MODE = "map_reduce"  # "map_reduce" (all chunks) or "single" (first 3000 chars)
+    EXTRACTION_CHUNKS_PER_CALL = 2  # Retrieved chunks per map-step LLM call
+    EXTRACTION_CONCURRENCY = 5      # Map-step LLM calls in flight at once
+    EXTRACTION_CHUNK_CHARS = 3000   # Per-chunk character cap in map-step prompts
+    ADAPTIVE_EXTRACTION = True      # Skip LLM extraction when Python covers a simple query
+    EXTRACTION_SKIP_MIN_CONFIDENCE = 0.9  # Python-layer confidence needed to skip
+    
+    # Prometheus exporter for the Chainlit process (0 = off)
+    METRICS_PORT = int(os.getenv("CHAINLIT_METRICS_PORT", "0"))
+    
+    # LLM Response Cache
+    LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_PATH = "data/cache/llm_response_cache.sqlite3"
+    LLM_CACHE_TTL = 24 * 3600        # seconds
+    LLM_CACHE_MAX_ENTRIES = 5000     # disk tier, least recently used evicted first
+    LLM_CACHE_MEMORY_ENTRIES = 256   # in-process tier
+    LLM_CACHE_SEMANTIC = False       # embedding-similarity tier (needs sentence-transformers)
+    LLM_CACHE_SIMILARITY = 0.97      # cosine similarity for a semantic hit
+    KB_PERSIST_DIRECTORY = os.getenv("KB_PERSIST_DIRECTORY", "D:/udc/data/chromadb")
+    
+    # Final-Answer Cache (whole pipeline skipped on a hit)
+    ANSWER_CACHE_ENABLED = os.getenv("ANSWER_CACHE_ENABLED", "true").lower() == "true"
+    ANSWER_CACHE_PATH = "data/cache/answer_cache.sqlite3"
+    ANSWER_CACHE_SIMILARITY = 0.92   # cosine similarity between questions for a hit
+    ANSWER_CACHE_TTL = 7 * 24 * 3600 # seconds
+    
     # Performance Limits
     MAX_COST_PER_QUERY = 2.00      # dollars
     MAX_TIME_PER_QUERY = 120       # seconds
@@ -21,7 +21,7 @@ class IntelligenceState(TypedDict):
     extracted_facts: Dict[str, Any]         # Structured facts from all sources
     extraction_confidence: float            # 0.0-1.0 confidence in extraction
     extraction_sources: List[str]           # Which sources were used
-    extraction_method: Optional[str]        # Method used: "python" or "llm"
+    extraction_method: Optional[str]        # Method used: "python", "llm" or "map_reduce"
     data_conflicts: List[Dict[str, Any]]    # Any conflicting data found
     data_quality_score: float               # Quality assessment of extracted data
     extraction_timestamp: Optional[datetime]
@@ -5,11 +5,11 @@ Challenges assumptions, identifies weaknesses, and stress-tests conclusions.
 
 from typing import Any, Dict, List, Optional
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.config.settings import settings
 from src.models.state import IntelligenceState
+from src.utils.chat_models import chat_model
 from src.utils.logging_config import logger
 
 class DevilsAdvocate:
@@ -22,11 +22,7 @@ class DevilsAdvocate:
         """
         Allow dependency injection of the LLM so tests can provide a stub.
         """
-        self.llm = llm or ChatAnthropic(
-            model=settings.ANALYSIS_MODEL,
-            temperature=0.7,  # Slightly higher for creative challenge
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+        self.llm = llm or chat_model(settings.ANALYSIS_MODEL, 0.7)  # Slightly higher for creative challenge
     
     async def critique(
         self,
@@ -6,11 +6,11 @@ and generates emergent insights through structured deliberation.
 
 from typing import Any, Dict, List, Optional
 
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from src.config.settings import settings
 from src.models.state import IntelligenceState
+from src.utils.chat_models import chat_model
 from src.utils.logging_config import logger
 
 class MultiAgentDebate:
@@ -23,11 +23,7 @@ class MultiAgentDebate:
         """
         Allow dependency injection of the LLM so tests can provide a stub.
         """
-        self.llm = llm or ChatAnthropic(
-            model=settings.ANALYSIS_MODEL,
-            temperature=0.6,  # Balanced for synthesis
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+        self.llm = llm or chat_model(settings.ANALYSIS_MODEL, 0.6)  # Balanced for synthesis
     
     async def synthesize_perspectives(
         self,
@@ -3,14 +3,27 @@ Data Extraction Node - Phase 2
 Extracts structured facts from raw data using Python + LLM verification.
 This is the ONLY node that sees raw data.
 """
-import re
-from typing import Dict, Any, List
+import asyncio
+import json
+import time
+from typing import Dict, Any, List, Optional, Set, Tuple
 from datetime import datetime
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 from src.models.state import IntelligenceState
 from src.config.settings import settings
+from src.utils.backend_imports import ensure_backend_app
+from src.utils.chat_models import chat_model
 from src.utils.logging_config import logger
+from src.utils.numeric_scanner import canonical_period, labelled_amounts, nearest_period, scan_tokens
+from src.utils.performance import extraction_skip_stats
+
+
+# Metrics a simple lookup query needs, keyed by the terms that ask for them
+INTENT_METRICS = {
+    'revenue': ('revenue', 'sales', 'top line', 'turnover'),
+    'net_profit': ('profit', 'net income', 'earnings', 'bottom line'),
+    'operating_cash_flow': ('cash flow', 'ocf', 'cash from operations'),
+}
 
 
 class DataExtractor:
@@ -21,12 +34,11 @@ class DataExtractor:
     3. Cross-validation (verify consistency)
     """
     
-    def __init__(self):
-        self.llm = ChatAnthropic(
-            model=settings.EXTRACTION_MODEL,
-            temperature=settings.EXTRACTION_TEMP,
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+    def __init__(self, llm: Optional[Any] = None):
+        """
+        Allow dependency injection of the LLM so tests can provide a stub.
+        """
+        self.llm = llm or chat_model(settings.EXTRACTION_MODEL, settings.EXTRACTION_TEMP)
     
     def extract_numeric_data(self, text: str) -> Dict[str, Any]:
         """
@@ -40,97 +52,25 @@ class DataExtractor:
         text = ' '.join(text.split())
 
         extracted = {}
+        tokens = scan_tokens(text)
+        periods = [token for token in tokens if token.kind == 'period']
         
-        # Revenue patterns (handle negatives and billions, with optional sign before currency)
-        revenue_patterns = [
-            r"revenues?\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
-            r"total\s+revenues?\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
-            r"revenue[:\s]+(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?",
-        ]
-        
-        for pattern in revenue_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Extract number and unit (groups are now: number, unit)
-                number = match.group(1).replace(',', '')
-                unit = match.group(2).lower() if len(match.groups()) >= 2 and match.group(2) else 'million'
-
-                # Convert to millions consistently
-                float_value = float(number)
-                if unit in ['bn', 'billion']:
-                    float_value *= 1000  # Convert billions to millions
-
-                extracted['revenue'] = {
-                    'value': float_value,
-                    'unit': 'QR millions',
-                    'source': 'python_extraction',
-                    'confidence': 0.95,
-                    'raw_text': match.group(0)
-                }
-                break
-        
-        # Profit patterns (handle negatives and billions)
-        profit_patterns = [
-            r"net\s+profit\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
-            r"profit\s+(?:of\s+)?(?:QR|QAR|\$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)",
-        ]
-
-        for pattern in profit_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Extract number and unit
-                number = match.group(1).replace(',', '')
-                unit = match.group(2).lower() if len(match.groups()) >= 2 and match.group(2) else 'million'
-
-                # Convert to millions consistently
-                float_value = float(number)
-                if unit in ['bn', 'billion']:
-                    float_value *= 1000  # Convert billions to millions
-
-                extracted['net_profit'] = {
-                    'value': float_value,
-                    'unit': 'QR millions',
-                    'source': 'python_extraction',
-                    'confidence': 0.95,
-                    'raw_text': match.group(0)
-                }
-                break
-        
-        # Cash flow patterns (handles both "-QR 460" and "QR -460" and billions)
-        cash_flow_patterns = [
-            r"operating cash flow[:\s]+(-)?(?:QR|QAR|$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?",
-            r"cash flow from operations[:\s]+(-)?(?:QR|QAR|$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?",
-            r"OCF[:\s]+(-)?(?:QR|QAR|$)?\s*([-+]?[\d,\.]+)\s*(million|m|bn|billion)?"
-        ]
-        
-        for pattern in cash_flow_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                # Handle both "-QR 460" (group 1 is -, group 2 is number) 
-                # and "QR -460" (group 1 is None, group 2 is -number)
-                prefix_minus = match.group(1) if match.group(1) else ''
-                number = match.group(2).replace(',', '')
-                unit = match.group(3).lower() if match.group(3) else 'million'
-                
-                # If there's a prefix minus, apply it
-                if prefix_minus and not number.startswith('-'):
-                    value = '-' + number
-                else:
-                    value = number
-                
-                # Convert to millions consistently
-                float_value = float(value)
-                if unit in ['bn', 'billion']:
-                    float_value *= 1000  # Convert billions to millions
-                    
-                extracted['operating_cash_flow'] = {
-                    'value': float_value,
-                    'unit': 'QR millions',
-                    'source': 'python_extraction',
-                    'confidence': 0.95,
-                    'raw_text': match.group(0)
-                }
-                break
+        # One scanner pass pairs each metric label with the figure that follows it
+        # (handles "-QR 460" and "QR -460", billions, thousands); first mention wins
+        for pair in labelled_amounts(text, tokens):
+            if pair['metric'] in extracted:
+                continue
+            extracted[pair['metric']] = {
+                'value': pair['value'],
+                'unit': 'QR millions',
+                'source': 'python_extraction',
+                'confidence': 0.95,
+                'raw_text': pair['raw_text']
+            }
+            # Same period attribution as the ingest-time fact index
+            period = nearest_period(periods, pair['offset'], pair['end'])
+            if period:
+                extracted[pair['metric']]['fiscal_period'] = period
         
         logger.info(f"Python extraction found {len(extracted)} metrics")
         return extracted
@@ -142,6 +82,112 @@ class DataExtractor:
         """
         logger.info("Layer 2: LLM extraction with verification")
         
+        try:
+            response = await self.llm.ainvoke(self._build_llm_messages(text[:3000], query))
+            extracted = self._parse_llm_response(response.content)
+            
+            logger.info(f"LLM extraction found {len(extracted)} metrics")
+            return extracted
+            
+        except Exception as e:
+            logger.error(f"LLM extraction failed: {e}")
+            return {}
+    
+    async def extract_with_llm_map_reduce(
+        self,
+        chunks: List[Dict[str, Any]],
+        query: str
+    ) -> Dict[str, Any]:
+        """
+        Layer 2 (map-reduce): extract from every retrieved chunk concurrently.
+        
+        Map: each group of EXTRACTION_CHUNKS_PER_CALL chunks gets its own LLM call,
+        at most EXTRACTION_CONCURRENCY in flight at once.
+        Reduce: per-chunk results are merged with source attribution per fact.
+        """
+        groups = [
+            chunks[i:i + settings.EXTRACTION_CHUNKS_PER_CALL]
+            for i in range(0, len(chunks), settings.EXTRACTION_CHUNKS_PER_CALL)
+        ]
+        logger.info(
+            f"Layer 2: Map-reduce LLM extraction over {len(chunks)} chunks "
+            f"({len(groups)} calls, concurrency={settings.EXTRACTION_CONCURRENCY})"
+        )
+        
+        semaphore = asyncio.Semaphore(settings.EXTRACTION_CONCURRENCY)
+        
+        async def _extract_group(group: List[Dict[str, Any]]) -> Tuple[List[str], Dict[str, Any]]:
+            citations = [chunk.get('citation', 'Unknown source') for chunk in group]
+            text = "\n\n".join(
+                f"[Source: {citation}]\n{chunk.get('content', '')[:settings.EXTRACTION_CHUNK_CHARS]}"
+                for citation, chunk in zip(citations, group)
+            )
+            async with semaphore:
+                try:
+                    response = await self.llm.ainvoke(self._build_llm_messages(text, query))
+                    return citations, self._parse_llm_response(response.content)
+                except Exception as e:
+                    logger.error(f"LLM extraction failed for {citations}: {e}")
+                    return citations, {}
+        
+        chunk_results = await asyncio.gather(*[_extract_group(group) for group in groups])
+        merged = self.merge_chunk_extractions(chunk_results)
+        
+        logger.info(f"Map-reduce extraction found {len(merged)} metrics")
+        return merged
+    
+    def merge_chunk_extractions(
+        self,
+        chunk_results: List[Tuple[List[str], Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """
+        Reduce per-chunk extractions into one fact per metric.
+        
+        The highest-confidence value wins; every chunk that agrees with it
+        (within 1%) is listed in 'sources', disagreeing values are kept in
+        'alternative_values' so conflicts stay visible downstream.
+        """
+        candidates: Dict[str, List[Dict[str, Any]]] = {}
+        
+        for citations, extracted in chunk_results:
+            for metric, data in extracted.items():
+                if not isinstance(data, dict) or not isinstance(data.get('value'), (int, float)):
+                    continue
+                candidate = dict(data)
+                # Prefer the citation the LLM attributed, fall back to the chunk group
+                source = candidate.get('source_citation')
+                candidate['source_citation'] = source if source in citations else "; ".join(citations)
+                candidates.setdefault(metric, []).append(candidate)
+        
+        merged = {}
+        for metric, options in candidates.items():
+            best = max(options, key=lambda c: c.get('confidence') or 0.0)
+            fact = dict(best)
+            fact['sources'] = []
+            fact['alternative_values'] = []
+            
+            for option in options:
+                denominator = max(abs(best['value']), abs(option['value']), 1e-9)
+                if abs(best['value'] - option['value']) / denominator < 0.01:
+                    if option['source_citation'] not in fact['sources']:
+                        fact['sources'].append(option['source_citation'])
+                else:
+                    fact['alternative_values'].append({
+                        'value': option['value'],
+                        'source_citation': option['source_citation']
+                    })
+            
+            if fact['alternative_values']:
+                logger.warning(
+                    f"Chunks disagree on {metric}: {best['value']} vs "
+                    f"{[alt['value'] for alt in fact['alternative_values']]}"
+                )
+            merged[metric] = fact
+        
+        return merged
+    
+    def _build_llm_messages(self, text: str, query: str) -> list:
+        """Build the strict extraction prompt for one block of text"""
         system_prompt = """You are a precise data extraction specialist.
 
 CRITICAL RULES:
@@ -150,6 +196,7 @@ CRITICAL RULES:
 3. If a number is not in the text, return null for that field
 4. Always include the exact quote from the text as proof
 5. Format numbers consistently (use millions as base unit)
+6. If the text is labelled with [Source: ...], copy that label into source_citation
 
 Output format (JSON):
 {
@@ -158,12 +205,14 @@ Output format (JSON):
     "unit": "QR millions",
     "quote": "exact text from source",
     "confidence": <0.0-1.0>,
-    "fiscal_period": "FY24" or "Q3-24" etc
+    "fiscal_period": "FY24" or "Q3-24" etc,
+    "source_citation": "label from [Source: ...]"
   }
 }
 
 Example:
-Text: "Revenue for FY24 was QR 1,032.1 million"
+Text: "[Source: UDC Annual Report 2024, p.12]
+Revenue for FY24 was QR 1,032.1 million"
 Output:
 {
   "revenue": {
@@ -171,7 +220,8 @@ Output:
     "unit": "QR millions",
     "quote": "Revenue for FY24 was QR 1,032.1 million",
     "confidence": 1.0,
-    "fiscal_period": "FY24"
+    "fiscal_period": "FY24",
+    "source_citation": "UDC Annual Report 2024, p.12"
   }
 }
 
@@ -180,44 +230,78 @@ NEVER fabricate numbers. If not in text, use null."""
         user_prompt = f"""Query: {query}
 
 Text to extract from:
-{text[:3000]}
+{text}
 
 Extract all financial metrics (revenue, profit, cash flow, assets, liabilities, etc.) in JSON format.
 Remember: ONLY extract what is explicitly stated. Use null for missing data."""
 
-        try:
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            
-            response = await self.llm.ainvoke(messages)
-            
-            # Parse JSON response
-            import json
-            response_text = response.content
-            
-            # Extract JSON from response (might be wrapped in markdown)
-            if "```json" in response_text:
-                json_text = response_text.split("```json")[1].split("```")[0]
-            elif "```" in response_text:
-                json_text = response_text.split("```")[1].split("```")[0]
-            else:
-                json_text = response_text
-            
-            extracted = json.loads(json_text.strip())
-            
-            # Add source metadata
-            for metric, data in extracted.items():
-                if data and isinstance(data, dict):
-                    data['source'] = 'llm_extraction'
-            
-            logger.info(f"LLM extraction found {len(extracted)} metrics")
-            return extracted
-            
-        except Exception as e:
-            logger.error(f"LLM extraction failed: {e}")
-            return {}
+        return [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt)
+        ]
+    
+    def _parse_llm_response(self, response_text: str) -> Dict[str, Any]:
+        """Parse the JSON object returned by the LLM and tag its source"""
+        # Extract JSON from response (might be wrapped in markdown)
+        if "```json" in response_text:
+            json_text = response_text.split("```json")[1].split("```")[0]
+        elif "```" in response_text:
+            json_text = response_text.split("```")[1].split("```")[0]
+        else:
+            json_text = response_text
+        
+        extracted = json.loads(json_text.strip())
+        
+        # Add source metadata
+        for metric, data in extracted.items():
+            if data and isinstance(data, dict):
+                data['source'] = 'llm_extraction'
+        
+        return extracted
+    
+    def required_metrics(self, query: str, complexity: str) -> List[str]:
+        """
+        Map a classified query to the metrics it needs.
+        Only simple lookups have a closed set; anything broader returns [].
+        """
+        if complexity != "simple":
+            return []
+        
+        query_lower = query.lower()
+        return [
+            metric for metric, terms in INTENT_METRICS.items()
+            if any(term in query_lower for term in terms)
+        ]
+    
+    def requested_periods(self, query: str) -> Set[str]:
+        """Fiscal periods named in the query, in canonical_period() form"""
+        return {canonical_period(token.text) for token in scan_tokens(query, {'period'})}
+    
+    def python_covers(
+        self,
+        python_extracted: Dict[str, Any],
+        required: List[str],
+        periods: Optional[Set[str]] = None
+    ) -> bool:
+        """
+        True when Layer 1 found every required metric with high confidence.
+        When the query names a period, each fact must be for that period:
+        an FY23 revenue figure does not answer "revenue in FY24".
+        """
+        if not required:
+            return False
+        if periods and len(periods) > 1:
+            return False  # One fact per metric cannot cover a comparison
+        for metric in required:
+            fact = python_extracted.get(metric)
+            if not fact or fact.get('confidence', 0.0) < settings.EXTRACTION_SKIP_MIN_CONFIDENCE:
+                return False
+            if periods and (
+                not fact.get('fiscal_period')
+                or canonical_period(fact['fiscal_period']) not in periods
+            ):
+                return False
+        return True
     
     def cross_validate(
         self,
@@ -268,6 +352,11 @@ Remember: ONLY extract what is explicitly stated. Use null for missing data."""
                             'resolution': 'used_python'
                         })
                         logger.warning(f"Conflict in {metric}: Python={py_value}, LLM={llm_value}")
+                    
+                    # Keep the LLM's per-chunk source attribution
+                    for key in ('fiscal_period', 'source_citation', 'sources'):
+                        if key in llm_data and key not in validated[metric]:
+                            validated[metric][key] = llm_data[key]
                 elif py_value is not None:
                     # Only Python has value
                     validated[metric] = python_data
@@ -309,21 +398,20 @@ async def data_extraction_node(state: IntelligenceState) -> IntelligenceState:
     logger.info("DATA EXTRACTION NODE: Starting extraction process")
     
     query = state["query"]
+    search_results: List[Dict[str, Any]] = []
+    indexed_facts: Dict[str, Any] = {}
+    
+    # Initialize extractor
+    extractor = DataExtractor()
+    periods = extractor.requested_periods(query)
     
     # FIXED: Connect to actual knowledge base instead of using fake data
     try:
-        import sys
-        from pathlib import Path
-        # From extract.py: ultimate-intelligence-system/src/nodes/extract.py
-        # Go up 4 levels to reach d:\udc, then add backend
-        backend_path = Path(__file__).parents[3] / "backend"
-        if str(backend_path) not in sys.path:
-            sys.path.insert(0, str(backend_path))
-        
+        ensure_backend_app()
         from app.services.knowledge_base_complete import UDCCompleteKnowledgeBase
         
         logger.info("Connecting to knowledge base...")
-        kb = UDCCompleteKnowledgeBase()
+        kb = UDCCompleteKnowledgeBase(persist_directory=settings.KB_PERSIST_DIRECTORY)
         
         # Search for relevant documents
         logger.info(f"Searching for: {query}")
@@ -340,20 +428,46 @@ async def data_extraction_node(state: IntelligenceState) -> IntelligenceState:
                 for r in search_results
             ])
             logger.info(f"Retrieved {len(sample_data)} characters of context")
+            
+            # Facts precomputed at ingestion for the retrieved chunks (of the query's period, if any)
+            indexed_facts = kb.get_chunk_facts([r['id'] for r in search_results], periods)
+            logger.info(f"Fact index returned {len(indexed_facts)} metrics")
     
     except Exception as e:
         logger.error(f"Failed to connect to knowledge base: {e}")
         logger.warning("Falling back to empty extraction")
         sample_data = f"Error accessing knowledge base: {e}"
     
-    # Initialize extractor
-    extractor = DataExtractor()
-    
-    # Layer 1: Python extraction
-    python_extracted = extractor.extract_numeric_data(sample_data)
+    # Layer 1: Python extraction (a fact-index lookup when chunks were indexed at ingestion)
+    if indexed_facts:
+        python_extracted = indexed_facts
+    else:
+        python_extracted = extractor.extract_numeric_data(sample_data)
     
-    # Layer 2: LLM extraction
-    llm_extracted = await extractor.extract_with_llm(sample_data, query)
+    # Layer 2: LLM extraction, skipped when Layer 1 already answers a simple lookup
+    required = extractor.required_metrics(query, state.get("complexity", "medium"))
+    if settings.ADAPTIVE_EXTRACTION and extractor.python_covers(python_extracted, required, periods):
+        llm_extracted = {}
+        state["extraction_method"] = "python"
+        extraction_skip_stats.record_skip()
+        logger.info(
+            f"Skipping LLM extraction: Python layer covers {required} "
+            f"(skip rate {extraction_skip_stats.skip_rate:.0%}, "
+            f"~{extraction_skip_stats.saved_seconds:.1f}s saved so far)"
+        )
+        state["reasoning_chain"].append(
+            f"⚡ Deterministic extraction covered {', '.join(required)} - LLM extraction skipped"
+        )
+    else:
+        llm_start = time.perf_counter()
+        # Map-reduce covers every retrieved chunk
+        if settings.EXTRACTION_MODE == "map_reduce" and search_results:
+            llm_extracted = await extractor.extract_with_llm_map_reduce(search_results, query)
+            state["extraction_method"] = "map_reduce"
+        else:
+            llm_extracted = await extractor.extract_with_llm(sample_data, query)
+            state["extraction_method"] = "llm"
+        extraction_skip_stats.record_llm(time.perf_counter() - llm_start)
     
     # Layer 3: Cross-validation
     validation_result = extractor.cross_validate(python_extracted, llm_extracted)
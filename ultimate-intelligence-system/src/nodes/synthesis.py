@@ -3,11 +3,12 @@ Synthesis Node - Phase 2
 Creates final intelligence output using ONLY extracted facts.
 This demonstrates the forced data usage mechanism.
 """
-from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, SystemMessage
 from src.models.state import IntelligenceState
 from src.config.settings import settings
+from src.utils.chat_models import chat_model
 from src.utils.logging_config import logger
+from src.utils.streaming import NodeTokenStreamer
 
 
 class IntelligenceSynthesizer:
@@ -17,11 +18,19 @@ class IntelligenceSynthesizer:
     """
     
     def __init__(self):
-        self.llm = ChatAnthropic(
-            model=settings.SYNTHESIS_MODEL,
-            temperature=settings.SYNTHESIS_TEMP,
-            api_key=settings.ANTHROPIC_API_KEY
-        )
+        self.llm = chat_model(settings.SYNTHESIS_MODEL, settings.SYNTHESIS_TEMP, streaming=True)  # Tokens reach the UI as they are generated
+    
+    async def _generate(self, messages: list) -> str:
+        """
+        Run the synthesis call, streaming tokens to the graph's custom stream.
+        
+        ainvoke on a streaming model still checks the response cache first
+        (astream would bypass it); on a miss it streams via the Messages API
+        and the streamer forwards each token.
+        """
+        streamer = NodeTokenStreamer("synthesis")
+        response = await self.llm.ainvoke(messages, config={"callbacks": [streamer]})
+        return str(response.content)
     
     def format_extracted_facts(self, facts: dict) -> str:
         """Format extracted facts for the LLM prompt"""
@@ -94,8 +103,7 @@ Provide CEO-ready strategic intelligence following the citation rules strictly."
                 HumanMessage(content=user_prompt)
             ]
             
-            response = await self.llm.ainvoke(messages)
-            synthesis_text = response.content
+            synthesis_text = await self._generate(messages)
             
             # Extract key insights (simple parsing)
             key_insights = self._extract_insights(synthesis_text)
@@ -259,8 +267,7 @@ Create the final CEO-ready intelligence report."""
                 HumanMessage(content=user_prompt)
             ]
             
-            response = await self.llm.ainvoke(messages)
-            synthesis_text = str(response.content)
+            synthesis_text = await self._generate(messages)
             
             # Extract elements
             key_insights = self._extract_insights(synthesis_text)
@@ -7,8 +7,15 @@ Detects fabrication and calculates confidence scores.
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.models.state import IntelligenceState
 from src.utils.logging_config import logger
+from src.utils.numeric_scanner import scan
+
+# Relative tolerance for a claim to match a fact (rounding in prose)
+MATCH_TOLERANCE = 0.01
+
 
 class FactVerifier:
     """
@@ -37,13 +44,20 @@ class FactVerifier:
         results = {}
         all_fabrications = []
         
-        for agent_name, analysis in analyses.items():
-            if not analysis:
-                continue
-            
-            # Extract all numbers from analysis
-            numbers_in_analysis = self._extract_numbers(analysis)
-            
+        # Extract all numbers from every analysis, then match them in one vectorized pass
+        numbers_by_agent = {
+            agent_name: self._extract_numbers(analysis)
+            for agent_name, analysis in analyses.items()
+            if analysis
+        }
+        fact_values, _ = self._index_facts(extracted_facts)
+        claims = np.array(
+            [info['value'] for numbers in numbers_by_agent.values() for info in numbers],
+            dtype=float
+        )
+        claim_matches = iter(self._match_claims(claims, fact_values))
+        
+        for agent_name, numbers_in_analysis in numbers_by_agent.items():
             # Check each number
             verified_count = 0
             fabrication_count = 0
@@ -53,7 +67,7 @@ class FactVerifier:
                 context = number_info['context']
                 
                 # Check if this number exists in extracted facts
-                is_verified, fact_source = self._verify_number(number_value, extracted_facts)
+                is_verified = next(claim_matches) >= 0
                 
                 # Check if cited properly
                 has_citation = self._has_citation(context)
@@ -118,57 +132,35 @@ class FactVerifier:
         """
         numbers = []
         
-        # Pattern handles optional sign/currency before or after the number (e.g. -QR 460.5m, $2.5B)
-        pattern = (
-            r'(?P<full>'
-            r'(?:(?P<sign1>[-+])\s*)?'
-            r'(?:(?P<currency_prefix>QR|USD|\$)\s*)?'
-            r'(?:(?P<sign2>[-+])\s*)?'
-            r'(?P<number>[\d][\d,]*\.?\d*)'
-            r'(?:\s*(?P<unit>million|billion|m|bn|B|M))'
-            r'(?:\s*(?P<currency_suffix>QR|USD|\$))?'
-            r')'
-        )
-        
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            number_str = match.group('full').strip()
-            groups = match.groupdict()
-            sign = '-' if (groups.get('sign1') == '-' or groups.get('sign2') == '-') else ''
-            numeric_component = groups.get('number') or ''
-            
-            try:
-                clean_number = numeric_component.replace(',', '')
-                number_value = float(f"{sign}{clean_number}")
-            except (TypeError, ValueError):
+        # Scanner amounts carry sign/currency before or after the number (e.g. -QR 460.5m, $2.5B)
+        for token in scan(text):
+            if token.kind != 'amount' or not token.unit:
                 continue
             
             # Skip small numbers (< 10) - typically ratios/percentages
-            if abs(number_value) < 10:
+            if abs(token.value) < 10:
                 continue
             
-            start = max(0, match.start() - 80)
-            end = min(len(text), match.end() + 80)
+            start = max(0, token.start - 80)
+            end = min(len(text), token.end + 80)
             context = text[start:end]
             
             numbers.append({
-                'value': number_value,
-                'original': number_str,
+                'value': token.value,
+                'original': token.text,
                 'context': context
             })
         
         return numbers
     
-    def _verify_number(
-        self, 
-        number: float, 
-        extracted_facts: Dict[str, Any]
-    ) -> Tuple[bool, Optional[str]]:
+    def _index_facts(self, extracted_facts: Dict[str, Any]) -> Tuple[np.ndarray, List[str]]:
         """
-        Check if a number exists in extracted facts.
+        Normalize fact values once into a sorted array.
         
         Returns:
-            (is_verified: bool, source: str)
+            (values sorted ascending, metric name for each value)
         """
+        entries = []
         for metric, data in extracted_facts.items():
             if isinstance(data, dict) and 'value' in data:
                 fact_value = data['value']
@@ -179,15 +171,57 @@ class FactVerifier:
                         continue
                 elif not isinstance(fact_value, (int, float)):
                     continue
-                
-                fact_value = float(fact_value)
-                
-                # Check if numbers match (with 1% tolerance for rounding)
-                denominator = max(abs(fact_value), abs(number), 1.0)
-                if abs(fact_value - number) / denominator < 0.01:
-                    return (True, metric)
+                entries.append((float(fact_value), metric))
         
-        return (False, None)
+        entries.sort(key=lambda entry: entry[0])
+        values = np.array([value for value, _ in entries], dtype=float)
+        return values, [metric for _, metric in entries]
+    
+    def _match_claims(self, claims: np.ndarray, fact_values: np.ndarray) -> np.ndarray:
+        """
+        Match every claim against the sorted fact values in one vectorized pass.
+        
+        A fact matches when |fact - claim| / max(|fact|, |claim|, 1) < 1%. For a
+        given claim the matching facts form one contiguous interval around it,
+        so only the two sorted neighbours found by binary search need checking.
+        
+        Returns:
+            Index into fact_values of the matching fact per claim, or -1
+        """
+        if len(claims) == 0 or len(fact_values) == 0:
+            return np.full(len(claims), -1, dtype=int)
+        
+        insert_at = np.searchsorted(fact_values, claims)
+        last = len(fact_values) - 1
+        left = np.clip(insert_at - 1, 0, last)
+        right = np.clip(insert_at, 0, last)
+        
+        def distance(candidates: np.ndarray) -> np.ndarray:
+            facts = fact_values[candidates]
+            denominator = np.maximum(np.maximum(np.abs(facts), np.abs(claims)), 1.0)
+            return np.abs(facts - claims) / denominator
+        
+        left_distance, right_distance = distance(left), distance(right)
+        best = np.where(left_distance <= right_distance, left, right)
+        best_distance = np.minimum(left_distance, right_distance)
+        return np.where(best_distance < MATCH_TOLERANCE, best, -1)
+    
+    def _verify_number(
+        self, 
+        number: float, 
+        extracted_facts: Dict[str, Any]
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Check if a number exists in extracted facts.
+        
+        Returns:
+            (is_verified: bool, source: str)
+        """
+        fact_values, fact_metrics = self._index_facts(extracted_facts)
+        match = self._match_claims(np.array([number], dtype=float), fact_values)[0]
+        if match < 0:
+            return (False, None)
+        return (True, fact_metrics[match])
     
     def _has_citation(self, context: str) -> bool:
         """
@@ -0,0 +1,144 @@
+"""
+Final-Answer Cache - Phase 5
+Serves a complete answer for questions that are near-duplicates of one
+already answered against the same knowledge-base data version, skipping
+extraction, the agents, debate and synthesis entirely.
+
+Storage and matching live in the backend's AnswerCache so the UIS pipeline
+and the backend councils share one cache file format. Identical questions
+asked while the first is still running share that run (backend
+SingleFlight), since the cache only has the answer once it finishes.
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from src.utils.backend_imports import ensure_backend_app
+
+ensure_backend_app()
+
+from app.services.answer_cache import AnswerCache  # noqa: E402
+from app.services.single_flight import single_flight  # noqa: E402
+
+from src.config.settings import settings  # noqa: E402
+from src.utils.llm_cache import kb_data_version  # noqa: E402
+from src.utils.logging_config import logger  # noqa: E402
+
+NAMESPACE = "uis"
+
+# State fields that make up a final answer (what the UI and reports render)
+ANSWER_FIELDS = (
+    "complexity",
+    "extracted_facts",
+    "extraction_sources",
+    "final_synthesis",
+    "confidence_score",
+    "synthesis_quality",
+    "verification_confidence",
+    "key_insights",
+    "recommendations",
+    "alternative_scenarios",
+)
+
+
+def _build_answer_cache() -> Optional[AnswerCache]:
+    if not settings.ANSWER_CACHE_ENABLED:
+        return None
+    return AnswerCache(
+        db_path=Path(settings.ANSWER_CACHE_PATH),
+        similarity_threshold=settings.ANSWER_CACHE_SIMILARITY,
+        ttl_seconds=settings.ANSWER_CACHE_TTL
+    )
+
+
+def lookup_answer(
+    query: str,
+    cache: Optional[AnswerCache] = None,
+    data_version: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Cached final answer for a query at the current knowledge-base version.
+
+    Returns:
+        State fields from ANSWER_FIELDS plus 'answer_cache' metadata, or None
+    """
+    cache = cache or answer_cache
+    if cache is None:
+        return None
+    if data_version is None:
+        data_version = kb_data_version()
+
+    try:
+        hit = cache.get(NAMESPACE, query, data_version)
+    except Exception as e:
+        logger.warning(f"Answer cache lookup failed: {e}")
+        return None
+    if hit is None:
+        return None
+
+    logger.info(
+        f"Answer cache hit (similarity {hit['cache']['similarity']:.2f}) "
+        f"for: {hit['cache']['matched_question']}"
+    )
+    return {**hit["payload"], "answer_cache": hit["cache"]}
+
+
+def store_answer(
+    query: str,
+    result: Dict[str, Any],
+    cache: Optional[AnswerCache] = None,
+    data_version: Optional[str] = None
+) -> None:
+    """Store the final answer fields of a completed pipeline run."""
+    cache = cache or answer_cache
+    if cache is None or not result.get("final_synthesis") or result.get("errors"):
+        return
+    if data_version is None:
+        data_version = kb_data_version()
+
+    try:
+        cache.put(NAMESPACE, query, data_version, {field: result.get(field) for field in ANSWER_FIELDS})
+    except Exception as e:
+        logger.warning(f"Answer cache store failed: {e}")
+
+
+async def run_once(
+    query: str,
+    run: Callable[[], Awaitable[Dict[str, Any]]],
+    variant: str = "",
+    data_version: Optional[str] = None,
+    on_join: Optional[Callable[[], Awaitable[None]]] = None
+) -> Dict[str, Any]:
+    """
+    Run the pipeline once for concurrent identical queries.
+
+    Args:
+        query: User query
+        run: Coroutine function running the full pipeline
+        variant: Pipeline options that change the answer (graph shape)
+        data_version: Knowledge-base version (looked up if omitted)
+        on_join: Awaited when the query joins a run already in progress
+
+    Returns:
+        Final state of the shared run (a copy for joining callers)
+    """
+    if data_version is None:
+        data_version = kb_data_version()
+    return await single_flight.do(NAMESPACE, query, f"{data_version}|{variant}", run, on_join=on_join)
+
+
+def apply_cached_answer(state: Dict[str, Any], cached: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge a cached answer into a fresh initial state."""
+    result = {**state, **cached}
+    result["cached_data_used"] = True
+    result["nodes_executed"] = ["answer_cache"]
+    result["reasoning_chain"] = [
+        f"Answered from cache: matched '{cached['answer_cache']['matched_question']}' "
+        f"(similarity {cached['answer_cache']['similarity']:.2f})"
+    ]
+    result["execution_end"] = datetime.now()
+    return result
+
+
+# Global instance (None when disabled)
+answer_cache = _build_answer_cache()
@@ -0,0 +1,50 @@
+"""
+Backend Imports - Phase 5
+The UIS reuses backend services (app.services.*, app.core.metrics). It
+imports them the way the API process does, as the top-level ``app``
+package with backend/ on sys.path, so both share one copy of each module.
+
+The repository root has its own app.py (the Chainlit UI). When the root
+comes first on sys.path, ``import app`` finds that file instead and the
+backend imports fail with "'app' is not a package". Every shim goes
+through ensure_backend_app(), which checks for this before importing.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Optional
+
+# ultimate-intelligence-system/src/utils -> repository root -> backend
+BACKEND_PATH = Path(__file__).parents[3] / "backend"
+BACKEND_APP_PATH = BACKEND_PATH / "app"
+
+
+def _is_backend_package(locations: Optional[Iterable[str]]) -> bool:
+    return any(Path(location).resolve() == BACKEND_APP_PATH.resolve() for location in locations or ())
+
+
+def ensure_backend_app() -> None:
+    """
+    Put backend/ on sys.path (once) and check that ``app`` is the backend package.
+
+    Raises:
+        ImportError: ``app`` is (or would be imported as) another module,
+            such as the repository root's Chainlit app.py
+    """
+    if str(BACKEND_PATH) not in sys.path:
+        sys.path.insert(0, str(BACKEND_PATH))
+
+    loaded: Optional[ModuleType] = sys.modules.get("app")
+    if loaded is not None:
+        locations, origin = getattr(loaded, "__path__", None), getattr(loaded, "__file__", None)
+    else:
+        # Resolve without importing, so a wrong match never runs its module code
+        spec = importlib.util.find_spec("app")
+        locations = spec.submodule_search_locations if spec else None
+        origin = spec.origin if spec else None
+    if not _is_backend_package(locations):
+        raise ImportError(
+            f"'app' resolves to {origin}, not the backend package in {BACKEND_APP_PATH}; "
+            f"put {BACKEND_PATH} before the repository root on sys.path"
+        )
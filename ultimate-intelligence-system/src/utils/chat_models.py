@@ -0,0 +1,48 @@
+"""
+Shared Chat Models - Phase 5
+One governed, cached, tracked model instance per (model, temperature,
+streaming) configuration.
+
+Agents and nodes used to build a new ChatAnthropic in every constructor.
+run_agents_parallel and each graph node construct their agent per query, so
+every query rebuilt its clients. The instances are stateless, so they are
+shared, and their SDK clients use the backend's pooled connections (see
+GovernedChatAnthropic).
+
+The model classes and the response cache are imported on the first call,
+so agent and node modules import without langchain_anthropic.
+"""
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from src.config.settings import settings
+from src.utils.llm_tracking import llm_call_tracker
+
+if TYPE_CHECKING:
+    from src.utils.governed_chat import GovernedChatAnthropic
+
+
+@lru_cache(maxsize=None)
+def chat_model(model: str, temperature: float, streaming: bool = False) -> "GovernedChatAnthropic":
+    """
+    Shared model for one configuration.
+
+    Args:
+        model: Anthropic model name
+        temperature: Sampling temperature
+        streaming: Stream tokens on ainvoke (for nodes that forward tokens to the UI)
+
+    Returns:
+        GovernedChatAnthropic with the response cache and call tracker attached
+    """
+    from src.utils.governed_chat import GovernedChatAnthropic
+    from src.utils.llm_cache import llm_response_cache
+
+    return GovernedChatAnthropic(
+        model=model,
+        temperature=temperature,
+        api_key=settings.ANTHROPIC_API_KEY,
+        callbacks=[llm_call_tracker],
+        cache=llm_response_cache,
+        streaming=streaming
+    )
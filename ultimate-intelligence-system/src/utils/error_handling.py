@@ -7,6 +7,8 @@ import inspect
 from datetime import datetime
 from typing import Any, Callable, Optional
 
+from src.utils.llm_governor import backoff_delay, current_agent
+from src.utils.llm_tracking import LLMBudgetExceeded
 from src.utils.logging_config import logger
 
 
@@ -28,6 +30,10 @@ class ErrorHandler:
         """
         Execute a function with retry logic.
         
+        Retries back off exponentially with jitter, or wait for the
+        provider's Retry-After when the error carries one. Exhausted query
+        budgets are not retried.
+        
         Args:
             func: Async function to execute
             node_name: Name of the node (for logging)
@@ -36,6 +42,20 @@ class ErrorHandler:
         Returns:
             Function result or error dict if all retries fail
         """
+        # LLM calls made by the node are labelled with it in the metrics
+        agent = current_agent.set(node_name)
+        try:
+            return await self._execute_with_retry(func, *args, node_name=node_name, **kwargs)
+        finally:
+            current_agent.reset(agent)
+    
+    async def _execute_with_retry(
+        self,
+        func: Callable,
+        *args,
+        node_name: str,
+        **kwargs
+    ) -> Any:
         last_exception: Optional[Exception] = None
         for attempt in range(self.max_retries):
             try:
@@ -53,7 +73,13 @@ class ErrorHandler:
                     f"⏱️ {node_name} timed out on attempt {attempt_index}/{self.max_retries}"
                 )
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(backoff_delay(exc, attempt))
+            
+            except LLMBudgetExceeded as exc:
+                # Retrying cannot succeed until the next query
+                last_exception = exc
+                logger.error(f"❌ {node_name} stopped: {exc}")
+                break
             
             except Exception as exc:
                 last_exception = exc
@@ -62,7 +88,7 @@ class ErrorHandler:
                     f"❌ {node_name} failed on attempt {attempt_index}/{self.max_retries}: {exc}"
                 )
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(2 ** attempt)
+                    await asyncio.sleep(backoff_delay(exc, attempt))
         
         # All retries failed - return error dict
         logger.error(f"💀 {node_name} failed after {self.max_retries} attempts")
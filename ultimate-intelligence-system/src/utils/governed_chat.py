@@ -0,0 +1,91 @@
+"""
+Governed Chat Model - Phase 5
+ChatAnthropic whose requests wait for a slot of the backend's process-wide
+LLMGovernor (see src.utils.llm_governor) and go out over the shared,
+keep-alive connection pools (app.services.llm_clients).
+
+Kept apart from llm_governor because langchain_anthropic takes seconds to
+import: modules that only need the governor's context variables (the UI,
+the CLI, error handling) do not pay for it. chat_models imports this
+module when it builds its first model.
+
+The governor retries the requests, so it also reports each retry to the
+run's callbacks (on_retry), as LangChain does for its own retries.
+"""
+from functools import cached_property
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
+
+from langchain_anthropic import ChatAnthropic
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from tenacity import RetryCallState
+
+from src.utils.llm_governor import estimate_tokens, llm_clients, llm_governor
+
+__all__ = ["GovernedChatAnthropic"]
+
+
+def _retry_reporter(
+    run_manager: Optional[AsyncCallbackManagerForLLMRun]
+) -> Optional[Callable[[BaseException, int], Awaitable[None]]]:
+    """Governor on_retry hook that fires the run's LangChain on_retry callbacks"""
+    if run_manager is None:
+        return None
+
+    async def on_retry(error: BaseException, attempt: int) -> None:
+        state = RetryCallState(retry_object=None, fn=None, args=(), kwargs={})
+        state.attempt_number = attempt
+        state.set_exception((type(error), error, error.__traceback__))
+        await run_manager.on_retry(state)
+
+    return on_retry
+
+
+class GovernedChatAnthropic(ChatAnthropic):
+    """ChatAnthropic whose requests wait for a governor slot."""
+
+    max_retries: int = 0
+
+    @cached_property
+    def _client(self) -> Any:
+        if self.anthropic_proxy:
+            return super()._client
+        return llm_clients.anthropic(**self._client_params)
+
+    @cached_property
+    def _async_client(self) -> Any:
+        if self.anthropic_proxy:
+            return super()._async_client
+        return llm_clients.async_anthropic(**self._client_params)
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        generate = super()._agenerate
+        return await llm_governor.call(
+            self.model,
+            lambda: generate(messages, stop=stop, run_manager=run_manager, **kwargs),
+            tokens=estimate_tokens(*(message.content for message in messages)),
+            on_retry=_retry_reporter(run_manager)
+        )
+
+    async def _astream(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        stream = super()._astream
+        async for chunk in llm_governor.stream(
+            self.model,
+            lambda: stream(messages, stop=stop, run_manager=run_manager, **kwargs),
+            tokens=estimate_tokens(*(message.content for message in messages)),
+            on_retry=_retry_reporter(run_manager)
+        ):
+            yield chunk
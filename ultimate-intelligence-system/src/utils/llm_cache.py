@@ -0,0 +1,400 @@
+"""
+LLM Response Cache - Phase 5
+Two-tier response cache shared by every ChatAnthropic client.
+
+Tier 1 is an exact match on (LLM string hash, system prompt hash, user
+prompt hash), where the LLM string is LangChain's serialization of every
+model parameter (model, temperature, max_tokens, stop sequences, bound
+kwargs), as in LangChain's own caches. Tier 2 is an optional
+embedding-similarity match between user prompts that share the same LLM
+string and system prompt. Entries live in a bounded in-process LRU in front
+of a local SQLite file. They expire after a TTL and are dropped when the
+knowledge-base data version changes. Model and temperature are stored only
+as readable columns.
+"""
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+from src.config.settings import settings
+from src.utils.backend_imports import ensure_backend_app
+from src.utils.logging_config import logger
+from src.utils.metrics import metrics_registry
+
+
+def _sha256(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _split_prompt(prompt: str) -> Tuple[str, str]:
+    """Return (system text, user text) from a serialized chat prompt."""
+    try:
+        messages = json.loads(prompt)
+    except (TypeError, ValueError):
+        return "", prompt
+
+    system_parts: List[str] = []
+    user_parts: List[str] = []
+    for message in messages if isinstance(messages, list) else []:
+        kwargs = message.get("kwargs", {}) if isinstance(message, dict) else {}
+        content = kwargs.get("content", "")
+        if not isinstance(content, str):
+            content = json.dumps(content, sort_keys=True)
+        role = kwargs.get("type", "human")
+        (system_parts if role == "system" else user_parts).append(f"{role}: {content}")
+    return "\n".join(system_parts), "\n".join(user_parts)
+
+
+def _model_and_temperature(llm_string: str) -> Tuple[str, Any]:
+    """Read model name and temperature from LangChain's serialized LLM string."""
+    try:
+        kwargs = json.loads(llm_string.split("---")[0]).get("kwargs", {})
+    except (TypeError, ValueError, AttributeError):
+        return llm_string, None
+    return kwargs.get("model") or kwargs.get("model_name") or "unknown", kwargs.get("temperature")
+
+
+class LLMResponseCache(BaseCache):
+    """
+    LangChain cache with exact and semantic tiers, TTL and LRU eviction.
+
+    Attach via ``ChatAnthropic(cache=llm_response_cache)``. Cached generations
+    are marked ``generation_info['cached'] = True`` so the call tracker can
+    count them as hits instead of billed calls.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 5000,
+        memory_entries: int = 256,
+        embed_fn: Optional[Callable[[str], Sequence[float]]] = None,
+        similarity_threshold: float = 0.97,
+        data_version_provider: Optional[Callable[[], Optional[str]]] = None
+    ):
+        self.db_path = Path(db_path) if db_path else None
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self.embed_fn = embed_fn
+        self.similarity_threshold = similarity_threshold
+        self.data_version_provider = data_version_provider
+
+        self._memory: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._data_version: Optional[str] = None
+        self._lock = threading.RLock()
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "misses": 0, "invalidations": 0}
+
+    # ------------------------------------------------------------------ #
+    # BaseCache interface
+    # ------------------------------------------------------------------ #
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Return cached generations for this prompt, or None on a miss."""
+        with self._lock:
+            version = self._check_data_version()
+            key, scope, user_text = self._keys(prompt, llm_string)
+
+            entry = self._memory_get(key) or self._disk_get(key)
+            if entry and not self._expired(entry, version):
+                self.stats["exact_hits"] += 1
+                self._touch(key, entry)
+                return self._restore(entry["generations"])
+
+            if self.embed_fn is not None:
+                entry = self._semantic_get(scope, user_text, version)
+                if entry:
+                    self.stats["semantic_hits"] += 1
+                    self._touch(entry["key"], entry)
+                    return self._restore(entry["generations"])
+
+            self.stats["misses"] += 1
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store generations for this prompt."""
+        with self._lock:
+            version = self._check_data_version()
+            key, scope, user_text = self._keys(prompt, llm_string)
+            model, temperature = _model_and_temperature(llm_string)
+            now = time.time()
+            entry = {
+                "key": key,
+                "scope": scope,
+                "model": model,
+                "temperature": temperature,
+                "generations": dumps(list(return_val)),
+                "data_version": version,
+                "created": now,
+                "last_used": now,
+                "embedding": self._embed(user_text) if self.embed_fn is not None else None
+            }
+            self._memory_put(key, entry)
+            self._disk_put(entry)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop every cached response."""
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM llm_cache")
+
+    def get_summary(self) -> Dict[str, Any]:
+        """Hit/miss counters for monitoring."""
+        lookups = self.stats["exact_hits"] + self.stats["semantic_hits"] + self.stats["misses"]
+        hits = self.stats["exact_hits"] + self.stats["semantic_hits"]
+        return {**self.stats, "hit_rate": hits / lookups if lookups else 0.0}
+
+    # ------------------------------------------------------------------ #
+    # Keys, expiry and invalidation
+    # ------------------------------------------------------------------ #
+
+    def _keys(self, prompt: str, llm_string: str) -> Tuple[str, str, str]:
+        """Return (exact key, semantic scope, user text)."""
+        system_text, user_text = _split_prompt(prompt)
+        # Any parameter difference (e.g. a smaller max_tokens) means a different scope
+        scope = _sha256(f"{_sha256(llm_string)}|{_sha256(system_text)}")
+        return _sha256(f"{scope}|{_sha256(user_text)}"), scope, user_text
+
+    def _expired(self, entry: Dict[str, Any], version: Optional[str]) -> bool:
+        if time.time() - entry["created"] > self.ttl_seconds or entry["data_version"] != version:
+            self._delete(entry["key"])
+            return True
+        return False
+
+    def _check_data_version(self) -> Optional[str]:
+        """Purge entries built on an older knowledge base."""
+        if self.data_version_provider is None:
+            return None
+        try:
+            version = self.data_version_provider()
+        except Exception as e:
+            logger.debug(f"LLM cache: data version unavailable: {e}")
+            return self._data_version
+
+        if version != self._data_version:
+            if self._data_version is not None:
+                self.stats["invalidations"] += 1
+                logger.info("LLM cache: knowledge base changed, invalidating cached responses")
+            self._memory = OrderedDict(
+                (key, entry) for key, entry in self._memory.items() if entry["data_version"] == version
+            )
+            conn = self._connection()
+            if conn is not None:
+                with conn:
+                    conn.execute("DELETE FROM llm_cache WHERE data_version IS NOT ?", (version,))
+            self._data_version = version
+        return version
+
+    # ------------------------------------------------------------------ #
+    # Semantic tier
+    # ------------------------------------------------------------------ #
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.asarray(self.embed_fn(text), dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _semantic_get(self, scope: str, user_text: str, version: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Most similar live entry in the same scope above the threshold."""
+        candidates = [entry for entry in self._scope_entries(scope)
+                      if entry["embedding"] is not None and not self._expired(entry, version)]
+        if not candidates:
+            return None
+
+        query = self._embed(user_text)
+        matrix = np.vstack([entry["embedding"] for entry in candidates])
+        similarities = matrix @ query
+        best = int(np.argmax(similarities))
+        if similarities[best] < self.similarity_threshold:
+            return None
+        return candidates[best]
+
+    def _scope_entries(self, scope: str) -> List[Dict[str, Any]]:
+        conn = self._connection()
+        if conn is None:
+            return [entry for entry in self._memory.values() if entry["scope"] == scope]
+        rows = conn.execute(
+            "SELECT key, scope, model, temperature, generations, data_version, created, last_used, embedding "
+            "FROM llm_cache WHERE scope = ? AND embedding IS NOT NULL",
+            (scope,)
+        ).fetchall()
+        return [self._row_to_entry(row) for row in rows]
+
+    # ------------------------------------------------------------------ #
+    # Storage tiers
+    # ------------------------------------------------------------------ #
+
+    def _restore(self, serialized: str) -> RETURN_VAL_TYPE:
+        generations = loads(serialized)
+        for generation in generations:
+            generation.generation_info = {**(generation.generation_info or {}), "cached": True}
+        return generations
+
+    def _memory_get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._memory.get(key)
+
+    def _memory_put(self, key: str, entry: Dict[str, Any]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _touch(self, key: str, entry: Dict[str, Any]) -> None:
+        entry["last_used"] = time.time()
+        self._memory_put(key, entry)
+        conn = self._connection()
+        if conn is not None:
+            with conn:
+                conn.execute("UPDATE llm_cache SET last_used = ? WHERE key = ?", (entry["last_used"], key))
+
+    def _delete(self, key: str) -> None:
+        self._memory.pop(key, None)
+        conn = self._connection()
+        if conn is not None:
+            with conn:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Open the disk tier on first use (no file is created at import)."""
+        if self.db_path is None:
+            return None
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(llm_cache)")]
+            if columns and "model" not in columns:
+                # Keyed on model and temperature only: those entries can never match again
+                with self._conn:
+                    self._conn.execute("DROP TABLE llm_cache")
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    model TEXT,
+                    temperature REAL,
+                    generations TEXT NOT NULL,
+                    data_version TEXT,
+                    created REAL NOT NULL,
+                    last_used REAL NOT NULL,
+                    embedding BLOB
+                );
+                CREATE INDEX IF NOT EXISTS idx_llm_cache_scope ON llm_cache (scope);
+                CREATE INDEX IF NOT EXISTS idx_llm_cache_last_used ON llm_cache (last_used);
+                """
+            )
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[Dict[str, Any]]:
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT key, scope, model, temperature, generations, data_version, created, last_used, embedding "
+            "FROM llm_cache WHERE key = ?",
+            (key,)
+        ).fetchone()
+        return self._row_to_entry(row) if row else None
+
+    def _disk_put(self, entry: Dict[str, Any]) -> None:
+        conn = self._connection()
+        if conn is None:
+            return
+        embedding = entry["embedding"]
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry["key"], entry["scope"], entry["model"], entry["temperature"],
+                    entry["generations"], entry["data_version"],
+                    entry["created"], entry["last_used"],
+                    embedding.tobytes() if embedding is not None else None
+                )
+            )
+            # Evict least recently used entries beyond the size bound
+            conn.execute(
+                "DELETE FROM llm_cache WHERE key IN ("
+                "SELECT key FROM llm_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+
+    @staticmethod
+    def _row_to_entry(row: Tuple) -> Dict[str, Any]:
+        key, scope, model, temperature, generations, data_version, created, last_used, embedding = row
+        return {
+            "key": key,
+            "scope": scope,
+            "model": model,
+            "temperature": temperature,
+            "generations": generations,
+            "data_version": data_version,
+            "created": created,
+            "last_used": last_used,
+            "embedding": np.frombuffer(embedding, dtype=np.float32) if embedding is not None else None
+        }
+
+
+def kb_data_version() -> Optional[str]:
+    """Data version of the knowledge base the extraction node reads from."""
+    ensure_backend_app()
+    from app.services.fact_index import FACT_INDEX_FILENAME, read_data_version
+
+    return read_data_version(Path(settings.KB_PERSIST_DIRECTORY) / FACT_INDEX_FILENAME)
+
+
+def _sentence_embedder() -> Optional[Callable[[str], Sequence[float]]]:
+    """Same embedding model as the knowledge base (shared sidecar or in-process), if installed."""
+    ensure_backend_app()
+    from app.services.embedding_service import text_embedder
+
+    embed = text_embedder("all-MiniLM-L6-v2")
+    if embed is None:
+        logger.warning("LLM cache: sentence-transformers not installed, semantic tier disabled")
+    return embed
+
+
+def _build_llm_response_cache() -> Optional[LLMResponseCache]:
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    return LLMResponseCache(
+        db_path=Path(settings.LLM_CACHE_PATH),
+        ttl_seconds=settings.LLM_CACHE_TTL,
+        max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+        memory_entries=settings.LLM_CACHE_MEMORY_ENTRIES,
+        embed_fn=_sentence_embedder() if settings.LLM_CACHE_SEMANTIC else None,
+        similarity_threshold=settings.LLM_CACHE_SIMILARITY,
+        data_version_provider=kb_data_version
+    )
+
+
+# Global instance shared by every ChatAnthropic client (None when disabled)
+llm_response_cache = _build_llm_response_cache()
+
+
+def _collect_metrics():
+    if llm_response_cache is None:
+        return
+    summary = llm_response_cache.get_summary()
+    yield ("polaris_llm_cache_lookups_total", "counter", "LLM response cache lookups by result",
+           [({"result": "exact_hit"}, summary["exact_hits"]),
+            ({"result": "semantic_hit"}, summary["semantic_hits"]),
+            ({"result": "miss"}, summary["misses"])])
+    yield ("polaris_llm_cache_hit_ratio", "gauge", "LLM response cache hits per lookup since start",
+           [({}, summary["hit_rate"])])
+
+
+metrics_registry.register_collector("llm_response_cache", _collect_metrics)
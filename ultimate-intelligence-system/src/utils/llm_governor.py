@@ -0,0 +1,37 @@
+"""
+LLM Concurrency Governor - Phase 5
+Routes every agent and node model call through the backend's process-wide
+LLMGovernor: per-model concurrency cap, tokens-per-minute budget,
+Retry-After-aware jittered retries and round-robin queuing across queries.
+
+The governor sits below LangChain's cache lookup, so cached responses never
+wait for a slot. It owns retries, which is why the SDK's own retries are
+switched off (max_retries=0). Requests go out over the backend's shared,
+keep-alive connection pools (app.services.llm_clients). The governed model
+itself, GovernedChatAnthropic, is defined in src.utils.governed_chat.
+"""
+from typing import Any
+
+from src.utils.backend_imports import ensure_backend_app
+
+ensure_backend_app()
+
+from app.services.llm_clients import llm_clients  # noqa: E402
+from app.services.llm_governor import (  # noqa: E402
+    backoff_delay,
+    current_agent,
+    current_query,
+    estimate_tokens,
+    llm_governor,
+)
+
+__all__ = ["GovernedChatAnthropic", "backoff_delay", "current_agent", "current_query", "llm_governor"]
+
+
+def __getattr__(name: str) -> Any:
+    # GovernedChatAnthropic lives in governed_chat so that importing the
+    # governor does not import langchain_anthropic
+    if name == "GovernedChatAnthropic":
+        from src.utils.governed_chat import GovernedChatAnthropic
+        return GovernedChatAnthropic
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
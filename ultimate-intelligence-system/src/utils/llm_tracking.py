@@ -0,0 +1,168 @@
+"""
+LLM Call Instrumentation - Phase 5
+LangChain callback handler that reports every chat model call to the
+performance monitor and enforces the per-query cost and call budgets.
+"""
+import time
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.utils.logging_config import logger
+from src.utils.performance import PerformanceMonitor, performance_monitor
+
+
+class LLMBudgetExceeded(RuntimeError):
+    """Raised instead of issuing an LLM call once the query budget is spent."""
+
+
+class LLMCallTracker(BaseCallbackHandler):
+    """
+    Records model, tokens, time-to-first-token, latency and retries per call.
+
+    Attach via ``ChatAnthropic(callbacks=[llm_call_tracker])``. When the
+    monitored query has hit MAX_COST_PER_QUERY or MAX_LLM_CALLS, the call is
+    short-circuited by raising LLMBudgetExceeded before any request is sent.
+    """
+
+    raise_error = True  # Budget violations must propagate to the caller
+    run_inline = True   # Keep timings on the event loop, not a thread pool
+
+    def __init__(self, monitor: Optional[PerformanceMonitor] = None):
+        self.monitor = monitor or performance_monitor
+        self._active: Dict[UUID, Dict[str, Any]] = {}
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[Any]],
+        *,
+        run_id: UUID,
+        metadata: Optional[Dict[str, Any]] = None,
+        **kwargs: Any
+    ) -> None:
+        """Check the budget and start timing the call"""
+        reason = self.monitor.budget_exceeded()
+        if reason:
+            logger.warning(f"LLM call refused: {reason}")
+            raise LLMBudgetExceeded(reason)
+
+        self._active[run_id] = {
+            'model': self._resolve_model(serialized, metadata, kwargs),
+            'start': time.perf_counter(),
+            'first_token': None,
+            'retries': 0
+        }
+
+    def on_llm_new_token(self, token: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Record time-to-first-token for streamed calls"""
+        call = self._active.get(run_id)
+        if call and call['first_token'] is None:
+            call['first_token'] = time.perf_counter()
+
+    def on_retry(self, retry_state: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Count retries issued by LangChain for this call"""
+        call = self._active.get(run_id)
+        if call:
+            call['retries'] += 1
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        """Report the completed call to the performance monitor"""
+        call = self._active.pop(run_id, None)
+        if call is None:
+            return
+
+        end = time.perf_counter()
+        latency = end - call['start']
+        
+        # Answered by the response cache: no tokens were billed
+        if self._is_cached(response):
+            self.monitor.track_cache_hit(call['model'], latency=latency)
+            return
+        
+        # Non-streamed calls receive the whole response at once
+        first_token = call['first_token'] or end
+        input_tokens, output_tokens, cache_read, cache_write = self._extract_usage(response)
+        model = (response.llm_output or {}).get('model') or call['model']
+
+        self.monitor.track_llm_call(
+            model,
+            input_tokens,
+            output_tokens,
+            latency=latency,
+            time_to_first_token=first_token - call['start'],
+            retries=call['retries'],
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write
+        )
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        """Drop timing state for failed calls"""
+        call = self._active.pop(run_id, None)
+        if call:
+            logger.debug(f"LLM call to {call['model']} failed after "
+                         f"{time.perf_counter() - call['start']:.2f}s: {error}")
+
+    @staticmethod
+    def _resolve_model(
+        serialized: Dict[str, Any],
+        metadata: Optional[Dict[str, Any]],
+        kwargs: Dict[str, Any]
+    ) -> str:
+        """Find the model name in whatever LangChain passed to the callback"""
+        invocation_params = kwargs.get('invocation_params') or {}
+        return (
+            invocation_params.get('model')
+            or invocation_params.get('model_name')
+            or (metadata or {}).get('ls_model_name')
+            or (serialized or {}).get('kwargs', {}).get('model')
+            or 'unknown'
+        )
+
+    @staticmethod
+    def _is_cached(response: LLMResult) -> bool:
+        """True when every generation was served by LLMResponseCache"""
+        generations = [generation for batch in response.generations for generation in batch]
+        return bool(generations) and all(
+            (generation.generation_info or {}).get('cached') for generation in generations
+        )
+    
+    @staticmethod
+    def _extract_usage(response: LLMResult) -> tuple:
+        """
+        Return (uncached input, output, cache read, cache write) token counts.
+
+        LangChain's usage_metadata counts cached tokens in input_tokens and
+        breaks them out in input_token_details; Anthropic's raw usage reports
+        uncached input_tokens with separate cache fields.
+        """
+        input_tokens = output_tokens = cache_read = cache_write = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, 'message', None), 'usage_metadata', None)
+                if usage:
+                    details = usage.get('input_token_details') or {}
+                    read = details.get('cache_read') or 0
+                    write = (details.get('cache_creation') or 0) or (
+                        (details.get('ephemeral_5m_input_tokens') or 0)
+                        + (details.get('ephemeral_1h_input_tokens') or 0)
+                    )
+                    input_tokens += usage.get('input_tokens', 0) - read - write
+                    output_tokens += usage.get('output_tokens', 0)
+                    cache_read += read
+                    cache_write += write
+
+        if not (input_tokens or output_tokens or cache_read or cache_write):
+            usage = (response.llm_output or {}).get('usage') or {}
+            input_tokens = usage.get('input_tokens', 0)
+            output_tokens = usage.get('output_tokens', 0)
+            cache_read = usage.get('cache_read_input_tokens') or 0
+            cache_write = usage.get('cache_creation_input_tokens') or 0
+
+        return input_tokens, output_tokens, cache_read, cache_write
+
+
+# Global instance shared by every ChatAnthropic client
+llm_call_tracker = LLMCallTracker()
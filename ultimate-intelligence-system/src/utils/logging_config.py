@@ -3,12 +3,20 @@ import os
 from datetime import datetime
 
 
+class LazyFileHandler(logging.FileHandler):
+    """FileHandler that creates its directory and file on the first record, not on import"""
+    
+    def __init__(self, filename: str, **kwargs):
+        super().__init__(filename, delay=True, **kwargs)
+    
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
 def setup_logging():
     """Configure comprehensive logging for the system"""
     
-    # Create logs directory if it doesn't exist
-    os.makedirs("logs", exist_ok=True)
-    
     # Create logger
     logger = logging.getLogger("intelligence_system")
     logger.setLevel(logging.INFO)
@@ -25,9 +33,9 @@ def setup_logging():
     )
     console_handler.setFormatter(console_format)
     
-    # File handler
+    # File handler (logs/ and the file appear with the first record)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_handler = logging.FileHandler(
+    file_handler = LazyFileHandler(
         f"logs/intelligence_{timestamp}.log"
     )
     file_handler.setLevel(logging.DEBUG)
@@ -0,0 +1,48 @@
+"""
+Prometheus Metrics - Phase 5
+The Chainlit process records into the backend's in-process registry
+(app.core.metrics), the same one the API serves at /metrics. LLM calls,
+the governor queue, connection pools and the caches report there. This
+module adds UIS graph node latency and the exporter.
+
+Chainlit has no /metrics route of its own, so start_metrics_exporter()
+serves the registry on CHAINLIT_METRICS_PORT from a daemon thread.
+"""
+from typing import Optional
+
+from src.utils.backend_imports import ensure_backend_app
+
+ensure_backend_app()
+
+from app.core.metrics import metrics_registry, start_http_server  # noqa: E402
+
+from src.config.settings import settings  # noqa: E402
+from src.utils.logging_config import logger  # noqa: E402
+
+__all__ = ["GRAPH_NODE_SECONDS", "metrics_registry", "start_metrics_exporter"]
+
+GRAPH_NODE_SECONDS = metrics_registry.histogram(
+    "polaris_graph_node_duration_seconds", "UIS graph node latency", ("node",)
+)
+
+
+def start_metrics_exporter(port: Optional[int] = None) -> Optional[int]:
+    """
+    Serve /metrics for this process (idempotent).
+
+    Args:
+        port: Port to listen on (defaults to settings.METRICS_PORT; 0 disables)
+
+    Returns:
+        Port the exporter listens on, or None when disabled
+    """
+    port = settings.METRICS_PORT if port is None else port
+    if not port:
+        return None
+    try:
+        server = start_http_server(port)
+    except OSError as e:
+        # Another worker on this host already serves the port
+        logger.warning(f"Metrics exporter not started on port {port}: {e}")
+        return None
+    return server.server_port
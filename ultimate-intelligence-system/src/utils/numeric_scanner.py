@@ -0,0 +1,31 @@
+"""
+Numeric Scanner - Phase 2
+Re-exports the backend's single-pass numeric scanner so extraction and
+verification tokenize text exactly like the ingest-time fact index.
+"""
+
+from src.utils.backend_imports import ensure_backend_app
+
+ensure_backend_app()
+
+from app.services.numeric_scanner import (  # noqa: E402
+    NumericToken,
+    canonical_period,
+    labelled_amounts,
+    nearest_period,
+    normalize_period,
+    numeric_signals,
+    scan,
+    scan_tokens,
+)
+
+__all__ = [
+    "NumericToken",
+    "canonical_period",
+    "labelled_amounts",
+    "nearest_period",
+    "normalize_period",
+    "numeric_signals",
+    "scan",
+    "scan_tokens",
+]
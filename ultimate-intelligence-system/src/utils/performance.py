@@ -3,14 +3,43 @@ Performance Monitoring - Phase 5
 Track execution time, cost, and performance metrics.
 """
 import time
-from typing import Dict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
 
 from src.utils.logging_config import logger
+from src.utils.metrics import GRAPH_NODE_SECONDS
+
+
+class QueryStats:
+    """Timings, cost and LLM calls of one tracked query"""
+    
+    def __init__(self, start_time: Optional[float] = None):
+        self.start_time = start_time
+        self.node_times: Dict[str, float] = {}
+        self.node_start_times: Dict[str, float] = {}
+        self.total_cost = 0.0
+        self.llm_calls = 0
+        self.llm_call_log: List[Dict[str, Any]] = []
+        self.cache_hits = 0
+        self.time_to_first_token: Optional[float] = None
+
+
+def _query_field(name: str) -> property:
+    """Expose a field of the current query's QueryStats as a monitor attribute"""
+    return property(
+        lambda self: getattr(self._stats(), name),
+        lambda self, value: setattr(self._stats(), name, value)
+    )
 
 
 class PerformanceMonitor:
     """
     Monitor and track system performance metrics.
+    
+    The counters belong to the query started in the current asyncio context:
+    start_query() installs a fresh QueryStats in a ContextVar, and the graph
+    tasks and LLM callbacks of that run inherit it. Concurrent sessions sharing
+    the global monitor therefore keep separate cost and call budgets.
     """
     
     # Claude API Pricing (as of Nov 2024)
@@ -25,24 +54,40 @@ class PerformanceMonitor:
         }
     }
     
+    # Anthropic prompt caching: cache writes and reads relative to input price
+    CACHE_WRITE_MULTIPLIER = 1.25
+    CACHE_READ_MULTIPLIER = 0.10
+    
     # Cost and time limits
     MAX_COST_PER_QUERY = 2.00  # dollars
     MAX_TIME_PER_QUERY = 120   # seconds
+    MAX_LLM_CALLS = 15         # per query
+    
+    start_time = _query_field("start_time")
+    node_times = _query_field("node_times")
+    node_start_times = _query_field("node_start_times")
+    total_cost = _query_field("total_cost")
+    llm_calls = _query_field("llm_calls")
+    llm_call_log = _query_field("llm_call_log")
+    cache_hits = _query_field("cache_hits")
+    time_to_first_token = _query_field("time_to_first_token")
     
     def __init__(self):
-        self.start_time = None
-        self.node_times: Dict[str, float] = {}
-        self.node_start_times: Dict[str, float] = {}
-        self.total_cost = 0.0
-        self.llm_calls = 0
+        self._query: ContextVar[Optional[QueryStats]] = ContextVar(
+            f"performance_query_{id(self)}", default=None
+        )
+    
+    def _stats(self) -> QueryStats:
+        """Counters of the current query (an untracked one outside any query)"""
+        stats = self._query.get()
+        if stats is None:
+            stats = QueryStats()
+            self._query.set(stats)
+        return stats
     
     def start_query(self):
-        """Start tracking a new query"""
-        self.start_time = time.time()
-        self.node_times = {}
-        self.node_start_times = {}
-        self.total_cost = 0.0
-        self.llm_calls = 0
+        """Start tracking a new query in the current context"""
+        self._query.set(QueryStats(start_time=time.time()))
         logger.info("Performance monitoring started")
     
     def start_node(self, node_name: str):
@@ -59,25 +104,54 @@ class PerformanceMonitor:
             return
         elapsed = time.time() - start_time
         self.node_times[node_name] = self.node_times.get(node_name, 0.0) + elapsed
+        GRAPH_NODE_SECONDS.observe(elapsed, node=node_name)
         logger.info(f"Node {node_name}: {elapsed:.2f}s")
     
     def track_llm_call(
         self, 
         model: str, 
         input_tokens: int, 
-        output_tokens: int
+        output_tokens: int,
+        latency: Optional[float] = None,
+        time_to_first_token: Optional[float] = None,
+        retries: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0
     ):
-        """Track an LLM API call"""
+        """
+        Track an LLM API call
+        
+        input_tokens counts only uncached prompt tokens; prompt-cache reads
+        and writes are passed separately and priced with their multipliers.
+        """
         self.llm_calls += 1
         
         # Calculate cost
         pricing = self.PRICING.get(model, self.PRICING["claude-3-5-sonnet-20241022"])
-        cost = (input_tokens * pricing["input"]) + (output_tokens * pricing["output"])
+        cost = (
+            input_tokens * pricing["input"]
+            + cache_write_tokens * pricing["input"] * self.CACHE_WRITE_MULTIPLIER
+            + cache_read_tokens * pricing["input"] * self.CACHE_READ_MULTIPLIER
+            + output_tokens * pricing["output"]
+        )
         self.total_cost += cost
         
+        self.llm_call_log.append({
+            'model': model,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'cache_read_tokens': cache_read_tokens,
+            'cache_write_tokens': cache_write_tokens,
+            'cost': cost,
+            'latency': latency,
+            'time_to_first_token': time_to_first_token,
+            'retries': retries
+        })
+        
         logger.debug(
             f"LLM call #{self.llm_calls}: {model}, "
-            f"tokens={input_tokens}+{output_tokens}, "
+            f"tokens={input_tokens}+{output_tokens} "
+            f"(cache read={cache_read_tokens}, write={cache_write_tokens}), "
             f"cost=${cost:.4f}, total=${self.total_cost:.4f}"
         )
         
@@ -87,6 +161,31 @@ class PerformanceMonitor:
                 f"Cost limit exceeded: ${self.total_cost:.2f} > ${self.MAX_COST_PER_QUERY}"
             )
     
+    def track_cache_hit(self, model: str, latency: Optional[float] = None):
+        """Track an LLM call answered from the response cache (not billed)"""
+        self.cache_hits += 1
+        logger.debug(f"LLM cache hit #{self.cache_hits}: {model}"
+                     + (f" in {latency * 1000:.1f}ms" if latency is not None else ""))
+    
+    def record_first_token(self, timestamp: float):
+        """Record when the first answer token reached the user (once per query)"""
+        if self.start_time and self.time_to_first_token is None:
+            self.time_to_first_token = timestamp - self.start_time
+            logger.info(f"Time to first token: {self.time_to_first_token:.2f}s")
+    
+    def budget_exceeded(self) -> Optional[str]:
+        """
+        Return the reason further LLM calls must be refused, or None.
+        Limits only apply while a query is being tracked.
+        """
+        if not self.start_time:
+            return None
+        if self.total_cost >= self.MAX_COST_PER_QUERY:
+            return f"cost limit reached (${self.total_cost:.2f} >= ${self.MAX_COST_PER_QUERY:.2f})"
+        if self.llm_calls >= self.MAX_LLM_CALLS:
+            return f"LLM call limit reached ({self.llm_calls} >= {self.MAX_LLM_CALLS})"
+        return None
+    
     def check_time_limit(self) -> bool:
         """Check if time limit exceeded"""
         if self.start_time:
@@ -111,6 +210,11 @@ class PerformanceMonitor:
             'node_times': self.node_times,
             'total_cost': self.total_cost,
             'llm_calls': self.llm_calls,
+            'llm_call_log': list(self.llm_call_log),
+            'llm_cache_hits': self.cache_hits,
+            'time_to_first_token': self.time_to_first_token,
+            'prompt_cache_read_tokens': sum(call['cache_read_tokens'] for call in self.llm_call_log),
+            'prompt_cache_write_tokens': sum(call['cache_write_tokens'] for call in self.llm_call_log),
             'avg_time_per_node': total_time / len(self.node_times) if self.node_times else 0,
             'avg_cost_per_call': self.total_cost / self.llm_calls if self.llm_calls > 0 else 0
         }
@@ -126,8 +230,10 @@ class PerformanceMonitor:
         logger.info("PERFORMANCE SUMMARY")
         logger.info("=" * 80)
         logger.info(f"Total Time: {summary['total_time']:.2f}s")
+        if summary['time_to_first_token'] is not None:
+            logger.info(f"Time to First Token: {summary['time_to_first_token']:.2f}s")
         logger.info(f"Total Cost: ${summary['total_cost']:.4f}")
-        logger.info(f"LLM Calls: {summary['llm_calls']}")
+        logger.info(f"LLM Calls: {summary['llm_calls']} (+{summary['llm_cache_hits']} cached)")
         logger.info(f"Avg Time/Node: {summary['avg_time_per_node']:.2f}s")
         logger.info(f"Avg Cost/Call: ${summary['avg_cost_per_call']:.4f}")
         logger.info("\nNode Breakdown:")
@@ -136,5 +242,52 @@ class PerformanceMonitor:
         logger.info("=" * 80)
 
 
-# Global instance
+class ExtractionSkipStats:
+    """
+    Process-wide record of how often the LLM extraction layer is skipped
+    because deterministic extraction already covered the query.
+    """
+    
+    def __init__(self):
+        self.runs = 0
+        self.llm_skipped = 0
+        self.llm_seconds = 0.0
+    
+    def record_llm(self, elapsed: float):
+        """Record an extraction that used the LLM layer"""
+        self.runs += 1
+        self.llm_seconds += elapsed
+    
+    def record_skip(self):
+        """Record an extraction answered by the Python layer alone"""
+        self.runs += 1
+        self.llm_skipped += 1
+    
+    @property
+    def avg_llm_seconds(self) -> float:
+        llm_runs = self.runs - self.llm_skipped
+        return self.llm_seconds / llm_runs if llm_runs > 0 else 0.0
+    
+    @property
+    def skip_rate(self) -> float:
+        return self.llm_skipped / self.runs if self.runs > 0 else 0.0
+    
+    @property
+    def saved_seconds(self) -> float:
+        """Estimated latency saved, priced at the average LLM extraction time"""
+        return self.llm_skipped * self.avg_llm_seconds
+    
+    def get_summary(self) -> dict:
+        """Get skip statistics"""
+        return {
+            'runs': self.runs,
+            'llm_skipped': self.llm_skipped,
+            'skip_rate': self.skip_rate,
+            'avg_llm_seconds': self.avg_llm_seconds,
+            'saved_seconds': self.saved_seconds
+        }
+
+
+# Global instances
 performance_monitor = PerformanceMonitor()
+extraction_skip_stats = ExtractionSkipStats()
@@ -0,0 +1,28 @@
+"""
+Prompt Caching - Phase 5
+Marks the static persona system prompts with Anthropic cache-control
+breakpoints so repeated calls read the prefix from the prompt cache.
+Block layout is shared with the backend agents.
+"""
+from typing import Optional
+
+from langchain_core.messages import SystemMessage
+
+from src.utils.backend_imports import ensure_backend_app
+
+ensure_backend_app()
+
+from app.services.prompt_caching import cached_system_blocks  # noqa: E402
+
+
+def cached_system_message(*parts: Optional[str]) -> SystemMessage:
+    """
+    System message with a cache breakpoint after each static part.
+
+    Keep per-query text (facts, query, complexity) out of the parts; it
+    belongs in the HumanMessage that follows.
+    """
+    return SystemMessage(content=cached_system_blocks(*parts))
+
+
+__all__ = ["cached_system_blocks", "cached_system_message"]
@@ -0,0 +1,61 @@
+"""
+Token Streaming - Phase 6
+Forwards LLM tokens generated inside a graph node to LangGraph's "custom"
+stream, so the UI can render the answer while it is being written.
+
+Consumers run ``graph.astream(state, stream_mode=["updates", "custom"])``
+and receive ``("custom", {"type": "token", "node": ..., "token": ...})``.
+"""
+import time
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from src.utils.performance import PerformanceMonitor, performance_monitor
+
+TOKEN_EVENT = "token"
+
+
+def get_node_stream_writer() -> Callable[[Any], None]:
+    """Custom-stream writer of the running graph node (no-op outside a graph run)."""
+    try:
+        from langgraph.config import get_stream_writer
+        return get_stream_writer()
+    except (ImportError, RuntimeError):
+        return lambda chunk: None
+
+
+class NodeTokenStreamer(BaseCallbackHandler):
+    """
+    Writes every generated token to the node's custom stream.
+
+    Pass per call via ``llm.ainvoke(messages, config={"callbacks": [streamer]})``
+    on a model created with ``streaming=True``. The first token is reported
+    to the performance monitor as the query's time-to-first-token.
+    """
+
+    run_inline = True  # Preserve token order on the event loop
+
+    def __init__(
+        self,
+        node: str,
+        writer: Optional[Callable[[Any], None]] = None,
+        monitor: Optional[PerformanceMonitor] = None
+    ):
+        self.node = node
+        self.writer = writer or get_node_stream_writer()
+        self.monitor = monitor or performance_monitor
+        self.tokens_streamed = 0
+
+    def on_llm_new_token(self, token: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        """Forward a token (text, or Anthropic content blocks) to the stream"""
+        text = token if isinstance(token, str) else "".join(
+            block.get("text", "") for block in token if isinstance(block, dict)
+        )
+        if not text:
+            return
+        if self.tokens_streamed == 0:
+            self.monitor.record_first_token(time.time())
+        self.tokens_streamed += 1
+        self.writer({"type": TOKEN_EVENT, "node": self.node, "token": text})
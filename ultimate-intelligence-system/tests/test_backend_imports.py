@@ -0,0 +1,42 @@
+"""
+Test that backend services are imported from the backend package, never the root app.py
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+UIS_PATH = Path(__file__).resolve().parents[1]
+REPO_ROOT = UIS_PATH.parent
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-c", code], cwd=UIS_PATH,
+                          capture_output=True, text=True, timeout=120)
+
+
+def test_shims_load_the_backend_package():
+    """The shims put backend/ on the path and import app.* from it"""
+    result = _run(
+        "import sys\n"
+        "from src.utils import numeric_scanner, prompt_caching, llm_governor\n"
+        "print(sys.modules['app'].__path__[0])\n"
+    )
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert Path(result.stdout.strip().splitlines()[-1]) == REPO_ROOT / "backend" / "app"
+
+
+def test_root_app_shadowing_the_backend_is_refused_without_running_it():
+    """With the repository root first on the path, 'app' would be the Chainlit app.py"""
+    result = _run(
+        "import sys\n"
+        f"sys.path[:0] = [{str(REPO_ROOT)!r}, {str(REPO_ROOT / 'backend')!r}]\n"
+        "from src.utils.backend_imports import ensure_backend_app\n"
+        "try:\n"
+        "    ensure_backend_app()\n"
+        "except ImportError as exc:\n"
+        "    print('refused', 'app' in sys.modules)\n"
+    )
+
+    assert result.returncode == 0, result.stderr[-2000:]
+    assert result.stdout.strip().splitlines()[-1] == "refused False"
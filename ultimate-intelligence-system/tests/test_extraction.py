@@ -2,6 +2,8 @@
 Test suite for data extraction - Phase 2
 """
 import asyncio
+import json
+import pytest
 from src.nodes.extract import DataExtractor, data_extraction_node
 from src.models.state import IntelligenceState
 from datetime import datetime
@@ -160,6 +162,121 @@ Operating Cash Flow: QR -100 million
     return True
 
 
+class ChunkEchoLLM:
+    """Async LLM stub that returns one fact per [Source: ...] block it is shown."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.calls = 0
+
+    async def ainvoke(self, messages):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+        facts = {}
+        for line in messages[1].content.splitlines():
+            if line.startswith("[Source: "):
+                citation = line[len("[Source: "):-1]
+                metric, value = citation.split("=")
+                facts[metric] = {"value": float(value), "unit": "QR millions",
+                                 "confidence": 0.9, "source_citation": citation}
+
+        class _Response:
+            content = json.dumps(facts)
+
+        return _Response()
+
+
+@pytest.mark.asyncio
+async def test_map_reduce_extraction_covers_all_chunks():
+    """Facts beyond the first 3000 characters are extracted and attributed"""
+    llm = ChunkEchoLLM()
+    extractor = DataExtractor(llm=llm)
+    chunks = [
+        {"citation": f"metric_{i}=100", "content": "x" * 3000}
+        for i in range(9)
+    ] + [{"citation": "metric_0=250", "content": "late restatement"}]
+
+    result = await extractor.extract_with_llm_map_reduce(chunks, "What changed?")
+
+    assert len(result) == 9, "Every chunk's metric should be extracted"
+    assert llm.calls == 5, "Two chunks per map call"
+    assert llm.max_in_flight > 1, "Map calls should run concurrently"
+    assert result["metric_5"]["sources"] == ["metric_5=100"]
+    assert result["metric_0"]["alternative_values"][0]["value"] == 250.0
+
+    validated = extractor.cross_validate(
+        {"metric_5": {"value": 100.0, "unit": "QR millions", "confidence": 0.95}},
+        result
+    )
+    assert validated["facts"]["metric_5"]["verified_by"] == "python_and_llm"
+    assert validated["facts"]["metric_5"]["sources"] == ["metric_5=100"]
+
+
+def test_adaptive_extraction_coverage():
+    """Simple lookups fully answered by Python extraction skip the LLM layer"""
+    extractor = DataExtractor(llm=ChunkEchoLLM())
+    python_extracted = extractor.extract_numeric_data("Revenue: QR 1,032.1 million")
+
+    required = extractor.required_metrics("What was revenue in FY24?", "simple")
+    assert required == ['revenue']
+    assert extractor.python_covers(python_extracted, required)
+
+    # Missing metric or broader query -> LLM layer still runs
+    assert not extractor.python_covers(
+        python_extracted, extractor.required_metrics("What was revenue and profit?", "simple")
+    )
+    assert extractor.required_metrics("What was revenue in FY24?", "medium") == []
+
+    from src.utils.performance import ExtractionSkipStats
+    stats = ExtractionSkipStats()
+    stats.record_llm(2.0)
+    stats.record_skip()
+    assert stats.skip_rate == 0.5
+    assert stats.saved_seconds == 2.0
+
+
+def test_adaptive_extraction_requires_the_requested_period():
+    """A fact for another fiscal period does not let a period query skip the LLM"""
+    extractor = DataExtractor(llm=ChunkEchoLLM())
+    required = extractor.required_metrics("What was revenue in FY24?", "simple")
+    fy23 = {'revenue': {'value': 1032.1, 'confidence': 0.95, 'fiscal_period': 'FY23'}}
+    fy24 = {'revenue': {'value': 1045.0, 'confidence': 0.95, 'fiscal_period': '2024'}}
+
+    periods = extractor.requested_periods("What was revenue in FY24?")
+    assert periods == {'2024'}
+    assert not extractor.python_covers(fy23, required, periods)
+    assert extractor.python_covers(fy24, required, periods)
+
+    # A figure with no stated period, or a comparison of periods, still needs the LLM
+    undated = {'revenue': {'value': 1045.0, 'confidence': 0.95}}
+    assert not extractor.python_covers(undated, required, periods)
+    assert not extractor.python_covers(fy24, required, extractor.requested_periods("Revenue FY23 vs FY24?"))
+
+    # Quarters are matched as quarters
+    q3 = {'revenue': {'value': 265.0, 'confidence': 0.95, 'fiscal_period': 'Q3-24'}}
+    assert extractor.python_covers(q3, required, extractor.requested_periods("Revenue in Q3 2024?"))
+    assert not extractor.python_covers(q3, required, periods)
+
+
+def test_period_query_over_period_text_skips_the_llm():
+    """Python extraction tags each figure with its nearest period, so FY24 text answers an FY24 query"""
+    extractor = DataExtractor(llm=ChunkEchoLLM())
+    query = "What was revenue in FY24?"
+    python_extracted = extractor.extract_numeric_data(
+        "[Source: UDC Annual Report, p.12]\nFY24 revenue was QR 1,032.1 million"
+    )
+
+    assert python_extracted['revenue']['fiscal_period'] == 'FY24'
+    assert extractor.python_covers(
+        python_extracted, extractor.required_metrics(query, "simple"), extractor.requested_periods(query)
+    )
+
+
 async def run_all_tests():
     """Run all extraction tests"""
     print("\n" + "="*80)
@@ -0,0 +1,72 @@
+"""
+Test that startup stays light: nodes, agents and the CLI import without the
+graph runtime or the Anthropic model classes (see scripts/benchmark_import_time.py)
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+UIS_PATH = Path(__file__).resolve().parents[1]
+
+# Seconds of cumulative import time. Generous for slow CI runners: importing
+# langchain_anthropic alone takes over two seconds, langgraph about one
+BUDGETS = {
+    "src.nodes.classify": 0.5,
+    "src.nodes.verify": 0.5,
+    "src.nodes.synthesis": 1.5,
+    "src.agents.financial_agent": 1.5,
+    "src.utils.llm_governor": 1.0,
+    "main": 2.0,
+}
+
+# Loaded when a graph is built or a model is first called, never on import
+DEFERRED = ("langgraph", "langchain_anthropic", "anthropic", "src.graph.workflow")
+
+
+def _import_times(module: str) -> dict:
+    """Cumulative import time in seconds per module, from a cold ``python -X importtime``"""
+    env = {**os.environ, "PYTHONPATH": str(UIS_PATH)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=UIS_PATH, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative) / 1_000_000
+    return times
+
+
+@pytest.mark.parametrize("module", sorted(BUDGETS))
+def test_module_imports_within_budget(module):
+    """Importing a node, an agent or the CLI defers the heavy libraries"""
+    times = _import_times(module)
+
+    assert [name for name in DEFERRED if name in times] == []
+    assert times[module] < BUDGETS[module]
+
+
+def test_graph_still_imports_every_node():
+    """The deferred modules load once the graph is actually built"""
+    times = _import_times("src.graph.workflow")
+
+    assert "langgraph" in times
+    for node in ("classify", "extract", "debate", "critique", "verify", "synthesis"):
+        assert f"src.nodes.{node}" in times
+
+
+def test_chat_model_and_legacy_import_resolve_the_governed_model():
+    """chat_models and llm_governor still hand out GovernedChatAnthropic"""
+    from src.utils import llm_governor
+    from src.utils.chat_models import chat_model
+    from src.utils.governed_chat import GovernedChatAnthropic
+
+    assert llm_governor.GovernedChatAnthropic is GovernedChatAnthropic
+    assert isinstance(chat_model("claude-sonnet-4-5-20250929", 0.3), GovernedChatAnthropic)
@@ -0,0 +1,100 @@
+"""
+Test the two-tier LLM response cache
+"""
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.utils.llm_cache import LLMResponseCache
+from src.utils.llm_tracking import LLMCallTracker
+from src.utils.performance import PerformanceMonitor
+
+
+def _messages(question: str):
+    return [SystemMessage(content="You are a CFO."), HumanMessage(content=question)]
+
+
+@pytest.mark.asyncio
+async def test_exact_hit_skips_model_and_is_not_billed(tmp_path):
+    """A repeated prompt is answered from disk and counted as a cache hit"""
+    monitor = PerformanceMonitor()
+    monitor.start_query()
+    cache = LLMResponseCache(db_path=tmp_path / "cache.sqlite3")
+    llm = FakeListChatModel(responses=["first", "second"], cache=cache,
+                            callbacks=[LLMCallTracker(monitor)])
+
+    assert (await llm.ainvoke(_messages("How is Qatar Cool performing?"))).content == "first"
+    # A fresh process-level tier still finds the disk entry
+    cache._memory.clear()
+    assert (await llm.ainvoke(_messages("How is Qatar Cool performing?"))).content == "first"
+    assert (await llm.ainvoke(_messages("What was revenue?"))).content == "second"
+
+    assert cache.stats["exact_hits"] == 1
+    assert monitor.llm_calls == 2
+    assert monitor.get_summary()['llm_cache_hits'] == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl_and_data_version_invalidate(tmp_path):
+    """Entries expire after the TTL and when the knowledge base changes"""
+    version = {"value": "v1"}
+    cache = LLMResponseCache(db_path=tmp_path / "cache.sqlite3", ttl_seconds=3600,
+                             data_version_provider=lambda: version["value"])
+    llm = FakeListChatModel(responses=["a", "b", "c"], cache=cache)
+
+    await llm.ainvoke(_messages("q"))
+    version["value"] = "v2"
+    assert (await llm.ainvoke(_messages("q"))).content == "b"
+    assert cache.stats["invalidations"] == 1
+
+    cache.ttl_seconds = -1
+    assert (await llm.ainvoke(_messages("q"))).content == "c"
+
+
+def test_disk_tier_is_size_bounded(tmp_path):
+    """Least recently used entries are evicted beyond max_entries"""
+    cache = LLMResponseCache(db_path=tmp_path / "cache.sqlite3", max_entries=2, memory_entries=1)
+    llm = FakeListChatModel(responses=["1", "2", "3", "4"], cache=cache)
+
+    for question in ("q1", "q2", "q3"):
+        llm.invoke(_messages(question))
+
+    count = cache._connection().execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+    assert count == 2
+    assert llm.invoke(_messages("q1")).content == "4"  # evicted, so regenerated
+
+
+def test_semantic_tier_matches_near_identical_prompts():
+    """Similar user prompts with the same system prompt share an answer"""
+    def embed(text):
+        text = text.lower()
+        return [text.count("qatar cool"), text.count("perform"), text.count("revenue")]
+
+    cache = LLMResponseCache(embed_fn=embed, similarity_threshold=0.95)
+    llm = FakeListChatModel(responses=["cached answer", "fresh answer"], cache=cache)
+
+    llm.invoke(_messages("How is Qatar Cool performing?"))
+    assert llm.invoke(_messages("how is qatar cool performing")).content == "cached answer"
+    assert llm.invoke(_messages("What was revenue?")).content == "fresh answer"
+    assert cache.stats["semantic_hits"] == 1
+
+
+def test_entries_are_scoped_to_every_model_parameter(tmp_path):
+    """A response cached with one max_tokens is not served to a call with another"""
+    import json
+    from langchain_core.outputs import Generation
+
+    def llm_string(max_tokens):
+        model = {"lc": 1, "type": "constructor", "id": ["langchain", "chat_models", "ChatAnthropic"],
+                 "kwargs": {"model": "claude-3-haiku-20240307", "temperature": 0.0, "max_tokens": max_tokens}}
+        return json.dumps(model) + "---" + str(sorted({"stop": None, "max_tokens": max_tokens}.items()))
+
+    cache = LLMResponseCache(db_path=tmp_path / "cache.sqlite3", embed_fn=lambda text: [1.0, 0.0])
+    prompt = json.dumps([{"kwargs": {"type": "human", "content": "Summarize FY24 results"}}])
+    cache.update(prompt, llm_string(64), [Generation(text="Truncated summa")])
+
+    assert cache.lookup(prompt, llm_string(64))[0].text == "Truncated summa"
+    assert cache.lookup(prompt, llm_string(4096)) is None
+    row = cache._connection().execute("SELECT model, temperature FROM llm_cache").fetchone()
+    assert row == ("claude-3-haiku-20240307", 0.0)
+
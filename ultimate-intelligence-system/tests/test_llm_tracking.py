@@ -0,0 +1,147 @@
+"""
+Test LLM call instrumentation and budget enforcement
+"""
+import asyncio
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from src.utils.llm_tracking import LLMBudgetExceeded, LLMCallTracker
+from src.utils.performance import PerformanceMonitor
+
+
+@pytest.mark.asyncio
+async def test_tracker_records_calls():
+    """Every chat model call lands in the monitor with timing data"""
+    monitor = PerformanceMonitor()
+    monitor.start_query()
+    llm = FakeListChatModel(responses=["ok", "ok"], callbacks=[LLMCallTracker(monitor)])
+
+    await llm.ainvoke("What was revenue?")
+    await llm.ainvoke("What was profit?")
+
+    summary = monitor.get_summary()
+    assert summary['llm_calls'] == 2
+    record = summary['llm_call_log'][0]
+    assert record['latency'] is not None and record['latency'] >= 0
+    assert record['time_to_first_token'] <= record['latency']
+    assert record['retries'] == 0
+
+
+@pytest.mark.asyncio
+async def test_tracker_short_circuits_over_budget():
+    """Calls beyond MAX_LLM_CALLS are refused before reaching the model"""
+    monitor = PerformanceMonitor()
+    monitor.MAX_LLM_CALLS = 1
+    monitor.start_query()
+    llm = FakeListChatModel(responses=["ok"], callbacks=[LLMCallTracker(monitor)])
+
+    await llm.ainvoke("first")
+    with pytest.raises(LLMBudgetExceeded):
+        await llm.ainvoke("second")
+
+    assert monitor.llm_calls == 1
+
+
+def test_budget_inactive_without_query():
+    """Limits only apply while a query is tracked"""
+    monitor = PerformanceMonitor()
+    monitor.llm_calls = 100
+    assert monitor.budget_exceeded() is None
+
+    monitor.start_query()
+    monitor.track_llm_call("claude-3-haiku-20240307", 10_000_000, 0)
+    assert "cost limit" in monitor.budget_exceeded()
+
+
+def test_concurrent_queries_keep_separate_budgets():
+    """Each query run gets its own counters, even on a shared monitor"""
+    monitor = PerformanceMonitor()
+    monitor.MAX_LLM_CALLS = 2
+    tracker = LLMCallTracker(monitor)
+    first_call_done = asyncio.Event()
+    second_query_done = asyncio.Event()
+
+    async def first_query():
+        monitor.start_query()
+        llm = FakeListChatModel(responses=["a1", "a2", "a3"], callbacks=[tracker])
+        await llm.ainvoke("first")
+        first_call_done.set()
+        await second_query_done.wait()
+        await llm.ainvoke("second")  # the other query's calls do not count here
+        with pytest.raises(LLMBudgetExceeded):
+            await llm.ainvoke("third")
+        return monitor.get_summary()['llm_calls']
+
+    async def second_query():
+        await first_call_done.wait()
+        monitor.start_query()  # must not reset the first query's counters
+        llm = FakeListChatModel(responses=["b1", "b2"], callbacks=[tracker])
+        await llm.ainvoke("first")
+        await llm.ainvoke("second")
+        second_query_done.set()
+        return monitor.get_summary()['llm_calls']
+
+    async def run_both():
+        return await asyncio.gather(first_query(), second_query())
+
+    assert asyncio.run(run_both()) == [2, 2]
+    # Nothing leaks into the caller's context
+    assert monitor.budget_exceeded() is None
+
+
+def test_governor_retries_reach_the_tracker(monkeypatch):
+    """Retries happen in the LLM governor, not LangChain, and are still counted per call"""
+    from langchain_anthropic import ChatAnthropic
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, ChatResult
+
+    from src.utils.governed_chat import GovernedChatAnthropic
+
+    class RateLimited(Exception):
+        status_code = 429
+        response = None
+
+    attempts = []
+
+    async def flaky_generate(self, messages, stop=None, run_manager=None, **kwargs):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RateLimited("rate limited")
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content="ok"))])
+
+    monkeypatch.setattr(ChatAnthropic, "_agenerate", flaky_generate)
+    monkeypatch.setattr("src.utils.governed_chat.llm_governor.sleep", lambda delay: asyncio.sleep(0))
+    monitor = PerformanceMonitor()
+    monitor.start_query()
+    llm = GovernedChatAnthropic(model="claude-3-haiku-20240307", api_key="test", cache=False,
+                                callbacks=[LLMCallTracker(monitor)])
+
+    assert asyncio.run(llm.ainvoke("What was revenue?")).content == "ok"
+
+    assert len(attempts) == 2
+    assert monitor.llm_call_log[0]['retries'] == 1
+
+
+def test_prompt_cache_tokens_are_priced_separately():
+    """Cache reads/writes are split out of input tokens and billed at their rates"""
+    from uuid import uuid4
+    from langchain_core.messages import AIMessage
+    from langchain_core.outputs import ChatGeneration, LLMResult
+
+    monitor = PerformanceMonitor()
+    monitor.start_query()
+    tracker = LLMCallTracker(monitor)
+    message = AIMessage(content="ok", usage_metadata={
+        "input_tokens": 3100, "output_tokens": 100, "total_tokens": 3200,
+        "input_token_details": {"cache_read": 3000, "cache_creation": 0}
+    })
+    run_id = uuid4()
+    tracker.on_chat_model_start({}, [[]], run_id=run_id,
+                                invocation_params={"model": "claude-3-5-sonnet-20241022"})
+    tracker.on_llm_end(LLMResult(generations=[[ChatGeneration(message=message)]]), run_id=run_id)
+
+    record = monitor.llm_call_log[0]
+    assert (record['input_tokens'], record['cache_read_tokens'], record['cache_write_tokens']) == (100, 3000, 0)
+    assert record['cost'] == pytest.approx((100 * 3 + 3000 * 0.3 + 100 * 15) / 1_000_000)
+    assert monitor.get_summary()['prompt_cache_read_tokens'] == 3000
@@ -8,6 +8,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 import asyncio
 from typing import Any
 
+import numpy as np
+
 from src.nodes.critique import DevilsAdvocate
 from src.nodes.debate import MultiAgentDebate
 from src.nodes.verify import FactVerifier
@@ -160,6 +162,38 @@ def test_verification():
     
     return True
 
+def test_indexed_fact_matching():
+    """Binary-search matching agrees with a linear 1%-tolerance scan"""
+    import random
+    
+    random.seed(7)
+    verifier = FactVerifier()
+    extracted_facts = {
+        f'metric_{i}': {'value': round(random.uniform(-5000, 5000), 1)} for i in range(300)
+    }
+    extracted_facts['as_text'] = {'value': '1,032.1'}
+    extracted_facts['not_numeric'] = {'value': 'n/a'}
+    
+    def linear(number):
+        for data in extracted_facts.values():
+            try:
+                fact = float(str(data['value']).replace(',', ''))
+            except ValueError:
+                continue
+            if abs(fact - number) / max(abs(fact), abs(number), 1.0) < 0.01:
+                return True
+        return False
+    
+    claims = [round(random.uniform(-6000, 6000), 1) for _ in range(500)] + [1032.1, 1040.0]
+    fact_values, _ = verifier._index_facts(extracted_facts)
+    matches = verifier._match_claims(np.array(claims), fact_values)
+    
+    assert [bool(m >= 0) for m in matches] == [linear(claim) for claim in claims]
+    assert verifier._verify_number(1035.0, extracted_facts) == (True, 'as_text')
+    assert verifier._verify_number(1.0e9, extracted_facts) == (False, None)
+    
+    return True
+
 async def run_all_phase4_tests():
     """Run all Phase 4 tests"""
     print("\n" + "="*80)
@@ -169,6 +203,7 @@ async def run_all_phase4_tests():
     await test_debate_node()
     await test_critique_node()
     test_verification()
+    test_indexed_fact_matching()
     
     print("\n" + "="*80)
     print("[OK] ALL PHASE 4 TESTS PASSED")
@@ -0,0 +1,61 @@
+"""
+Test token streaming from graph nodes to the custom stream
+"""
+import asyncio
+from typing import TypedDict
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langgraph.graph import END, StateGraph
+
+from src.utils.performance import PerformanceMonitor
+from src.utils.streaming import TOKEN_EVENT, NodeTokenStreamer
+
+
+class StreamingFakeChat(FakeListChatModel):
+    """Fake model with a ``streaming`` field; set it to stream on ainvoke like ChatAnthropic"""
+    streaming: bool = False
+
+
+class _State(TypedDict):
+    answer: str
+
+
+def test_node_tokens_reach_custom_stream_with_ttft():
+    """Tokens stream as custom events before the node update; TTFT is recorded once"""
+    monitor = PerformanceMonitor()
+    monitor.start_query()
+    llm = StreamingFakeChat(responses=["Revenue QR 1,032M"], streaming=True)
+
+    async def synthesis(state: _State) -> _State:
+        streamer = NodeTokenStreamer("synthesis", monitor=monitor)
+        response = await llm.ainvoke("Summarise", config={"callbacks": [streamer]})
+        return {"answer": response.content}
+
+    workflow = StateGraph(_State)
+    workflow.add_node("synthesis", synthesis)
+    workflow.set_entry_point("synthesis")
+    workflow.add_edge("synthesis", END)
+    graph = workflow.compile()
+
+    async def collect():
+        return [event async for event in graph.astream({"answer": ""}, stream_mode=["updates", "custom"])]
+
+    events = asyncio.run(collect())
+
+    tokens = [chunk for mode, chunk in events if mode == "custom"]
+    assert all(chunk["type"] == TOKEN_EVENT and chunk["node"] == "synthesis" for chunk in tokens)
+    assert "".join(chunk["token"] for chunk in tokens) == "Revenue QR 1,032M"
+    assert events[-1] == ("updates", {"synthesis": {"answer": "Revenue QR 1,032M"}})
+    assert monitor.get_summary()["time_to_first_token"] is not None
+
+
+def test_streamer_is_noop_outside_graph():
+    """Calling a streaming model outside a graph run does not fail"""
+    monitor = PerformanceMonitor()
+    monitor.start_query()
+    streamer = NodeTokenStreamer("synthesis", monitor=monitor)
+    llm = StreamingFakeChat(responses=["ok"], streaming=True)
+
+    asyncio.run(llm.ainvoke("hi", config={"callbacks": [streamer]}))
+
+    assert streamer.tokens_streamed == 2